@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк: кыскартуулардын сөздүгүнүн көлөмү жана издөө убактысы.
+
+``kyrgyz_abbr`` таблицасы 50дөн 50 000ге чейин жасалма кыскартуулар менен
+толукталат (``overrides``). ``named_abbr`` этабы бир өтүүлүү издөөчү
+менен жана мурунку ыкма — ``\\b(КР|ЖМК|...)(мүчө)?\\b`` жана
+``\\b(IT|...)\\b`` чоң regex'тери менен салыштырылат. Издөөчүнүн
+убактысы дээрлик туруктуу калышы керек.
+
+    python benchmarks/bench_abbr.py [--sizes 50 500 5000 50000]
+"""
+
+import argparse
+import random
+import re
+import time
+
+from kyrgyz_normalizer import KyrgyzTextNormalizer
+
+ALPHABET = 'АБВГДЕЖЗИКЛМНОПРСТУФХЧШЫЭЮЯӨҮ'
+SENTENCES = (
+    "Бүгүн {0}дын өкмөтү жана {1} өкүлдөрү жолугушту.",
+    "{0} менен {1} ортосундагы келишим {2}га жөнөтүлдү.",
+    "Жаңылыктарды {0} жана {1} маалымдады, {2}дан комментарий алынган жок.",
+    "Шаардын көчөлөрүндө кар жаады, жолдор тайгак.",
+)
+
+
+def make_dictionary(size, rng):
+    entries = {}
+    while len(entries) < size:
+        abbr = ''.join(rng.choice(ALPHABET) for _ in range(rng.randint(2, 6)))
+        entries[abbr] = 'жасалма уюм'
+    return entries
+
+
+def make_corpus(entries, rng, count=500):
+    keys = list(entries)
+    return [rng.choice(SENTENCES).format(*(rng.choice(keys) for _ in range(3)))
+            for _ in range(count)]
+
+
+def alternation(words):
+    return '|'.join(re.escape(w) for w in sorted(words, key=len, reverse=True))
+
+
+def best_of(func, repeat=5):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[50, 500, 5000, 50000])
+    args = parser.parse_args()
+
+    KyrgyzTextNormalizer().warmup()  # бөлүшүлгөн таблицалар жана паттерндер
+    print(f"{'сөздүк':>8} {'түзүү':>9} {'издөөчү':>14} {'мурунку regex':>16}")
+    for size in args.sizes:
+        rng = random.Random(size)
+        entries = make_dictionary(size, rng)
+        corpus = make_corpus(entries, rng)
+
+        started = time.perf_counter()
+        normalizer = KyrgyzTextNormalizer(overrides={'kyrgyz_abbr': entries}).warmup()
+        build = time.perf_counter() - started
+
+        kg_abbr, en_abbr = normalizer.kyrgyz_abbr, normalizer.english_abbr
+        suffixes = '|'.join(normalizer.abbr_suffixes)
+        kg_regex = re.compile(rf'\b({alternation(kg_abbr)})({suffixes})?\b')
+        en_regex = re.compile(rf'\b({alternation(en_abbr)})\b')
+
+        def sub_kg(m):
+            full = kg_abbr[m.group(1)]
+            return normalizer.apply_suffix_harmony(full, m.group(2)) if m.group(2) else full
+
+        def run_matcher():
+            for sentence in corpus:
+                normalizer._run_stage('named_abbr', sentence)
+
+        def run_regex():
+            for sentence in corpus:
+                sentence = kg_regex.sub(sub_kg, sentence)
+                en_regex.sub(lambda m: en_abbr[m.group(1)], sentence)
+
+        new = best_of(run_matcher) / len(corpus) * 1e6
+        old = best_of(run_regex, repeat=1 if size > 5000 else 3) / len(corpus) * 1e6
+        print(f"{size:>8} {build * 1000:7.1f}мс {new:10.1f} мкс {old:12.1f} мкс")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк: бузук текстте ар бир этап сызыктуу убакытта иштейби.
+
+Ар бир учур (цифралардын узун катарлары, бөлгүчтөрдүн ташкыны, рим
+тамгаларынын кайталанышы ж.б.) ``--size`` жана ``--size * --factor``
+узундугунда ``trace()`` менен иштетилет. Кайсы бир этаптын убактысы
+``factor * tolerance`` эседен ашык өссө, ал белгиленет жана скрипт
+1 коду менен чыгат (CI үчүн).
+
+    python benchmarks/bench_adversarial.py [--size 1000] [--factor 4] [--cases digits roman]
+"""
+
+import argparse
+import sys
+
+from kyrgyz_normalizer import KyrgyzTextNormalizer
+from kyrgyz_normalizer.bench.adversarial import ADVERSARIAL, check_scaling
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--cases', nargs='+', choices=ADVERSARIAL, default=list(ADVERSARIAL))
+    parser.add_argument('--engines', nargs='+', choices=KyrgyzTextNormalizer.ENGINES,
+                        default=list(KyrgyzTextNormalizer.ENGINES))
+    parser.add_argument('--size', type=int, default=1000)
+    parser.add_argument('--factor', type=int, default=4)
+    parser.add_argument('--tolerance', type=float, default=2.5)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('-v', '--verbose', action='store_true', help='бардык этаптарды чыгаруу')
+    args = parser.parse_args()
+
+    failed = 0
+    print(f"{'учур':>14} {'кыймылдаткыч':>12} {'этап':>18} "
+          f"{args.size:>9} {args.size * args.factor:>9}  өсүү")
+    for engine in args.engines:
+        normalizer = KyrgyzTextNormalizer(engine=engine).warmup()
+        for case in args.cases:
+            rows = check_scaling(normalizer, case, args.size, args.factor,
+                                 args.repeat, args.tolerance)
+            shown = rows if args.verbose else [max(rows, key=lambda row: row.large)]
+            shown += [row for row in rows if not row.ok and row not in shown]
+            for row in shown:
+                mark = '' if row.ok else '  СЫЗЫКТУУ ЭМЕС'
+                print(f"{case:>14} {engine:>12} {row.stage:>18} {row.small * 1000:7.2f}мс "
+                      f"{row.large * 1000:7.2f}мс {row.ratio:5.1f}x{mark}")
+            failed += sum(not row.ok for row in rows)
+    if failed:
+        print(f"{failed} этап сызыктуу эмес өстү", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк: ``AsyncNormalizer`` — inline же жиптер пулу.
+
+Ар түрдүү узундуктагы тексттер үчүн:
+  * inline — ``normalize`` event loop'то (loop ушунча убакыт бөгөттөлөт);
+  * thread — жиптер пулуна жөнөтүү (loop бөгөттөлбөйт, бирок ар бир
+    чакыруу жөнөтүүнүн чыгымын төлөйт).
+Кайсы узундуктан баштап жөнөтүү арзан болорун көрсөтөт
+(``inline_threshold`` тандоо үчүн).
+
+    python benchmarks/bench_async.py [-n 2000]
+"""
+
+import argparse
+import asyncio
+import time
+
+from kyrgyz_normalizer.aio import AsyncNormalizer
+from kyrgyz_normalizer.bench import generate_corpus
+
+LENGTHS = (16, 64, 256, 1024, 4096)
+
+
+def texts_of_length(length, count):
+    pool = ' '.join(generate_corpus('mixed', sentences=400, seed=1))
+    step = max(1, len(pool) // count)
+    texts = []
+    for i in range(count):
+        start = (i * step) % max(1, len(pool) - length)
+        texts.append(pool[start:start + length])
+    return texts
+
+
+async def per_call(normalizer, texts):
+    started = time.perf_counter()
+    for text in texts:
+        await normalizer.normalize(text)
+    return (time.perf_counter() - started) / len(texts)
+
+
+async def main_async(count):
+    inline = AsyncNormalizer(inline_threshold=10 ** 12)
+    pooled = AsyncNormalizer(inline_threshold=0, max_workers=2)
+    inline.normalizer.warmup()
+    pooled.normalizer.warmup()
+    print(f"{'узундук':>8} {'inline мкс':>11} {'thread мкс':>11} {'чыгым мкс':>10}")
+    for length in LENGTHS:
+        # ар бир режим өз тексттерин алат — кэш жок, бирок тексттер бирдей
+        texts = texts_of_length(length, count)
+        t_inline = await per_call(inline, texts)
+        t_pooled = await per_call(pooled, texts)
+        print(f"{length:>8} {t_inline * 1e6:11.1f} {t_pooled * 1e6:11.1f} "
+              f"{(t_pooled - t_inline) * 1e6:10.1f}")
+    await pooled.aclose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('-n', '--count', type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.count))
+
+
+if __name__ == '__main__':
+    main()
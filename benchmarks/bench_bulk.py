@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк: сандардын мамычасын сөзгө айландыруу.
+
+``number_to_words_many`` / ``number_to_ordinal_many`` (NumPy) менен
+скалярдык функцияны ар бир элементке чакырууну салыштырат.
+
+    pip install kyrgyz-normalizer[numpy]
+    python benchmarks/bench_bulk.py
+"""
+
+import time
+
+import numpy as np
+
+from kyrgyz_normalizer import KyrgyzTextNormalizer
+
+SIZE = 1_000_000
+
+
+def timed(func):
+    started = time.perf_counter()
+    result = func()
+    return time.perf_counter() - started, result
+
+
+def main():
+    normalizer = KyrgyzTextNormalizer()
+    rng = np.random.default_rng(0)
+    columns = {
+        'жылдар (1900..2030)': rng.integers(1900, 2030, size=SIZE),
+        'баалар (100..10^6)': rng.integers(100, 10 ** 6, size=SIZE),
+        'калк (10^6..10^10)': rng.integers(10 ** 6, 10 ** 10, size=SIZE),
+    }
+    pairs = (
+        ('number_to_words', normalizer.number_to_words_many, normalizer.number_to_words),
+        ('number_to_ordinal', normalizer.number_to_ordinal_many, normalizer.number_to_ordinal),
+    )
+    print(f"{SIZE} элемент")
+    for name, column in columns.items():
+        print(name)
+        for label, many, scalar in pairs:
+            t_many, result = timed(lambda: many(column))
+            t_loop, expected = timed(lambda: [scalar(x) for x in column.tolist()])
+            assert result.tolist() == expected
+            print(f"  {label:<18} цикл {t_loop:6.2f} с   _many {t_many:6.2f} с   "
+                  f"{t_loop / t_many:5.1f}x")
+
+
+if __name__ == '__main__':
+    main()
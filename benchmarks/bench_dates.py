@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Микро-бенчмарк: даталарды сөзгө айландыруу.
+
+Даталардын сөздөрүнүн кэшин (``(формат, күн, ай, жыл)`` → сөздөр) жана
+жылдардын иреттик таблицасын (1000..2199) кэшсиз нускага жана мурунку
+``number_to_ordinal`` жолуна салыштырат — жасалма ``dates`` корпусунда
+(1950..2030 жылдардын туш келди даталары) жана жаңылыктардагыдай акыркы
+эки жылдын даталарына толгон текстте. Кэштин hit rate'и да чыгарылат.
+
+    python benchmarks/bench_dates.py [--sentences 5000]
+"""
+
+import argparse
+import datetime
+import random
+import timeit
+
+from kyrgyz_normalizer import KyrgyzTextNormalizer
+from kyrgyz_normalizer.bench import generate_corpus
+
+N = KyrgyzTextNormalizer()
+
+
+def news(sentences, seed=0):
+    """Акыркы эки жылдын даталары ар кандай форматта."""
+    rng = random.Random(seed)
+    end = datetime.date(2026, 1, 1)
+    rows = []
+    for _ in range(sentences):
+        day = end - datetime.timedelta(days=rng.randrange(730))
+        rows.append(rng.choice((
+            f"{day:%d.%m.%Y} күнү токтом кабыл алынды.",
+            f"Жыйын {day.isoformat()} өттү.",
+            f"{day.day} {N.months[f'{day.month:02d}']} {day.year} жылы маалымат жарыяланды.",
+            f"Мөөнөтү: {day:%d/%m/%y}.",
+        )))
+    return rows
+
+
+def table_ordinal(num):
+    """Мурунку жол: 1000 дөн чоң сан топтордон курулат."""
+    upper, low = divmod(num, 1000)
+    if low:
+        return N._scaled_groups[1][upper] + ' ' + N._group_ordinals[low]
+    return N._group_words[upper] + ' ' + N.scale_ordinals['миң']
+
+
+def bench(label, normalizer, texts, repeat=5):
+    best = min(timeit.repeat(lambda: [normalizer.normalize(text) for text in texts],
+                             number=1, repeat=repeat))
+    chars = sum(map(len, texts))
+    print(f"  {label:<20} {chars / best / 1e3:8.0f} Kсимв/с")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sentences', type=int, default=5000)
+    args = parser.parse_args()
+
+    corpora = {
+        'dates корпусу': list(generate_corpus('dates', sentences=args.sentences, seed=0)),
+        'жаңылыктар': news(args.sentences),
+    }
+    stages = ('dates', 'years')
+    for name, texts in corpora.items():
+        cached = KyrgyzTextNormalizer(profile=stages).warmup()
+        uncached = KyrgyzTextNormalizer(profile=stages, date_cache_size=0).warmup()
+        assert [cached.normalize(text) for text in texts] == [uncached.normalize(text) for text in texts]
+        # Бир жолку өтүүнүн hit rate'и (бенчмарктын кайталоолорусуз)
+        info = cached.date_cache_info()
+        print(name)
+        before = bench('кэшсиз', uncached, texts)
+        after = bench('кэш', cached, texts)
+        print(f"  {'ылдамдоо':<20} {before / after:8.2f}x")
+        print(f"  {'hit rate':<20} {info.hits / max(info.hits + info.misses, 1):8.1%} "
+              f"({info.size} жазуу)")
+
+    years = [random.Random(1).randrange(1900, 2100) for _ in range(20000)]
+    print('жылдар (1900..2100), иреттик')
+    for label, func in (('топтордон', table_ordinal), ('таблица', N.number_to_ordinal)):
+        best = min(timeit.repeat(lambda: [func(year) for year in years], number=1, repeat=5))
+        print(f"  {label:<20} {best / len(years) * 1e9:8.0f} нс/сан")
+
+
+if __name__ == '__main__':
+    main()
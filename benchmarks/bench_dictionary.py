@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк: колдонуучунун сөздүгүн жүктөө, издөө жана жаңыртуу.
+
+1 000, 10 000 жана 100 000 жасалма жазуудан турган сөздүк (жарымы
+``kyrgyz_abbr``, жарымы ``units``) TSV файлына жазылат жана өлчөнөт:
+
+* жүктөө — ``load_dictionary`` + нормализаторду түзүү + ``warmup()``;
+* издөө — сөздүктүн ачкычтары бар сүйлөмдөрдү нормализациялоо;
+* жаңыртуу — иштеп жаткан нормализаторго бир жазууну кошуу/өчүрүү
+  (``add_entries``/``remove_entries``), бүт сөздүктү кайра түзүү менен
+  салыштырганда.
+
+    python benchmarks/bench_dictionary.py [--sizes 1000 10000 100000]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from kyrgyz_normalizer import KyrgyzTextNormalizer, load_dictionary
+
+ALPHABET = 'АБВГДЕЖЗИКЛМНОПРСТУФХЧШЫЭЮЯӨҮ'
+UNIT_ALPHABET = 'абвгдежзиклмнопрстуфхчшыэюяөү'
+SENTENCES = (
+    "Бүгүн {0}дын өкмөтү {2} {1} жүк жөнөттү.",
+    "{0} менен келишим боюнча {2}-{3} {1} берилет.",
+    "Шаардын көчөлөрүндө кар жаады, жолдор тайгак.",
+)
+
+
+def make_dictionary(size, rng):
+    abbr, units = {}, {}
+    while len(abbr) < size // 2:
+        abbr[''.join(rng.choice(ALPHABET) for _ in range(rng.randint(3, 7)))] = 'жасалма уюм'
+    while len(units) < size - size // 2:
+        units[''.join(rng.choice(UNIT_ALPHABET) for _ in range(rng.randint(3, 7)))] = 'бирдик'
+    return {'kyrgyz_abbr': abbr, 'units': units}
+
+
+def write_tsv(dictionary, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        for name, entries in dictionary.items():
+            for key, value in entries.items():
+                f.write(f"{name}\t{key}\t{value}\n")
+
+
+def make_corpus(dictionary, rng, count=500):
+    abbr, units = list(dictionary['kyrgyz_abbr']), list(dictionary['units'])
+    return [rng.choice(SENTENCES).format(rng.choice(abbr), rng.choice(units),
+                                         rng.randint(1, 99), rng.randint(100, 999))
+            for _ in range(count)]
+
+
+def best_of(func, repeat=5):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    KyrgyzTextNormalizer().warmup()  # бөлүшүлгөн таблицалар жана паттерндер
+    print(f"{'сөздүк':>8} {'жүктөө':>10} {'түзүү':>10} {'издөө':>14} "
+          f"{'кошуу':>10} {'өчүрүү':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            rng = random.Random(size)
+            dictionary = make_dictionary(size, rng)
+            corpus = make_corpus(dictionary, rng)
+            path = os.path.join(tmp, f'dictionary_{size}.tsv')
+            write_tsv(dictionary, path)
+
+            load = best_of(lambda: load_dictionary(path), repeat=3)
+            overrides = load_dictionary(path)
+            build = best_of(
+                lambda: KyrgyzTextNormalizer(overrides=overrides, cache_size=0).warmup(),
+                repeat=3)
+            normalizer = KyrgyzTextNormalizer(overrides=overrides, cache_size=0).warmup()
+
+            def run():
+                for sentence in corpus:
+                    normalizer.normalize(sentence)
+
+            lookup = best_of(run) / len(corpus) * 1e6
+
+            keys = [f'ЖАҢЫ{i}' for i in range(200)]
+            started = time.perf_counter()
+            for key in keys:
+                normalizer.add_entries('kyrgyz_abbr', {key: 'жаңы уюм'})
+                normalizer.add_entries('units', {key.lower(): 'жаңы бирдик'})
+            add = (time.perf_counter() - started) / (2 * len(keys))
+            started = time.perf_counter()
+            for key in keys:
+                normalizer.remove_entries('kyrgyz_abbr', [key])
+                normalizer.remove_entries('units', [key.lower()])
+            remove = (time.perf_counter() - started) / (2 * len(keys))
+
+            print(f"{size:>8} {load * 1000:8.1f}мс {build * 1000:8.1f}мс "
+                  f"{lookup:10.1f} мкс {add * 1e6:6.1f} мкс {remove * 1e6:6.1f} мкс")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк: түзөтүлгөн документти кайра нормализациялоо.
+
+Ар бир көлөмдөгү документ (аралаш корпустун сүйлөмдөрү) үчүн бүт
+текстти ``normalize()`` менен иштетүү жана ``NormalizedDocument.edit()``
+менен бир сөздү алмаштыруу салыштырылат. Түзөтүүнүн убактысы
+документтин көлөмүнөн дээрлик көз карандысыз калышы керек.
+
+    python benchmarks/bench_document.py [--sizes 10KB 100KB 1MB] [--edits 200]
+"""
+
+import argparse
+import random
+import time
+
+from kyrgyz_normalizer import KyrgyzTextNormalizer, NormalizedDocument
+from kyrgyz_normalizer.bench import generate_corpus, parse_size
+
+WORDS = ('китеп', '2025-жылы', '15 км', 'КР', 'саат 12:30да', 'жана')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', nargs='+', default=['10KB', '100KB', '1MB'])
+    parser.add_argument('--edits', type=int, default=200)
+    args = parser.parse_args()
+
+    normalizer = KyrgyzTextNormalizer().warmup()
+    print(f"{'көлөм':>8} {'normalize()':>12} {'документ':>10} {'edit()':>12}")
+    for size in args.sizes:
+        text = ' '.join(generate_corpus('mixed', size=parse_size(size), seed=0))
+
+        started = time.perf_counter()
+        normalizer.normalize(text)
+        full = time.perf_counter() - started
+
+        started = time.perf_counter()
+        doc = NormalizedDocument(text, normalizer)
+        build = time.perf_counter() - started
+
+        rng = random.Random(0)
+        started = time.perf_counter()
+        for _ in range(args.edits):
+            position = rng.randrange(len(doc))
+            doc.edit(position, min(position + 5, len(doc)), rng.choice(WORDS))
+        edit = (time.perf_counter() - started) / args.edits
+        print(f"{size:>8} {full * 1000:10.1f}мс {build * 1000:8.1f}мс {edit * 1e6:9.1f} мкс")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк: ``normalize_file`` — чоң файлдын ылдамдыгы жана эс тутуму.
+
+Аралаш корпустун файлдары (демейки 20 жана 80 МБ) жазылат жана ар бир
+процесстердин саны үчүн өзүнчө Python процессинде нормализацияланат:
+ылдамдык (МБ/с) жана негизги процесстин, ошондой эле эң чоң жумушчу
+процесстин эң чоң RSS'и көрсөтүлөт. RSS файлдын көлөмүнө көз каранды
+болбошу керек.
+
+    python benchmarks/bench_files.py [--sizes 20MB 80MB] [--workers 1 2 4]
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+
+from kyrgyz_normalizer.bench import generate_corpus, parse_size
+from kyrgyz_normalizer.bench.corpus import format_size
+
+
+def _rss(who):
+    rss = resource.getrusage(who).ru_maxrss
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+
+def run_one(src, dst, workers, chunk_bytes):
+    """Өзүнчө процессте: бир өлчөө, жыйынтыгы JSON катары stdout'ка."""
+    from kyrgyz_normalizer import normalize_file
+
+    stats = normalize_file(src, dst, workers=workers, chunk_bytes=chunk_bytes)
+    print(json.dumps({'mb_per_s': stats.done / 1e6 / stats.elapsed, 'lines': stats.lines,
+                      'rss': _rss(resource.RUSAGE_SELF),
+                      'worker_rss': _rss(resource.RUSAGE_CHILDREN)}))
+
+
+def write_corpus(path, size):
+    with open(path, 'w', encoding='utf-8') as f:
+        for sentence in generate_corpus('mixed', size=size, seed=0):
+            f.write(sentence)
+            f.write('\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', nargs='+', default=['20MB', '80MB'])
+    parser.add_argument('--workers', type=int, nargs='+',
+                        default=sorted({1, 2, os.cpu_count() or 1}))
+    parser.add_argument('--chunk-bytes', type=int, default=1 << 20)
+    parser.add_argument('--run', nargs=3, metavar=('SRC', 'DST', 'WORKERS'),
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.run:
+        run_one(args.run[0], args.run[1], int(args.run[2]), args.chunk_bytes)
+        return
+
+    print(f"{'файл':>8} {'процесс':>8} {'ылдамдык':>12} {'RSS':>10} {'жумушчу RSS':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            src = os.path.join(tmp, 'corpus.txt')
+            write_corpus(src, parse_size(size))
+            for workers in args.workers:
+                output = subprocess.run(
+                    [sys.executable, __file__, '--chunk-bytes', str(args.chunk_bytes),
+                     '--run', src, os.path.join(tmp, 'out.txt'), str(workers)],
+                    check=True, capture_output=True, text=True).stdout
+                result = json.loads(output)
+                worker_rss = format_size(result['worker_rss']) if workers > 1 else '-'
+                print(f"{size:>8} {workers:>8} {result['mb_per_s']:8.2f} МБ/с "
+                      f"{format_size(result['rss']):>10} {worker_rss:>12}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Микро-бенчмарк: ``apply_suffix_harmony``.
+
+Таблицалык ыкманы (даяр формалар → класстар таблицасы) ар бир чакырууда
+үндүүлөрдү издеп, суффиксти тамгама-тамга кайра түзгөн мурунку ыкма
+менен салыштырат.
+
+    python benchmarks/bench_harmony.py
+"""
+
+import random
+import timeit
+
+from kyrgyz_normalizer import KyrgyzTextNormalizer
+
+N = KyrgyzTextNormalizer()
+
+
+def scanning_harmony(word, suffix):
+    """Мурунку ыкма: ар бир чакырууда толук эсептөө."""
+    if not suffix:
+        return word
+    word_lower = word.lower().strip()
+    if not word_lower:
+        return word + suffix
+    all_vowels = 'оуаыөүеи'
+    last_char = word_lower[-1]
+    last_vowel = ''
+    for ch in reversed(word_lower):
+        if ch in all_vowels:
+            last_vowel = ch
+            break
+    is_back_rounded = last_vowel in 'оу'
+    is_front_rounded = last_vowel in 'өү'
+    is_front_unrounded = last_vowel in 'еи'
+    ends_vowel = last_char in all_vowels
+    ends_voiceless = last_char in 'кпстфхцчшщ'
+    new_suffix = suffix
+    if suffix[0] in 'дт':
+        new_suffix = ('н' if ends_vowel else 'т' if ends_voiceless else 'д') + suffix[1:]
+    elif suffix[0] in 'гк':
+        new_suffix = ('н' if ends_vowel else 'к' if ends_voiceless else 'г') + suffix[1:]
+    out = []
+    for ch in new_suffix:
+        if ch == 'а':
+            out.append('ө' if is_front_rounded else 'е' if is_front_unrounded
+                       else 'о' if is_back_rounded and not ends_vowel else 'а')
+        elif ch == 'ы':
+            out.append('ү' if is_front_rounded else 'и' if is_front_unrounded
+                       else 'у' if is_back_rounded else 'ы')
+        elif ch == 'о':
+            out.append('ө' if is_front_rounded else 'о')
+        elif ch == 'у':
+            out.append('ү' if is_front_rounded else 'у')
+        elif ch == 'ө':
+            out.append('о' if is_back_rounded else 'ө')
+        elif ch == 'ү':
+            out.append('у' if is_back_rounded else 'ү')
+        else:
+            out.append(ch)
+    return word + ''.join(out)
+
+
+def bench(label, func, cases, repeat=5):
+    best = min(timeit.repeat(lambda: [func(w, s) for w, s in cases], number=1, repeat=repeat))
+    per_call = best / len(cases) * 1e9
+    print(f"  {label:<12} {per_call:6.0f} нс/чакыруу")
+    return per_call
+
+
+def main():
+    rng = random.Random(0)
+    abbrs = list(N.kyrgyz_abbr.values())
+    datasets = {
+        'аббревиатуралар (КРдин, БУУга)': [
+            (rng.choice(abbrs), rng.choice(N.abbr_suffixes)) for _ in range(50000)],
+        'бөлчөктөр (бештен)': [
+            (N.number_to_words(rng.randrange(2, 1000)), 'дан') for _ in range(50000)],
+        'убакыт (он эки отузга)': [
+            (f"{N.number_to_words(rng.randrange(24))} {N.number_to_words(rng.randrange(1, 60))}",
+             rng.choice(('га', 'да', 'ка', 'та'))) for _ in range(50000)],
+    }
+    for name, cases in datasets.items():
+        assert [scanning_harmony(w, s) for w, s in cases] == \
+            [N.apply_suffix_harmony(w, s) for w, s in cases]
+        print(name)
+        old = bench('мурунку', scanning_harmony, cases)
+        new = bench('таблицалык', N.apply_suffix_harmony, cases)
+        print(f"  {'ылдамдоо':<12} {old / new:6.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк: бир нусканын эс тутуму.
+
+Бөлүшүлгөн таблицалар биринчи нуска менен түзүлөт, андан кийин ``N``
+нуска (орнотулган жана бир нече өзгөчө аббревиатуралуу) түзүлүп,
+``tracemalloc`` менен орточо көлөм өлчөнөт.
+
+    python benchmarks/bench_memory.py [-n 200]
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from kyrgyz_normalizer import KyrgyzTextNormalizer
+
+SAMPLE = "2024-жылы КРдин 15 км жолу курулду, баасы 1500 сом"
+
+
+def measure(factory, count, warm):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = []
+    for i in range(count):
+        normalizer = factory(i)
+        if warm:
+            normalizer.warmup()
+            normalizer.normalize(SAMPLE)
+        instances.append(normalizer)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('-n', '--count', type=int, default=200)
+    args = parser.parse_args()
+
+    KyrgyzTextNormalizer().warmup()  # бөлүшүлгөн таблицалар жана паттерндер
+
+    factories = {
+        'орнотулган': lambda i: KyrgyzTextNormalizer(),
+        '3 өзгөчө аббревиатура': lambda i: KyrgyzTextNormalizer(overrides={'kyrgyz_abbr': {
+            f'КЛ{i}А': 'кардардын биринчи уюму', f'КЛ{i}Б': 'кардардын экинчи уюму',
+            f'КЛ{i}В': 'кардардын үчүнчү уюму'}}),
+    }
+    print(f"{args.count} нуска, бир нускага:")
+    for name, factory in factories.items():
+        cold = measure(factory, args.count, warm=False)
+        warm = measure(factory, args.count, warm=True)
+        print(f"  {name:<24} түзүлгөндө {cold / 1024:7.1f} КБ   warmup'тан кийин {warm / 1024:7.1f} КБ")
+
+
+if __name__ == '__main__':
+    main()
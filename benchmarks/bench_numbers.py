@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Микро-бенчмарк: сандарды сөзгө айландыруу.
+
+Таблицалык (үч орундуу топтор) ыкманы мурунку рекурсивдүү ыкма менен
+салыштырат — баалар, калктын саны жана жылдар сыяктуу сандарда. Узун
+цифралар катарлары (50 – 5000 цифра, таблицалар жана ID'лер) үчүн
+``int()`` + ``number_to_words`` жолун ``number_string_to_words`` жана
+цифра-цифра окуу менен салыштырат: бир цифранын баасы катардын
+узундугуна көз каранды болбошу керек.
+
+    python benchmarks/bench_numbers.py
+"""
+
+import random
+import sys
+import timeit
+
+from kyrgyz_normalizer import KyrgyzTextNormalizer
+
+N = KyrgyzTextNormalizer()
+
+
+def recursive_words(num):
+    """Мурунку ыкма: ар бир чакырууда рекурсия жана тизмелер."""
+    if num == 0:
+        return 'нөл'
+    parts = []
+    for threshold, label in ((1_000_000_000_000, 'триллион'),
+                             (1_000_000_000, 'миллиард'),
+                             (1_000_000, 'миллион'),
+                             (1_000, 'миң')):
+        if num >= threshold:
+            parts.append(recursive_words(num // threshold))
+            parts.append(label)
+            num %= threshold
+    if num >= 100:
+        parts.append(N.hundreds[num // 100])
+        num %= 100
+    if num >= 10:
+        parts.append(N.tens[num // 10])
+        num %= 10
+    if num > 0:
+        parts.append(N.ones[num])
+    return ' '.join(parts)
+
+
+def recursive_ordinal(num):
+    if num >= 1000:
+        thousands, remainder = divmod(num, 1000)
+        if remainder == 0:
+            return recursive_words(thousands) + ' миңинчи'
+        return recursive_words(thousands) + ' миң ' + recursive_ordinal(remainder)
+    return N.number_to_ordinal(num)
+
+
+def bench(label, func, numbers, repeat=5):
+    best = min(timeit.repeat(lambda: [func(x) for x in numbers], number=1, repeat=repeat))
+    per_call = best / len(numbers) * 1e9
+    print(f"  {label:<28} {per_call:8.0f} нс/сан")
+    return per_call
+
+
+def main():
+    rng = random.Random(0)
+    datasets = {
+        'жылдар (1900..2100)': [rng.randrange(1900, 2100) for _ in range(20000)],
+        'баалар (100..10^6)': [rng.randrange(100, 10 ** 6) for _ in range(20000)],
+        'калк (10^6..10^10)': [rng.randrange(10 ** 6, 10 ** 10) for _ in range(20000)],
+    }
+    for name, numbers in datasets.items():
+        print(name)
+        old = bench('рекурсивдүү number_to_words', recursive_words, numbers)
+        new = bench('таблицалык number_to_words', N.number_to_words, numbers)
+        print(f"  {'ылдамдоо':<28} {old / new:8.1f}x")
+        if name.startswith('калк'):
+            continue  # мурунку иреттик ыкма 10^6 дан чоң сандарда туура эмес
+        old = bench('рекурсивдүү number_to_ordinal', recursive_ordinal, numbers)
+        new = bench('таблицалык number_to_ordinal', N.number_to_ordinal, numbers)
+        print(f"  {'ылдамдоо':<28} {old / new:8.1f}x")
+
+
+def bench_long_runs(lengths=(50, 500, 4000, 5000, 50000), count=10):
+    rng = random.Random(1)
+    digits_policy = KyrgyzTextNormalizer(long_numbers='digits')
+    # int() < 3.11 чеги жок; 3.11+ те 4300 цифрадан узун сапты кабыл албайт
+    limit = getattr(sys, 'get_int_max_str_digits', lambda: 0)()
+    print('узун катарлар (нс/цифра)')
+    print(f"  {'цифра':>6} {'int + number_to_words':>22} {'number_string_to_words':>23} {'цифра-цифра':>12}")
+    for length in lengths:
+        runs = [str(rng.randrange(1, 10)) + ''.join(rng.choice('0123456789') for _ in range(length - 1))
+                for _ in range(count)]
+        total = length * count
+
+        def per_digit(func):
+            best = min(timeit.repeat(lambda: [func(run) for run in runs], number=1, repeat=3))
+            return f"{best / total * 1e9:.0f}"
+
+        old = per_digit(lambda run: N.number_to_words(int(run))) if not limit or length <= limit else 'ката'
+        print(f"  {length:>6} {old:>22} {per_digit(N.number_string_to_words):>23} "
+              f"{per_digit(digits_policy._digit_run_words):>12}")
+
+
+if __name__ == '__main__':
+    main()
+    bench_long_runs()
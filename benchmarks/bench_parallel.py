@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк: бир узун документтин кечигүүсү — ``normalize`` жана ``normalize_document``.
+
+Аралаш корпустун сүйлөмдөрү бир документке бириктирилет (демейки 1 жана
+5 МБ); ``ocr`` варианты — тыныш белгилери жок, кичине тамгалар менен.
+Ар бир процесстердин саны үчүн пул алдын ала ысытылат, андан кийин
+эң жакшы кечигүү өлчөнөт. Кечигүү ядролордун санына жараша азайышы керек.
+
+    python benchmarks/bench_parallel.py [--sizes 1MB 5MB] [--workers 1 2 4 8]
+"""
+
+import argparse
+import os
+import re
+import time
+
+from kyrgyz_normalizer import KyrgyzTextNormalizer
+from kyrgyz_normalizer.bench import generate_corpus, parse_size
+from kyrgyz_normalizer.parallel import ParallelNormalizer
+
+
+def best_of(func, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', nargs='+', default=['1MB', '5MB'])
+    parser.add_argument('--workers', type=int, nargs='+',
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    serial = KyrgyzTextNormalizer().warmup()
+    pools = {workers: ParallelNormalizer(workers) for workers in args.workers if workers > 1}
+    print(f"{'документ':>14} {'normalize':>11}"
+          + ''.join(f"{f'{w} процесс':>18}" for w in args.workers if w > 1))
+    try:
+        for size in args.sizes:
+            text = ' '.join(generate_corpus('mixed', size=parse_size(size), seed=0))
+            for kind, document in (('', text), (' ocr', re.sub(r'[.!?,;:]', '', text).lower())):
+                base = best_of(lambda: serial.normalize(document), args.repeat)
+                cells = []
+                for parallel in pools.values():
+                    assert parallel.normalize(document) == serial.normalize(document)
+                    elapsed = best_of(lambda: parallel.normalize(document), args.repeat)
+                    cells.append(f"{elapsed * 1000:8.0f} мс {base / elapsed:4.1f}x")
+                print(f"{size + kind:>14} {base * 1000:8.0f} мс" + ''.join(f"{c:>18}" for c in cells))
+    finally:
+        for parallel in pools.values():
+            parallel.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк: орнотулган профилдердин ылдамдыгы.
+
+Ар бир профиль (``KyrgyzTextNormalizer.PROFILES``) ар бир категориянын
+жана аралаш корпустун сүйлөмдөрүндө өлчөнөт; ``full`` профилине
+салыштырмалуу ылдамдык да көрсөтүлөт.
+
+    python benchmarks/bench_profiles.py [--sentences 2000] [--categories dates prose]
+"""
+
+import argparse
+
+from kyrgyz_normalizer import KyrgyzTextNormalizer
+from kyrgyz_normalizer.bench import CATEGORIES, generate_corpus, measure
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sentences', type=int, default=2000)
+    parser.add_argument('--categories', nargs='+', default=list(CATEGORIES) + ['mixed'])
+    args = parser.parse_args()
+
+    profiles = list(KyrgyzTextNormalizer.PROFILES)
+    normalizers = {name: KyrgyzTextNormalizer(profile=name).warmup() for name in profiles}
+    print(f"{'корпус':<14}" + ''.join(f"{name:>22}" for name in profiles))
+    for category in args.categories:
+        def corpus(category=category):
+            return generate_corpus(category, sentences=args.sentences, seed=0)
+
+        speeds = {name: measure(normalizer, corpus, memory_sample=0)['chars_per_s']
+                  for name, normalizer in normalizers.items()}
+        cells = [f"{speeds[name] / 1e3:9.0f} Kсимв/с {speeds[name] / speeds['full']:4.2f}x"
+                 for name in profiles]
+        print(f"{category:<14}" + ''.join(f"{cell:>22}" for cell in cells))
+
+
+if __name__ == '__main__':
+    main()
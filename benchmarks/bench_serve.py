@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Жүк тести: ``kyrgyz-normalizer serve``.
+
+Кызматты өзүнчө процессте иштетет (же ``--url``/``--unix`` менен даяр
+кызматка туташат), ``--clients`` кардар keep-alive байланыштары менен
+``POST /normalize`` жөнөтөт жана секундасына суроо-талаптарды,
+p50/p90/p99 кечигүүнү жана микро-пакеттердин орточо өлчөмүн чыгарат.
+
+    python benchmarks/bench_serve.py [--clients 32] [--duration 5] [--workers 4]
+    python benchmarks/bench_serve.py --window 0      # микро-пакетсиз салыштыруу
+"""
+
+import argparse
+import http.client
+import json
+import socket
+import subprocess
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
+
+from kyrgyz_normalizer.bench import generate_corpus
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path, timeout=30):
+        super().__init__('localhost', timeout=timeout)
+        self.path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.path)
+
+
+def start_server(args):
+    command = [sys.executable, '-m', 'kyrgyz_normalizer.cli', 'serve', '--window', str(args.window)]
+    if args.workers is not None:
+        command += ['--workers', str(args.workers)]
+    command += ['--unix', args.unix] if args.unix else ['--port', '0']
+    process = subprocess.Popen(command, stderr=subprocess.PIPE, text=True)
+    # "kyrgyz-normalizer serve: http://127.0.0.1:PORT (...)"
+    url = process.stderr.readline().split()[2]
+    return process, url
+
+
+def connect(url):
+    if url.startswith('unix:'):
+        return UnixHTTPConnection(url[len('unix:'):])
+    parts = urlsplit(url)
+    return http.client.HTTPConnection(parts.hostname, parts.port, timeout=30)
+
+
+def client(url, texts, stop, latencies, errors):
+    conn = connect(url)
+    i = 0
+    while not stop.is_set():
+        body = json.dumps({'text': texts[i % len(texts)]}).encode('utf-8')
+        i += 1
+        started = time.perf_counter()
+        try:
+            conn.request('POST', '/normalize', body=body,
+                         headers={'Content-Type': 'application/json'})
+            response = conn.getresponse()
+            response.read()
+            if response.status != 200:
+                errors.append(response.status)
+        except (OSError, http.client.HTTPException) as e:
+            errors.append(repr(e))
+            conn.close()
+            conn = connect(url)
+            continue
+        latencies.append(time.perf_counter() - started)
+    conn.close()
+
+
+def percentile(ordered, fraction):
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--clients', type=int, default=32)
+    parser.add_argument('--duration', type=float, default=5.0, help='секунд')
+    parser.add_argument('--url', help='Даяр кызмат, мис. http://127.0.0.1:8080 же unix:/path')
+    parser.add_argument('--unix', help='Кызматты Unix сокетинде иштетүү')
+    parser.add_argument('--workers', type=int, help='Кызматтын процесстери')
+    parser.add_argument('--window', type=float, default=2.0, help='Микро-пакет терезеси, мс')
+    args = parser.parse_args()
+
+    process = None
+    url = args.url
+    if url is None:
+        process, url = start_server(args)
+    try:
+        texts = list(generate_corpus('mixed', sentences=2000, seed=7))
+        stop = threading.Event()
+        latencies = [[] for _ in range(args.clients)]
+        errors = []
+        threads = [threading.Thread(target=client, args=(url, texts, stop, latencies[i], errors))
+                   for i in range(args.clients)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        time.sleep(args.duration)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        conn = connect(url)
+        conn.request('GET', '/health')
+        health = json.loads(conn.getresponse().read())
+        conn.close()
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    ordered = sorted(t for per_client in latencies for t in per_client)
+    if not ordered:
+        sys.exit(f"жооп жок, каталар: {errors[:5]}")
+    print(f"{url}: {args.clients} кардар, {elapsed:.1f} с, workers={health['workers']}, "
+          f"window={health['window_ms']:g} мс")
+    print(f"  {len(ordered) / elapsed:10.0f} суроо/с   ката: {len(errors)}")
+    print(f"  p50 {percentile(ordered, 0.50) * 1e3:7.2f} мс   p90 {percentile(ordered, 0.90) * 1e3:7.2f} мс"
+          f"   p99 {percentile(ordered, 0.99) * 1e3:7.2f} мс   max {ordered[-1] * 1e3:7.2f} мс")
+    print(f"  орточо микро-пакет: {health['mean_batch']:.1f} текст ({health['batches']} пакет)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк: ишке киргизүү (cold start).
+
+Ар бир өлчөө жаңы Python процессинде аткарылат: пакетти импорттоо,
+нормализаторду түзүү, биринчи чакыруунун кечигүүсү, ``warmup()`` жана
+экинчи нусканы түзүү. Медиана чыгарылат.
+
+    python benchmarks/bench_startup.py [-n 15]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+PROBE = r'''
+import json, time
+t0 = time.perf_counter()
+import kyrgyz_normalizer
+t1 = time.perf_counter()
+normalizer = kyrgyz_normalizer.KyrgyzTextNormalizer()
+t2 = time.perf_counter()
+normalizer.normalize("2024-жылы 15 км жол курулду, баасы 1500 сом")
+t3 = time.perf_counter()
+normalizer.normalize("Саат 12:30да КРдин 3-классында 50% арзандатуу")
+t4 = time.perf_counter()
+normalizer.warmup()
+t5 = time.perf_counter()
+kyrgyz_normalizer.KyrgyzTextNormalizer().warmup()
+t6 = time.perf_counter()
+print(json.dumps({
+    "import": t1 - t0, "init": t2 - t1, "first_call": t3 - t2,
+    "second_call": t4 - t3, "warmup": t5 - t4, "second_instance": t6 - t5,
+}))
+'''
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('-n', '--runs', type=int, default=15)
+    args = parser.parse_args()
+
+    runs = []
+    for _ in range(args.runs):
+        out = subprocess.run([sys.executable, '-c', PROBE], capture_output=True,
+                             text=True, check=True).stdout
+        runs.append(json.loads(out))
+
+    print(f"{args.runs} процесс, медиана:")
+    for key in runs[0]:
+        value = statistics.median(run[key] for run in runs)
+        print(f"  {key:<16} {value * 1000:7.2f} мс")
+
+
+if __name__ == '__main__':
+    main()
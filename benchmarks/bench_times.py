@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Микро-бенчмарк: убакытты сөзгө айландыруу (``_time_to_words``).
+
+Жарактуу убакыттардын бөлүшүлгөн таблицасын (ар бир саат, мүнөт жана
+суффикс бир жолу эсептелет) ар бир дал келүүдө сандарды, суффикстердин
+таблицасын жана сингармонизмди кайра караган мурунку ыкма менен
+салыштырат — транспорттун графиктери жана телепрограммалар сыяктуу
+убакыттарга толгон текстте.
+
+    python benchmarks/bench_times.py [--lines 2000]
+"""
+
+import argparse
+import random
+import timeit
+
+from kyrgyz_normalizer import KyrgyzTextNormalizer
+from kyrgyz_normalizer.bench import generate_corpus
+
+
+class Uncached(KyrgyzTextNormalizer):
+    """Мурунку ыкма: ар бир дал келүүдө толук эсептөө."""
+
+    def _time_to_words(self, hours, minutes_str, suffix=None):
+        return self._compute_time_words(hours, minutes_str, suffix)
+
+
+_SUFFIXES = ('', 'да', 'дө', 'га', 'гө', 'та', 'те', 'ка', 'ке')
+
+
+def timetable(lines, seed=0):
+    """Графиктин саптары: ``Бишкек 06:15 – Ош 14.40та``."""
+    rng = random.Random(seed)
+    stops = ('Бишкек', 'Ош', 'Каракол', 'Нарын', 'Талас', 'Токмок', 'Балыкчы')
+    rows = []
+    for _ in range(lines):
+        times = [f"{rng.randrange(24):02d}:{rng.randrange(60):02d}{rng.choice(_SUFFIXES)}"
+                 for _ in range(4)]
+        rows.append(f"{rng.choice(stops)} {times[0]}, {times[1]}, {times[2]} жана "
+                    f"{times[3]} жөнөйт, акыркы рейс {rng.randrange(24)}.{rng.randrange(60):02d}да.")
+    return rows
+
+
+def bench(label, normalizer, texts, repeat=5):
+    best = min(timeit.repeat(lambda: [normalizer.normalize(text) for text in texts],
+                             number=1, repeat=repeat))
+    chars = sum(map(len, texts))
+    print(f"  {label:<20} {chars / best / 1e3:8.0f} Kсимв/с")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--lines', type=int, default=2000)
+    args = parser.parse_args()
+
+    corpora = {
+        'график': timetable(args.lines),
+        'times корпусу': list(generate_corpus('times', sentences=args.lines, seed=0)),
+    }
+    stages = ('time', 'time_dot_sfx', 'remaining_numbers')
+    new = KyrgyzTextNormalizer(profile=stages).warmup()
+    old = Uncached(profile=stages).warmup()
+    for name, texts in corpora.items():
+        assert [old.normalize(text) for text in texts] == [new.normalize(text) for text in texts]
+        print(name)
+        before = bench('толук эсептөө', old, texts)
+        after = bench('таблица', new, texts)
+        print(f"  {'ылдамдоо':<20} {before / after:8.2f}x")
+
+    sfx = [(h, f'{m:02d}', s or None) for h in range(24) for m in range(60) for s in _SUFFIXES]
+    print('бир чакыруу (бардык убакыттар)')
+    for label, normalizer in (('толук эсептөө', old), ('таблица', new)):
+        best = min(timeit.repeat(lambda: [normalizer._time_to_words(*args) for args in sfx],
+                                 number=1, repeat=5))
+        print(f"  {label:<20} {best / len(sfx) * 1e9:8.0f} нс/убакыт")
+
+
+if __name__ == '__main__':
+    main()
@@ -12,29 +12,133 @@
     from kyrgyz_normalizer import KyrgyzTextNormalizer
     normalizer = KyrgyzTextNormalizer()
     result = normalizer.normalize("Баасы $500")
+
+    # кайталанган тексттер кэштен алынат
+    from kyrgyz_normalizer import cache_info
+    cache_info()   # CacheInfo(hits=..., misses=..., evictions=..., ...)
+
+    # кайсы этап канча убакыт алганы жана кайсы эреже иштегени
+    normalizer.trace("Саат 12:30да").format()
+
+    # көп тексттер, бардык процессордук ядролордо
+    from kyrgyz_normalizer import normalize_batch
+    results = normalize_batch(sentences, workers=8)
+
+    # көп ГБ файл: mmap бөлүктөрү процесстерде, эс тутум чектелген
+    from kyrgyz_normalizer import normalize_file
+    normalize_file("crawl.txt", "crawl.norm.txt", workers=16)
+
+    # бир узун документ бир нече ядродо (жыйынтык normalize() менен бирдей)
+    from kyrgyz_normalizer import normalize_document
+    result = normalize_document(chapter, workers=8)
+
+    # asyncio серверлеринде (event loop бөгөттөлбөйт)
+    from kyrgyz_normalizer import anormalize
+    result = await anormalize("Баасы $500")
+
+    # LLM токендеринин агымы → TTS (коопсуз чекке чейин ошол замат)
+    from kyrgyz_normalizer import StreamingNormalizer
+    stream = StreamingNormalizer()
+    piece = stream.feed(token)   # ... акырында stream.flush()
+
+    # түзөтүлгөн документте өзгөргөн сүйлөмдөр гана кайра иштетилет
+    from kyrgyz_normalizer import NormalizedDocument
+    doc = NormalizedDocument(manuscript)
+    change = doc.edit(start, end, "2025")   # DocumentChange(start, end, text)
+
+    # колдонуучунун сөздүгү файлдан; иштеп жатканда кайра жүктөлөт
+    from kyrgyz_normalizer import load_dictionary
+    normalizer = KyrgyzTextNormalizer(overrides=load_dictionary("abbr.tsv"))
+    normalizer.update_overrides(load_dictionary("abbr.tsv"))
+    normalizer.add_entries("units", {"пуд": "пуд"})
 """
 
 __version__ = "0.2.1"
 
 from .normalizer import KyrgyzTextNormalizer
+from .batch import BatchItemError, normalize_batch
+from .cache import CacheInfo
+from .dictionary import load_dictionary
+from .document import DocumentChange, NormalizedDocument
+from .files import FileStats, normalize_file
+from .parallel import normalize_document
+from .streaming import StreamingNormalizer
+from .trace import StageTrace, Trace
+
+# normalize() колдонгон нормализатордун кэшинин өлчөмү: жазуулар жана
+# байттар (узун тексттер кэшти эс тутумда чексиз чоңойтпосун)
+DEFAULT_CACHE_SIZE = 4096
+DEFAULT_CACHE_BYTES = 16 * 1024 * 1024
 
 _default_normalizer = None
 
 
+def _get_default_normalizer():
+    global _default_normalizer
+    if _default_normalizer is None:
+        _default_normalizer = KyrgyzTextNormalizer(cache_size=DEFAULT_CACHE_SIZE,
+                                                   cache_bytes=DEFAULT_CACHE_BYTES)
+    return _default_normalizer
+
+
 def normalize(text: str) -> str:
     """
     Текстти нормализациялоо (ыңгайлуу функция).
 
+    Кайталанган тексттердин жыйынтыгы LRU кэштен алынат
+    (``DEFAULT_CACHE_SIZE`` жазуу, ``DEFAULT_CACHE_BYTES`` байт).
+
     Args:
         text: Кирүүчү текст
 
     Returns:
         Нормализацияланган текст (сандар сөзгө айландырылган)
     """
-    global _default_normalizer
-    if _default_normalizer is None:
-        _default_normalizer = KyrgyzTextNormalizer()
-    return _default_normalizer.normalize(text)
+    return _get_default_normalizer().normalize(text)
+
+
+def cache_info() -> CacheInfo:
+    """``normalize()`` кэшинин статистикасы: hits, misses, evictions, size, ..."""
+    return _get_default_normalizer().cache_info()
+
+
+def cache_clear() -> None:
+    """``normalize()`` кэшин тазалоо."""
+    _get_default_normalizer().cache_clear()
+
+
+async def anormalize(text: str) -> str:
+    """
+    ``normalize()`` дин asyncio варианты.
+
+    Узун тексттер жиптер пулунда иштетилет, кыска тексттер — ошол замат.
+    Параметрлерди өзгөртүү үчүн ``kyrgyz_normalizer.aio.AsyncNormalizer``.
+    """
+    from .aio import anormalize as _anormalize
+    return await _anormalize(text)
+
+
+async def anormalize_many(texts) -> list:
+    """
+    ``normalize_batch()`` тин asyncio варианты (киргизүү тартибинде;
+    катасы бар элементтин ордунда ``BatchItemError``).
+    """
+    from .aio import anormalize_many as _anormalize_many
+    return await _anormalize_many(texts)
+
+
+def __getattr__(name):
+    # asyncio импорту кымбат — ``aio`` модулу керек болгондо гана жүктөлөт
+    if name == "AsyncNormalizer":
+        from .aio import AsyncNormalizer
+        return AsyncNormalizer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-__all__ = ["KyrgyzTextNormalizer", "normalize", "__version__"]
+__all__ = [
+    "KyrgyzTextNormalizer", "normalize", "normalize_batch", "BatchItemError",
+    "normalize_file", "FileStats", "normalize_document",
+    "anormalize", "anormalize_many", "AsyncNormalizer", "StreamingNormalizer",
+    "NormalizedDocument", "DocumentChange", "load_dictionary",
+    "cache_info", "cache_clear", "CacheInfo", "Trace", "StageTrace", "__version__",
+]
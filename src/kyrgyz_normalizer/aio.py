@@ -0,0 +1,262 @@
+"""
+asyncio серверлери үчүн нормализация (event loop бөгөттөлбөйт).
+
+Узун тексттер чектелген executor'го (жиптер же процесстер) жөнөтүлөт;
+бир убакта иштеген тапшырмалардын саны чектелет — чек толсо, чакыруучу
+күтөт (backpressure). Кыска тексттер жөнөтүүнүн чыгымын болтурбоо үчүн
+ошол замат event loop'то иштетилет.
+
+Колдонуу:
+    from kyrgyz_normalizer import anormalize, anormalize_many
+    text = await anormalize("Баасы 1500 сом")
+    texts = await anormalize_many(paragraphs)
+
+    # өз параметрлери менен
+    from kyrgyz_normalizer.aio import AsyncNormalizer
+    async with AsyncNormalizer(executor='process', max_workers=4) as normalizer:
+        text = await normalizer.normalize(paragraph)
+"""
+
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from .batch import BatchItemError, _chunks, _normalize_items, auto_chunksize
+from .normalizer import KyrgyzTextNormalizer
+
+# Мындан кыска тексттер (символ) event loop'то иштетилет: loop ~100 мкс'тан
+# ашык бөгөттөлбөйт, ал эми жиптер пулуна жөнөтүү ~40-50 мкс турат
+# (benchmarks/bench_async.py)
+DEFAULT_INLINE_THRESHOLD = 128
+
+EXECUTORS = ('thread', 'process')
+
+_process_normalizer = None
+_process_config = None
+
+
+def _get_process_normalizer(config):
+    """``config`` — ``(engine, options)``; процесстин нормализатору ошол параметрлер менен."""
+    global _process_normalizer, _process_config
+    if _process_normalizer is None or _process_config != config:
+        engine, options = config
+        _process_normalizer = KyrgyzTextNormalizer(engine=engine, **options)
+        _process_config = config
+    return _process_normalizer
+
+
+def _process_normalize(config, text):
+    return _get_process_normalizer(config).normalize(text)
+
+
+def _process_normalize_items(config, start, texts):
+    return _normalize_items(_get_process_normalizer(config), start, texts)
+
+
+class AsyncNormalizer:
+    """
+    ``KyrgyzTextNormalizer`` үчүн asyncio интерфейси.
+
+    ``'thread'`` executor'до бардык жиптер бир нормализаторду бөлүшөт.
+    ``'process'`` executor'до ар бир процесс өз нормализаторун ошол эле
+    параметрлер (``engine``, ``profile``, ``overrides``, ``cache_size``
+    ж.б.) менен түзөт, бул көп ядрону колдонууга мүмкүндүк берет.
+    Параметрлер ар бир тапшырма менен жөнөтүлөт, ошондуктан бир
+    ``ProcessPoolExecutor`` ар кандай ``AsyncNormalizer`` лер үчүн да
+    колдонула берет; ``normalizer.update_overrides()`` процесстерге
+    жетпейт.
+    """
+
+    def __init__(self, executor='thread', max_workers=None, max_concurrency=None,
+                 inline_threshold=DEFAULT_INLINE_THRESHOLD, engine='scan', **options):
+        """
+        Args:
+            executor: ``'thread'``, ``'process'`` же даяр
+                ``concurrent.futures.Executor`` (аны жабуу — чакыруучунун иши)
+            max_workers: Executor'дун жиптери/процесстери
+                (демейки: ``os.cpu_count()``)
+            max_concurrency: Бир убакта executor'до турган тапшырмалардын
+                эң көп саны (демейки: ``2 * max_workers``); чек толгондо
+                жаңы чакыруулар орун бошогонго чейин күтөт
+            inline_threshold: Мындан кыска тексттер (символ) event loop'то
+                иштетилет; ``0`` — баары executor'до
+            engine: ``KyrgyzTextNormalizer`` кыймылдаткычы
+            **options: ``KyrgyzTextNormalizer`` үчүн калган параметрлер
+                (``cache_size``, ``overrides`` ж.б.)
+        """
+        if isinstance(executor, Executor):
+            self._executor, self._owns_executor = executor, False
+            self._processes = isinstance(executor, ProcessPoolExecutor)
+        elif executor in EXECUTORS:
+            self._executor, self._owns_executor = None, True
+            self._processes = executor == 'process'
+        else:
+            raise ValueError(f"Белгисиз executor: {executor!r} ({', '.join(EXECUTORS)})")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_concurrency = max_concurrency or 2 * self.max_workers
+        if self.max_concurrency < 1:
+            raise ValueError(f"max_concurrency оң сан болушу керек: {self.max_concurrency}")
+        self.inline_threshold = inline_threshold
+        self.engine = engine
+        self.normalizer = KyrgyzTextNormalizer(engine=engine, **options)
+        self._config = (engine, options)
+        self._loop = None
+        self._semaphore = None
+
+    # ================================================================
+    # Executor жана чек
+    # ================================================================
+
+    def _get_executor(self):
+        if self._executor is None:
+            if self._processes:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix='kyrgyz-normalizer')
+        return self._executor
+
+    def _get_semaphore(self):
+        # asyncio.Semaphore бир loop'ко байланат (Python < 3.10)
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def _submit(self, func, *args):
+        """
+        Тапшырманы executor'го жөнөтөт жана жыйынтыгын күтөт.
+
+        Орун тапшырма чындап бүткөндө гана бошойт: күтүү токтотулса
+        (cancel), кезектеги тапшырма жокко чыгарылат, иштеп жаткан
+        тапшырма бүткөнчө орунду ээлеп турат — executor'дун жүгү
+        ``max_concurrency`` дан ашпайт.
+        """
+        semaphore = self._get_semaphore()
+        await semaphore.acquire()
+        loop = self._loop
+        try:
+            future = self._get_executor().submit(func, *args)
+        except BaseException:
+            semaphore.release()
+            raise
+
+        def release(_future):
+            try:
+                loop.call_soon_threadsafe(semaphore.release)
+            except RuntimeError:  # loop жабылган
+                pass
+
+        future.add_done_callback(release)
+        return await asyncio.wrap_future(future)
+
+    # ================================================================
+    # Нормализация
+    # ================================================================
+
+    async def normalize(self, text):
+        """
+        Текстти нормализациялайт; узун текст executor'до иштетилет.
+
+        Returns:
+            Нормализацияланган текст (``KyrgyzTextNormalizer.normalize`` менен бирдей)
+        """
+        if not isinstance(text, str) or len(text) < self.inline_threshold:
+            return self.normalizer.normalize(text)
+        if self._processes:
+            return await self._submit(_process_normalize, self._config, text)
+        return await self._submit(self.normalizer.normalize, text)
+
+    async def normalize_many(self, texts, chunksize=None):
+        """
+        Тексттердин тизмесин нормализациялайт (киргизүү тартибинде).
+
+        Тексттер бөлүктөргө бириктирилип жөнөтүлөт; бир убакта эң көп
+        ``max_concurrency`` бөлүк иштетилет. Бир элементтин катасы бүт
+        тизмени токтотпойт — ордунда ``BatchItemError`` болот.
+
+        Args:
+            texts: Тексттердин итерабели
+            chunksize: Бир тапшырмадагы тексттердин саны
+                (демейки: ``auto_chunksize`` боюнча)
+
+        Returns:
+            Нормализацияланган тексттер жана/же ``BatchItemError``
+        """
+        texts = list(texts)
+        if chunksize is None:
+            total_chars = sum(len(t) for t in texts if isinstance(t, str))
+            chunksize = auto_chunksize(len(texts), total_chars, self.max_workers)
+        results = [None] * len(texts)
+        chunks = _chunks(texts, chunksize)
+
+        async def worker():
+            for start, chunk in chunks:
+                results[start:start + len(chunk)] = await self._normalize_chunk(start, chunk)
+
+        n_workers = min(self.max_concurrency, -(-len(texts) // chunksize))
+        tasks = [asyncio.ensure_future(worker()) for _ in range(n_workers)]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return results
+
+    async def _normalize_chunk(self, start, chunk):
+        if sum(len(t) for t in chunk if isinstance(t, str)) < self.inline_threshold:
+            return _normalize_items(self.normalizer, start, chunk)
+        try:
+            if self._processes:
+                return await self._submit(_process_normalize_items, self._config, start, chunk)
+            return await self._submit(_normalize_items, self.normalizer, start, chunk)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:  # процесс кулады же жыйынтык сериализацияланбады
+            message = f"{type(e).__name__}: {e}"
+            return [BatchItemError(start + i, text, message) for i, text in enumerate(chunk)]
+
+    # ================================================================
+    # Жабуу
+    # ================================================================
+
+    def close(self, wait=True):
+        """Өзү түзгөн executor'ду жабат (берилген executor'го тийбейт)."""
+        executor, self._executor = self._executor, None
+        if executor is not None and self._owns_executor:
+            executor.shutdown(wait=wait)
+
+    async def aclose(self):
+        """``close()`` — event loop'ту бөгөттөбөй."""
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+
+_default_async = None
+
+
+def _get_default_async():
+    global _default_async
+    if _default_async is None:
+        from . import DEFAULT_CACHE_BYTES, DEFAULT_CACHE_SIZE
+        _default_async = AsyncNormalizer(cache_size=DEFAULT_CACHE_SIZE,
+                                         cache_bytes=DEFAULT_CACHE_BYTES)
+    return _default_async
+
+
+async def anormalize(text):
+    """``normalize()`` дин asyncio варианты (жиптер пулу, демейки параметрлер)."""
+    return await _get_default_async().normalize(text)
+
+
+async def anormalize_many(texts):
+    """``normalize_batch()`` тин asyncio варианты (жиптер пулу, демейки параметрлер)."""
+    return await _get_default_async().normalize_many(texts)
@@ -0,0 +1,276 @@
+"""
+Көп тексттерди параллелдүү нормализациялоо (процесстер пулу).
+
+Колдонуу:
+    from kyrgyz_normalizer import normalize_batch
+    results = normalize_batch(sentences, workers=8)
+
+    # чоң файлдар үчүн — эс тутум чектелген агым
+    from kyrgyz_normalizer.batch import iter_normalize
+    for result in iter_normalize(lines, workers=8):
+        ...
+"""
+
+import os
+from collections import deque
+
+from .normalizer import KyrgyzTextNormalizer
+
+# Бир бөлүккө келген символдордун болжолдуу саны: IPC чыгымын жабуу үчүн
+CHUNK_TARGET_CHARS = 64 * 1024
+MAX_CHUNKSIZE = 4096
+
+_worker_normalizer = None
+
+
+class BatchItemError(Exception):
+    """
+    Бир элементти нормализациялоодо чыккан ката.
+
+    ``normalize_batch`` мындай объектти жыйынтыктар тизмесинде ошол
+    элементтин ордуна кайтарат; калган элементтер иштетиле берет.
+    """
+
+    def __init__(self, index, text, message):
+        super().__init__(f"#{index}: {message}")
+        self.index = index
+        self.text = text
+        self.message = message
+
+    def __reduce__(self):
+        return (BatchItemError, (self.index, self.text, self.message))
+
+
+def _init_worker(engine, profile='full'):
+    global _worker_normalizer
+    _worker_normalizer = KyrgyzTextNormalizer(engine=engine, profile=profile)
+
+
+def _normalize_chunk(start, texts):
+    return _normalize_items(_worker_normalizer, start, texts)
+
+
+def _normalize_items(normalizer, start, texts):
+    results = []
+    for offset, text in enumerate(texts):
+        try:
+            results.append(normalizer.normalize(text))
+        except Exception as e:  # бир элементтин катасы бүт пакетти токтотпойт
+            results.append(BatchItemError(start + offset, text, f"{type(e).__name__}: {e}"))
+    return results
+
+
+def auto_chunksize(n_items, total_chars, workers):
+    """
+    Бөлүктүн өлчөмүн киргизүүнүн узундугуна жараша тандайт.
+
+    Ар бир процесске жок дегенде 4 бөлүк тийет (жүк тең бөлүнөт), бирок
+    бөлүк ``CHUNK_TARGET_CHARS`` символдон кичине болбошу керек
+    (кыска сүйлөмдөр үчүн IPC чыгымы азаят).
+    """
+    if n_items == 0:
+        return 1
+    by_balance = -(-n_items // (workers * 4))
+    avg_chars = max(1, total_chars // n_items)
+    by_size = max(1, CHUNK_TARGET_CHARS // avg_chars)
+    return max(1, min(MAX_CHUNKSIZE, by_balance, by_size))
+
+
+def _chunks(texts, chunksize):
+    chunk = []
+    start = 0
+    for text in texts:
+        chunk.append(text)
+        if len(chunk) == chunksize:
+            yield start, chunk
+            start += len(chunk)
+            chunk = []
+    if chunk:
+        yield start, chunk
+
+
+def iter_normalize(texts, workers=None, chunksize=256, engine='scan', max_pending=None,
+                   profile='full'):
+    """
+    Тексттерди агым катары нормализациялоо.
+
+    Киргизүү акырындык менен окулат жана бир убакта эң көп
+    ``max_pending`` бөлүк иштетилет, ошондуктан эс тутум киргизүүнүн
+    көлөмүнө көз каранды эмес. Жыйынтыктар киргизүү тартибинде чыгат.
+    Процесс куласа, пул кайра түзүлөт жана агым уланат: ``BatchItemError``
+    ошол процессти кулаткан бөлүктүн элементтерине гана коюлат.
+
+    Args:
+        texts: Тексттердин итерабели (генератор болушу мүмкүн)
+        workers: Процесстердин саны (демейки: ``os.cpu_count()``);
+            ``1`` — учурдагы процессте иштетүү
+        chunksize: Бир тапшырмадагы тексттердин саны
+        engine: ``KyrgyzTextNormalizer`` кыймылдаткычы
+        max_pending: Иштетилип жаткан бөлүктөрдүн эң көп саны
+            (демейки: ``2 * workers``)
+        profile: ``KyrgyzTextNormalizer`` профили
+
+    Yields:
+        Нормализацияланган текст же ``BatchItemError``
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1:
+        normalizer = KyrgyzTextNormalizer(engine=engine, profile=profile)
+        for start, chunk in _chunks(texts, chunksize):
+            yield from _normalize_items(normalizer, start, chunk)
+        return
+
+    if max_pending is None:
+        max_pending = 2 * workers
+    jobs = ((_normalize_chunk, start, chunk) for start, chunk in _chunks(texts, chunksize))
+    for (_, start, chunk), outcome in _run_ordered(jobs, workers, max_pending, (engine, profile)):
+        if isinstance(outcome, Exception):  # процесс кулады же жыйынтык сериализацияланбады
+            message = f"{type(outcome).__name__}: {outcome}"
+            outcome = [BatchItemError(start + i, text, message) for i, text in enumerate(chunk)]
+        yield from outcome
+
+
+def _run_ordered(jobs, workers, max_pending, initargs):
+    """
+    Тапшырмаларды процесстер пулунда аткарып, жыйынтыктарды тартиби менен чыгарат.
+
+    Бир убакта эң көп ``max_pending`` тапшырма иштетилет. Процесс кулап
+    пул бузулса (``BrokenProcessPool``), пул кайра түзүлөт жана бүтпөгөн
+    тапшырмалар кайра тапшырылат: алгач пулга жөнөтүлүп калышы мүмкүн
+    болгон биринчилери бир-бирден аткарылат, ошондо пулду кайра бузган
+    тапшырма гана ката менен бүтөт.
+
+    Args:
+        jobs: ``(функция, *аргументтер)`` итерабели
+        workers: Процесстердин саны
+        max_pending: Иштетилип жаткан тапшырмалардын эң көп саны
+        initargs: ``_init_worker`` аргументтери
+
+    Yields:
+        ``(тапшырма, жыйынтык)`` — тапшырма аткарылбаса жыйынтыктын
+        ордунда ``Exception``
+    """
+    pool = _RecoveringPool(workers, initargs)
+    pending = deque()
+    try:
+        for job in jobs:
+            pending.append([job, pool.submit(job), False])
+            if len(pending) >= max_pending:
+                yield pool.collect(pending)
+        while pending:
+            yield pool.collect(pending)
+    finally:
+        pool.shutdown(pending)
+
+
+class _RecoveringPool:
+    """``ProcessPoolExecutor`` — процесс кулаганда кайра түзүлөт."""
+
+    def __init__(self, workers, initargs):
+        # concurrent.futures.process импорту кымбат — пакетти импорттоо тез болсун
+        from concurrent.futures import Future, ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+
+        self.workers = workers
+        self.initargs = initargs
+        self._future = Future
+        self._executor = ProcessPoolExecutor
+        self._broken = BrokenProcessPool
+        self.pool = self._new_pool()
+
+    def _new_pool(self):
+        return self._executor(max_workers=self.workers, initializer=_init_worker,
+                              initargs=self.initargs)
+
+    def submit(self, job):
+        try:
+            return self.pool.submit(*job)
+        except self._broken as e:  # пул мурда эле бузулган — жыйнаганда калыбына келет
+            future = self._future()
+            future.set_exception(e)
+            return future
+
+    def collect(self, pending):
+        """``pending`` тин биринчи тапшырмасынын ``(тапшырма, жыйынтык)`` ун кайтарат."""
+        while True:
+            job, future, crashed = pending[0]
+            try:
+                outcome = future.result()
+            except self._broken as e:
+                if not crashed:
+                    self._recover(pending)
+                    continue
+                outcome = e
+            except Exception as e:
+                outcome = e
+            pending.popleft()
+            return job, outcome
+
+    def _recover(self, pending):
+        self.shutdown()
+        self.pool = self._new_pool()
+        # Кулатуучу тапшырма пулга жөнөтүлгөндөрдүн арасында: ар бир
+        # процессте бирөө жана кезекте эң көп ``workers + 1``
+        suspects = 2 * self.workers + 1
+        for entry in pending:
+            future = entry[1]
+            if future.done() and not isinstance(future.exception(), self._broken):
+                continue
+            entry[1] = future = self.submit(entry[0])
+            if not suspects:
+                continue
+            suspects -= 1
+            try:
+                future.result()
+            except self._broken:
+                entry[2] = True
+                suspects = 0
+                self.shutdown()
+                self.pool = self._new_pool()
+            except Exception:
+                pass
+
+    def shutdown(self, pending=()):
+        """Пулду жабат; ``pending`` тин баштала элек тапшырмалары жокко чыгарылат."""
+        # ``shutdown(cancel_futures=True)`` Python 3.9дан бери гана бар
+        running = False
+        for entry in pending:
+            future = entry[1]
+            running |= not future.cancel() and not future.done()
+        # Иштеп жаткан тапшырмаларды күтпөйбүз — генератор эрте жабылган
+        self.pool.shutdown(wait=not running)
+
+
+def normalize_batch(texts, workers=None, chunksize=None, engine='scan', profile='full'):
+    """
+    Тексттердин тизмесин процесстер пулунда нормализациялоо.
+
+    Ар бир процесс нормализаторду бир жолу, баштапкы инициализацияда
+    түзөт. Жыйынтыктар киргизүү тартибинде кайтарылат.
+
+    Args:
+        texts: Тексттердин итерабели
+        workers: Процесстердин саны (демейки: ``os.cpu_count()``);
+            ``1`` — учурдагы процессте иштетүү
+        chunksize: Бир тапшырмадагы тексттердин саны
+            (демейки: ``auto_chunksize`` боюнча)
+        engine: ``KyrgyzTextNormalizer`` кыймылдаткычы
+        profile: ``KyrgyzTextNormalizer`` профили (аталыш же этаптардын тизмеси)
+
+    Returns:
+        Нормализацияланган тексттердин тизмеси. Иштетилбей калган
+        элементтин ордунда ``BatchItemError`` болот.
+    """
+    texts = list(texts)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunksize is None:
+        total_chars = sum(len(t) for t in texts if isinstance(t, str))
+        chunksize = auto_chunksize(len(texts), total_chars, workers)
+    if len(texts) <= chunksize:
+        workers = 1
+    # Бардык бөлүктөр бир эле учурда тапшырылат: киргизүү баары бир эс тутумда
+    return list(iter_normalize(texts, workers, chunksize, engine,
+                               max_pending=-(-len(texts) // chunksize), profile=profile))
@@ -0,0 +1,17 @@
+"""
+``normalize`` ылдамдыгынын бенчмарктары.
+
+Семиотикалык класстар (даталар, убакыт, акча, бирдиктер, кыскартуулар,
+рим сандары, телефондор, жөнөкөй текст) боюнча кайра чыгарылуучу жасалма
+корпустар жана 1 KB – 100 MB аралаш корпустар; өткөрүү жөндөмдүүлүгү,
+p50/p99 кечигүү жана эс тутум JSON түрүндө жазылат.
+
+Колдонуу:
+    kyrgyz-normalizer bench -o results.json
+    kyrgyz-normalizer bench --sizes 1KB 1MB --compare results.json
+"""
+
+from .corpus import CATEGORIES, generate_corpus, parse_size
+from .runner import compare, measure, run_suite
+
+__all__ = ["CATEGORIES", "generate_corpus", "parse_size", "measure", "run_suite", "compare"]
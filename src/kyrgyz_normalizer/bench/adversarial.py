@@ -0,0 +1,119 @@
+"""
+Бузук жана атайын түзүлгөн тексттер: этаптардын сызыктуулугун текшерүү.
+
+Ар бир учур (``ADVERSARIAL``) берилген узундуктагы текстти түзөт:
+цифралардын узун катарлары, бөлгүчтөрдүн ташкыны, рим тамгаларынын
+кайталанышы ж.б. — сайттардан алынган "таштанды" текстте кездешүүчү
+нерселер. ``check_scaling`` текстти ``size`` жана ``size * factor``
+узундугунда ``trace()`` менен иштетип, ар бир этаптын убактысынын
+өсүшүн салыштырат: сызыктуу этап ``factor`` эсе, квадраттык этап
+``factor ** 2`` эсе жайлайт.
+
+Колдонуу:
+    for row in check_scaling(KyrgyzTextNormalizer(), 'digits', size=1000):
+        if not row.ok:
+            print(row.stage, row.ratio)
+"""
+
+import random
+from collections import namedtuple
+
+# Учурдун аты → кайталануучу үлгү (текст ушул үлгүнү кайталап түзүлөт)
+_PATTERNS = {
+    'digits': '1234567890',             # бир узун сан
+    'digit_groups': '123 ',             # 123 123 123 ... (боштуктуу сан)
+    'dotted': '123.',                   # 123.123.123... (дата/версия)
+    'slashed': '12/',                   # 12/12/12...
+    'ranges': '1-',                     # 1-1-1-... (диапазон/минус)
+    'dash_flood': '-',
+    'separators': '.,:;/-–',
+    'dots_spaces': '. ',
+    'roman': 'I',                       # IIIIII...
+    'roman_words': 'XIV ',
+    'roman_ranges': 'XX - ',
+    'caps': 'КРБУУ',                    # баш тамгалардын узун сөзү
+    'email_local': 'a.',                # a.a.a.a... (@ аягында)
+    'apostrophes': "ab'",
+    'percent': '1%',
+    'math': '1+',
+    'times': '12:3',
+    'units': '1 км',
+    'currency': '1$',
+}
+
+# Туш келди таштанды үчүн символдор
+_GARBAGE = '0123456789 .,-–/:%+$IVXаАжКР\'"№@'
+
+
+def _repeat(unit, size):
+    return (unit * (size // len(unit) + 1))[:size]
+
+
+def _dash_spaces(size):
+    # 5<боштуктар>-<боштуктар>x — эки \s* арасындагы боштуктар
+    left = max(0, size - 3) // 2
+    return '5' + ' ' * left + '-' + ' ' * max(0, size - 3 - left) + 'x'
+
+
+def _garbage(size):
+    rng = random.Random(size)
+    return ''.join(rng.choice(_GARBAGE) for _ in range(size))
+
+
+ADVERSARIAL = tuple(_PATTERNS) + ('dash_spaces', 'garbage')
+
+
+def adversarial_text(case, size):
+    """
+    ``case`` учурунун ``size`` символдуу тексти.
+
+    Raises:
+        ValueError: Белгисиз учур
+    """
+    if case in _PATTERNS:
+        text = _repeat(_PATTERNS[case], size)
+        return text[:-1] + '@' if case == 'email_local' else text
+    if case == 'dash_spaces':
+        return _dash_spaces(size)
+    if case == 'garbage':
+        return _garbage(size)
+    raise ValueError(f"Белгисиз учур: {case!r} ({', '.join(ADVERSARIAL)})")
+
+
+Scaling = namedtuple('Scaling', 'case stage small large ratio ok')
+
+
+def _stage_seconds(normalizer, text, repeat):
+    """``{этап: эң жакшы убакыт}`` — ``repeat`` жолу ``trace()``."""
+    best = {}
+    for _ in range(repeat):
+        for stage in normalizer.trace(text).stages:
+            best[stage.stage] = min(best.get(stage.stage, float('inf')), stage.seconds)
+    return best
+
+
+def check_scaling(normalizer, case, size=1000, factor=4, repeat=3, tolerance=2.5,
+                  floor=0.002):
+    """
+    ``case`` учурунда ар бир этаптын убактысы узундук менен сызыктуу өсөбү.
+
+    Args:
+        normalizer: ``KyrgyzTextNormalizer`` (алдын ала ``warmup()`` кылынган)
+        case: ``ADVERSARIAL`` тизмесинен
+        size: Кичине тексттин узундугу (символ)
+        factor: Чоң текст канча эсе узун
+        repeat: Ар бир өлчөөнүн кайталанышы (эң жакшысы алынат)
+        tolerance: Убакыт ``factor * tolerance`` эседен ашык өссө — сызыктуу эмес
+        floor: Чоң тексттеги убактысы мындан аз (секунд) этап текшерилбейт
+
+    Returns:
+        Этаптардын ``Scaling(case, stage, small, large, ratio, ok)`` тизмеси
+    """
+    small = _stage_seconds(normalizer, adversarial_text(case, size), repeat)
+    large = _stage_seconds(normalizer, adversarial_text(case, size * factor), repeat)
+    rows = []
+    for stage, seconds in large.items():
+        ratio = seconds / max(small.get(stage, 0.0), 1e-9)
+        ok = seconds < floor or ratio <= factor * tolerance
+        rows.append(Scaling(case, stage, small.get(stage, 0.0), seconds, ratio, ok))
+    return rows
@@ -0,0 +1,232 @@
+"""
+Семиотикалык класстар боюнча жасалма корпустар.
+
+Ар бир категория үчүн сүйлөмдөр шаблондордон ``random.Random(seed)``
+менен түзүлөт: бир эле ``seed`` ар дайым бир эле корпусту берет.
+
+Колдонуу:
+    for sentence in generate_corpus('dates', sentences=1000, seed=0):
+        ...
+    for sentence in generate_corpus('mixed', size=parse_size('10MB')):
+        ...
+"""
+
+import random
+import re
+from itertools import count
+
+from .. import tables
+
+CATEGORIES = (
+    'dates', 'times', 'currency', 'units', 'abbreviations', 'roman', 'phones', 'prose',
+)
+
+# Аралаш корпустагы категориялардын салмактары (жөнөкөй текст басымдуу)
+MIXED_WEIGHTS = {
+    'dates': 2, 'times': 1, 'currency': 2, 'units': 2, 'abbreviations': 2,
+    'roman': 1, 'phones': 1, 'prose': 6,
+}
+
+_SIZE_UNITS = {'': 1, 'B': 1, 'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3}
+
+_SUBJECTS = (
+    'Шаардын мэриясы', 'Министрлик', 'Университет', 'Компания', 'Ассоциация',
+    'Облустук администрация', 'Райондук кеңеш', 'Мектептин жамааты', 'Фонд',
+)
+_PLACES = ('Бишкек', 'Ош', 'Каракол', 'Нарын', 'Талас', 'Жалал-Абад', 'Баткен', 'Токмок')
+_OBJECTS = (
+    'жаңы мектеп', 'көпүрө', 'оорукана', 'стадион', 'китепкана', 'жол', 'музей', 'парк',
+)
+_VERBS = (
+    'ачылды', 'курулду', 'оңдолду', 'кабыл алынды', 'жарыяланды', 'бекитилди',
+    'талкууланды', 'пайдаланууга берилди',
+)
+_PROSE = (
+    'Тоолордо кар эрте түштү', 'балдар мектепке кубанып барышты',
+    'дыйкандар түшүмдү жыйнап бүтүштү', 'шаардын көчөлөрү жашылданып калды',
+    'эл аралык конференция ийгиликтүү өттү', 'жаштар спорт менен машыгышат',
+    'китепканага жаңы китептер келди', 'аба ырайы бир аз жылыйт деп күтүлүүдө',
+    'көл жээгинде эс алуучулар көбөйдү', 'жолдордо жөө жүргүнчүлөр үчүн белгилер коюлду',
+    'мугалимдер жаңы окуу программасын талкуулашты', 'базарда жашылчалардын баасы төмөндөдү',
+)
+_CONNECTORS = (', ал эми ', ', бирок ', ' жана ', '. Ошондой эле ', ', ошондуктан ')
+_UNITS = ('км', 'м', 'см', 'кг', 'г', 'т', 'л', 'мл', 'га', 'м2', 'ГБ', 'МБ', 'км/ч', 'кВт')
+_CURRENCY_AFTER = ('сом', 'доллар', 'евро', 'рубль')
+_CURRENCY_BEFORE = ('$', '€', '₽')
+_ROMAN = (
+    (1000, 'M'), (900, 'CM'), (500, 'D'), (400, 'CD'), (100, 'C'), (90, 'XC'),
+    (50, 'L'), (40, 'XL'), (10, 'X'), (9, 'IX'), (5, 'V'), (4, 'IV'), (1, 'I'),
+)
+_MONTH_NAMES = tuple(tables.MONTHS[f'{m:02d}'] for m in range(1, 13))
+
+
+def _to_roman(num):
+    parts = []
+    for value, numeral in _ROMAN:
+        while num >= value:
+            parts.append(numeral)
+            num -= value
+    return ''.join(parts)
+
+
+def _date_parts(rng):
+    return rng.randint(1, 28), rng.randint(1, 12), rng.randint(1950, 2030)
+
+
+def _dates(rng):
+    d, m, y = _date_parts(rng)
+    subject, verb = rng.choice(_SUBJECTS), rng.choice(_VERBS)
+    return rng.choice((
+        f"{d:02d}.{m:02d}.{y} күнү {subject.lower()} тарабынан токтом {verb}.",
+        f"Келишим {y}-{m:02d}-{d:02d} датасында кол коюлган.",
+        f"{d} {_MONTH_NAMES[m - 1]} {y} жылы {rng.choice(_PLACES)} шаарында фестиваль болот.",
+        f"{y}-жылы {rng.choice(_PLACES)} шаарында {rng.choice(_OBJECTS)} {verb}.",
+        f"Арыздар {d:02d}/{m:02d}/{y} чейин кабыл алынат.",
+        f"{y}-{y + rng.randint(1, 5)}-жылдары {rng.choice(_OBJECTS)} курулат.",
+    ))
+
+
+def _times(rng):
+    h, mi = rng.randint(0, 23), rng.choice((0, 5, 10, 15, 20, 30, 45, 50))
+    return rng.choice((
+        f"Жыйын саат {h:02d}:{mi:02d}да башталат.",
+        f"Поезд {h}:{mi:02d} жөнөйт, {(h + 2) % 24}:{mi:02d} келет.",
+        f"Дүкөн {rng.randint(7, 10):02d}:00дөн {rng.randint(18, 22)}:00гө чейин иштейт.",
+        f"Түшкү тыныгуу {h:02d}:{mi:02d} - {(h + 1) % 24:02d}:{mi:02d}.",
+    ))
+
+
+def _currency(rng):
+    amount = rng.choice((rng.randint(1, 999), rng.randint(1000, 99999), rng.randint(1, 50) * 1000))
+    return rng.choice((
+        f"Баасы {amount} сом.",
+        f"Келишимдин суммасы {rng.choice(_CURRENCY_BEFORE)}{amount} түздү.",
+        f"Айлык {amount // 1000 or 1} {amount % 1000:03d} сом болду.",
+        f"Билеттер {amount}-{amount + rng.randint(100, 900)} {rng.choice(_CURRENCY_AFTER)} турат.",
+        f"Бюджетке {rng.randint(2, 900)} млн сом бөлүндү.",
+    ))
+
+
+def _units(rng):
+    value, unit = rng.randint(1, 999), rng.choice(_UNITS)
+    return rng.choice((
+        f"Аралык {value} {unit} түзөт.",
+        f"Жүктүн салмагы {value},{rng.randint(1, 9)} {unit} болду.",
+        f"{rng.choice(_PLACES)} шаарына чейин {value}-{value + rng.randint(5, 50)} {unit}.",
+        f"Жаңы {rng.choice(_OBJECTS)} {value} {unit} аянтты ээлейт.",
+    ))
+
+
+_KYRGYZ_ABBR = tuple(tables.KYRGYZ_ABBR)
+_ENGLISH_ABBR = tuple(tables.ENGLISH_ABBR)
+_SHORT_ABBR = tuple(tables.SHORT_ABBR)
+
+
+def _abbreviations(rng):
+    kg, en = rng.choice(_KYRGYZ_ABBR), rng.choice(_ENGLISH_ABBR)
+    suffix = rng.choice(('', 'нын', 'да', 'га', 'дан', ''))
+    return rng.choice((
+        f"{kg}{suffix} өкүлдөрү {en} долбоору боюнча маалымат беришти.",
+        f"{kg} менен {rng.choice(_KYRGYZ_ABBR)} ортосунда келишим түзүлдү.",
+        f"Китептер, журналдар {rng.choice(_SHORT_ABBR)} {rng.choice(_PLACES)} ш. сакталат.",
+        f"{en} жана {rng.choice(_ENGLISH_ABBR)} боюнча курстар ачылды.",
+    ))
+
+
+def _roman(rng):
+    century = rng.randint(1, 21)
+    return rng.choice((
+        f"{_to_roman(century)} кылымда {rng.choice(_PLACES)} шаары өнүккөн.",
+        f"{_to_roman(century)}-{_to_roman(century + 1)} кылымдар аралыгында жазылган.",
+        f"Китептин {_to_roman(rng.randint(1, 40))} бөлүмү {rng.choice(_VERBS)}.",
+        f"Бул эстелик {_to_roman(century)} к. таандык.",
+    ))
+
+
+def _phones(rng):
+    a, b, c = rng.randint(500, 999), rng.randint(0, 999), rng.randint(0, 999)
+    return rng.choice((
+        f"Байланыш: +996 {a} {b:03d} {c:03d}.",
+        f"Телефон: 0{a} {b:03d} {c:03d}",
+        f"Маалымат үчүн +996-{a}-{b:03d}-{c:03d} номерине чалыңыз.",
+        f"Кабылдама: 0312 {b:03d} {c:03d}, электрондук почта info@example.kg",
+    ))
+
+
+def _prose(rng):
+    parts = [rng.choice(_PROSE)]
+    for _ in range(rng.randint(0, 2)):
+        parts.append(rng.choice(_CONNECTORS))
+        parts.append(rng.choice(_PROSE).lower())
+    sentence = ''.join(parts)
+    return sentence[0].upper() + sentence[1:] + '.'
+
+
+_GENERATORS = {
+    'dates': _dates, 'times': _times, 'currency': _currency, 'units': _units,
+    'abbreviations': _abbreviations, 'roman': _roman, 'phones': _phones, 'prose': _prose,
+}
+
+
+def parse_size(size):
+    """
+    ``'1KB'``, ``'100MB'``, ``'512'`` → байттар (1 KB = 1024 байт).
+
+    Raises:
+        ValueError: Белгисиз формат
+    """
+    m = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([KMG]?B?)\s*', str(size).upper())
+    if not m:
+        raise ValueError(f"Белгисиз өлчөм: {size!r} (мис. 1KB, 10MB)")
+    return int(float(m.group(1)) * _SIZE_UNITS[m.group(2)])
+
+
+def format_size(nbytes):
+    for unit in ('GB', 'MB', 'KB'):
+        if nbytes >= _SIZE_UNITS[unit] and nbytes % _SIZE_UNITS[unit] == 0:
+            return f'{nbytes // _SIZE_UNITS[unit]}{unit}'
+    return f'{nbytes}B'
+
+
+def generate_corpus(category='mixed', sentences=None, size=None, seed=0):
+    """
+    Жасалма корпустун сүйлөмдөрү (генератор).
+
+    Args:
+        category: ``CATEGORIES`` тизмесинен бири же ``'mixed'``
+        sentences: Сүйлөмдөрдүн саны
+        size: Корпустун UTF-8 көлөмү (байт, сүйлөмдөр ``\\n`` менен);
+            акыркы сүйлөм чектен ашып кетпейт
+        seed: Кайра чыгарылуучулук үчүн
+
+    Yields:
+        Сүйлөмдөр
+    """
+    if category != 'mixed' and category not in _GENERATORS:
+        raise ValueError(f"Белгисиз категория: {category!r} "
+                         f"({', '.join(CATEGORIES)}, mixed)")
+    if sentences is None and size is None:
+        raise ValueError("sentences же size керек")
+    rng = random.Random(f'{category}:{seed}')
+    if category == 'mixed':
+        names = list(MIXED_WEIGHTS)
+        weights = [MIXED_WEIGHTS[name] for name in names]
+
+        def make():
+            return _GENERATORS[rng.choices(names, weights)[0]](rng)
+    else:
+        generator = _GENERATORS[category]
+
+        def make():
+            return generator(rng)
+
+    total = 0
+    for index in count():
+        if sentences is not None and index >= sentences:
+            return
+        sentence = make()
+        if size is not None:
+            total += len(sentence.encode('utf-8')) + 1
+            if total > size:
+                return
+        yield sentence
@@ -0,0 +1,187 @@
+"""
+``normalize`` бенчмаркынын өлчөөлөрү жана JSON отчету.
+
+Колдонуу:
+    report = run_suite(categories=CATEGORIES, sentences=2000, sizes=['1KB', '1MB'])
+    json.dump(report, f)
+"""
+
+import hashlib
+import platform
+import sys
+import time
+import tracemalloc
+from array import array
+from datetime import datetime, timezone
+from itertools import islice
+
+from .. import __version__
+from ..normalizer import KyrgyzTextNormalizer
+from .corpus import CATEGORIES, format_size, generate_corpus, parse_size
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+# Эс тутуму өлчөнгөн сүйлөмдөрдүн саны (tracemalloc ылдамдыкты бузат,
+# ошондуктан ал өзүнчө өтүүдө аткарылат)
+MEMORY_SAMPLE = 2000
+
+SCHEMA_VERSION = 1
+
+
+def _percentile(ordered, fraction):
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _max_rss():
+    """Процесстин эң чоң RSS'и (байт) же ``None``."""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+
+def measure(normalizer, corpus, memory_sample=MEMORY_SAMPLE):
+    """
+    Бир корпустун өлчөөлөрү.
+
+    Ар бир ``normalize`` чакыруусу өзүнчө өлчөнөт; корпусту түзүү
+    убактысы эсепке кирбейт. Эс тутум — биринчи ``memory_sample``
+    сүйлөмдүн ``tracemalloc`` боюнча эң чоң убактылуу көлөмү.
+
+    Args:
+        normalizer: ``KyrgyzTextNormalizer``
+        corpus: Сүйлөмдөрдү берүүчү функция (ар бир чакырууда жаңы итератор)
+        memory_sample: Эс тутумду өлчөө үчүн сүйлөмдөрдүн саны
+
+    Returns:
+        dict: sentences, chars, bytes, sha256, seconds, chars_per_s,
+        sentences_per_s, latency_us (p50, p90, p99, max), peak_memory_bytes
+    """
+    timer = time.perf_counter
+    latencies = array('d')
+    digest = hashlib.sha256()
+    chars = nbytes = 0
+    normalize = normalizer.normalize
+    for sentence in corpus():
+        encoded = sentence.encode('utf-8')
+        digest.update(encoded + b'\n')
+        chars += len(sentence)
+        nbytes += len(encoded) + 1
+        started = timer()
+        normalize(sentence)
+        latencies.append(timer() - started)
+
+    sample = list(islice(corpus(), memory_sample))
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        for sentence in sample:
+            normalize(sentence)
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+
+    seconds = sum(latencies)
+    ordered = sorted(latencies)
+    elapsed = max(seconds, 1e-12)
+    return {
+        'sentences': len(latencies),
+        'chars': chars,
+        'bytes': nbytes,
+        'sha256': digest.hexdigest(),
+        'seconds': seconds,
+        'chars_per_s': chars / elapsed,
+        'sentences_per_s': len(latencies) / elapsed,
+        'latency_us': {
+            'p50': _percentile(ordered, 0.50) * 1e6,
+            'p90': _percentile(ordered, 0.90) * 1e6,
+            'p99': _percentile(ordered, 0.99) * 1e6,
+            'max': (ordered[-1] if ordered else 0.0) * 1e6,
+        },
+        'peak_memory_bytes': peak,
+    }
+
+
+def run_suite(categories=CATEGORIES, sentences=2000, sizes=(), seed=0, engine='scan',
+              memory_sample=MEMORY_SAMPLE, progress=None, profile='full'):
+    """
+    Категориялар жана аралаш корпустар боюнча бенчмарк.
+
+    Args:
+        categories: Категориялар (ар бири ``sentences`` сүйлөм)
+        sentences: Бир категориядагы сүйлөмдөрдүн саны
+        sizes: Аралаш корпустардын көлөмдөрү, мис. ``['1KB', '100MB']``
+        seed: Корпустардын ``seed``'и
+        engine: ``KyrgyzTextNormalizer`` кыймылдаткычы
+        memory_sample: Эс тутумду өлчөө үчүн сүйлөмдөрдүн саны
+        progress: ``progress(аты, жыйынтык)`` — ар бир корпустан кийин
+        profile: ``KyrgyzTextNormalizer`` профили
+
+    Returns:
+        dict: ``{'meta': {...}, 'results': {корпус: measure(...)}}``
+    """
+    normalizer = KyrgyzTextNormalizer(engine=engine, profile=profile).warmup()
+    jobs = [(name, name, {'sentences': sentences}) for name in categories]
+    jobs += [(f'mixed-{format_size(parse_size(size))}', 'mixed', {'size': parse_size(size)})
+             for size in sizes]
+
+    results = {}
+    for name, category, limit in jobs:
+        def corpus(category=category, limit=limit):
+            return generate_corpus(category, seed=seed, **limit)
+
+        results[name] = measure(normalizer, corpus, memory_sample)
+        if progress is not None:
+            progress(name, results[name])
+
+    return {
+        'meta': {
+            'schema': SCHEMA_VERSION,
+            'kyrgyz_normalizer': __version__,
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'engine': engine,
+            'profile': profile if isinstance(profile, str) else list(normalizer.stages),
+            'seed': seed,
+            'sentences_per_category': sentences,
+            'memory_sample': memory_sample,
+            'max_rss_bytes': _max_rss(),
+            'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        },
+        'results': results,
+    }
+
+
+def format_result(name, result):
+    """Адам окуй турган бир сап."""
+    latency = result['latency_us']
+    return (f"{name:<16} {result['sentences']:>9} сүйл. {result['chars_per_s'] / 1e6:7.2f} М симв/с "
+            f"{result['sentences_per_s']:>9.0f} сүйл/с  p50 {latency['p50']:7.1f} мкс  "
+            f"p99 {latency['p99']:8.1f} мкс  эс {result['peak_memory_bytes'] / 1024:7.1f} КБ")
+
+
+def compare(report, baseline):
+    """
+    Эки отчеттун ылдамдыктарын салыштырат.
+
+    Returns:
+        Саптар: ар бир жалпы корпус үчүн символ/с катышы жана p99 (жаңы/мурунку).
+        Корпустун ``sha256``'сы айырмаланса, белгиленет.
+    """
+    lines = []
+    for name, result in report['results'].items():
+        old = baseline.get('results', {}).get(name)
+        if old is None:
+            continue
+        speedup = result['chars_per_s'] / max(old['chars_per_s'], 1e-12)
+        p99 = result['latency_us']['p99'] / max(old['latency_us']['p99'], 1e-12)
+        note = '' if old.get('sha256') == result['sha256'] else '  (корпус башка)'
+        lines.append(f"{name:<16} ылдамдык {speedup:6.2f}x   p99 {p99:6.2f}x{note}")
+    return lines
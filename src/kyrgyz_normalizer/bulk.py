@@ -0,0 +1,146 @@
+"""
+Сандардын массивдерин (мамычаларды) бир жолу сөзгө айландыруу.
+
+NumPy кошумча көз карандылык: ``pip install kyrgyz-normalizer[numpy]``.
+Ал жок болсо, ошол эле функциялар жөнөкөй Python циклинде иштейт.
+
+Колдонуу:
+    normalizer = KyrgyzTextNormalizer()
+    normalizer.number_to_words_many(np.array([1500, 2024, 1500]))
+    # array(['бир миң беш жүз', 'эки миң жыйырма төрт', 'бир миң беш жүз'], dtype=object)
+"""
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy кошумча
+    np = None
+
+# 10^15 жана андан чоң сандар скалярдык функция менен айландырылат
+_VECTOR_LIMIT = 1_000_000_000_000_000
+_MAX_GROUPS = 5
+
+# Таблицалар нормализатордун бөлүшүлгөн топ таблицаларынан бир жолу түзүлөт
+_TABLES = None
+
+
+def _tables(normalizer):
+    """
+    Ар бир масштаб үчүн 4000 элементтүү object-таблица (бир жолу түзүлөт).
+
+    ``table[g]`` — ``' ' + g тобу масштабы менен`` (g = 0 болсо бош сап),
+    ``table[1000 + g]`` — ошол эле топтун иреттик формасы (сан ушул топ
+    менен бүтсө колдонулат), ``table[2000 + ...]`` — ошолор алдыңкы
+    боштуксуз (сандын эң жогорку тобу үчүн).
+    """
+    global _TABLES
+    tables = _TABLES
+    if tables is None:
+        tables = []
+        for scale, groups in enumerate(normalizer._scaled_groups):
+            if scale:
+                suffix = ' ' + normalizer.scale_ordinals[normalizer.scale_words[scale]]
+                ordinals = [''] + [w + suffix for w in normalizer._group_words[1:]]
+            else:
+                ordinals = normalizer._group_ordinals
+            entries = [' ' + w if w else '' for w in groups]
+            entries += [' ' + w if w else '' for w in ordinals]
+            entries += list(groups) + list(ordinals)
+            tables.append(np.array(entries, dtype=object))
+        _TABLES = tables
+    return tables
+
+
+def _verbalize_unique(normalizer, values, ordinal):
+    """
+    Кайталанбаган бүтүн сандардын массивин сөзгө айландырат.
+
+    Топторго бөлүү (``% 1000``, ``// 1000``) бүт массивке бир жолу
+    аткарылат; ар бир топтун сөзү таблицадан ``take`` менен алынып,
+    object-массивдерди кошуу аркылуу бириктирилет.
+    """
+    scalar = normalizer.number_to_ordinal if ordinal else normalizer.number_to_words
+    negative = values < 0
+    magnitude = np.where(negative, -values, values)
+    # -(int64 минимуму) толуп кетет — ал дагы скалярдык жол менен
+    fallback = (magnitude < 0) | (magnitude >= _VECTOR_LIMIT)
+    magnitude = np.where(fallback, 0, magnitude)
+
+    groups = []
+    rest = magnitude
+    while True:
+        groups.append(rest % 1000)
+        rest = rest // 1000
+        if len(groups) == _MAX_GROUPS or not rest.any():
+            break
+
+    # Эң жогорку нөл эмес топтун алдында боштук жок
+    top = []
+    higher_zero = np.ones(len(values), dtype=bool)
+    for group in reversed(groups):
+        top.append(higher_zero)
+        higher_zero = higher_zero & (group == 0)
+    top.reverse()
+
+    tables = _tables(normalizer)
+    lower_zero = np.ones(len(values), dtype=bool)
+    result = None
+    for scale, group in enumerate(groups):
+        index = group + 2000 * top[scale]
+        if ordinal:
+            index += 1000 * lower_zero
+            lower_zero = lower_zero & (group == 0)
+        part = tables[scale].take(index)
+        result = part if result is None else part + result
+
+    if not ordinal:
+        result[magnitude == 0] = 'нөл'
+    result[negative] = 'минус ' + result[negative]
+
+    for i in np.flatnonzero(fallback):
+        result[i] = scalar(int(values[i]))
+    return result
+
+
+def _many_python(normalizer, values, ordinal):
+    scalar = normalizer.number_to_ordinal if ordinal else normalizer.number_to_words
+    memo = {}
+    result = []
+    for value in values:
+        words = memo.get(value)
+        if words is None:
+            words = memo[value] = scalar(value)
+        result.append(words)
+    return result
+
+
+def _many(normalizer, values, ordinal):
+    if np is None:
+        return _many_python(normalizer, values, ordinal)
+
+    is_array = isinstance(values, np.ndarray)
+    array = values if is_array else np.asarray(list(values))
+    if array.size and array.dtype != object and array.dtype.kind not in 'iu':
+        raise TypeError(f"Бүтүн сандардын массиви керек, алынганы: {array.dtype}")
+
+    flat = array.ravel()
+    # Python int (object) же int64 ке батпаган uint64 — жөнөкөй цикл
+    if (array.dtype == object or flat.size == 0
+            or (flat.dtype.kind == 'u' and flat.max() > np.iinfo(np.int64).max)):
+        result = _many_python(normalizer, flat.tolist(), ordinal)
+        if is_array:
+            return np.array(result, dtype=object).reshape(array.shape)
+        return result
+
+    unique, inverse = np.unique(flat.astype(np.int64), return_inverse=True)
+    result = _verbalize_unique(normalizer, unique, ordinal).take(inverse.ravel())
+    if is_array:
+        return result.reshape(array.shape)
+    return result.tolist()
+
+
+def number_to_words_many(normalizer, values):
+    return _many(normalizer, values, ordinal=False)
+
+
+def number_to_ordinal_many(normalizer, values):
+    return _many(normalizer, values, ordinal=True)
@@ -0,0 +1,88 @@
+"""
+Нормализациянын жыйынтыктары үчүн чектелген LRU кэш.
+
+Колдонуу:
+    normalizer = KyrgyzTextNormalizer(cache_size=4096)
+    normalizer.normalize("Баасы 1500 сом")
+    normalizer.cache_info()   # CacheInfo(hits=0, misses=1, evictions=0, ...)
+"""
+
+import sys
+import threading
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple('CacheInfo', 'hits misses evictions size maxsize nbytes maxbytes')
+
+
+class ResultCache:
+    """
+    Текст → жыйынтык LRU кэши.
+
+    Чек жазуулардын саны (``maxsize``) жана/же эс тутумдагы көлөм
+    (``maxbytes``, ``sys.getsizeof`` боюнча ачкыч + маани) менен
+    коюлат. Чектен ашканда эң эски колдонулган жазуулар чыгарылат.
+    """
+
+    def __init__(self, maxsize=None, maxbytes=None):
+        """
+        Args:
+            maxsize: Жазуулардын эң көп саны (``None`` — чексиз)
+            maxbytes: Байттардын эң көп саны (``None`` — чексиз)
+        """
+        for name, value in (('maxsize', maxsize), ('maxbytes', maxbytes)):
+            if value is not None and value < 0:
+                raise ValueError(f"{name} терс болбошу керек: {value}")
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def _entry_size(key, value):
+        return sys.getsizeof(key) + sys.getsizeof(value)
+
+    def get(self, key):
+        """Жыйынтыкты кайтарат же ``None`` (жок болсо)."""
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self._misses += 1
+                return None
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key, value):
+        size = self._entry_size(key, value)
+        if self.maxsize == 0 or (self.maxbytes is not None and size > self.maxbytes):
+            return
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._nbytes -= self._entry_size(key, old)
+            self._data[key] = value
+            self._nbytes += size
+            while ((self.maxsize is not None and len(self._data) > self.maxsize)
+                   or (self.maxbytes is not None and self._nbytes > self.maxbytes)):
+                old_key, old_value = self._data.popitem(last=False)
+                self._nbytes -= self._entry_size(old_key, old_value)
+                self._evictions += 1
+
+    def clear(self):
+        """Жазууларды жана статистиканы тазалайт."""
+        with self._lock:
+            self._data.clear()
+            self._nbytes = 0
+            self._hits = self._misses = self._evictions = 0
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, len(self._data),
+                             self.maxsize, self._nbytes, self.maxbytes)
+
+    def __len__(self):
+        return len(self._data)
@@ -0,0 +1,379 @@
+"""
+kyrgyz-normalizer буйрук сабы.
+
+Колдонуу:
+    kyrgyz-normalizer "Баасы 1500 сом"               # бир текст
+    kyrgyz-normalizer --trace "Саат 12:30да"         # + этаптардын отчету (stderr)
+    kyrgyz-normalizer --profile numbers -i subs.txt  # сандар жана даталар гана
+    kyrgyz-normalizer                                # интерактивдүү режим
+    kyrgyz-normalizer -i corpus.txt -o out.txt -j 8  # файл, сап боюнча
+    kyrgyz-normalizer -i data.jsonl --format jsonl --field text -j 8
+    kyrgyz-normalizer -i big.txt -o out.txt --mmap -j 8  # көп ГБ файл, mmap
+    cat corpus.txt | kyrgyz-normalizer > out.txt     # stdin → stdout
+    kyrgyz-normalizer bench -o results.json          # ылдамдык бенчмаркы
+    kyrgyz-normalizer serve --port 8080 --workers 4  # HTTP кызматы
+"""
+
+import argparse
+import io
+import json
+import sys
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from .batch import BatchItemError, iter_normalize
+from .files import DEFAULT_CHUNK_BYTES, _parse_record
+from .normalizer import KyrgyzTextNormalizer, interactive_loop
+
+PROGRESS_INTERVAL = 2.0
+MAX_REPORTED_ERRORS = 10
+
+
+def _build_parser():
+    parser = argparse.ArgumentParser(
+        prog='kyrgyz-normalizer',
+        description='Кыргызча текст нормализатор (TTS үчүн)')
+    parser.add_argument('text', nargs='*', help='Нормализациялана турган текст')
+    parser.add_argument('-i', '--input', help="Киргизүү файлы ('-' — stdin)")
+    parser.add_argument('-o', '--output', default='-', help="Чыгаруу файлы (демейки: stdout)")
+    parser.add_argument('--format', choices=('text', 'jsonl'), default='text',
+                        help='text — ар бир сап бир текст; jsonl — ар бир сап JSON объект')
+    parser.add_argument('--field', default='text', help='jsonl форматындагы тексттин талаасы')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='Процесстердин саны')
+    parser.add_argument('--chunk-size', type=int, default=256,
+                        help='Бир тапшырмадагы саптардын саны')
+    parser.add_argument('--mmap', action='store_true',
+                        help='Киргизүү файлын mmap менен бөлүктөргө бөлүп иштетүү (чоң корпустар)')
+    parser.add_argument('--chunk-bytes', type=int, default=DEFAULT_CHUNK_BYTES,
+                        help='--mmap режиминде бир тапшырманын өлчөмү (байт)')
+    parser.add_argument('--engine', choices=KyrgyzTextNormalizer.ENGINES, default='scan')
+    parser.add_argument('--profile', choices=sorted(KyrgyzTextNormalizer.PROFILES), default='full',
+                        help='Иштетиле турган этаптардын профили')
+    parser.add_argument('--trace', action='store_true',
+                        help='Бир текст үчүн этаптардын убактысын жана эрежелерин stderr ге жазуу')
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help='stderr ге прогрессти жана жыйынтыкты жазбоо')
+    return parser
+
+
+def _build_bench_parser():
+    from .bench import CATEGORIES
+
+    parser = argparse.ArgumentParser(
+        prog='kyrgyz-normalizer bench',
+        description='normalize() ылдамдыгынын бенчмаркы (жасалма корпустар, JSON отчет)')
+    parser.add_argument('-o', '--output', default='-', help="JSON отчет (демейки: stdout)")
+    parser.add_argument('--categories', nargs='*', choices=CATEGORIES, default=list(CATEGORIES),
+                        metavar='CATEGORY',
+                        help=f"Категориялар (демейки: баары — {', '.join(CATEGORIES)})")
+    parser.add_argument('--sentences', type=int, default=2000,
+                        help='Бир категориядагы сүйлөмдөрдүн саны')
+    parser.add_argument('--sizes', nargs='*',
+                        default=['1KB', '10KB', '100KB', '1MB', '10MB', '100MB'],
+                        help='Аралаш корпустардын көлөмдөрү')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--engine', choices=KyrgyzTextNormalizer.ENGINES, default='scan')
+    parser.add_argument('--profile', choices=sorted(KyrgyzTextNormalizer.PROFILES), default='full',
+                        help='Иштетиле турган этаптардын профили')
+    parser.add_argument('--memory-sample', type=int, default=2000,
+                        help='Эс тутуму өлчөнгөн сүйлөмдөрдүн саны')
+    parser.add_argument('--compare', metavar='JSON', help='Мурунку отчет менен салыштыруу')
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help='stderr ге жыйынтыктарды жазбоо')
+    return parser
+
+
+def bench_main(argv=None):
+    """``kyrgyz-normalizer bench``: отчет JSON түрүндө, жыйынтыктар stderr ге."""
+    from .bench import compare, parse_size, run_suite
+    from .bench.runner import format_result
+
+    parser = _build_bench_parser()
+    args = parser.parse_args(argv)
+    try:
+        for size in args.sizes:
+            parse_size(size)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.sentences < 1 or args.memory_sample < 0:
+        parser.error("--sentences оң, --memory-sample терс эмес сан болушу керек")
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    def progress(name, result):
+        if not args.quiet:
+            sys.stderr.write(format_result(name, result) + '\n')
+            sys.stderr.flush()
+
+    report = run_suite(args.categories, args.sentences, args.sizes, args.seed, args.engine,
+                       args.memory_sample, progress, args.profile)
+    with _open_output(args.output) as dst:
+        json.dump(report, dst, ensure_ascii=False, indent=2)
+        dst.write('\n')
+    if baseline is not None:
+        for line in compare(report, baseline):
+            sys.stderr.write(line + '\n')
+    return 0
+
+
+def _build_serve_parser():
+    from .server import DEFAULT_MAX_BATCH, DEFAULT_WINDOW
+
+    parser = argparse.ArgumentParser(
+        prog='kyrgyz-normalizer serve',
+        description='Жергиликтүү HTTP нормализация кызматы (микро-пакеттер менен)')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080, help='TCP порту (0 — бош порт)')
+    parser.add_argument('--unix', metavar='PATH', help='TCP ордуна Unix сокети')
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help='Процесстердин саны (демейки: CPU саны; 0 — бир процессте)')
+    parser.add_argument('--window', type=float, default=DEFAULT_WINDOW * 1000,
+                        help='Микро-пакетти чогултуу терезеси, мс')
+    parser.add_argument('--max-batch', type=int, default=DEFAULT_MAX_BATCH,
+                        help='Бир микро-пакеттеги тексттердин эң көп саны')
+    parser.add_argument('--engine', choices=KyrgyzTextNormalizer.ENGINES, default='scan')
+    parser.add_argument('--profile', choices=sorted(KyrgyzTextNormalizer.PROFILES), default='full',
+                        help='Иштетиле турган этаптардын профили')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='Ар бир суроо-талапты stderr ге жазуу')
+    return parser
+
+
+def serve_main(argv=None):
+    """``kyrgyz-normalizer serve``: Ctrl+C басылганча иштейт."""
+    from .server import create_server
+
+    parser = _build_serve_parser()
+    args = parser.parse_args(argv)
+    try:
+        server = create_server(args.host, args.port, args.unix, args.workers,
+                               args.window / 1000, args.max_batch, args.engine,
+                               quiet=not args.verbose, profile=args.profile)
+    except ValueError as e:
+        parser.error(str(e))
+    sys.stderr.write(f"kyrgyz-normalizer serve: {server.url} "
+                     f"(workers={server.batcher.workers}, window={args.window:g} мс)\n")
+    sys.stderr.flush()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+@contextmanager
+def _open_input(path):
+    if path in (None, '-'):
+        wrapper = io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8', errors='replace')
+        try:
+            yield wrapper
+        finally:
+            wrapper.detach()
+    else:
+        with open(path, encoding='utf-8', errors='replace') as f:
+            yield f
+
+
+@contextmanager
+def _open_output(path):
+    if path == '-':
+        sys.stdout.flush()
+        wrapper = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+        try:
+            yield wrapper
+        finally:
+            wrapper.flush()
+            wrapper.detach()
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            yield f
+
+
+class _Progress:
+    """stderr ге прогресс жана акыркы жыйынтык (саптар, символдор, ылдамдык)."""
+
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self.lines = 0
+        self.chars = 0
+        self.errors = 0
+        self.started = time.perf_counter()
+        self._last = self.started
+        self._tty = enabled and sys.stderr.isatty()
+
+    def update(self, chars):
+        self.lines += 1
+        self.chars += chars
+        if self.enabled and self.lines % 1024 == 0:
+            now = time.perf_counter()
+            if now - self._last >= PROGRESS_INTERVAL:
+                self._last = now
+                if self._tty:
+                    sys.stderr.write(f"\r{self._summary(now)}")
+                else:
+                    sys.stderr.write(f"{self._summary(now)}\n")
+                sys.stderr.flush()
+
+    def error(self, message):
+        self.errors += 1
+        if self.enabled and self.errors <= MAX_REPORTED_ERRORS:
+            prefix = '\n' if self._tty else ''
+            sys.stderr.write(f"{prefix}Ката, сап {self.lines + 1}: {message}\n")
+
+    def _summary(self, now):
+        elapsed = max(now - self.started, 1e-9)
+        return (f"{self.lines} сап, {self.chars} символ, {elapsed:.1f} с — "
+                f"{self.lines / elapsed:.0f} сап/с, {self.chars / elapsed:.0f} символ/с")
+
+    def finish(self):
+        if self.enabled:
+            prefix = '\r' if self._tty else ''
+            sys.stderr.write(f"{prefix}{self._summary(time.perf_counter())}, ката: {self.errors}\n")
+
+
+class _FileProgress:
+    """``--mmap`` режими: stderr ге байттар, саптар жана ылдамдык (МБ/с)."""
+
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self.errors = 0
+        self._last = time.perf_counter()
+        self._tty = enabled and sys.stderr.isatty()
+
+    def __call__(self, stats):
+        now = time.perf_counter()
+        if self.enabled and now - self._last >= PROGRESS_INTERVAL:
+            self._last = now
+            sys.stderr.write(f"\r{self._summary(stats)}" if self._tty
+                             else f"{self._summary(stats)}\n")
+            sys.stderr.flush()
+
+    def error(self, line, message):
+        self.errors += 1
+        if self.enabled and self.errors <= MAX_REPORTED_ERRORS:
+            prefix = '\n' if self._tty else ''
+            sys.stderr.write(f"{prefix}Ката, сап {line}: {message}\n")
+
+    @staticmethod
+    def _summary(stats):
+        elapsed = max(stats.elapsed, 1e-9)
+        percent = 100 * stats.done / stats.total if stats.total else 100
+        return (f"{stats.done / 1e6:.1f}/{stats.total / 1e6:.1f} МБ ({percent:.0f}%), "
+                f"{stats.lines} сап, {elapsed:.1f} с — {stats.done / 1e6 / elapsed:.1f} МБ/с, "
+                f"{stats.lines / elapsed:.0f} сап/с")
+
+    def finish(self, stats):
+        if self.enabled:
+            prefix = '\r' if self._tty else ''
+            sys.stderr.write(f"{prefix}{self._summary(stats)}, ката: {stats.errors}\n")
+
+
+def stream(src, dst, fmt='text', field='text', jobs=1, chunk_size=256, engine='scan',
+           progress=None, profile='full'):
+    """
+    Саптарды агым катары нормализациялап жазат.
+
+    Эс тутумда иштетилип жаткан бөлүктөр гана сакталат, ошондуктан
+    файлдын өлчөмү чектелбейт. Иштетилбеген сап өзгөрүүсүз жазылат.
+
+    Returns:
+        ``_Progress`` — саптардын, символдордун жана каталардын саны
+    """
+    if progress is None:
+        progress = _Progress(enabled=False)
+    pending = deque()
+
+    def texts():
+        for line in src:
+            line = line.rstrip('\n')
+            record, text, error = _parse_record(line, fmt, field)
+            pending.append((line, record, error))
+            yield text
+
+    for result in iter_normalize(texts(), jobs, chunk_size, engine, profile=profile):
+        line, record, error = pending.popleft()
+        if error is None and isinstance(result, BatchItemError):
+            error = result.message
+        if error is not None:
+            progress.error(error)
+            out = line
+        elif record is None:
+            out = result
+        else:
+            record[field] = result
+            out = json.dumps(record, ensure_ascii=False)
+        dst.write(out)
+        dst.write('\n')
+        progress.update(len(line))
+    return progress
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv[:1] == ['bench']:
+        return bench_main(argv[1:])
+    if argv[:1] == ['serve']:
+        return serve_main(argv[1:])
+    args = _build_parser().parse_args(argv)
+
+    if args.text and args.input is None:
+        normalizer = KyrgyzTextNormalizer(engine=args.engine, profile=args.profile)
+        if args.trace:
+            result = normalizer.warmup().trace(' '.join(args.text))
+            print(result.output)
+            sys.stderr.write(result.format() + '\n')
+        else:
+            print(normalizer.normalize(' '.join(args.text)))
+        return 0
+
+    if args.input is None and sys.stdin.isatty():
+        interactive_loop(KyrgyzTextNormalizer(engine=args.engine, profile=args.profile))
+        return 0
+
+    if args.jobs < 1 or args.chunk_size < 1:
+        sys.stderr.write("--jobs жана --chunk-size оң сан болушу керек\n")
+        return 2
+
+    if args.mmap:
+        return _file_main(args)
+
+    progress = _Progress(enabled=not args.quiet)
+    with _open_input(args.input) as src, _open_output(args.output) as dst:
+        stream(src, dst, args.format, args.field, args.jobs, args.chunk_size,
+               args.engine, progress, args.profile)
+    progress.finish()
+    return 1 if progress.errors else 0
+
+
+def _file_main(args):
+    """``--mmap``: ``normalize_file`` менен, прогресс байттар боюнча."""
+    from .files import normalize_file
+
+    if args.input in (None, '-'):
+        sys.stderr.write("--mmap киргизүү файлын (-i) талап кылат\n")
+        return 2
+    if args.chunk_bytes < 1:
+        sys.stderr.write("--chunk-bytes оң сан болушу керек\n")
+        return 2
+    progress = _FileProgress(enabled=not args.quiet)
+    if args.output == '-':
+        sys.stdout.flush()
+        dst = sys.stdout.buffer
+    else:
+        dst = args.output
+    stats = normalize_file(args.input, dst, args.jobs, args.chunk_bytes, args.engine,
+                           args.profile, args.format, args.field,
+                           progress=progress, on_error=progress.error)
+    progress.finish(stats)
+    return 1 if stats.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
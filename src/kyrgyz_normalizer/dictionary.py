@@ -0,0 +1,62 @@
+"""
+Колдонуучунун сөздүктөрүн файлдан жүктөө.
+
+Сөздүк — ``KyrgyzTextNormalizer`` дин ``overrides`` түзүлүшү
+(``{таблица: {ачкыч: маани}}``). Файлдын эки форматы бар:
+
+* ``.json`` — ``{"kyrgyz_abbr": {"КТУ": "..."}, "units": {...}}``;
+* башкасы — TSV: ар бир сапта ``таблица<TAB>ачкыч<TAB>маани``,
+  ``#`` менен башталган жана бош саптар өткөрүлөт.
+
+Колдонуу:
+    from kyrgyz_normalizer import KyrgyzTextNormalizer, load_dictionary
+
+    normalizer = KyrgyzTextNormalizer(overrides=load_dictionary('abbr.tsv'))
+    ...
+    # файл өзгөрдү — айырмалар гана колдонулат
+    normalizer.update_overrides(load_dictionary('abbr.tsv'))
+"""
+
+import json
+
+from .normalizer import KyrgyzTextNormalizer
+
+
+def load_dictionary(path):
+    """
+    Сөздүк файлын окуйт.
+
+    Returns:
+        ``{таблица: {ачкыч: маани}}`` — ``overrides`` же
+        ``update_overrides()`` үчүн
+
+    Raises:
+        ValueError: белгисиз таблица же туура эмес сап
+    """
+    with open(path, encoding='utf-8') as f:
+        if str(path).endswith('.json'):
+            data = json.load(f)
+            if not isinstance(data, dict) or not all(isinstance(v, dict) for v in data.values()):
+                raise ValueError(f"{path}: {{таблица: {{ачкыч: маани}}}} күтүлгөн")
+            overrides = {name: dict(entries) for name, entries in data.items()}
+        else:
+            overrides = _read_tsv(f, path)
+    unknown = set(overrides) - set(KyrgyzTextNormalizer.OVERRIDABLE_TABLES)
+    if unknown:
+        raise ValueError(f"{path}: белгисиз таблица: {', '.join(sorted(unknown))} "
+                         f"({', '.join(KyrgyzTextNormalizer.OVERRIDABLE_TABLES)})")
+    return overrides
+
+
+def _read_tsv(lines, path):
+    overrides = {}
+    for number, line in enumerate(lines, 1):
+        line = line.rstrip('\r\n')
+        if not line.strip() or line.lstrip().startswith('#'):
+            continue
+        fields = line.split('\t')
+        if len(fields) != 3 or not fields[1]:
+            raise ValueError(f"{path}:{number}: 'таблица<TAB>ачкыч<TAB>маани' күтүлгөн")
+        name, key, value = fields
+        overrides.setdefault(name.strip(), {})[key] = value
+    return overrides
@@ -0,0 +1,305 @@
+"""
+Түзөтүлүп жаткан документтерди бөлүк-бөлүк кайра нормализациялоо.
+
+Документ сүйлөмдөргө (``KyrgyzTextNormalizer._split_segments``
+сегменттерине) бөлүнөт; ар бир сегменттин жыйынтыгы анын мазмуну
+боюнча кэште сакталат. Түзөтүүдөн кийин өзгөргөн сегменттер жана
+алардын кошуналары гана кайра бөлүнүп нормализацияланат, ошондуктан
+түзөтүүнүн баасы документтин көлөмүнө эмес, түзөтүүнүн көлөмүнө жараша.
+
+Колдонуу:
+    from kyrgyz_normalizer import NormalizedDocument
+
+    doc = NormalizedDocument(manuscript)
+    doc.output                            # normalize(manuscript) менен бирдей
+    change = doc.edit(1200, 1204, "2025")
+    change                                # DocumentChange(start=..., end=..., text='...')
+    audio_text = (audio_text[:change.start] + change.text
+                  + audio_text[change.end:])   # == doc.output
+
+    # редактор бүт текстти берсе
+    change = doc.update(new_manuscript)
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+from itertools import accumulate, chain
+
+from .cache import ResultCache
+from .normalizer import KyrgyzTextNormalizer
+
+# Сегменттердин жыйынтыктар кэшинин демейки өлчөмү (жазуулар)
+DEFAULT_SEGMENT_CACHE = 65536
+
+DocumentChange = namedtuple('DocumentChange', 'start end text')
+DocumentChange.__doc__ = """
+Чыгуудагы өзгөрүү: эски ``output[start:end]`` ордуна ``text`` коюлат.
+
+Өзгөрүү жок болсо ``start == end`` жана ``text == ''``.
+"""
+
+
+def _common_affixes(old, new):
+    """``old`` жана ``new`` саптарынын жалпы башынын жана аягынын узундуктары."""
+    limit = min(len(old), len(new))
+    prefix = 0
+    while prefix < limit and old[prefix] == new[prefix]:
+        prefix += 1
+    suffix = 0
+    limit -= prefix
+    while suffix < limit and old[-1 - suffix] == new[-1 - suffix]:
+        suffix += 1
+    return prefix, suffix
+
+
+class _Lengths:
+    """
+    Блоктордун узундуктары жана алардын префикс суммалары (Fenwick дарагы):
+    блокту издөө жана блоктун узундугун өзгөртүү — O(log n).
+    """
+
+    __slots__ = ('values', '_tree', '_top')
+
+    def __init__(self, values=()):
+        self.build(values)
+
+    def build(self, values):
+        self.values = list(values)
+        size = len(self.values)
+        tree = [0] + self.values
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                tree[parent] += tree[i]
+        self._tree = tree
+        self._top = 1 << size.bit_length() >> 1
+
+    def __len__(self):
+        return len(self.values)
+
+    def set(self, index, value):
+        delta = value - self.values[index]
+        self.values[index] = value
+        tree = self._tree
+        index += 1
+        while index < len(tree):
+            tree[index] += delta
+            index += index & -index
+
+    def prefix(self, index):
+        """``sum(values[:index])``."""
+        total = 0
+        tree = self._tree
+        while index:
+            total += tree[index]
+            index -= index & -index
+        return total
+
+    def find(self, position):
+        """``position`` турган блок жана андан мурунку блоктордун узундугу."""
+        tree = self._tree
+        index = 0
+        rest = position
+        step = self._top
+        while step:
+            if index + step < len(tree) and tree[index + step] <= rest:
+                index += step
+                rest -= tree[index]
+            step >>= 1
+        last = len(self.values) - 1
+        if index > last:
+            # Документтин аягы: акыркы блок
+            return last, position - rest - self.values[last]
+        return index, position - rest
+
+
+class NormalizedDocument:
+    """
+    Нормализацияланган чыгуусу менен кошо сакталган документ.
+
+    Чыгуу сегменттердин жыйынтыктарынан турат: сегменттин жыйынтыгы
+    (боштуктары кысылган) андан мурунку сегменттен бир боштук менен
+    ажыратылат — бул бүт текстке ``normalize()`` менен бирдей, анткени
+    сегменттер ар дайым боштуктан башталат.
+
+    Сегменттер ``BLOCK_SIZE`` өлчөмдүү блокторго бөлүнүп сакталат:
+    түзөтүү тийген блоктор гана кайра түзүлөт. Блоктордун узундуктары
+    Fenwick дарагында (``_Lengths``), ошондуктан түзөтүүнүн орду жана
+    чыгуудагы орду O(log блоктор) менен табылат. Жип үчүн коопсуз эмес.
+    """
+
+    BLOCK_SIZE = 256
+
+    __slots__ = ('normalizer', '_cache', '_blocks', '_block_lengths', '_block_outputs',
+                 '_length', '_text', '_output')
+
+    def __init__(self, text='', normalizer=None, cache_size=DEFAULT_SEGMENT_CACHE):
+        """
+        Args:
+            text: Документтин баштапкы тексти
+            normalizer: ``KyrgyzTextNormalizer`` (демейки: жаңы нуска)
+            cache_size: Сегменттердин жыйынтыктар кэшиндеги жазуулардын
+                эң көп саны; документтен чыгарылган сегменттер да (мис.
+                түзөтүүнү жокко чыгарганда) ушул кэштен алынат
+        """
+        self.normalizer = normalizer if normalizer is not None else KyrgyzTextNormalizer()
+        self._cache = ResultCache(cache_size)
+        segments = self.normalizer._split_segments(text)
+        pieces = [self._piece(segment, i == 0) for i, segment in enumerate(segments)]
+        self._blocks, self._block_lengths, self._block_outputs = [], _Lengths(), _Lengths()
+        self._set_blocks(0, 0, segments, pieces)
+        self._length = len(text)
+        self._text = text
+        self._output = None
+
+    @property
+    def text(self):
+        """Документтин азыркы тексти."""
+        if self._text is None:
+            self._text = ''.join(''.join(block[0]) for block in self._blocks)
+        return self._text
+
+    @property
+    def output(self):
+        """Нормализацияланган текст (``normalize(self.text)`` менен бирдей)."""
+        if self._output is None:
+            self._output = ''.join(''.join(block[1]) for block in self._blocks)
+        return self._output
+
+    def __len__(self):
+        return self._length
+
+    def cache_info(self):
+        """Сегменттердин кэшинин статистикасы (``CacheInfo``)."""
+        return self._cache.info()
+
+    def _piece(self, segment, first):
+        normalizer = self.normalizer
+        result = self._cache.get(segment)
+        if result is None:
+            result = normalizer._p_spaces.sub(' ', normalizer._run_plan(segment)).strip()
+            self._cache.put(segment, result)
+        if first or not result:
+            return result
+        return ' ' + result
+
+    def _set_blocks(self, first, stop, segments, pieces):
+        """``_blocks[first:stop]`` ордуна сегменттерди ``BLOCK_SIZE`` блокторго бөлүп коёт."""
+        size = self.BLOCK_SIZE
+        blocks = [[segments[i:i + size], pieces[i:i + size]]
+                  for i in range(0, len(segments), size)]
+        self._blocks[first:stop] = blocks
+        for lengths, part in ((self._block_lengths, 0), (self._block_outputs, 1)):
+            values = [sum(map(len, block[part])) for block in blocks]
+            if len(values) == stop - first:
+                for i, value in enumerate(values, first):
+                    lengths.set(i, value)
+            else:
+                # Блоктордун саны өзгөрдү (сейрек): дарак кайра түзүлөт
+                lengths.build(lengths.values[:first] + values + lengths.values[stop:])
+
+    def edit(self, start, end, replacement):
+        """
+        ``text[start:end]`` бөлүгүн ``replacement`` менен алмаштырат.
+
+        Түзөтүү тийген сегменттер жана ар бир тараптан бир кошуна
+        сегмент (алардын ортосундагы чек өзгөрүшү мүмкүн) кайра бөлүнөт;
+        калган сегменттер кайра иштетилбейт.
+
+        Returns:
+            ``DocumentChange`` — чыгуунун өзгөргөн бөлүгү
+        """
+        if not 0 <= start <= end <= self._length:
+            raise ValueError(f"Түзөтүүнүн чеги туура эмес: [{start}:{end}] "
+                             f"(документтин узундугу {self._length})")
+        lengths = self._block_lengths.values
+        first_block, block_start = self._block_lengths.find(start)
+        stop_block, stop_start = self._block_lengths.find(end)
+        # Кошуна сегмент мурунку/кийинки блокто болушу мүмкүн
+        if first_block and start - block_start <= len(self._blocks[first_block][0][0]):
+            first_block -= 1
+            block_start -= lengths[first_block]
+        stop_end = stop_start + lengths[stop_block]
+        if (stop_block < len(lengths) - 1
+                and end >= stop_end - len(self._blocks[stop_block][0][-1])):
+            stop_block += 1
+        stop_block += 1
+
+        segments, pieces = [], []
+        for block in self._blocks[first_block:stop_block]:
+            segments += block[0]
+            pieces += block[1]
+        offsets = list(accumulate(chain((block_start,), map(len, segments))))
+        last = len(segments) - 1
+        first = max(min(bisect_right(offsets, start) - 1, last) - 1, 0)
+        stop = min(bisect_left(offsets, end, 1), last) + 1
+
+        region = ''.join(segments[first:stop])
+        region_start = offsets[first]
+        region = (region[:start - region_start] + replacement
+                  + region[end - region_start:])
+        output_start = self._block_outputs.prefix(first_block)
+        change = self._replace(segments, pieces, first, stop,
+                               self.normalizer._split_segments(region),
+                               output_start, first_block == 0)
+        self._set_blocks(first_block, stop_block, segments, pieces)
+        self._length += len(replacement) - (end - start)
+        self._text = self._output = None
+        return change
+
+    def update(self, text):
+        """
+        Документтин бүт текстин алмаштырат.
+
+        Текст кайра сегменттерге бөлүнөт (бир regex өтүүсү); мурунку
+        тексттеги же кэштеги сегменттер кайра нормализацияланбайт.
+
+        Returns:
+            ``DocumentChange`` — чыгуунун өзгөргөн бөлүгү
+        """
+        old, pieces = [], []
+        for block in self._blocks:
+            old += block[0]
+            pieces += block[1]
+        new = self.normalizer._split_segments(text)
+        limit = min(len(old), len(new))
+        head = 0
+        while head < limit and old[head] == new[head]:
+            head += 1
+        tail = 0
+        limit -= head
+        while tail < limit and old[-1 - tail] == new[-1 - tail]:
+            tail += 1
+        change = self._replace(old, pieces, head, len(old) - tail,
+                               new[head:len(new) - tail], 0, True)
+        self._set_blocks(0, len(self._blocks), old, pieces)
+        self._length = len(text)
+        self._text = text
+        self._output = None
+        return change
+
+    def _replace(self, segments, pieces, first, stop, new_segments, output_start, at_start):
+        """
+        ``segments[first:stop]`` ордуна ``new_segments`` коёт (тизмелер ордунда
+        өзгөрөт) жана чыгуунун өзгөрүүсүн кайтарат.
+
+        ``output_start`` — ``segments[0]`` дун чыгуудагы орду, ``at_start`` —
+        ``segments[0]`` документтин биринчи сегментиби.
+        """
+        new_pieces = [self._piece(segment, at_start and first + i == 0)
+                      for i, segment in enumerate(new_segments)]
+        if at_start and first == 0 and stop < len(segments) and not new_segments:
+            # Биринчи сегмент өчүрүлсө, кийинкиси биринчи болуп калат
+            new_pieces = [pieces[stop].lstrip(' ')]
+            new_segments = [segments[stop]]
+            stop += 1
+
+        start = output_start + sum(map(len, pieces[:first]))
+        old = ''.join(pieces[first:stop])
+        new = ''.join(new_pieces)
+        prefix, suffix = _common_affixes(old, new)
+
+        segments[first:stop] = new_segments
+        pieces[first:stop] = new_pieces
+        return DocumentChange(start + prefix, start + len(old) - suffix,
+                              new[prefix:len(new) - suffix])
@@ -0,0 +1,318 @@
+"""
+Чоң корпус файлдарын нормализациялоо (mmap + процесстер пулу).
+
+Файл эс тутумга окулбайт: негизги процесс аны ``mmap`` менен ачып,
+``chunk_bytes`` өлчөмүндөгү бөлүктөрдүн чектерин гана табат — сап
+аягында же (сап өтө узун болсо) сүйлөмдүн чегинде же тынч чекте. Ар бир процесс өз
+бөлүгүн файлдан өзү окуйт (бөлүктүн тексти IPC аркылуу берилбейт),
+сап боюнча нормализациялайт жана жыйынтыкты кайтарат; жыйынтыктар
+файлга киргизүү тартибинде жазылат. Бир убакта эң көп ``max_pending``
+бөлүк иштетилет, ошондуктан эс тутум файлдын көлөмүнө көз каранды эмес.
+Процесс куласа, пул кайра түзүлөт; аны кулаткан бөлүк гана өзгөрүүсүз
+жазылат (``batch.iter_normalize`` тегидей).
+
+Жыйынтык ``kyrgyz-normalizer -i src -o dst`` менен бирдей: ар бир сап
+``normalize()`` кылынып, ``\\n`` менен жазылат.
+
+Колдонуу:
+    from kyrgyz_normalizer import normalize_file
+
+    stats = normalize_file('crawl.txt', 'crawl.norm.txt', workers=16,
+                           progress=lambda s: print(s.done, '/', s.total))
+    stats   # FileStats(done=..., total=..., lines=..., errors=0, elapsed=...)
+"""
+
+import json
+import mmap
+import os
+import re
+import time
+from collections import deque, namedtuple
+
+from . import batch
+from .normalizer import KyrgyzTextNormalizer
+from .streaming import _quiet_cut, _quiet_rules
+
+# Бир бөлүктүн болжолдуу өлчөмү (байт)
+DEFAULT_CHUNK_BYTES = 1 << 20
+# Саптын ичинде кесилген бөлүктүн эң чоң өлчөмү:
+# ``MAX_CHUNK_FACTOR * max(chunk_bytes, MIN_CAP_BYTES)``
+MAX_CHUNK_FACTOR = 8
+MIN_CAP_BYTES = 1 << 12
+
+FileStats = namedtuple('FileStats', 'done total lines errors elapsed')
+FileStats.__doc__ = """
+``normalize_file`` дин абалы.
+
+Args:
+    done: Иштетилген жана жазылган киргизүү байттары
+    total: Файлдын өлчөмү (байт)
+    lines: Жазылган саптар
+    errors: Өзгөрүүсүз жазылган (иштетилбеген) саптар
+    elapsed: Өткөн убакыт (секунд)
+"""
+
+
+def _segment_end_bytes():
+    """
+    ``KyrgyzTextNormalizer._p_segment_end`` UTF-8 байттары үчүн.
+
+    Боштук катары сап которуудан башка ASCII боштуктар гана алынат:
+    табылган ар бир чек саптын ичиндеги чыныгы сегмент чеги болот
+    (кээ бир чектер табылбай калышы мүмкүн — бул коопсуз).
+    """
+    def letters(first, last, extra):
+        chars = [chr(c) for c in range(ord(first), ord(last) + 1)] + list(extra)
+        return b'(?:' + b'|'.join(re.escape(ch.encode('utf-8')) for ch in chars) + b')'
+
+    lower = letters('а', 'я', 'өүң')
+    upper = letters('А', 'Я', 'ӨҮҢ')
+    return re.compile(lower + lower + rb'[.!?](?=[ \t\r\f\v]+' + upper + lower + b')')
+
+
+_p_segment_end = _segment_end_bytes()
+
+
+def _parse_record(line, fmt, field):
+    """Сапты ``(объект, текст, ката)`` кылып ажыратат."""
+    if fmt == 'text':
+        return None, line, None
+    if not line.strip():
+        return None, '', 'бош сап'
+    try:
+        record = json.loads(line)
+    except ValueError as e:
+        return None, '', f"JSON катасы: {e}"
+    if not isinstance(record, dict) or not isinstance(record.get(field), str):
+        return None, '', f"'{field}' талаасы (сап) жок"
+    return record, record[field], None
+
+
+def _chunk_spans(mm, size, chunk_bytes, quiet=None):
+    """
+    ``(башы, аягы, сап уланабы)`` бөлүктөрү.
+
+    Чек — ``chunk_bytes`` тан кийинки биринчи сап аягы. Кийинки
+    ``chunk_bytes`` ичинде сап бүтпөсө жана ``quiet`` (``_quiet_rules``)
+    берилсе, чек сүйлөмдүн аягына же тынч чекке (``StreamingNormalizer``
+    тегидей) коюлат: ``scan`` кыймылдаткычында бул чектердин эки
+    жагы көз карандысыз, ошондуктан саптын бөлүктөрүнүн жыйынтыктары бир
+    боштук менен бириктирилсе, бүт саптын жыйынтыгы алынат. Бөлүк
+    ``MAX_CHUNK_FACTOR * max(chunk_bytes, MIN_CAP_BYTES)`` байттан ашпайт:
+    андай чек табылбаса, акыркы боштукта кесилет (бул учурда гана саптын жыйынтыгы
+    айырмаланышы мүмкүн). ``quiet`` жок болсо (JSONL, ``sequential``),
+    сап бөлүнбөйт — бөлүк эң узун саптан чоң болушу мүмкүн.
+    """
+    start = 0
+    while start < size:
+        end = start + chunk_bytes
+        if end >= size:
+            yield start, size, False
+            return
+        limit = min(size, end + chunk_bytes)
+        newline = mm.find(b'\n', end, limit)
+        if newline != -1:
+            end = newline + 1
+        elif quiet is None:
+            newline = mm.find(b'\n', limit)
+            end = size if newline == -1 else newline + 1
+        else:
+            cap = min(size, start + MAX_CHUNK_FACTOR * max(chunk_bytes, MIN_CAP_BYTES))
+            newline = mm.find(b'\n', limit, cap)
+            stop = cap if newline == -1 else newline + 1
+            cut = _line_cut(mm, end, limit, quiet)
+            if cut is None and stop > limit:
+                cut = _line_cut(mm, limit, stop, quiet)
+            if cut is not None:
+                end = cut
+            elif newline != -1 or stop == size:
+                end = stop
+            else:
+                end = _hard_cut(mm, end, cap)
+        yield start, end, end < size and mm[end - 1] != 0x0A
+        start = end
+
+
+def _line_cut(mm, lo, hi, quiet):
+    """``[lo, hi)`` ичиндеги сүйлөмдүн аягы же биринчи тынч чек (байт), же ``None``."""
+    m = _p_segment_end.search(mm, lo, hi)
+    if m is not None:
+        return m.end()
+    while lo < hi and 0x80 <= mm[lo] < 0xC0:  # UTF-8 белгисинин ортосу
+        lo += 1
+    # Мурунку байт боштук болбосо, биринчи сөз бүтпөгөн — ал эсептелбейт
+    head = ' ' if mm[lo - 1] in b' \t\r\f\v\n' else 'x'
+    text = head + mm[lo:hi].decode('utf-8', errors='surrogateescape')
+    cut = _quiet_cut(text, 1, len(text), *quiet)
+    if cut is None:
+        return None
+    return lo + len(text[1:cut].encode('utf-8', errors='surrogateescape'))
+
+
+def _hard_cut(mm, lo, hi):
+    """``[lo, hi)`` ичиндеги акыркы боштуктун алды, же ``hi`` (UTF-8 белгисинин чеги)."""
+    space = mm.rfind(b' ', lo, hi)
+    if space != -1:
+        return space
+    while hi > lo + 1 and 0x80 <= mm[hi] < 0xC0:
+        hi -= 1
+    return hi
+
+
+def _normalize_span(normalizer, path, start, end, final, fmt, field):
+    """
+    Файлдын ``[start:end)`` бөлүгүн сап боюнча нормализациялайт.
+
+    Returns:
+        ``(UTF-8 жыйынтык, биринчи саптын жыйынтыгы бошпу, каталар)`` —
+        ката ``(бөлүктөгү сап, билдирүү)``. Бөлүк сап ортосунда бүтсө
+        (жана файлдын аягы эмес), акыркы сап ``\\n`` сиз кайтарылат.
+    """
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        text = mm[start:end].decode('utf-8', errors='replace')
+    lines = text.split('\n')
+    terminated = final
+    if text.endswith('\n'):
+        lines.pop()
+        terminated = True
+    results, errors = [], []
+    for i, line in enumerate(lines):
+        record, value, error = _parse_record(line, fmt, field)
+        if error is None:
+            try:
+                value = normalizer.normalize(value)
+            except Exception as e:  # бир саптын катасы бүт файлды токтотпойт
+                error = f"{type(e).__name__}: {e}"
+        if error is not None:
+            errors.append((i, error))
+            results.append(line)
+        elif record is None:
+            results.append(value)
+        else:
+            record[field] = value
+            results.append(json.dumps(record, ensure_ascii=False))
+    data = '\n'.join(results) + ('\n' if terminated else '')
+    return data.encode('utf-8'), not results[0], errors
+
+
+def _normalize_span_worker(path, start, end, final, fmt, field):
+    return _normalize_span(batch._worker_normalizer, path, start, end, final, fmt, field)
+
+
+def normalize_file(src, dst, workers=None, chunk_bytes=DEFAULT_CHUNK_BYTES, engine='scan',
+                   profile='full', fmt='text', field='text', max_pending=None,
+                   progress=None, on_error=None):
+    """
+    ``src`` файлын сап боюнча нормализациялап ``dst`` га жазат.
+
+    Args:
+        src: Киргизүү файлынын жолу (UTF-8; ``mmap`` үчүн кадимки файл)
+        dst: Чыгаруу файлынын жолу же бинардык файл объекти
+        workers: Процесстердин саны (демейки: ``os.cpu_count()``);
+            ``1`` — учурдагы процессте иштетүү
+        chunk_bytes: Бир тапшырманын болжолдуу өлчөмү (байт)
+        engine: ``KyrgyzTextNormalizer`` кыймылдаткычы; узун саптар
+            сүйлөмдөр боюнча ``scan`` кыймылдаткычында гана бөлүнөт
+        profile: ``KyrgyzTextNormalizer`` профили
+        fmt: ``'text'`` же ``'jsonl'`` (``field`` талаасы алмаштырылат)
+        max_pending: Иштетилип жаткан бөлүктөрдүн эң көп саны
+            (демейки: ``2 * workers``)
+        progress: Ар бир жазылган бөлүктөн кийин ``progress(FileStats)``
+        on_error: Иштетилбеген сап үчүн ``on_error(сап_номери, билдирүү)``;
+            андай сап өзгөрүүсүз жазылат
+
+    Returns:
+        Акыркы ``FileStats``
+    """
+    if chunk_bytes < 1:
+        raise ValueError("chunk_bytes оң сан болушу керек")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if max_pending is None:
+        max_pending = 2 * workers
+    sentences = engine == 'scan' and fmt == 'text'
+    started = time.perf_counter()
+    size = os.path.getsize(src)
+
+    own = not hasattr(dst, 'write')
+    out = open(dst, 'wb') if own else dst
+    try:
+        if size == 0:
+            return FileStats(0, 0, 0, 0, time.perf_counter() - started)
+        normalizer = KyrgyzTextNormalizer(engine=engine, profile=profile)
+        quiet = _quiet_rules(normalizer) if sentences else None
+        with open(src, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            spans = _chunk_spans(mm, size, chunk_bytes, quiet)
+            state = _Writer(out, mm, size, started, progress, on_error)
+            if workers <= 1:
+                for start, end, continues in spans:
+                    state.write(start, end, continues, _normalize_span(
+                        normalizer, src, start, end, end == size, fmt, field))
+                return state.stats()
+
+            # Бөлүктөрдүн чектери жыйынтыктар менен бирдей тартипте
+            bounds = deque()
+
+            def jobs():
+                for start, end, continues in spans:
+                    bounds.append((start, end, continues))
+                    yield (_normalize_span_worker, os.fspath(src), start, end,
+                           end == size, fmt, field)
+
+            for _, outcome in batch._run_ordered(jobs(), workers, max_pending, (engine, profile)):
+                state.collect(*bounds.popleft(), outcome)
+            return state.stats()
+    finally:
+        if own:
+            out.close()
+        else:
+            out.flush()
+
+
+class _Writer:
+    """Бөлүктөрдүн жыйынтыктарын тартиби менен жазат жана эсептейт."""
+
+    def __init__(self, out, mm, size, started, progress, on_error):
+        self.out = out
+        self.mm = mm
+        self.size = size
+        self.started = started
+        self.progress = progress
+        self.on_error = on_error
+        self.done = self.lines = self.errors = 0
+        # Мурунку бөлүк сап ортосунда бүттүбү / ошол саптан текст жазылдыбы
+        self.open_line = False
+        self.line_text = False
+
+    def collect(self, start, end, continues, result):
+        if isinstance(result, Exception):  # процесс кулады — бөлүк өзгөрүүсүз жазылат
+            data = self.mm[start:end]
+            if end == self.size and not data.endswith(b'\n'):
+                data += b'\n'
+            result = (data, not data.split(b'\n', 1)[0],
+                      [(0, f"{type(result).__name__}: {result}")])
+        self.write(start, end, continues, result)
+
+    def write(self, start, end, continues, result):
+        data, head_empty, errors = result
+        for index, message in errors:
+            self.errors += 1
+            if self.on_error is not None:
+                self.on_error(self.lines + index + 1, message)
+        if self.open_line and self.line_text and not head_empty:
+            self.out.write(b' ')
+        self.out.write(data)
+
+        newlines = data.count(b'\n')
+        self.lines += newlines
+        if continues:
+            tail = data[data.rfind(b'\n') + 1:]
+            self.line_text = bool(tail) or (not newlines and self.line_text)
+        self.open_line = continues
+        self.done = end
+        if self.progress is not None:
+            self.progress(self.stats())
+
+    def stats(self):
+        return FileStats(self.done, self.size, self.lines, self.errors,
+                         time.perf_counter() - self.started)
@@ -0,0 +1,552 @@
+"""
+Кыскартуулардын сөздүгү боюнча бир өтүүдө издөө.
+
+Бир нече таблицанын ачкычтары префикстик дарактарга (trie) жыйналат.
+Текст бир жолу каралат: ачкыч башталышы мүмкүн болгон орундар
+(сол чек + биринчи эки тамга) бир regex менен табылат, ар бир ордунан
+дарак боюнча басылат. Ачкычтардын саны канча болбосун, бир орундун
+баасы табылган ачкычтын узундугуна гана көз каранды.
+
+Өлчөө бирдиктери (``UnitMatcher``) ``сан [боштук] бирдик`` түрүндө
+изделет: сандан кийинки бирдик сөздүктөн (hash) эң узунунан баштап
+текшерилет, ошондуктан бирдиктердин саны издөөнүн ылдамдыгына да,
+компиляциянын убактысына да таасир этпейт.
+
+Эки издөөчүгө тең ачкычтарды кошууга/өчүрүүгө болот (``add``/``discard``):
+бүт сөздүк кайра түзүлбөйт.
+
+Колдонуу:
+    matcher = AbbreviationMatcher([
+        AbbreviationTable('kyrgyz_abbr', {'КР': ...}, tails=('дын', 'га')),
+        AbbreviationTable('english_abbr', {'IT': ...}),
+    ])
+    matcher.sub(lambda m: m.key.lower(), "КРдын IT тармагы")
+    # 'крдын it тармагы'  (m.tail == 'дын')
+"""
+
+import re
+from collections import namedtuple
+
+# Чектердин түрлөрү:
+#   WORD  — regex ``\b`` (``str.isalnum()`` же ``_`` — сөздүн тамгасы)
+#   ALNUM — эки жагында кириллица/латын тамгасы же цифра болбошу керек
+WORD = 'word'
+ALNUM = 'alnum'
+
+_ALNUM_CLASS = 'а-яөүңА-ЯӨҮҢA-Za-z0-9'
+_ALNUM_CHARS = frozenset(
+    ''.join(chr(c) for c in range(ord('а'), ord('я') + 1))
+    + ''.join(chr(c) for c in range(ord('А'), ord('Я') + 1))
+    + 'өүңӨҮҢ'
+    + ''.join(chr(c) for c in range(ord('A'), ord('Z') + 1))
+    + ''.join(chr(c) for c in range(ord('a'), ord('z') + 1))
+    + '0123456789'
+)
+
+# Дарактын түйүнүндөгү ачкычтын белгиси (тамгалар бош эмес саптар)
+_KEY = ''
+
+AbbreviationTable = namedtuple('AbbreviationTable', 'name keys boundary ignore_case tails',
+                               defaults=(WORD, False, ()))
+AbbreviationTable.__doc__ = """
+Издөөчүнүн бир таблицасы.
+
+Args:
+    name: Таблицанын аты (``AbbreviationMatch.table``)
+    keys: Ачкычтар (dict болсо, ачкычтары гана колдонулат)
+    boundary: ``WORD`` же ``ALNUM``
+    ignore_case: Регистрди эске албоо
+    tails: Ачкычтан кийин келе ала турган кошумчалар, текшерүү тартибинде
+        (мис. ``('.',)`` же мүчөлөр). Бири да ылайык келбесе, кошумчасыз
+        вариант текшерилет.
+"""
+
+AbbreviationMatch = namedtuple('AbbreviationMatch', 'start end table key tail string')
+
+
+def _is_word(ch):
+    return ch.isalnum() or ch == '_'
+
+
+def _right_ok(text, end, n, alnum):
+    """Ачкычтын (кошумчасы менен) ``end`` ордундагы оң чеги."""
+    if end == n:
+        return alnum or _is_word(text[end - 1])
+    following = text[end]
+    if alnum:
+        return following not in _ALNUM_CHARS
+    return _is_word(text[end - 1]) != (following.isalnum() or following == '_')
+
+
+def _fold(text):
+    """Регистрсиз салыштыруу үчүн кичине тамгалар (узундугу сакталат)."""
+    folded = text.lower()
+    if len(folded) == len(text):
+        return folded
+    return ''.join(ch if len(ch.lower()) != 1 else ch.lower() for ch in text)
+
+
+class AbbreviationMatcher:
+    """
+    Бир нече кыскартуулар таблицасы үчүн бир өтүүлүү издөөчү.
+
+    Табылгандар солдон оңго, бири-бирин жаппай чыгарылат. Бир орунда
+    биринчи ылайык келген таблица (``tables`` тартиби) утат; таблицанын
+    ичинде эң узун ачкыч (андан кийин ``tails`` тартиби) — мурунку
+    ``\\b(узун|кыска)(кошумча)?\\b`` паттерндериндей.
+    """
+
+    __slots__ = ('tables', 'trigger', '_tries', '_plan', '_fold_case')
+
+    def __init__(self, tables):
+        self.tables = tuple(tables)
+        self._tries = [self._build_trie(table) for table in self.tables]
+        # (аты, дарак, кошумчалар биринчи тамгасы боюнча, регистрсизби, ALNUMбу)
+        self._plan = []
+        for table, trie in zip(self.tables, self._tries):
+            tails = {}
+            for tail in table.tails:
+                if tail:
+                    tails.setdefault(tail[0], []).append(tail)
+            self._plan.append((table.name, trie, tails, table.ignore_case,
+                               table.boundary == ALNUM))
+        self._fold_case = any(table.ignore_case for table in self.tables)
+        self.trigger = re.compile(self._trigger_source())
+
+    @staticmethod
+    def _build_trie(table):
+        root = {}
+        for key in table.keys:
+            AbbreviationMatcher._insert(root, key, table.ignore_case)
+        return root
+
+    @staticmethod
+    def _insert(root, key, ignore_case):
+        """
+        Ачкычты даракка кошот. Дарактын алгачкы эки деңгээли (триггер
+        алардан түзүлөт) өзгөрсө ``True`` кайтарат.
+        """
+        if not key:
+            return False
+        path = _fold(key) if ignore_case else key
+        changed = False
+        node = root
+        for depth, ch in enumerate(path):
+            child = node.get(ch)
+            if child is None:
+                child = node[ch] = {}
+                changed = changed or depth < 2
+            node = child
+        if len(path) == 1 and _KEY not in node:
+            changed = True
+        node.setdefault(_KEY, key)
+        return changed
+
+    def _table_index(self, name):
+        for index, table in enumerate(self.tables):
+            if table.name == name:
+                return index
+        raise KeyError(name)
+
+    def add(self, name, keys):
+        """
+        ``name`` таблицасынын дарагына ачкычтарды кошот.
+
+        Таблицанын ``keys`` сөздүгү буга чейин эле жаңыртылган болушу
+        керек. Баасы — ачкычтардын узундугунун суммасы; триггер анын
+        булагы өзгөргөндө гана кайра компиляцияланат.
+        """
+        index = self._table_index(name)
+        ignore_case = self.tables[index].ignore_case
+        changed = False
+        for key in keys:
+            changed = self._insert(self._tries[index], key, ignore_case) or changed
+        if changed:
+            self._refresh_trigger()
+
+    def discard(self, name, keys, remaining=None):
+        """
+        ``name`` таблицасынын дарагынан ачкычтарды өчүрөт.
+
+        Таблицанын ``keys`` сөздүгүндө дагы эле бар ачкыч (мис.
+        орнотулган маани кайра көрүнүп калса) дарактан өчүрүлбөйт.
+        Регистрсиз таблицада ошол эле формадагы башка ачкыч калса,
+        түйүн ошол ачкычка өтөт.
+
+        Args:
+            remaining: Өчүрүүдөн кийин таблицада кала турган ачкычтар
+                (``in`` жана итерация; демейки — ``keys`` сөздүгү). Ачкычтарды
+                сөздүктөн өчүрө электе дарактан өчүрүү үчүн.
+        """
+        index = self._table_index(name)
+        table = self.tables[index]
+        if remaining is None:
+            remaining = table.keys
+        changed = False
+        for key in keys:
+            if not key or key in remaining:
+                continue
+            path = _fold(key) if table.ignore_case else key
+            nodes = [self._tries[index]]
+            for ch in path:
+                node = nodes[-1].get(ch)
+                if node is None:
+                    break
+                nodes.append(node)
+            else:
+                node = nodes[-1]
+                if node.get(_KEY) != key:
+                    continue
+                del node[_KEY]
+                if table.ignore_case:
+                    for other in remaining:
+                        if other and _fold(other) == path:
+                            node[_KEY] = other
+                            break
+                changed = changed or (len(path) == 1 and _KEY not in node)
+                # Бош калган бутактар кесилет (триггер кеңейип калбашы үчүн)
+                for depth in range(len(path), 0, -1):
+                    if nodes[depth]:
+                        break
+                    del nodes[depth - 1][path[depth - 1]]
+                    changed = changed or depth <= 2
+        if changed:
+            self._refresh_trigger()
+
+    def _refresh_trigger(self):
+        source = self._trigger_source()
+        if source != self.trigger.pattern:
+            self.trigger = re.compile(source)
+
+    def _trigger_source(self):
+        """
+        Ачкыч башталышы мүмкүн болгон орундардын паттерни.
+
+        Ар бир таблица үчүн: сол чек, биринчи тамга жана (бир тамгалуу
+        ачкыч жок болсо) экинчи тамгалардын классы. Паттерндин көлөмү
+        алфавитке көз каранды, сөздүктүн көлөмүнө эмес.
+        """
+        alternatives = []
+        for table, trie in zip(self.tables, self._tries):
+            firsts = sorted(ch for ch in trie if ch != _KEY)
+            if table.boundary == ALNUM:
+                groups = [(rf'(?<![{_ALNUM_CLASS}])', firsts)]
+            else:
+                groups = [(r'(?<!\w)', [ch for ch in firsts if _is_word(ch)]),
+                          (r'(?<=\w)', [ch for ch in firsts if not _is_word(ch)])]
+            for lookbehind, chars in groups:
+                if not chars:
+                    continue
+                branches = []
+                for ch in chars:
+                    node = trie[ch]
+                    if _KEY in node:
+                        branches.append(re.escape(ch))
+                    else:
+                        seconds = ''.join(re.escape(c) for c in sorted(node))
+                        branches.append(f'{re.escape(ch)}(?=[{seconds}])')
+                source = '(?:' + '|'.join(branches) + ')'
+                if table.ignore_case:
+                    source = f'(?i:{source})'
+                alternatives.append(lookbehind + source)
+        return '|'.join(alternatives) or '(?!)'
+
+    def _match_at(self, text, folded, i):
+        n = len(text)
+        prev = text[i - 1] if i else ''
+        for name, trie, tails, ignore_case, alnum in self._plan:
+            source = folded if ignore_case else text
+            node = trie.get(source[i])
+            if node is None:
+                continue
+            if alnum:
+                if prev in _ALNUM_CHARS:
+                    continue
+            elif (prev.isalnum() or prev == '_') == (text[i].isalnum() or text[i] == '_'):
+                continue
+
+            ends = []
+            k = i + 1
+            while True:
+                key = node.get(_KEY)
+                if key is not None:
+                    ends.append((k, key))
+                if k == n:
+                    break
+                node = node.get(source[k])
+                if node is None:
+                    break
+                k += 1
+
+            for end, key in reversed(ends):
+                if end < n:
+                    for tail in tails.get(source[end], ()):
+                        stop = end + len(tail)
+                        if source.startswith(tail, end) and _right_ok(text, stop, n, alnum):
+                            return AbbreviationMatch(i, stop, name, key, tail, text)
+                if _right_ok(text, end, n, alnum):
+                    return AbbreviationMatch(i, end, name, key, None, text)
+        return None
+
+    def finditer(self, text):
+        """
+        Бардык табылгандар, солдон оңго (бири-бирин жаппайт).
+
+        Returns:
+            ``AbbreviationMatch(start, end, table, key, tail, string)``
+            итератору — ``key`` сөздүктөгү ачкыч (регистрсиз таблицада
+            тексттегиден айырмаланышы мүмкүн), ``tail`` — табылган кошумча
+            же ``None``, ``string`` — изделген текст
+        """
+        return iter(self._scan(text))
+
+    def _scan(self, text):
+        matches = []
+        folded = None
+        pos = 0
+        for candidate in self.trigger.finditer(text):
+            i = candidate.start()
+            if i < pos:
+                continue
+            if folded is None:
+                folded = _fold(text) if self._fold_case else text
+            match = self._match_at(text, folded, i)
+            if match is not None:
+                matches.append(match)
+                pos = match.end
+        return matches
+
+    def search(self, text):
+        matches = self._scan(text)
+        return matches[0] if matches else None
+
+    def sub(self, repl, text):
+        """
+        Табылгандарды ``repl(match)`` жыйынтыгы менен алмаштырат.
+
+        ``re.Pattern.sub`` сыяктуу чакырылат, ошондуктан этаптын эрежелер
+        тизмесинде паттерндин ордуна тура алат.
+        """
+        return self.subn(repl, text)[0]
+
+    def subn(self, repl, text):
+        """``sub`` сыяктуу, бирок ``(текст, алмаштыруулардын саны)`` кайтарат."""
+        matches = self._scan(text)
+        if not matches:
+            return text, 0
+        parts = []
+        last = 0
+        for match in matches:
+            parts.append(text[last:match.start])
+            parts.append(repl(match))
+            last = match.end
+        parts.append(text[last:])
+        return ''.join(parts), len(matches)
+
+
+_p_digits = re.compile(r'\d+')
+_p_blank = re.compile(r'\s*')
+_DASHES = frozenset('-–—')
+
+
+class UnitMatch:
+    """``re.Match`` сыяктуу табылган: ``group(i)``, ``start()``, ``end()``."""
+
+    __slots__ = ('string', '_start', '_end', '_groups')
+
+    def __init__(self, string, start, end, groups):
+        self.string = string
+        self._start = start
+        self._end = end
+        self._groups = groups
+
+    def group(self, index=0):
+        if index == 0:
+            return self.string[self._start:self._end]
+        return self._groups[index - 1]
+
+    __getitem__ = group
+
+    def groups(self):
+        return self._groups
+
+    def start(self):
+        return self._start
+
+    def end(self):
+        return self._end
+
+    def span(self):
+        return self._start, self._end
+
+    def __repr__(self):
+        return f"<UnitMatch span={self.span()!r} groups={self._groups!r}>"
+
+
+class UnitPattern:
+    """
+    ``UnitMatcher`` дин бир эрежеси — паттерндин ордуна тура алат.
+
+    ``sub``/``subn``/``search``/``finditer`` мурунку regex'тердегидей
+    солдон оңго, бири-бирин жаппаган табылгандарды берет.
+    """
+
+    __slots__ = ('matcher', '_match_at')
+
+    def __init__(self, matcher, match_at):
+        self.matcher = matcher
+        self._match_at = match_at
+
+    @property
+    def trigger(self):
+        return self.matcher.trigger
+
+    def _scan(self, text):
+        matches = []
+        match_at = self._match_at
+        pos = 0
+        while True:
+            run = _p_digits.search(text, pos)
+            if run is None:
+                return matches
+            match = match_at(text, run.start())
+            if match is None:
+                # Сандын ичиндеги башталыштардын аяктары ушул эле
+                # аяктардын бөлүгү — алар да ийгиликсиз болот
+                pos = run.end()
+            else:
+                matches.append(match)
+                pos = match._end
+
+    def finditer(self, text):
+        return iter(self._scan(text))
+
+    def search(self, text):
+        matches = self._scan(text)
+        return matches[0] if matches else None
+
+    def sub(self, repl, text):
+        return self.subn(repl, text)[0]
+
+    def subn(self, repl, text):
+        matches = self._scan(text)
+        if not matches:
+            return text, 0
+        parts = []
+        last = 0
+        for match in matches:
+            parts.append(text[last:match._start])
+            parts.append(repl(match))
+            last = match._end
+        parts.append(text[last:])
+        return ''.join(parts), len(matches)
+
+
+class UnitMatcher:
+    """
+    ``сан бирдик`` жана ``сан-сан бирдик`` издөөчүсү.
+
+    Мурунку ``(\\d+(?:[,]\\d+)?)\\s*(бирдик|...)\\b`` жана
+    ``(\\d+(?:[,]\\d+)?)\\s*[-–—]\\s*(\\d+(?:[,]\\d+)?)\\s*(бирдик|...)\\b``
+    паттерндеринин жыйынтыгын так кайталайт (regex'тин кайра
+    артка кайтуу тартиби менен), бирок бирдик сөздүктөн изделет:
+
+    * ``single`` — ``(сан, бирдик)`` топтору;
+    * ``range`` — ``(сан, сан, бирдик)`` топтору;
+    * ``trigger`` — цифрадан кийин бирдиктин биринчи тамгасы.
+
+    ``units`` — тирүү сөздүк (dict же ChainMap): ``add``/``discard``
+    издөөчүгө анын өзгөрүүлөрү жөнүндө гана билдирет.
+    """
+
+    __slots__ = ('units', 'trigger', 'single', 'range', '_firsts', '_longest')
+
+    def __init__(self, units):
+        self.units = units
+        self._firsts = set()
+        self._longest = 0
+        self.trigger = None
+        self._note(units)
+        self.single = UnitPattern(self, self._single_at)
+        self.range = UnitPattern(self, self._range_at)
+
+    def _note(self, keys):
+        firsts = set(self._firsts)
+        for key in keys:
+            if key:
+                firsts.add(key[0])
+                if len(key) > self._longest:
+                    self._longest = len(key)
+        if self.trigger is None or firsts != self._firsts:
+            self._firsts = firsts
+            chars = ''.join(re.escape(ch) for ch in sorted(firsts))
+            self.trigger = re.compile(rf'\d\s*[{chars}]' if chars else '(?!)')
+
+    def add(self, keys):
+        """Сөздүккө кошулган ачкычтарды эсепке алат (баасы — ачкычтардын саны)."""
+        self._note(keys)
+
+    def discard(self, keys):
+        """
+        Сөздүктөн өчүрүлгөн ачкычтар: издөө сөздүктүн өзүн карагандыктан
+        эч нерсе кайра түзүлбөйт (биринчи тамгалар жана эң узун ачкыч
+        кеңири бойдон калат — бул туура, бир аз гана ашыкча текшерүү).
+        """
+
+    def unit_at(self, text, start):
+        """``start`` ордунан башталган, артында ``\\b`` бар эң узун бирдик."""
+        n = len(text)
+        if start >= n or text[start] not in self._firsts:
+            return None
+        units = self.units
+        for end in range(min(n, start + self._longest), start, -1):
+            word = _is_word(text[end - 1])
+            if (word == _is_word(text[end])) if end < n else not word:
+                continue
+            key = text[start:end]
+            if key in units:
+                return key
+        return None
+
+    @staticmethod
+    def _number_ends(text, start):
+        """
+        ``\\d+(?:[,]\\d+)?`` үчүн regex текшерген аяктар, анын тартибинде:
+        ондук бөлүгү менен (узунунан кыскасына), андан кийин бүтүн бөлүгү.
+        """
+        whole = _p_digits.match(text, start).end()
+        ends = []
+        if whole + 1 < len(text) and text[whole] == ',':
+            fraction = _p_digits.match(text, whole + 1)
+            if fraction is not None:
+                ends.extend(range(fraction.end(), whole + 1, -1))
+        ends.extend(range(whole, start, -1))
+        return ends
+
+    def _unit_after(self, text, end):
+        position = _p_blank.match(text, end).end()
+        key = self.unit_at(text, position)
+        return None if key is None else (position + len(key), key)
+
+    def _single_at(self, text, start):
+        for end in self._number_ends(text, start):
+            found = self._unit_after(text, end)
+            if found is not None:
+                return UnitMatch(text, start, found[0], (text[start:end], found[1]))
+        return None
+
+    def _range_at(self, text, start):
+        n = len(text)
+        for end in self._number_ends(text, start):
+            dash = _p_blank.match(text, end).end()
+            if dash >= n or text[dash] not in _DASHES:
+                continue
+            second = _p_blank.match(text, dash + 1).end()
+            if second >= n or not text[second].isdecimal():
+                continue
+            for second_end in self._number_ends(text, second):
+                found = self._unit_after(text, second_end)
+                if found is not None:
+                    return UnitMatch(text, start, found[0],
+                                     (text[start:end], text[second:second_end], found[1]))
+        return None
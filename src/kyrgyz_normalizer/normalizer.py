@@ -7,367 +7,587 @@
 
 import re
 import sys
+import threading
+from collections import ChainMap
+from time import perf_counter
 
+from . import tables
+from .cache import ResultCache
+from .matcher import ALNUM, AbbreviationMatcher, AbbreviationTable, UnitMatcher
+from .trace import StageTrace, Trace
 
-class KyrgyzTextNormalizer:
-    YEAR_THRESHOLD = 50
-    CENTURY_2000 = 2000
-    CENTURY_1900 = 1900
+# Пландагы этап али компиляцияланбаганын билдирет
+_UNLOADED = object()
 
-    def __init__(self):
-        self._init_data()
-        self._init_caches()
-        self._compile_patterns()
+# Таблицаларды жаңыртуучуларды ырааттайт (``normalize`` аны колдонбойт)
+_update_lock = threading.RLock()
 
-    # ================================================================
-    # Маалыматтар
-    # ================================================================
 
-    def _init_data(self):
-        self.ones = ['', 'бир', 'эки', 'үч', 'төрт', 'беш', 'алты', 'жети', 'сегиз', 'тогуз']
-        self.tens = ['', 'он', 'жыйырма', 'отуз', 'кырк', 'элүү', 'алтымыш', 'жетимиш', 'сексен', 'токсон']
-        self.hundreds = ['', 'жүз', 'эки жүз', 'үч жүз', 'төрт жүз', 'беш жүз',
-                         'алты жүз', 'жети жүз', 'сегиз жүз', 'тогуз жүз']
-
-        self.ordinal_ones = ['', 'биринчи', 'экинчи', 'үчүнчү', 'төртүнчү', 'бешинчи',
-                             'алтынчы', 'жетинчи', 'сегизинчи', 'тогузунчу']
-        self.ordinal_tens = ['', 'онунчу', 'жыйырманчы', 'отузунчу', 'кыркынчы', 'элүүнчү',
-                             'алтымышынчы', 'жетимишинчи', 'сексенинчи', 'токсонунчу']
-
-        self.months = {
-            '01': 'январь', '02': 'февраль', '03': 'март', '04': 'апрель',
-            '05': 'май', '06': 'июнь', '07': 'июль', '08': 'август',
-            '09': 'сентябрь', '10': 'октябрь', '11': 'ноябрь', '12': 'декабрь',
-            '1': 'январь', '2': 'февраль', '3': 'март', '4': 'апрель',
-            '5': 'май', '6': 'июнь', '7': 'июль', '8': 'август',
-            '9': 'сентябрь',
-        }
+def _lookup(table, key, default=None):
+    """
+    ``table.get(key, default)``: ``ChainMap.get`` ``in`` жана ``[]`` менен
+    эки жолу карайт, ортосунда ачкыч өчүрүлсө ``KeyError`` чыгат.
+    """
+    try:
+        return table[key]
+    except KeyError:
+        return default
 
-        self.month_abbr = {
-            'янв': 'январь', 'фев': 'февраль', 'мар': 'март', 'апр': 'апрель',
-            'июн': 'июнь', 'июл': 'июль', 'авг': 'август',
-            'сен': 'сентябрь', 'окт': 'октябрь', 'ноя': 'ноябрь', 'дек': 'декабрь',
-        }
 
-        self.short_abbr = {
-            'ж.б.у.с.': 'жана башка ушул сыяктуу',
-            'ж.б.': 'жана башка',
-            'б.з.ч.': 'биздин заманга чейин',
-            'б.з.ч': 'биздин заманга чейин',
-            'б.з.': 'биздин заман',
-            'кк.': 'кылымдар',
-            'жж.': 'жылдар',
-            'к.': 'кылым',
-            'көч.': 'көчөсү',
-            'м-н': 'менен',
-            'б-ча': 'боюнча',
-            'ж-а': 'жана',
-            'т.б.': 'тагыраак болсо',
-            'ө.к.': 'өңдүү көп',
-            'б.а.': 'башкача айтканда',
-            'мис.': 'мисалы',
-            'ш.': 'шаары',
-            'обл.': 'облусу',
-            'р-н': 'району',
-            'р.': 'району',
-            'үй': 'үй',
-            'кв.': 'квартира',
-            'мкр.': 'микрорайон',
-            'мкр': 'микрорайон',
-        }
+class _Without:
+    """
+    ``ChainMap`` тин биринчи катмарынан ``keys`` өчүрүлгөндөн кийинки
+    ачкычтары (``in`` жана итерация): орнотулган таблицада да бар ачкыч калат.
+    """
 
-        self.kyrgyz_abbr = {
-            'КР': 'кыргыз республикасы',
-            'КТЖ': 'кыргыз темир жолу',
-            'ЖОЖ': 'жогорку окуу жайы',
-            'КМШ': 'көз карандысыз мамлекеттердин шериктештиги',
-            'ААК': 'ачык акционердик коом',
-            'ЖЧК': 'жоопкерчилиги чектелген коом',
-            'БУУ': 'бириккен улуттар уюму',
-            'АКШ': 'америка кошмо штаттары',
-            'БШК': 'борбордук шайлоо комиссиясы',
-            'ШКУ': 'шанхай кызматташтык уюму',
-            'ЕККУ': 'европа коопсуздук жана кызматташуу уюму',
-            'ЕБ': 'европалык биримдик',
-            'ЕАЭБ': 'евразия экономикалык биримдиги',
-            'СССР': 'советтик социалисттик республикалар союзу',
-            'ФСК': 'сорос кыргызстан фонду',
-            'ЭЭА': 'эркин экономикалык аймак',
-            'ПРООН': 'бириккен улуттар уюмунун өнүктүрүү программасы',
-            'UNICEF': 'бириккен улуттар уюмунун балдар фонду',
-            'USAID': 'америка кошмо штаттарынын эл аралык өнүктүрүү агенттиги',
-            'ИДП': 'ички дүң продукциясы',
-            'ЖМК': 'жалпыга маалымдоо каражаттары',
-            'ЖАМК': 'жаза аткаруу мамлекеттик кызматы',
-            'УКМК': 'улуттук коопсуздук мамлекеттик комитети',
-            'ТИМ': 'тышкы иштер министрлиги',
-            'ӨКМ': 'өзгөчө кырдаалдар министрлиги',
-            'ИИМ': 'ички иштер министрлиги',
-            'ОИИБ': 'облустук ички иштер башкармалыгы',
-            'ШИИББ': 'шаардык ички иштер башкы башкармалыгы',
-            'РИИБ': 'райондук ички иштер башкармалыгы',
-            'ЧЧК': 'чоң чүй каналы',
-        }
+    __slots__ = ('chain', 'keys', 'rest')
 
-        self.english_abbr = {
-            'IT': 'ай ти', 'AI': 'эй ай', 'GPU': 'жи пи ю', 'CPU': 'си пи ю',
-            'ML': 'эм эл', 'API': 'эй пи ай', 'URL': 'ю ар эл',
-            'HTTP': 'эйч ти ти пи', 'HTTPS': 'эйч ти ти пи эс',
-            'HTML': 'эйч ти эм эл', 'CSS': 'си эс эс', 'PDF': 'пи ди эф',
-            'USB': 'ю эс би', 'WiFi': 'вай фай', 'GPS': 'жи пи эс',
-            'SMS': 'эс эм эс', 'SIM': 'сим', 'PIN': 'пин', 'ATM': 'эй ти эм',
-            'VPN': 'ви пи эн', 'iOS': 'ай о эс', 'RAM': 'рам', 'ROM': 'ром',
-            'SSD': 'эс эс ди', 'HDD': 'эйч ди ди', 'LED': 'лед', 'LCD': 'эл си ди',
-            'TV': 'ти ви', 'DVD': 'ди ви ди', 'CD': 'си ди', 'PR': 'пи ар',
-            'HR': 'эйч ар', 'CEO': 'си и о', 'ID': 'ай ди', 'OK': 'окей', 'QR': 'кю ар',
-        }
+    def __init__(self, chain, keys):
+        self.chain = chain
+        self.keys = keys
+        self.rest = ChainMap(*chain.maps[1:])
 
-        self.units = {
-            'км': 'километр', 'м': 'метр', 'см': 'сантиметр', 'мм': 'миллиметр',
-            'кг': 'килограмм', 'г': 'грамм', 'мг': 'миллиграмм', 'т': 'тонна',
-            'л': 'литр', 'мл': 'миллилитр', 'га': 'гектар',
-            'м2': 'квадрат метр', 'м3': 'куб метр', 'км2': 'квадрат километр',
-            'см2': 'квадрат сантиметр', 'км/ч': 'километр саатына', 'м/с': 'метр секундасына',
-            'кВт': 'киловатт', 'Вт': 'ватт', 'МВт': 'мегаватт',
-            'ГГц': 'гигагерц', 'МГц': 'мегагерц', 'кГц': 'килогерц', 'Гц': 'герц',
-            'ГБ': 'гигабайт', 'МБ': 'мегабайт', 'КБ': 'килобайт', 'ТБ': 'терабайт',
-            'мин': 'мүнөт', 'сек': 'секунд', 'саат': 'саат',
-            'km': 'километр', 'km²': 'квадрат километр', 'm': 'метр',
-            'm²': 'квадрат метр', 'm³': 'куб метр', 'cm': 'сантиметр', 'mm': 'миллиметр',
-            'kg': 'килограмм', 'g': 'грамм', 'mg': 'миллиграмм',
-            'l': 'литр', 'ml': 'миллилитр', 'ha': 'гектар',
-            'km/h': 'километр саатына', 'm/s': 'метр секундасына',
-            'kW': 'киловатт', 'W': 'ватт', 'MW': 'мегаватт',
-            'GHz': 'гигагерц', 'MHz': 'мегагерц', 'kHz': 'килогерц', 'Hz': 'герц',
-            'GB': 'гигабайт', 'MB': 'мегабайт', 'KB': 'килобайт', 'TB': 'терабайт',
-            'min': 'мүнөт', 'sec': 'секунд', 'h': 'саат',
-        }
+    def __contains__(self, key):
+        return key in self.rest if key in self.keys else key in self.chain
 
-        self.currencies = {
-            'сом': 'сом', '$': 'доллар', '€': 'евро', '₽': 'рубль',
-            '¥': 'юань', '£': 'фунт', '₸': 'тенге', '₴': 'гривна',
-        }
+    def __iter__(self):
+        return (key for key in self.chain if key not in self.keys or key in self.rest)
 
-        self.large_numbers = {'млн': 'миллион', 'млрд': 'миллиард', 'трлн': 'триллион', 'тыс': 'миң'}
 
-        self.symbols = {
-            '%': 'пайыз', '№': 'номур', '@': 'эт белгиси', '&': 'жана',
-            '§': 'параграф', '©': 'автордук укук', '®': 'катталган', '™': 'соода белгиси',
-            '°': 'градус', '×': 'көбөйтүү', '÷': 'бөлүү', '±': 'кошуу кемитүү',
-            '≈': 'болжол менен', '≠': 'барабар эмес', '≤': 'кичине же барабар',
-            '≥': 'чоң же барабар', '<': 'кичине', '>': 'чоң', '=': 'барабар',
-            '+': 'кошуу', '−': 'кемитүү', '—': '', '–': '', '/': 'сызыкча',
-        }
+class KyrgyzTextNormalizer:
+    YEAR_THRESHOLD = 50
+    CENTURY_2000 = 2000
+    CENTURY_1900 = 1900
 
-        self.roman_values = [
-            ('M', 1000), ('CM', 900), ('D', 500), ('CD', 400),
-            ('C', 100), ('XC', 90), ('L', 50), ('XL', 40),
-            ('X', 10), ('IX', 9), ('V', 5), ('IV', 4), ('I', 1),
-        ]
+    ENGINES = ('scan', 'sequential')
+
+    # Узун цифралар катарын окуу ыкмалары (``long_numbers``): топтор боюнча
+    # сан катары же цифра-цифра менен
+    LONG_NUMBER_POLICIES = ('cardinal', 'digits')
+
+    # Мындан көп цифралуу катар "узун" (10**15 жана андан чоң)
+    LONG_NUMBER_DIGITS = 15
+
+    # Даталардын сөздөрүнүн кэшиндеги жазуулардын демейки саны
+    DATE_CACHE_SIZE = 4096
+
+    # Иреттик сандардын даяр таблицасынын узундугу: 0..999 жана жылдар 1000..2199
+    ORDINAL_TABLE_SIZE = 2200
+
+    # ``scan`` кыймылдаткычы бир жолу иштете турган сегменттин эң чоң
+    # узундугу (символ); узунураак сегменттер бөлүнөт (``_split_long``)
+    MAX_INPUT_CHARS = 64 * 1024
+
+    # Нуска боюнча толукталуучу/алмаштырылуучу таблицалар (``overrides``)
+    OVERRIDABLE_TABLES = (
+        'short_abbr', 'month_abbr', 'kyrgyz_abbr', 'english_abbr',
+        'units', 'currencies', 'large_numbers', 'symbols',
+    )
+
+    __slots__ = OVERRIDABLE_TABLES + (
+        'engine', 'stages', 'max_input_chars', 'long_numbers', 'long_number_digits',
+        '_result_cache', '_date_cache', '_stage_rules', '_scan_plan', '_stage_stats',
+        '_quiet', '__weakref__',
+    )
+
+    # Бөлүшүлгөн орнотулган таблицалар (tables.py) — нускаларда көчүрмөсү жок
+    ones = tables.ONES
+    tens = tables.TENS
+    hundreds = tables.HUNDREDS
+    ordinal_ones = tables.ORDINAL_ONES
+    ordinal_tens = tables.ORDINAL_TENS
+    scale_words = tables.SCALE_WORDS
+    scale_ordinals = tables.SCALE_ORDINALS
+    digit_words = tables.DIGIT_WORDS
+    decimal_places = tables.DECIMAL_PLACES
+    months = tables.MONTHS
+    roman_values = tables.ROMAN_VALUES
+    cardinal_suffixes = tables.CARDINAL_SUFFIXES
+    abbr_suffixes = tables.ABBR_SUFFIXES
+    time_suffixes = tables.TIME_SUFFIXES
+    _suffix_base_map = tables.SUFFIX_BASE_MAP
+
+    # Бардык нускалар бөлүшкөн эсептелген таблицалар (``_init_shared``)
+    _shared_ready = False
+    _group_words = _group_ordinals = _scaled_groups = _ordinals = None
+    _harmony_classes = _harmony_table = _inflected = None
+    _time_words = _time_minutes = None
+
+    # Сингармонизм: үндүүнүн классы жана каткалаң үнсүздөр
+    _HARMONY_VOWELS = {'о': 0, 'у': 0, 'а': 1, 'ы': 1, 'ө': 2, 'ү': 2, 'е': 3, 'и': 3}
+    _VOICELESS = frozenset('кпстфхцчшщ')
+    # Сөздөрдүн класстары жана суффикстер таблицасы үчүн чек
+    _HARMONY_MEMO_LIMIT = 4096
+
+    STAGES = (
+        'short_abbr', 'contacts', 'dates', 'years', 'time', 'currency',
+        'time_dot_sfx', 'ordinals', 'units', 'percentages', 'centuries',
+        'math_and_ranges', 'named_abbr', 'addresses', 'symbols', 'remaining_numbers',
+    )
+
+    # Аталган профилдер: иштетиле турган этаптар (``STAGES`` тартибинде)
+    PROFILES = {
+        'full': STAGES,
+        # сандар, даталар, убакыт (мис. субтитрлер)
+        'numbers': (
+            'dates', 'years', 'time', 'currency', 'time_dot_sfx', 'ordinals', 'units',
+            'percentages', 'centuries', 'math_and_ranges', 'remaining_numbers',
+        ),
+        # email жана телефон номерлери жок тексттер
+        'no_contacts': tuple(stage for stage in STAGES if stage != 'contacts'),
+    }
+
+    # Бардык эрежелери санды талап кылган этаптар
+    _NUMERIC_STAGES = frozenset({
+        'dates', 'years', 'time', 'currency', 'time_dot_sfx', 'ordinals',
+        'units', 'percentages', 'math_and_ranges', 'remaining_numbers',
+    })
+
+    # Цифрасыз текстте да иштей турган эрежелер
+    _DIGIT_FREE_RULES = frozenset({
+        'short_abbr', 'email', 'century_roman_range', 'named_abbr', 'addr_city',
+        'apostrophe', 'quotes_double', 'quotes_single', 'standalone_symbol',
+        'roman_century', 'roman_general',
+    })
+
+    # Паттерндер бузук текстте да сызыктуу убакытта иштейт
+    # (benchmarks/bench_adversarial.py):
+    #   * ``(\d+`` менен башталган паттерндердин алдында ``(?<!\d)`` — цифралар
+    #     катарынын ортосунан башталган издөө катардын башынан башталгандан
+    #     жаңы эч нерсе таппайт, бирок ар бир орундан катарды кайра карайт;
+    #   * ``\s*-?\s*`` ордуна ``\s*(?:-\s*)?`` — боштуктар эки ``\s*`` ортосунда
+    #     бөлүштүрүлбөйт;
+    #   * чынжырлар (``(?:[./]\d+)+``, ``(?:\s\d{3})+``) ортосунан башталбайт.
+    #     Өзгөчөлүк: date_invalid ``\d{3,}(?:[./]\d+)+`` чынжырдын ортосунан
+    #     да башталат (эски эреже ушундай иштеген) — ал жерден башталса дайыма
+    #     табылат, ошондуктан кайра караган издөө болбойт.
+    # Үч орундуу топтордун чынжыры ``\d{1,3}(?:\s\d{3})*`` үчүн башталыш:
+    # катардын башы (чынжырдын ичиндеги топтон эмес) же узун катардын
+    # акыркы үч цифрасы.
+    _SPACED_START = r'(?:(?<!\d)(?!(?<=\d\s)\d{3})|(?<=\d)(?=\d{3}(?!\d)))'
+
+    def __init__(self, engine='scan', cache_size=None, cache_bytes=None, overrides=None,
+                 profile='full', max_input_chars=MAX_INPUT_CHARS, long_numbers='cardinal',
+                 long_number_digits=LONG_NUMBER_DIGITS, date_cache_size=DATE_CACHE_SIZE):
+        """
+        Args:
+            engine: ``'scan'`` — текст бир жолу сегменттерге бөлүнөт; ар
+                бир сегментте триггери табылбаган этаптар жана цифрасыз
+                сегментте сандык эрежелер өткөрүлөт, калган эрежелер
+                кезек менен өз ``re.sub`` өтүүсү менен колдонулат
+                (демейки); ``'sequential'`` — ар бир этап бүт текстке
+                кезек менен колдонулат (салыштыруу үчүн эталон).
+            cache_size: Жыйынтыктар кэшиндеги жазуулардын эң көп саны
+            cache_bytes: Жыйынтыктар кэшинин эң көп көлөмү (байт).
+                Экөө тең ``None`` болсо, кэш өчүк (демейки).
+            overrides: Нусканын өзгөчө жазуулары, мис.
+                ``{'kyrgyz_abbr': {'КТУ': 'кыргыз техникалык университети'}}``.
+                Таблицалар — ``OVERRIDABLE_TABLES``; калган жазуулар
+                бардык нускалар бөлүшкөн орнотулган таблицалардан алынат.
+            profile: ``PROFILES`` ичиндеги аталыш же этаптардын тизмеси
+                (``STAGES`` ичинен). Өчүк этаптардын паттерндери
+                компиляцияланбайт жана иштетилбейт; калган этаптар
+                ``STAGES`` тартибинде иштейт.
+            max_input_chars: ``scan`` кыймылдаткычында сегменттин эң чоң
+                узундугу; ``None`` — чексиз. Тыныш белгиси жок узун текст
+                коопсуз чектерден бөлүнүп иштетилет, ошондуктан ар бир
+                паттерн чектелген текстте гана иштейт.
+            long_numbers: ``long_number_digits`` тен көп цифралуу катарды
+                окуу: ``'cardinal'`` — топтор боюнча сан катары
+                (``number_to_words`` менен бирдей, демейки), ``'digits'`` —
+                цифра-цифра менен (ID, таблицалардагы коддор). Эки учурда
+                тең катар ``int()`` сыз, цифралардын санына сызыктуу
+                убакытта окулат.
+            long_number_digits: Узун катардын чеги (цифралар)
+            date_cache_size: Даталардын сөздөрүнүн кэшиндеги жазуулардын эң
+                көп саны (``0`` — кэш өчүк); статистика — ``date_cache_info()``
+        """
+        if engine not in self.ENGINES:
+            raise ValueError(f"Белгисиз engine: {engine!r} ({', '.join(self.ENGINES)})")
+        if long_numbers not in self.LONG_NUMBER_POLICIES:
+            raise ValueError(f"Белгисиз long_numbers: {long_numbers!r} "
+                             f"({', '.join(self.LONG_NUMBER_POLICIES)})")
+        self.engine = engine
+        self.long_numbers = long_numbers
+        self.long_number_digits = long_number_digits
+        self.stages = self._resolve_profile(profile)
+        self.max_input_chars = max_input_chars
+        self._quiet = None
+        self._result_cache = None
+        if cache_size is not None or cache_bytes is not None:
+            self._result_cache = ResultCache(cache_size, cache_bytes)
+        self._date_cache = ResultCache(date_cache_size)
+        self._init_data(overrides)
+        self._init_shared()
+        self._init_plan()
+
+    @classmethod
+    def _resolve_profile(cls, profile):
+        """Профилдин аталышын же этаптардын тизмесин ``STAGES`` тартибиндеги кортежге айландырат."""
+        if isinstance(profile, str):
+            stages = cls.PROFILES.get(profile)
+            if stages is None:
+                raise ValueError(f"Белгисиз профиль: {profile!r} ({', '.join(cls.PROFILES)})")
+            return tuple(stages)
+        selected = set(profile)
+        unknown = selected - set(cls.STAGES)
+        if unknown:
+            raise ValueError(f"Белгисиз этап: {', '.join(sorted(unknown))} "
+                             f"({', '.join(cls.STAGES)})")
+        return tuple(stage for stage in cls.STAGES if stage in selected)
 
-        self.cardinal_suffixes = (
-            'дык', 'дик', 'дүк', 'дук',
-            'тык', 'тик', 'түк', 'тук',
-            'лык', 'лик', 'лүк', 'лук',
-            'луу', 'лүү', 'дуу', 'дүү', 'туу', 'түү',
-        )
-
-        self._suffix_base_map = {
-            'га': 'га', 'ге': 'га', 'го': 'га', 'гө': 'га',
-            'ка': 'ка', 'ке': 'ка', 'ко': 'ка', 'кө': 'ка',
-            'да': 'да', 'де': 'да', 'до': 'да', 'дө': 'да',
-            'та': 'та', 'те': 'та', 'то': 'та', 'тө': 'та',
-        }
+    # ================================================================
+    # Маалыматтар
+    # ================================================================
 
-        self.time_suffixes = {
-            ('нөл', 'га'): 'нөлгө', ('беш', 'га'): 'бешке', ('он', 'га'): 'онго',
-            ('он беш', 'га'): 'он бешке', ('жыйырма', 'га'): 'жыйырмага',
-            ('жыйырма беш', 'га'): 'жыйырма бешке', ('отуз', 'га'): 'отузга',
-            ('отуз беш', 'га'): 'отуз бешке', ('кырк', 'га'): 'кыркка',
-            ('кырк беш', 'га'): 'кырк бешке', ('элүү', 'га'): 'элүүгө',
-            ('элүү беш', 'га'): 'элүү бешке',
-            ('нөл', 'да'): 'нөлдө', ('беш', 'да'): 'беште', ('он', 'да'): 'ондо',
-            ('он беш', 'да'): 'он беште', ('жыйырма', 'да'): 'жыйырмада',
-            ('жыйырма беш', 'да'): 'жыйырма беште', ('отуз', 'да'): 'отузда',
-            ('отуз беш', 'да'): 'отуз беште', ('кырк', 'да'): 'кыркта',
-            ('кырк беш', 'да'): 'кырк беште', ('элүү', 'да'): 'элүүдө',
-            ('элүү беш', 'да'): 'элүү беште',
-        }
+    def _init_data(self, overrides):
+        """
+        Алмаштырылуучу таблицаларды орнотот.
+
+        Өзгөртүүсү жок таблица — ``tables`` модулундагы бөлүшүлгөн объект.
+        Өзгөртүүсү бар таблица — ``ChainMap(өзгөртүүлөр, бөлүшүлгөн)``:
+        нускада айырмалар гана сакталат, кийинки жазуулар да ошол катмарга
+        түшөт (copy-on-write).
+        """
+        overrides = overrides or {}
+        unknown = set(overrides) - set(self.OVERRIDABLE_TABLES)
+        if unknown:
+            raise ValueError(f"Белгисиз таблица: {', '.join(sorted(unknown))} "
+                             f"({', '.join(self.OVERRIDABLE_TABLES)})")
+        for name in self.OVERRIDABLE_TABLES:
+            shared = getattr(tables, name.upper())
+            entries = overrides.get(name)
+            setattr(self, name, ChainMap(dict(entries), shared) if entries else shared)
+
+    def add_entries(self, table, entries):
+        """
+        Иштеп жаткан нормализатордун ``table`` таблицасына жазууларды
+        кошот (же алардын маанилерин алмаштырат).
+
+        Жазуулар нусканын өз катмарына түшөт. Таблицанын издөөчүсү
+        кайра түзүлбөйт — жаңы ачкычтар гана ага кошулат (таблица
+        бөлүшүлгөн болсо, биринчи өзгөртүүдө нусканын өз издөөчүсү бир
+        жолу түзүлөт). Параллелдүү ``normalize`` чакыруулары бөгөттөлбөйт
+        (ошол учурда иштеп жаткан чакыруу өзгөрүүнү сегменттердин бир
+        бөлүгүндө гана көрүшү мүмкүн). Жыйынтыктар кэши тазаланат.
+
+        Args:
+            table: ``OVERRIDABLE_TABLES`` тизмесиндеги таблицанын аты
+            entries: ``{ачкыч: маани}`` же ``(ачкыч, маани)`` жуптары
+        """
+        entries = dict(entries)
+        with _update_lock:
+            self._own_layer(table).update(entries)
+            self._table_changed(table, entries, ())
+
+    def remove_entries(self, table, keys):
+        """
+        Нусканын ``table`` таблицасына кошулган жазууларды өчүрөт.
+
+        Орнотулган таблицанын жазуулары өчүрүлбөйт: алмаштырылган
+        ачкычтын орнотулган мааниси кайра көрүнөт. Ачкычтар адегенде
+        издөөчүдөн, андан кийин таблицадан өчүрүлөт, ошондуктан ошол
+        учурда иштеп жаткан ``normalize`` таблицада жок ачкычты таппайт.
+
+        Returns:
+            Өчүрүлгөн жазуулардын саны
+        """
+        with _update_lock:
+            current = self._table(table)
+            if not isinstance(current, ChainMap):
+                return 0
+            layer = current.maps[0]
+            removed = [key for key in dict.fromkeys(keys) if key in layer]
+            if not removed:
+                return 0
+            stage, matcher, owned = self._table_matcher(table)
+            if owned and stage != 'units':
+                matcher.discard(table, removed, _Without(current, frozenset(removed)))
+            for key in removed:
+                del layer[key]
+            self._table_changed(table, (), removed)
+            return len(removed)
+
+    def update_overrides(self, overrides):
+        """
+        Нусканын бардык өзгөртүүлөрүн ``overrides`` менен алмаштырат.
+
+        Сөздүк файлын кайра жүктөө үчүн (``load_dictionary``): мурунку
+        жана жаңы өзгөртүүлөрдүн айырмасы гана ``add_entries`` /
+        ``remove_entries`` аркылуу колдонулат. ``overrides`` та жок
+        таблицанын өзгөртүүлөрү өчүрүлөт.
+        """
+        overrides = overrides or {}
+        unknown = set(overrides) - set(self.OVERRIDABLE_TABLES)
+        if unknown:
+            raise ValueError(f"Белгисиз таблица: {', '.join(sorted(unknown))} "
+                             f"({', '.join(self.OVERRIDABLE_TABLES)})")
+        with _update_lock:
+            for name in self.OVERRIDABLE_TABLES:
+                entries = dict(overrides.get(name) or {})
+                current = getattr(self, name)
+                layer = current.maps[0] if isinstance(current, ChainMap) else {}
+                removed = [key for key in layer if key not in entries]
+                changed = {key: value for key, value in entries.items()
+                           if key not in layer or layer[key] != value}
+                if removed:
+                    self.remove_entries(name, removed)
+                if changed:
+                    self.add_entries(name, changed)
+
+    def _table(self, name):
+        if name not in self.OVERRIDABLE_TABLES:
+            raise ValueError(f"Белгисиз таблица: {name} ({', '.join(self.OVERRIDABLE_TABLES)})")
+        return getattr(self, name)
+
+    def _own_layer(self, name):
+        """
+        Таблицанын нускага тиешелүү катмары. Бөлүшүлгөн таблица биринчи
+        жолу ``ChainMap`` ке айланат жана анын этабы кайра компиляцияланат
+        (бөлүшүлгөн издөөчү өзгөртүлбөшү керек).
+        """
+        current = self._table(name)
+        if isinstance(current, ChainMap):
+            return current.maps[0]
+        layer = {}
+        setattr(self, name, ChainMap(layer, current))
+        stage = self._TABLE_STAGES.get(name)
+        if stage is not None:
+            self._reset_stage(stage)
+        return layer
+
+    def _table_matcher(self, name):
+        """
+        ``(этап, издөөчү, owned)`` — таблицанын этабы (же ``None``), анын
+        азыркы издөөчүсү (же ``None``) жана издөөчү ушул таблицаны (нусканын
+        катмары менен) колдонобу.
+        """
+        stage = self._TABLE_STAGES.get(name)
+        if stage is None:
+            return None, None, False
+        rules = self._stage_rules.get(stage)
+        matcher = rules[0][1] if rules else None
+        keys = getattr(self, name)
+        if stage == 'units':
+            matcher = matcher.matcher if matcher is not None else None
+            owned = matcher is not None and matcher.units is keys
+        else:
+            owned = matcher is not None and any(
+                table.name == name and table.keys is keys for table in matcher.tables)
+        return stage, matcher, owned
+
+    def _table_changed(self, name, added, removed):
+        """Таблицанын ачкычтары өзгөргөндөн кийин анын издөөчүсүн жаңыртат."""
+        # Кыскартуулардын биринчи сөздөрү коопсуз чектерге таасир этет
+        self._quiet = None
+        stage, matcher, owned = self._table_matcher(name)
+        if stage is not None:
+            if owned:
+                if stage == 'units':
+                    matcher.add(added)
+                    matcher.discard(removed)
+                else:
+                    matcher.add(name, added)
+                    matcher.discard(name, removed)
+                # Триггер өзгөргөн болушу мүмкүн — кийинки чакырууда кайра алынат
+                for entry in self._scan_plan:
+                    if entry[0] == stage:
+                        entry[2] = _UNLOADED
+            elif matcher is not None:
+                self._reset_stage(stage)
+        self.cache_clear()
+
+    def _reset_stage(self, stage):
+        """Этаптын эрежелерин таштайт — алар кийинки колдонууда кайра түзүлөт."""
+        self._stage_rules.pop(stage, None)
+        for entry in self._scan_plan:
+            if entry[0] == stage:
+                entry[2:] = [_UNLOADED, None, None]
 
     # ================================================================
     # Кэш
     # ================================================================
 
+    def _init_shared(self):
+        """
+        Бардык нускалар бөлүшкөн эсептелген таблицаларды бир жолу түзөт.
+
+        Алар орнотулган таблицалардан гана көз каранды (нусканын
+        ``overrides`` катмарынан эмес), ошондуктан класстын деңгээлинде
+        сакталат.
+        """
+        cls = KyrgyzTextNormalizer
+        if cls._shared_ready:
+            return
+        self._init_caches()
+        self._init_harmony()
+        self._init_time_minutes()
+        cls._shared_ready = True
+
     def _init_caches(self):
-        self._number_cache = {}
-        self._ordinal_cache = {}
-        for i in range(101):
-            self._number_cache[i] = self._compute_number_to_words(i)
-            self._ordinal_cache[i] = self._compute_number_to_ordinal(i)
+        cls = KyrgyzTextNormalizer
+        # 0..999 бардык топтордун сөз жана иреттик формалары
+        cls._group_words = [self._compute_group_words(i) for i in range(1000)]
+        cls._group_ordinals = [self._compute_group_ordinal(i) for i in range(1000)]
+        # _scaled_groups[k][g] — g тобу k-масштабы менен: [1][200] = 'эки жүз миң'
+        cls._scaled_groups = [cls._group_words] + [
+            [''] + [f'{words} {scale}' for words in cls._group_words[1:]]
+            for scale in self.scale_words[1:]
+        ]
+        # _ordinals[n] — n < ORDINAL_TABLE_SIZE иреттик саны: жылдар даталарда
+        # жана "2024-жылы" сыяктуу тексттерде ар дайым кездешет
+        thousand = self.scale_ordinals[self.scale_words[1]]
+        cls._ordinals = cls._group_ordinals + [
+            f'{cls._scaled_groups[1][num // 1000]} {cls._group_ordinals[num % 1000]}'
+            if num % 1000 else f'{cls._group_words[num // 1000]} {thousand}'
+            for num in range(1000, self.ORDINAL_TABLE_SIZE)
+        ]
+        # (саат, мүнөт, суффикс же None) → убакыттын сөздөрү;
+        # жарактуу убакыттар (00:00..23:59) биринчи колдонулганда толукталат
+        cls._time_words = {}
+
+    def _init_harmony(self):
+        """
+        Сингармонизм таблицалары.
+
+        ``_harmony_table`` — ``(класс, суффикс) → ылайыкташкан суффикс``
+        бардык класстар жана белгилүү суффикстер үчүн; ``_inflected`` —
+        аббревиатуралардын жана топтордун (бөлчөктүн бөлүмү) даяр формалары.
+        """
+        cls = KyrgyzTextNormalizer
+        cls._harmony_classes = {}
+        vocabulary = set(self.ones + self.tens + self.scale_words + ('нөл', 'жүз'))
+        for full in tables.KYRGYZ_ABBR.values():
+            vocabulary.add(full.lower().rsplit(' ', 1)[-1])
+        for token in vocabulary:
+            if token:
+                harmony_class = self._harmony_class(token)
+                if harmony_class[0] != 4:
+                    cls._harmony_classes[token] = harmony_class
+
+        suffixes = set(self.abbr_suffixes) | set(self._suffix_base_map.values())
+        cls._harmony_table = {
+            ((vowel_class, ending), suffix): self._harmonize_suffix((vowel_class, ending), suffix)
+            for vowel_class in range(5) for ending in range(3) for suffix in suffixes
+        }
+
+        cls._inflected = {}
+        inflected = {}
+        for full in tables.KYRGYZ_ABBR.values():
+            for suffix in self.abbr_suffixes:
+                inflected[(full, suffix)] = self.apply_suffix_harmony(full, suffix)
+        for words in self._group_words[1:]:
+            inflected[(words, 'дан')] = self.apply_suffix_harmony(words, 'дан')
+        cls._inflected = inflected
 
     # ================================================================
     # Прекомпиляция regex паттерндери
     # ================================================================
 
-    def _compile_patterns(self):
-        _sfx = r'(га|ге|го|гө|ка|ке|ко|кө|да|де|до|дө|та|те|то|тө)'
-
-        # --- Кыскартуулар ---
-        short_sorted = sorted(self.short_abbr.items(), key=lambda x: -len(x[0]))
-        self._short_abbr_compiled = [
-            (re.compile(rf'(?<![а-яөүңА-ЯӨҮҢA-Za-z0-9]){re.escape(a)}(?![а-яөүңА-ЯӨҮҢA-Za-z0-9])'), f)
-            for a, f in short_sorted
-        ]
-        self._month_abbr_compiled = [
-            (re.compile(rf'\b{re.escape(a)}\.?\b', re.IGNORECASE), f)
-            for a, f in self.month_abbr.items()
-        ]
-
-        # --- Email, телефон ---
-        self._p_email = re.compile(r'\b([a-zA-Z0-9._%+-]+)@([a-zA-Z0-9.-]+)\.([a-zA-Z]{2,})\b')
-        self._p_phone_996 = re.compile(r'\+996[\s-]?(\d{3})[\s-]?(\d{3})[\s-]?(\d{3})')
-        self._p_phone_mobile = re.compile(r'\b(0\d{3})[\s-]?(\d{3})[\s-]?(\d{3})\b')
-        self._p_phone_context = re.compile(
-            r'(номер|номери|тел|телефон|звоните|позвоните|code|код|борбор|индекс|почтовый|WhatsApp|Telegram)'
-            r'[\s::-]*(\d{3,6})\b', re.IGNORECASE)
-
-        # --- Даталар ---
-        self._p_date_ymd = re.compile(r'\b(\d{4})[./](\d{1,2})[./](\d{1,2})\b')
-        self._p_date_invalid = re.compile(
-            r'\b\d*\d{3,}\d*(?:[./]\d+)+\b|(?<!\d[./])\b\d+(?:[./]\d*\d{3,}\d*)+\b')
-        self._p_date_year_word = re.compile(r'(\d{4})\s*-?\s*жылдын\s+(\d{1,2})\s*-?\s*(\w+)')
-        self._p_date_dmy_comma = re.compile(r'\b(\d{1,2})\s*-?\s*(\w+),?\s*(\d{4})\s*[-\.]\s*жыл\b')
-        self._p_date_dmy_space = re.compile(r'\b(\d{1,2})\s*-?\s*(\w+)\s+(\d{4})\s*[-\.]\s*жыл\b')
-        self._p_date_iso_time = re.compile(r'(\d{4})-(\d{2})-(\d{2})\s+(\d{1,2}):(\d{2})')
-        self._p_date_iso = re.compile(r'\b(\d{4})-(\d{1,2})-(\d{1,2})\b')
-        self._p_date_text_month = re.compile(
-            r'\b(\d{1,2})\s+(январь|февраль|март|апрель|май|июнь|июль|август|'
-            r'сентябрь|октябрь|ноябрь|декабрь)\s+(\d{4})\b', re.IGNORECASE)
-        self._p_date_dot = re.compile(r'\b(\d{1,2})\.(\d{1,2})\.(\d{2,4})\b')
-        self._p_date_slash = re.compile(r'\b(\d{1,2})/(\d{1,2})/(\d{2,4})\b')
-        self._p_date_dash = re.compile(r'\b(\d{1,2})-(\d{1,2})-(\d{2,4})\b')
-
-        # --- Жылдар ---
-        self._p_year_range = re.compile(
-            r'(\d{4})\s*[-–—]\s*(\d{4})\s*[-.]?\s*(жылдары|жылдар|жж|гг)\.?')
-        self._p_year_single = re.compile(r'(\d{4})\s*[-.]?\s*(жылы|жыл|жж|гг|ж|г)\.?(?!\w)')
-
-        # --- Убакыт ---
-        self._p_time_colon_sfx = re.compile(rf'(\d{{1,2}}):(\d{{2}}){_sfx}')
-        self._p_time_colon = re.compile(r'\b(\d{1,2}):(\d{2})\b')
-        self._p_time_dot_ctx = re.compile(
-            rf'((?:саат|убакыт)\s+)(\d{{1,2}})\.(\d{{2}}){_sfx}?')
-        self._p_time_dot_sfx = re.compile(rf'\b(\d{{1,2}})\.(\d{{2}}){_sfx}')
-
-        # --- Сандар "k" ---
-        self._p_number_k = re.compile(r'\b(\d+)k\b')
-
-        # --- Акча ---
-        self._p_som_range = re.compile(
-            r'(\d+(?:[,]\d+)?)\s*[-–—]\s*(\d+(?:[,]\d+)?)\s*сом\b')
-        self._p_large_range = re.compile(
-            r'(\d+(?:[,]\d+)?)\s*[-–—]\s*(\d+(?:[,]\d+)?)\s*(млн|млрд|трлн)\s*(сом|доллар|евро|рубль)')
-        self._p_large_single = re.compile(
-            r'(\d+(?:[,]\d+)?)\s*(млн|млрд|трлн)\s*(сом|доллар|евро|рубль)')
-        self._p_som_spaced_dec = re.compile(r'(\d{1,3}(?:\s\d{3})*)[,.](\d{2})\s*сом')
-        self._p_som_spaced = re.compile(r'(\d{1,3}(?:\s\d{3})+)\s*сом\b')
-        self._p_som_simple = re.compile(r'(\d+)\s*сом\b')
-        self._p_cur_before = re.compile(r'([$€₽£¥₸₴])(\d+(?:[,]\d+)?)')
-        self._p_cur_after = re.compile(r'(\d+(?:[,]\d+)?)([$€₽£¥₸₴])')
-
-        # --- Иреттик сандар ---
-        self._p_num_dash_word = re.compile(r'(\d+)-([а-яөүңА-ЯӨҮҢ]+)')
-        self._p_ordinal_sfx = re.compile(r'(\d+)\s*-?\s*(чи|чу|чү|нчи|нчу|нчү|ынчы|инчи|үнчү|унчу)')
-        self._p_age = re.compile(r'(\d+)жашта')
-        self._p_class = re.compile(r'(\d+)(чи|чу|чү)\s*класста')
-        self._p_minutes = re.compile(r'(\d+)(мин|мүн|сек|саат)\b')
-        self._p_course = re.compile(r'(\d+)\s*-?\s*курста')
-
-        # --- Өлчөм бирдиктери (бириктирилген) ---
-        units_alt = '|'.join(re.escape(k) for k in sorted(self.units, key=len, reverse=True))
-        self._p_units_range = re.compile(
-            rf'(\d+(?:[,]\d+)?)\s*[-–—]\s*(\d+(?:[,]\d+)?)\s*({units_alt})\b')
-        self._p_units_single = re.compile(rf'(\d+(?:[,]\d+)?)\s*({units_alt})\b')
-
-        # --- Пайыз ---
-        self._p_pct_range = re.compile(r'(\d+(?:[,]\d+)?)\s*[-–—]\s*(\d+(?:[.,]\d+)?)\s*%')
-        self._p_pct_single = re.compile(r'(\d+(?:[,]\d+)?)\s*%')
-
-        # --- Кылымдар ---
-        self._p_century_roman_range = re.compile(
-            r'\b([IVXLCDM]{1,15})\s*[-–—]\s*([IVXLCDM]{1,15})\s*[-.]?\s*(кылымдары|кылымдар|кк)\.?')
-        self._p_century_arabic_range = re.compile(
-            r'(\d+)\s*[-–—]\s*(\d+)\s*[-.]?\s*(кылымдары|кылымдар|кк)\.?')
-
-        # --- Математика ---
-        self._p_math_mul_eq = re.compile(r'(\d+)\s*[×xXхХ*]\s*(\d+)\s*=\s*(\d+)')
-        self._p_math_add_eq = re.compile(r'(\d+)\s*\+\s*(\d+)\s*=\s*(\d+)')
-        self._p_math_sub_eq = re.compile(r'(\d+)\s*[-−–—]\s*(\d+)\s*=\s*(\d+)')
-        self._p_math_div_eq = re.compile(r'(\d+)\s*/\s*(\d+)\s*=\s*(\d+)')
-        self._p_num_range = re.compile(r'\b(\d+(?:[,]\d+)?)\s*[-–—]\s*(\d+(?:[,]\d+)?)\b')
-        self._p_math_add = re.compile(r'(\d+)\s*\+\s*(\d+)')
-        self._p_math_mul = re.compile(r'(\d+)\s*[×xXхХ*]\s*(\d+)')
-        self._p_math_div = re.compile(r'(\d+)\s*/\s*(\d+)')
-
-        # --- Аббревиатуралар (бириктирилген) ---
-        kg_alt = '|'.join(re.escape(k) for k in sorted(self.kyrgyz_abbr, key=len, reverse=True))
-        kg_sfx = (r'(нын|нун|нүн|нин|дын|дун|дүн|дин|тын|тун|түн|тин'
-                  r'|га|ге|ка|ке|го|гө|ко|кө|да|де|та|те|до|дө|то|тө'
-                  r'|дан|ден|тан|тен|дон|дөн|тон|төн|н|ы|и|у|ү)?')
-        self._p_kg_abbr = re.compile(rf'\b({kg_alt}){kg_sfx}\b')
-        en_alt = '|'.join(re.escape(k) for k in sorted(self.english_abbr, key=len, reverse=True))
-        self._p_en_abbr = re.compile(rf'\b({en_alt})\b')
-
-        # --- Адрестер ---
-        self._p_addr_city = re.compile(r'\bг\.\s*')
-        self._p_addr_district = re.compile(r'(\d+)\s*-?\s*кичи\s*район')
-        self._p_fraction = re.compile(r'\b(\d+)/(\d+)\b')
-
-        # --- Символдор ---
-        self._p_apostrophe = re.compile(r"(\w+)'(\w+)")
-        self._p_quotes_double = re.compile(r'[«»„"""]')
-        self._p_quotes_single = re.compile(r"[''‚']")
-        self._p_number_sign = re.compile(r'№\s*(\d+)')
-        self._p_roman_century = re.compile(r'\b([IVXLCDM]{1,15})\s*к\.')
-        self._p_roman_general = re.compile(r'(?<![a-zA-Z])\b([IVXLCDM]{1,15})\b(?!\.|\s*[a-zA-Z])')
-
-        # --- Калган сандар ---
-        self._p_decimal = re.compile(r'\b(\d+[,]\d+)\b')
-        self._p_spaced_num = re.compile(r'\b\d{1,3}(?:\s\d{3})+\b')
-        self._p_simple_num = re.compile(r'\b(\d+)\b')
-        self._p_letter_digit = re.compile(r'([а-яөүңА-ЯӨҮҢa-zA-Z])(\d+)')
-        self._p_sep_nums = re.compile(r'\d+[./]\d+(?:[./]\d+)*')
-        self._p_remaining = re.compile(r'\d+')
-        self._p_spaces = re.compile(r'\s+')
+    # Бардык нускалар бөлүшкөн паттерндер: (булак, флагдар) → паттерн
+    _pattern_cache = {}
+
+    _p_spaces = re.compile(r'\s+')
+    _p_digit = re.compile(r'\d')
+    _p_segment_end = re.compile(r'[а-яөүң]{2}[.!?](?=\s+[А-ЯӨҮҢ][а-яөүң])')
+
+    # Убакыттан кийинки суффикстер
+    _SFX = r'(га|ге|го|гө|ка|ке|ко|кө|да|де|до|дө|та|те|то|тө)'
+
+    # Этап триггерлери: табылбаса, этаптын бир да эрежеси иштей албайт.
+    # None — триггер жок (этап ар дайым иштейт); маалыматтан көз каранды
+    # триггерлер ``_trigger_source`` ичинде түзүлөт, сөздүк этаптарынын
+    # триггери — издөөчүнүн ``trigger`` паттерни.
+    _TRIGGERS = {
+        'contacts': r'[@\d]',
+        'dates': (r'[./\-]|жыл|(?i:январь|февраль|март|апрель|май|июнь|июль|август|'
+                  r'сентябрь|октябрь|ноябрь|декабрь)'),
+        'years': r'[жг]',
+        'time': r'[:.]',
+        'currency': r'k|сом|доллар|евро|рубль|[$€₽£¥₸₴]',
+        'time_dot_sfx': r'\.',
+        'ordinals': r'[-ч]|жашта|мин|мүн|сек|саат|курста',
+        'percentages': r'%',
+        'centuries': r'кылымдар|кк',
+        'math_and_ranges': r'[-−–—+×xXхХ*/]',
+        'addresses': r'г\.|кичи|/',
+        'symbols': r"['\"«»„‚№%@&IVXLCDM]",
+        'remaining_numbers': None,
+    }
+
+    @classmethod
+    def _re(cls, source, flags=0):
+        """
+        Паттернди компиляциялайт же бөлүшүлгөн кэштен алат.
+
+        Бир эле булак бардык нускалар үчүн бир жолу гана компиляцияланат
+        (``re`` модулунун чектелген кэшинен көз карандысыз).
+        """
+        key = (source, flags)
+        pattern = cls._pattern_cache.get(key)
+        if pattern is None:
+            pattern = cls._pattern_cache[key] = re.compile(source, flags)
+        return pattern
+
+    @staticmethod
+    def _alternation(words):
+        return '|'.join(re.escape(w) for w in sorted(words, key=len, reverse=True))
+
+    def _trigger_source(self, stage):
+        return self._TRIGGERS[stage]
+
+    # Сөздүк этаптары: таблицалар бир ``AbbreviationMatcher`` (бирдиктер —
+    # ``UnitMatcher``) менен бир өтүүдө изделет. Бөлүшүлгөн таблицалардын
+    # издөөчүлөрү — бардык нускалар үчүн бирөө.
+    _MATCHER_STAGES = {
+        'short_abbr': ('short_abbr', 'month_abbr'),
+        'named_abbr': ('kyrgyz_abbr', 'english_abbr'),
+        'units': ('units',),
+    }
+    _TABLE_STAGES = {name: stage for stage, names in _MATCHER_STAGES.items() for name in names}
+    _matcher_cache = {}
+
+    def _matcher_tables(self, stage):
+        """
+        Этаптын таблицалары артыкчылык тартибинде, мурунку паттерндердин
+        чектери менен: ``short_abbr`` — тамга/цифра эмес кошуналар,
+        ``month_abbr`` — ``\\b`` регистрсиз, аягында чекит болушу мүмкүн,
+        ``kyrgyz_abbr`` — ``\\b`` мүчөлөр менен, ``english_abbr`` — ``\\b``.
+        """
+        if stage == 'short_abbr':
+            return (AbbreviationTable('short_abbr', self.short_abbr, ALNUM),
+                    AbbreviationTable('month_abbr', self.month_abbr, ignore_case=True,
+                                      tails=('.',)))
+        return (AbbreviationTable('kyrgyz_abbr', self.kyrgyz_abbr, tails=self.abbr_suffixes),
+                AbbreviationTable('english_abbr', self.english_abbr))
+
+    def _matcher(self, stage):
+        shared = all(getattr(self, name) is getattr(tables, name.upper())
+                     for name in self._MATCHER_STAGES[stage])
+        matcher = self._matcher_cache.get(stage) if shared else None
+        if matcher is None:
+            if stage == 'units':
+                matcher = UnitMatcher(self.units)
+            else:
+                matcher = AbbreviationMatcher(self._matcher_tables(stage))
+            if shared:
+                self._matcher_cache[stage] = matcher
+        return matcher
 
     # ================================================================
     # Санды сөзгө айландыруу
     # ================================================================
 
     def digit_to_word(self, digit):
-        _map = {'0': 'нөл', '1': 'бир', '2': 'эки', '3': 'үч', '4': 'төрт',
-                '5': 'беш', '6': 'алты', '7': 'жети', '8': 'сегиз', '9': 'тогуз'}
-        return _map.get(digit, digit)
+        return self.digit_words.get(digit, digit)
 
     def digits_to_words(self, number_string):
-        return ' '.join(self.digit_to_word(d) for d in number_string if d.isdigit())
-
-    def _compute_number_to_words(self, num):
-        if num == 0:
-            return 'нөл'
-        if num < 0:
-            return 'минус ' + self._compute_number_to_words(abs(num))
+        digit_words = self.digit_words
+        return ' '.join(digit_words[d] for d in number_string if d in digit_words)
 
+    def _compute_group_words(self, num):
+        """0..999 диапазонундагы топту сөзгө айландырат (0 → бош сап)."""
         parts = []
-        for threshold, label in ((1_000_000_000_000, 'триллион'),
-                                 (1_000_000_000, 'миллиард'),
-                                 (1_000_000, 'миллион'),
-                                 (1_000, 'миң')):
-            if num >= threshold:
-                parts.append(self._compute_number_to_words(num // threshold))
-                parts.append(label)
-                num %= threshold
-
         if num >= 100:
             parts.append(self.hundreds[num // 100])
             num %= 100
@@ -376,27 +596,15 @@ class KyrgyzTextNormalizer:
             num %= 10
         if num > 0:
             parts.append(self.ones[num])
-
         return ' '.join(parts)
 
-    def number_to_words(self, num):
-        if 0 <= num <= 100:
-            return self._number_cache[num]
-        return self._compute_number_to_words(num)
-
-    def _compute_number_to_ordinal(self, num):
-        if num >= 1000:
-            thousands = num // 1000
-            remainder = num % 1000
-            if remainder == 0:
-                return self._compute_number_to_words(thousands) + ' миңинчи'
-            return self._compute_number_to_words(thousands) + ' миң ' + self._compute_number_to_ordinal(remainder)
-
+    def _compute_group_ordinal(self, num):
+        """0..999 диапазонундагы топтун иреттик формасы."""
         if num >= 100:
             remainder = num % 100
             if remainder == 0:
                 return self.hundreds[num // 100] + 'үнчү'
-            return self.hundreds[num // 100] + ' ' + self._compute_number_to_ordinal(remainder)
+            return self.hundreds[num // 100] + ' ' + self._compute_group_ordinal(remainder)
 
         if num >= 10:
             remainder = num % 10
@@ -404,14 +612,144 @@ class KyrgyzTextNormalizer:
                 return self.ordinal_tens[num // 10]
             return self.tens[num // 10] + ' ' + self.ordinal_ones[remainder]
 
-        if num < len(self.ordinal_ones):
-            return self.ordinal_ones[num]
-        return self._compute_number_to_words(num) + 'инчи'
+        return self.ordinal_ones[num]
+
+    def _group_parts(self, num):
+        """
+        Оң санды үч орундуу топторго бөлүп, сөздөрдүн тизмесин кайтарат.
+
+        Ар бир топ масштабы менен кошо (``эки жүз миң``) ``_scaled_groups``
+        таблицасынан алынат; нөл топтор өткөрүлөт.
+        """
+        high = None
+        if num >= 1_000_000_000_000_000:
+            high, num = divmod(num, 1_000_000_000_000)
+
+        parts = []
+        scaled_groups = self._scaled_groups
+        scale = 0
+        while num:
+            num, group = divmod(num, 1000)
+            if group:
+                parts.append(scaled_groups[scale][group])
+            scale += 1
+        if high is not None:
+            parts.append(self.number_to_words(high) + ' ' + self.scale_words[4])
+        parts.reverse()
+        return parts
+
+    def number_to_words(self, num):
+        if 0 < num < 1000:
+            return self._group_words[num]
+        if 1000 <= num < 1_000_000:
+            thousands, low = divmod(num, 1000)
+            if low:
+                return self._scaled_groups[1][thousands] + ' ' + self._group_words[low]
+            return self._scaled_groups[1][thousands]
+        if num == 0:
+            return 'нөл'
+        if num < 0:
+            return 'минус ' + self.number_to_words(-num)
+        return ' '.join(self._group_parts(num))
+
+    def number_string_to_words(self, digits):
+        """
+        Цифралардын сабын ``int()`` сыз сөзгө айландырат.
+
+        Жыйынтык ``number_to_words(int(digits))`` менен бирдей, бирок убакыт
+        цифралардын санына сызыктуу: ``int()`` өтө узун катарда ката
+        берет, ал эми андан кыскасында квадраттык убакыт алат.
+        """
+        digits = digits.lstrip('0')
+        if len(digits) <= self.LONG_NUMBER_DIGITS:
+            return self.number_to_words(int(digits)) if digits else 'нөл'
+        # number_to_words 10**15 тен баштап жогорку бөлүктү триллион менен
+        # кайталайт: <4..15 цифра> триллион <12 цифра> триллион <12 цифра> ...
+        head = len(digits) - (len(digits) - 4) // 12 * 12
+        parts = [self.number_to_words(int(digits[:head]))]
+        scaled_groups = self._scaled_groups
+        trillion = self.scale_words[4]
+        for start in range(head, len(digits), 12):
+            parts.append(trillion)
+            for i, pos in enumerate(range(start, start + 12, 3)):
+                group = int(digits[pos:pos + 3])
+                if group:
+                    parts.append(scaled_groups[3 - i][group])
+        return ' '.join(parts)
+
+    def _digit_run_words(self, digits):
+        """Цифралар катарын окуйт; узун катар — ``long_numbers`` боюнча."""
+        if len(digits) > self.long_number_digits:
+            if self.long_numbers == 'digits':
+                return self.digits_to_words(digits)
+            return self.number_string_to_words(digits)
+        return self.number_to_words(int(digits))
+
+    def number_string_to_ordinal(self, digits):
+        """
+        Цифралардын сабын ``int()`` сыз иреттик санга айландырат.
+
+        Жыйынтык ``number_to_ordinal(int(digits))`` менен бирдей
+        (``number_string_to_words`` тегидей, цифралардын санына сызыктуу).
+        """
+        digits = digits.lstrip('0')
+        if len(digits) <= self.LONG_NUMBER_DIGITS:
+            return self.number_to_ordinal(int(digits) if digits else 0)
+        low = int(digits[-3:])
+        if low:
+            return self.number_string_to_words(digits[:-3] + '000') + ' ' + self._group_ordinals[low]
+        # Акыркы сөз — масштаб, ``number_to_ordinal`` тегидей
+        head, _, scale = self.number_string_to_words(digits).rpartition(' ')
+        return head + ' ' + self.scale_ordinals[scale]
+
+    def _digit_run_ordinal(self, digits):
+        """``_digit_run_words`` тин иреттик формасы (цифра-цифра менен окулса, акыркы цифра иреттик)."""
+        if len(digits) > self.long_number_digits:
+            if self.long_numbers == 'digits':
+                last = self._group_ordinals[int(digits[-1])] or self.digit_words['0'] + 'үнчү'
+                return ' '.join(filter(None, (self.digits_to_words(digits[:-1]), last)))
+            return self.number_string_to_ordinal(digits)
+        return self.number_to_ordinal(int(digits))
 
     def number_to_ordinal(self, num):
-        if 0 <= num <= 100:
-            return self._ordinal_cache[num]
-        return self._compute_number_to_ordinal(num)
+        ordinals = self._ordinals
+        if 0 <= num < len(ordinals):
+            return ordinals[num]
+        if num < 0:
+            return 'минус ' + self.number_to_ordinal(-num)
+
+        upper, low = divmod(num, 1000)
+        if low:
+            if upper < 1000:
+                return self._scaled_groups[1][upper] + ' ' + self._group_ordinals[low]
+            parts = self._group_parts(num - low)
+            parts.append(self._group_ordinals[low])
+            return ' '.join(parts)
+        # Акыркы сөз — масштаб: миң → миңинчи, миллион → миллионунчу
+        words = ' '.join(self._group_parts(num))
+        head, _, scale = words.rpartition(' ')
+        return head + ' ' + self.scale_ordinals[scale]
+
+    def number_to_words_many(self, values):
+        """
+        Сандардын массивин сөзгө айландыруу (``number_to_words`` менен бирдей).
+
+        Args:
+            values: NumPy бүтүн сандар массиви же сандардын итерабели.
+                NumPy орнотулган болсо, топторго бөлүү векторлоштурулат
+                жана кайталанган маанилер бир эле жолу айландырылат.
+
+        Returns:
+            ``numpy.ndarray`` үчүн — ошол формадагы object-массив,
+            башка учурда — саптардын тизмеси
+        """
+        from .bulk import number_to_words_many
+        return number_to_words_many(self, values)
+
+    def number_to_ordinal_many(self, values):
+        """Иреттик сандардын массиви (``number_to_ordinal`` менен бирдей)."""
+        from .bulk import number_to_ordinal_many
+        return number_to_ordinal_many(self, values)
 
     def roman_to_number(self, roman):
         result = 0
@@ -425,15 +763,12 @@ class KyrgyzTextNormalizer:
 
     def decimal_to_words(self, num_str):
         parts = num_str.split(',')
-        whole = int(parts[0]) if parts[0] else 0
-        result = 'нөл' if whole == 0 else self.number_to_words(whole)
+        result = self._digit_run_words(parts[0]) if parts[0] else 'нөл'
 
         if len(parts) > 1 and parts[1]:
             decimal = parts[1]
-            decimal_places = {1: 'ондон', 2: 'жүздөн', 3: 'миңден',
-                              4: 'он миңден', 5: 'жүз миңден', 6: 'миллиондон'}
-            place = decimal_places.get(len(decimal), '')
-            decimal_num = self.number_to_words(int(decimal))
+            place = self.decimal_places.get(len(decimal), '')
+            decimal_num = self._digit_run_words(decimal)
             result += ' бүтүн'
             if place:
                 result += f' {place} {decimal_num}'
@@ -446,34 +781,39 @@ class KyrgyzTextNormalizer:
     # Сингармонизм
     # ================================================================
 
-    def apply_suffix_harmony(self, word, suffix):
-        if not suffix:
-            return word
-
-        word_lower = word.lower().strip()
-        if not word_lower:
-            return word + suffix
-
-        back_rounded = 'оу'
-        back_unrounded = 'аы'
-        front_rounded = 'өү'
-        front_unrounded = 'еи'
-        all_vowels = back_rounded + back_unrounded + front_rounded + front_unrounded
-        voiceless = 'кпстфхцчшщ'
+    def _harmony_class(self, word_lower):
+        """
+        Сөздүн үндөшүү классы: ``(акыркы үндүүнүн классы, акыркы тамганын классы)``.
 
-        last_char = word_lower[-1]
-        last_vowel = ''
+        Үндүүнүн классы: 0 — жоон эринчил (о, у), 1 — жоон эринсиз (а, ы),
+        2 — ичке эринчил (ө, ү), 3 — ичке эринсиз (е, и), 4 — үндүү жок.
+        Акыркы тамга: 0 — үндүү, 1 — каткалаң үнсүз, 2 — башка.
+        """
+        vowel_class = 4
         for ch in reversed(word_lower):
-            if ch in all_vowels:
-                last_vowel = ch
+            vowel_class = self._HARMONY_VOWELS.get(ch, 4)
+            if vowel_class != 4:
                 break
-
-        is_back_rounded = last_vowel in back_rounded
-        is_back_unrounded = last_vowel in back_unrounded
-        is_front_rounded = last_vowel in front_rounded
-        is_front_unrounded = last_vowel in front_unrounded
-        ends_vowel = last_char in all_vowels
-        ends_voiceless = last_char in voiceless
+        last_char = word_lower[-1]
+        if last_char in self._HARMONY_VOWELS:
+            ending = 0
+        elif last_char in self._VOICELESS:
+            ending = 1
+        else:
+            ending = 2
+        return vowel_class, ending
+
+    def _harmonize_suffix(self, harmony_class, suffix):
+        """Суффиксти үндөшүү классына ылайыкташтырат (``_harmony_table`` үчүн)."""
+        vowel_class, ending = harmony_class
+        # Үндүүсүз сөз (мис. аббревиатура) бардык класстарга тиешелүү деп
+        # эсептелет — мурунку ``'' in 'өү'`` текшерүүсүнүн жыйынтыгы
+        no_vowel = vowel_class == 4
+        is_back_rounded = vowel_class == 0 or no_vowel
+        is_front_rounded = vowel_class == 2 or no_vowel
+        is_front_unrounded = vowel_class == 3 or no_vowel
+        ends_vowel = ending == 0
+        ends_voiceless = ending == 1
 
         new_suffix = suffix
         fc = suffix[0]
@@ -512,65 +852,147 @@ class KyrgyzTextNormalizer:
                 out.append('у' if is_back_rounded else 'ү')
             else:
                 out.append(ch)
+        return ''.join(out)
+
+    def _word_harmony_class(self, word_lower):
+        harmony_class = self._harmony_classes.get(word_lower)
+        if harmony_class is not None:
+            return harmony_class
+        # Акыркы сөздө үндүү болсо, класс ошол сөз менен гана аныкталат
+        token = word_lower.rpartition(' ')[2]
+        harmony_class = self._harmony_classes.get(token)
+        if harmony_class is None:
+            harmony_class = self._harmony_class(token)
+            if harmony_class[0] == 4:
+                harmony_class = self._harmony_class(word_lower)
+        # Үндүүсүз сөздүн (мис. "тв") классы алдындагы сөздөрдөн көз каранды,
+        # ошондуктан ал эстелбейт: "тв" жана "мамлекеттик тв" ар башка
+        if harmony_class[0] != 4 and len(self._harmony_classes) < self._HARMONY_MEMO_LIMIT:
+            self._harmony_classes[word_lower] = harmony_class
+        return harmony_class
 
-        return word + ''.join(out)
+    def apply_suffix_harmony(self, word, suffix):
+        if not suffix:
+            return word
+
+        inflected = self._inflected.get((word, suffix))
+        if inflected is not None:
+            return inflected
+
+        # Ачкычтар кичине тамга менен жана боштуксуз, ошондуктан табылса —
+        # сөз ошондой формада
+        harmony_class = self._harmony_classes.get(word)
+        if harmony_class is None:
+            word_lower = word.lower().strip()
+            if not word_lower:
+                return word + suffix
+            harmony_class = self._word_harmony_class(word_lower)
+        ending = self._harmony_table.get((harmony_class, suffix))
+        if ending is None:
+            ending = self._harmonize_suffix(harmony_class, suffix)
+            if len(self._harmony_table) < self._HARMONY_MEMO_LIMIT:
+                self._harmony_table[(harmony_class, suffix)] = ending
+        return word + ending
 
     # ================================================================
     # Убакыт хелпери
     # ================================================================
 
+    def _init_time_minutes(self):
+        """
+        ``_time_minutes[мүнөт][негиз]`` — ``'01'..'59'`` мүнөттөрдүн сөздөрү
+        суффикстин ар бир негизи менен (``None`` — суффикссиз).
+
+        ``time_suffixes`` тин даяр формалары ушул жерде бир жолу колдонулат;
+        калгандары — ``apply_suffix_harmony``.
+        """
+        bases = (None,) + tuple(dict.fromkeys(self._suffix_base_map.values()))
+        minutes = {}
+        for minute in range(1, 60):
+            words = self.number_to_words(minute)
+            if minute < 10:
+                words = f"{self.digit_words['0']} {words}"
+            minutes[f'{minute:02d}'] = {
+                base: self.time_suffixes.get((words, base)) or self.apply_suffix_harmony(words, base)
+                for base in bases
+            }
+        KyrgyzTextNormalizer._time_minutes = minutes
+
     def _time_to_words(self, hours, minutes_str, suffix=None):
+        key = (hours, minutes_str, suffix)
+        words = self._time_words.get(key)
+        if words is None:
+            words = self._compute_time_words(hours, minutes_str, suffix)
+            # Жарактуу убакыттар гана: таблица 24 * 60 * 17 жазуудан ашпайт
+            if (hours < 24 and minutes_str.isdigit() and int(minutes_str) < 60
+                    and (not suffix or suffix in self._suffix_base_map)):
+                self._time_words[key] = words
+        return words
+
+    def _compute_time_words(self, hours, minutes_str, suffix):
+        base = self._suffix_base_map.get(suffix, suffix) if suffix else None
         hours_word = self.number_to_words(hours)
 
-        if not suffix:
-            if minutes_str == '00':
-                return hours_word
-            if minutes_str.startswith('0'):
-                return f"{hours_word} нөл {self.number_to_words(int(minutes_str[1]))}"
-            return f"{hours_word} {self.number_to_words(int(minutes_str))}"
-
-        base = self._suffix_base_map.get(suffix, suffix)
-
         if minutes_str == '00':
             return self.apply_suffix_harmony(hours_word, base)
 
+        forms = self._time_minutes.get(minutes_str)
+        if forms is not None and base in forms:
+            return f"{hours_word} {forms[base]}"
+
+        # Жараксыз мүнөттөр (60..99) же белгисиз суффикс
         if minutes_str.startswith('0'):
             time_str = f"{hours_word} нөл {self.number_to_words(int(minutes_str[1]))}"
-            return self.apply_suffix_harmony(time_str, base)
-
-        minutes_word = self.number_to_words(int(minutes_str))
-        hardcoded = self.time_suffixes.get((minutes_word, base))
-        if hardcoded:
-            return f"{hours_word} {hardcoded}"
-
-        return self.apply_suffix_harmony(f"{hours_word} {minutes_word}", base)
+        else:
+            time_str = f"{hours_word} {self.number_to_words(int(minutes_str))}"
+        return self.apply_suffix_harmony(time_str, base)
 
     # ================================================================
     # Дата хелперлери
     # ================================================================
 
+    def _cached_date(self, fmt, m, compute):
+        """
+        Датанын сөздөрү ``(формат, күн, ай, жыл)`` ачкычы менен кэштен.
+
+        ``compute`` топтордон (сап түрүндө) сөздөрдү эсептейт же ``None``
+        кайтарат (дата эмес) — анда текст өзгөрбөйт жана кэшке жазылбайт.
+        """
+        key = (fmt,) + m.groups()
+        words = self._date_cache.get(key)
+        if words is None:
+            words = compute(*m.groups())
+            if words is None:
+                return m.group(0)
+            self._date_cache.put(key, words)
+        return words
+
     def _format_date_ymd(self, m):
-        year_full = int(m.group(1))
-        num2, num3 = int(m.group(2)), int(m.group(3))
+        return self._cached_date('ymd', m, self._date_ymd_words)
+
+    def _format_date_dmy(self, m):
+        return self._cached_date('dmy', m, self._date_dmy_words)
+
+    def _date_ymd_words(self, year_str, num2_str, num3_str):
+        year_full = int(year_str)
+        num2, num3 = int(num2_str), int(num3_str)
 
         if num2 <= 12:
-            month_num, day = str(num2).zfill(2), num3
+            month_num, day = num2, num3
         elif num3 <= 12:
-            month_num, day = str(num3).zfill(2), num2
+            month_num, day = num3, num2
         else:
-            return m.group(0)
+            return None
 
-        month = self.months.get(month_num, month_num)
-        return f"{self.number_to_ordinal(year_full)} жыл {self.number_to_ordinal(day)} {month}"
+        return self._date_words(year_full, month_num, day)
 
-    def _format_date_dmy(self, m):
-        num1, num2 = int(m.group(1)), int(m.group(2))
-        year_str = m.group(3)
+    def _date_dmy_words(self, num1_str, num2_str, year_str):
+        num1, num2 = int(num1_str), int(num2_str)
 
         if num2 > 12 and num1 <= 12:
-            month_num, day = str(num1).zfill(2), num2
+            month_num, day = num1, num2
         else:
-            day, month_num = num1, str(num2).zfill(2)
+            day, month_num = num1, num2
 
         if len(year_str) == 2:
             y = int(year_str)
@@ -578,303 +1000,799 @@ class KyrgyzTextNormalizer:
         else:
             year_full = int(year_str)
 
+        return self._date_words(year_full, month_num, day)
+
+    def _date_words(self, year_full, month_num, day):
+        month_num = str(month_num).zfill(2)
         month = self.months.get(month_num, month_num)
         return f"{self.number_to_ordinal(year_full)} жыл {self.number_to_ordinal(day)} {month}"
 
+    def date_cache_info(self):
+        """
+        Даталардын сөздөрүнүн кэшинин статистикасы.
+
+        Returns:
+            ``CacheInfo(hits, misses, evictions, size, maxsize, nbytes, maxbytes)``
+        """
+        return self._date_cache.info()
+
+    def date_cache_clear(self):
+        self._date_cache.clear()
+
     # ================================================================
-    # Нормализация этаптары
+    # Эреже иштеткичтери (regex match → текст)
     # ================================================================
 
-    def _normalize_short_abbr(self, text):
-        for pat, full in self._short_abbr_compiled:
-            text = pat.sub(full, text)
-        for pat, full in self._month_abbr_compiled:
-            text = pat.sub(full, text)
-        return text
+    def _sub_email(self, m):
+        return f"{m.group(1)} эт белгиси {m.group(2)} чекит {m.group(3)}"
 
-    def _normalize_contacts(self, text):
-        text = self._p_email.sub(
-            lambda m: f"{m.group(1)} эт белгиси {m.group(2)} чекит {m.group(3)}", text)
-        text = self._p_phone_996.sub(
-            lambda m: (f"плюс тогуз тогуз алты {self.digits_to_words(m.group(1))} "
-                       f"{self.digits_to_words(m.group(2))} {self.digits_to_words(m.group(3))}"), text)
-        text = self._p_phone_mobile.sub(
-            lambda m: (f"{self.digits_to_words(m.group(1))} {self.digits_to_words(m.group(2))} "
-                       f"{self.digits_to_words(m.group(3))}"), text)
-        text = self._p_phone_context.sub(
-            lambda m: f"{m.group(1)} {self.digits_to_words(m.group(2))}", text)
-        return text
+    def _sub_phone_996(self, m):
+        return (f"плюс тогуз тогуз алты {self.digits_to_words(m.group(1))} "
+                f"{self.digits_to_words(m.group(2))} {self.digits_to_words(m.group(3))}")
 
-    def _normalize_dates(self, text):
-        text = self._p_date_ymd.sub(self._format_date_ymd, text)
+    def _sub_phone_mobile(self, m):
+        return (f"{self.digits_to_words(m.group(1))} {self.digits_to_words(m.group(2))} "
+                f"{self.digits_to_words(m.group(3))}")
 
-        def _convert_invalid(m):
-            return ' '.join(self.number_to_words(int(p)) for p in re.split(r'[./]', m.group(0)) if p)
-        text = self._p_date_invalid.sub(_convert_invalid, text)
+    def _sub_phone_context(self, m):
+        return f"{m.group(1)} {self.digits_to_words(m.group(2))}"
 
-        text = self._p_date_year_word.sub(
-            lambda m: f"{self.number_to_ordinal(int(m.group(1)))} жылдын "
-                       f"{self.number_to_ordinal(int(m.group(2)))} {m.group(3)}", text)
+    def _sub_separated_numbers(self, m):
+        return ' '.join(self._digit_run_words(p) for p in re.split(r'[./]', m.group(0)) if p)
 
-        text = self._p_date_dmy_comma.sub(
-            lambda m: f"{self.number_to_words(int(m.group(1)))} {m.group(2)} "
-                       f"{self.number_to_ordinal(int(m.group(3)))} жыл", text)
+    def _sub_date_year_word(self, m):
+        return (f"{self.number_to_ordinal(int(m.group(1)))} жылдын "
+                f"{self.number_to_ordinal(int(m.group(2)))} {m.group(3)}")
 
-        text = self._p_date_dmy_space.sub(
-            lambda m: f"{self.number_to_words(int(m.group(1)))} {m.group(2)} "
-                       f"{self.number_to_ordinal(int(m.group(3)))} жыл", text)
+    def _sub_date_dmy_words(self, m):
+        return (f"{self.number_to_words(int(m.group(1)))} {m.group(2)} "
+                f"{self.number_to_ordinal(int(m.group(3)))} жыл")
 
-        text = self._p_date_iso_time.sub(
-            lambda m: (f"{self.number_to_words(int(m.group(1)))} жылдын "
-                       f"{self.months.get(m.group(2), m.group(2))} айынын "
-                       f"{self.number_to_words(int(m.group(3)))} күнү саат "
-                       f"{self.number_to_words(int(m.group(4)))} "
-                       f"{self.number_to_words(int(m.group(5)))}"), text)
+    def _sub_date_iso_time(self, m):
+        return (f"{self.number_to_words(int(m.group(1)))} жылдын "
+                f"{self.months.get(m.group(2), m.group(2))} айынын "
+                f"{self.number_to_words(int(m.group(3)))} күнү саат "
+                f"{self.number_to_words(int(m.group(4)))} "
+                f"{self.number_to_words(int(m.group(5)))}")
 
-        text = self._p_date_iso.sub(self._format_date_ymd, text)
+    def _sub_date_text_month(self, m):
+        return self._cached_date('text_month', m, self._date_text_month_words)
 
-        text = self._p_date_text_month.sub(
-            lambda m: (f"{self.number_to_ordinal(int(m.group(1)))} {m.group(2).lower()} "
-                       f"{self.number_to_ordinal(int(m.group(3)))} жыл"), text)
+    def _date_text_month_words(self, day, month, year):
+        return (f"{self.number_to_ordinal(int(day))} {month.lower()} "
+                f"{self.number_to_ordinal(int(year))} жыл")
 
-        text = self._p_date_dot.sub(self._format_date_dmy, text)
-        text = self._p_date_slash.sub(self._format_date_dmy, text)
-        text = self._p_date_dash.sub(self._format_date_dmy, text)
-        return text
+    def _sub_year_range(self, m):
+        return (f"{self.number_to_ordinal(int(m.group(1)))} "
+                f"{self.number_to_ordinal(int(m.group(2)))} жылдар")
 
-    def _normalize_years(self, text):
-        text = self._p_year_range.sub(
-            lambda m: f"{self.number_to_ordinal(int(m.group(1)))} "
-                       f"{self.number_to_ordinal(int(m.group(2)))} жылдар", text)
-        text = self._p_year_single.sub(
-            lambda m: f"{self.number_to_ordinal(int(m.group(1)))} жыл"
-                       + ('ы' if m.group(2) == 'жылы' else ''), text)
-        return text
+    def _sub_year_single(self, m):
+        return (f"{self.number_to_ordinal(int(m.group(1)))} жыл"
+                + ('ы' if m.group(2) == 'жылы' else ''))
 
-    def _normalize_time(self, text):
-        text = self._p_time_colon_sfx.sub(
-            lambda m: self._time_to_words(int(m.group(1)), m.group(2), m.group(3)), text)
+    def _sub_time_sfx(self, m):
+        return self._time_to_words(int(m.group(1)), m.group(2), m.group(3))
 
-        text = self._p_time_colon.sub(
-            lambda m: self._time_to_words(int(m.group(1)), m.group(2)), text)
+    def _sub_time_colon(self, m):
+        return self._time_to_words(int(m.group(1)), m.group(2))
 
-        def _dot_ctx(m):
-            prefix = m.group(1) or ''
-            return prefix + self._time_to_words(int(m.group(2)), m.group(3), m.group(4))
-        text = self._p_time_dot_ctx.sub(_dot_ctx, text)
-        return text
+    def _sub_time_dot_ctx(self, m):
+        prefix = m.group(1) or ''
+        return prefix + self._time_to_words(int(m.group(2)), m.group(3), m.group(4))
 
-    def _normalize_currency(self, text):
-        text = self._p_number_k.sub(
-            lambda m: f"{self.number_to_words(int(m.group(1)))} миң", text)
+    def _sub_number_k(self, m):
+        return f"{self._digit_run_words(m.group(1))} миң"
 
-        text = self._p_som_range.sub(
-            lambda m: f"{self.decimal_to_words(m.group(1))} {self.decimal_to_words(m.group(2))} сом", text)
+    def _sub_som_range(self, m):
+        return f"{self.decimal_to_words(m.group(1))} {self.decimal_to_words(m.group(2))} сом"
 
-        text = self._p_large_range.sub(
-            lambda m: (f"{self.decimal_to_words(m.group(1))} {self.decimal_to_words(m.group(2))} "
-                       f"{self.large_numbers.get(m.group(3), m.group(3))} {m.group(4)}"), text)
+    def _sub_large_range(self, m):
+        return (f"{self.decimal_to_words(m.group(1))} {self.decimal_to_words(m.group(2))} "
+                f"{_lookup(self.large_numbers, m.group(3), m.group(3))} {m.group(4)}")
 
-        text = self._p_large_single.sub(
-            lambda m: (f"{self.decimal_to_words(m.group(1))} "
-                       f"{self.large_numbers.get(m.group(2), m.group(2))} {m.group(3)}"), text)
+    def _sub_large_single(self, m):
+        return (f"{self.decimal_to_words(m.group(1))} "
+                f"{_lookup(self.large_numbers, m.group(2), m.group(2))} {m.group(3)}")
 
-        text = self._p_som_spaced_dec.sub(
-            lambda m: (f"{self.number_to_words(int(m.group(1).replace(' ', '')))} сом "
-                       f"{self.number_to_words(int(m.group(2)))} тыйын"), text)
+    def _sub_som_spaced_dec(self, m):
+        return (f"{self._digit_run_words(''.join(m.group(1).split()))} сом "
+                f"{self._digit_run_words(m.group(2))} тыйын")
 
-        text = self._p_som_spaced.sub(
-            lambda m: f"{self.number_to_words(int(m.group(1).replace(' ', '')))} сом", text)
+    def _sub_som_spaced(self, m):
+        return f"{self._digit_run_words(''.join(m.group(1).split()))} сом"
 
-        text = self._p_som_simple.sub(
-            lambda m: f"{self.number_to_words(int(m.group(1)))} сом", text)
+    def _sub_som_simple(self, m):
+        return f"{self._digit_run_words(m.group(1))} сом"
 
-        text = self._p_cur_before.sub(
-            lambda m: f"{self.decimal_to_words(m.group(2))} {self.currencies[m.group(1)]}", text)
-        text = self._p_cur_after.sub(
-            lambda m: f"{self.decimal_to_words(m.group(1))} {self.currencies[m.group(2)]}", text)
-        return text
+    def _sub_cur_before(self, m):
+        currency = _lookup(self.currencies, m.group(1))
+        if currency is None:
+            return m.group(0)
+        return f"{self.decimal_to_words(m.group(2))} {currency}"
 
-    def _normalize_time_dot_sfx(self, text):
-        text = self._p_time_dot_sfx.sub(
-            lambda m: self._time_to_words(int(m.group(1)), m.group(2), m.group(3)), text)
-        return text
+    def _sub_cur_after(self, m):
+        currency = _lookup(self.currencies, m.group(2))
+        if currency is None:
+            return m.group(0)
+        return f"{self.decimal_to_words(m.group(1))} {currency}"
 
-    def _normalize_ordinals(self, text):
-        def _num_dash_word(m):
-            num, word = int(m.group(1)), m.group(2)
-            for sfx in self.cardinal_suffixes:
-                if word.lower().find(sfx) >= 2:
-                    return f"{self.number_to_words(num)} {word}"
-            return f"{self.number_to_ordinal(num)} {word}"
+    def _sub_num_dash_word(self, m):
+        digits, word = m.group(1), m.group(2)
+        for sfx in self.cardinal_suffixes:
+            if word.lower().find(sfx) >= 2:
+                return f"{self._digit_run_words(digits)} {word}"
+        return f"{self._digit_run_ordinal(digits)} {word}"
 
-        text = self._p_num_dash_word.sub(_num_dash_word, text)
+    def _sub_ordinal(self, m):
+        return self._digit_run_ordinal(m.group(1))
 
-        text = self._p_ordinal_sfx.sub(
-            lambda m: self.number_to_ordinal(int(m.group(1))), text)
+    def _sub_age(self, m):
+        return f"{self._digit_run_words(m.group(1))} жашта"
 
-        text = self._p_age.sub(
-            lambda m: f"{self.number_to_words(int(m.group(1)))} жашта", text)
+    def _sub_class(self, m):
+        return f"{self._digit_run_ordinal(m.group(1))} класста"
 
-        text = self._p_class.sub(
-            lambda m: f"{self.number_to_ordinal(int(m.group(1)))} класста", text)
+    def _sub_minutes(self, m):
+        return f"{self._digit_run_words(m.group(1))} {_lookup(self.units, m.group(2), m.group(2))}"
 
-        text = self._p_minutes.sub(
-            lambda m: f"{self.number_to_words(int(m.group(1)))} {self.units.get(m.group(2), m.group(2))}", text)
+    def _sub_course(self, m):
+        return f"{self._digit_run_ordinal(m.group(1))} курста"
 
-        text = self._p_course.sub(
-            lambda m: f"{self.number_to_ordinal(int(m.group(1)))} курста", text)
-        return text
+    # Сөздүк жаңыртылып жатканда бирдик табылгандан кийин өчүрүлүшү
+    # мүмкүн — анда текст өзгөрбөйт
+    def _sub_units_range(self, m):
+        unit = _lookup(self.units, m.group(3))
+        if unit is None:
+            return m.group(0)
+        return (f"{self.decimal_to_words(m.group(1))} "
+                f"{self.decimal_to_words(m.group(2))} {unit}")
 
-    def _normalize_units(self, text):
-        text = self._p_units_range.sub(
-            lambda m: (f"{self.decimal_to_words(m.group(1))} "
-                       f"{self.decimal_to_words(m.group(2))} {self.units[m.group(3)]}"), text)
-        text = self._p_units_single.sub(
-            lambda m: f"{self.decimal_to_words(m.group(1))} {self.units[m.group(2)]}", text)
-        return text
+    def _sub_units_single(self, m):
+        unit = _lookup(self.units, m.group(2))
+        if unit is None:
+            return m.group(0)
+        return f"{self.decimal_to_words(m.group(1))} {unit}"
 
-    def _normalize_percentages(self, text):
-        text = self._p_pct_range.sub(
-            lambda m: f"{self.decimal_to_words(m.group(1))} {self.decimal_to_words(m.group(2))} пайыз", text)
-        text = self._p_pct_single.sub(
-            lambda m: f"{self.decimal_to_words(m.group(1))} пайыз", text)
-        return text
+    def _sub_pct_range(self, m):
+        return f"{self.decimal_to_words(m.group(1))} {self.decimal_to_words(m.group(2))} пайыз"
 
-    def _normalize_centuries(self, text):
-        def _roman_range(m):
-            try:
-                n1 = self.roman_to_number(m.group(1))
-                n2 = self.roman_to_number(m.group(2))
-            except (ValueError, IndexError):
-                return m.group(0)
-            word = 'кылымдары' if m.group(3) == 'кылымдары' else 'кылымдар'
-            return f"{self.number_to_ordinal(n1)} {self.number_to_ordinal(n2)} {word}"
+    def _sub_pct_single(self, m):
+        return f"{self.decimal_to_words(m.group(1))} пайыз"
+
+    def _sub_century_roman_range(self, m):
+        try:
+            n1 = self.roman_to_number(m.group(1))
+            n2 = self.roman_to_number(m.group(2))
+        except (ValueError, IndexError):
+            return m.group(0)
+        word = 'кылымдары' if m.group(3) == 'кылымдары' else 'кылымдар'
+        return f"{self.number_to_ordinal(n1)} {self.number_to_ordinal(n2)} {word}"
+
+    def _sub_century_arabic_range(self, m):
+        return (f"{self._digit_run_ordinal(m.group(1))} "
+                f"{self._digit_run_ordinal(m.group(2))} "
+                f"{'кылымдары' if m.group(3) == 'кылымдары' else 'кылымдар'}")
+
+    def _sub_math_mul_eq(self, m):
+        return (f"{self._digit_run_words(m.group(1))} көбөйтүү "
+                f"{self._digit_run_words(m.group(2))} барабар "
+                f"{self._digit_run_words(m.group(3))}")
+
+    def _sub_math_add_eq(self, m):
+        return (f"{self._digit_run_words(m.group(1))} кошуу "
+                f"{self._digit_run_words(m.group(2))} барабар "
+                f"{self._digit_run_words(m.group(3))}")
+
+    def _sub_math_sub_eq(self, m):
+        return (f"{self._digit_run_words(m.group(1))} кемитүү "
+                f"{self._digit_run_words(m.group(2))} барабар "
+                f"{self._digit_run_words(m.group(3))}")
+
+    def _sub_math_div_eq(self, m):
+        return (f"{self._digit_run_words(m.group(1))} бөлүү "
+                f"{self._digit_run_words(m.group(2))} барабар "
+                f"{self._digit_run_words(m.group(3))}")
+
+    def _sub_num_range(self, m):
+        return f"{self.decimal_to_words(m.group(1))} {self.decimal_to_words(m.group(2))}"
+
+    def _sub_math_add(self, m):
+        return f"{self._digit_run_words(m.group(1))} кошуу {self._digit_run_words(m.group(2))}"
+
+    def _sub_math_mul(self, m):
+        return f"{self._digit_run_words(m.group(1))} көбөйтүү {self._digit_run_words(m.group(2))}"
+
+    def _sub_math_div(self, m):
+        return f"{self._digit_run_words(m.group(1))} бөлүү {self._digit_run_words(m.group(2))}"
+
+    def _sub_abbr(self, m):
+        full = _lookup(getattr(self, m.table), m.key)
+        if full is None:
+            return m.string[m.start:m.end]
+        if m.table == 'kyrgyz_abbr' and m.tail:
+            return self.apply_suffix_harmony(full, m.tail)
+        return full
+
+    def _sub_addr_district(self, m):
+        return f"{self._digit_run_ordinal(m.group(1))} кичи район"
+
+    def _sub_fraction(self, m):
+        numer = self._digit_run_words(m.group(1))
+        denom = self._digit_run_words(m.group(2))
+        return f"{self.apply_suffix_harmony(denom, 'дан')} {numer}"
+
+    def _sub_apostrophe(self, m):
+        return m.group(1) + m.group(2)
+
+    def _sub_number_sign(self, m):
+        return f"номур {self._digit_run_words(m.group(1))}"
+
+    def _sub_standalone_symbol(self, m):
+        return _lookup(self.symbols, m.group(1), m.group(0))
+
+    def _sub_roman_century(self, m):
+        try:
+            return f"{self.number_to_ordinal(self.roman_to_number(m.group(1)))} кылым"
+        except (ValueError, IndexError):
+            return m.group(0)
+
+    def _sub_roman_general(self, m):
+        return self.number_to_ordinal(self.roman_to_number(m.group(0)))
+
+    def _sub_decimal(self, m):
+        return self.decimal_to_words(m.group(1))
+
+    def _sub_spaced_num(self, m):
+        return self._digit_run_words(''.join(m.group(0).split()))
+
+    def _sub_simple_num(self, m):
+        return self._digit_run_words(m.group(1))
+
+    def _sub_letter_digit(self, m):
+        return f"{m.group(1)} {m.group(2)}"
+
+    def _sub_remaining(self, m):
+        return self._digit_run_words(m.group(0))
+
+    # ================================================================
+    # Этаптардын эрежелери
+    # ================================================================
+
+    def _init_plan(self):
+        """
+        ``scan`` кыймылдаткычынын планын даярдайт.
+
+        Этаптын триггери этапка биринчи жолу жеткенде, эрежелери триггер
+        биринчи жолу табылганда компиляцияланат (``warmup()`` — баарын
+        азыр). Пландын жазуусу — ``[этап, сандыкпы, триггер, эрежелер,
+        цифрасыз эрежелер]``.
+        """
+        self._stage_rules = {}
+        self._scan_plan = [[stage, stage in self._NUMERIC_STAGES, _UNLOADED, None, None]
+                           for stage in self.stages]
+        self.reset_stage_stats()
+
+    def _get_stage_rules(self, stage):
+        """
+        Этаптын эрежелерин артыкчылык тартибинде кайтарат (биринчи жолу түзүлөт).
+
+        Эреже — ``(аты, паттерн, алмаштыруу)``. ``_DIGIT_FREE_RULES``
+        тизмесиндеги эрежелерден башкасынын баары санды талап кылат:
+        цифрасы жок сегментте ``scan`` кыймылдаткычы аларды өткөрүп жиберет.
+        """
+        rules = self._stage_rules.get(stage)
+        if rules is None:
+            rules = self._stage_rules[stage] = getattr(self, f'_rules_{stage}')()
+        return rules
+
+    def _load_trigger(self, entry):
+        stage = entry[0]
+        if stage in self._MATCHER_STAGES:
+            entry[2] = self._get_stage_rules(stage)[0][1].trigger
+            return entry[2]
+        source = self._trigger_source(stage)
+        entry[2] = None if source is None else self._re(source)
+        return entry[2]
+
+    def _load_plan_rules(self, entry):
+        stage = entry[0]
+        rules = self._get_stage_rules(stage)
+        plain_rules = [rule for rule in rules if rule[0] in self._DIGIT_FREE_RULES]
+        entry[3], entry[4] = rules, plain_rules
+        return rules, plain_rules
+
+    def warmup(self):
+        """
+        Бардык этаптардын паттерндерин азыр компиляциялайт.
+
+        Демейки боюнча паттерндер биринчи колдонулганда компиляцияланат;
+        ``warmup()`` бул чыгымды тандалган убакытка (мис. сервердин
+        ишке киргизилишине) жылдырат.
+
+        Returns:
+            ``self``
+        """
+        for entry in self._scan_plan:
+            if entry[2] is _UNLOADED:
+                self._load_trigger(entry)
+            if entry[3] is None:
+                self._load_plan_rules(entry)
+        return self
+
+    def _rules_short_abbr(self):
+        return [('short_abbr', self._matcher('short_abbr'), self._sub_abbr)]
+
+    def _rules_contacts(self):
+        _re = self._re
+        return [
+            ('email', _re(r'\b([a-zA-Z0-9._%+-]{1,64})@([a-zA-Z0-9.-]+)\.([a-zA-Z]{2,})\b'),
+             self._sub_email),
+            ('phone_996', _re(r'\+996[\s-]?(\d{3})[\s-]?(\d{3})[\s-]?(\d{3})'),
+             self._sub_phone_996),
+            ('phone_mobile', _re(r'\b(0\d{3})[\s-]?(\d{3})[\s-]?(\d{3})\b'),
+             self._sub_phone_mobile),
+            ('phone_context', _re(
+                r'(номер|номери|тел|телефон|звоните|позвоните|code|код|борбор|индекс|почтовый|WhatsApp|Telegram)'
+                r'[\s::-]*(\d{3,6})\b', re.IGNORECASE), self._sub_phone_context),
+        ]
+
+    def _rules_dates(self):
+        _re = self._re
+        return [
+            ('date_ymd', _re(r'\b(\d{4})[./](\d{1,2})[./](\d{1,2})\b'), self._format_date_ymd),
+            ('date_invalid', _re(
+                r'\b\d{3,}(?:[./]\d+)+\b|(?<!\d[./])\b\d+(?:[./]\d{3,})+\b'),
+             self._sub_separated_numbers),
+            ('date_year_word', _re(r'(\d{4})\s*(?:-\s*)?жылдын\s+(\d{1,2})\s*(?:-\s*)?(\w+)'),
+             self._sub_date_year_word),
+            ('date_dmy_comma', _re(r'\b(\d{1,2})\s*(?:-\s*)?(\w+),?\s*(\d{4})\s*[-\.]\s*жыл\b'),
+             self._sub_date_dmy_words),
+            ('date_dmy_space', _re(r'\b(\d{1,2})\s*(?:-\s*)?(\w+)\s+(\d{4})\s*[-\.]\s*жыл\b'),
+             self._sub_date_dmy_words),
+            ('date_iso_time', _re(r'(\d{4})-(\d{2})-(\d{2})\s+(\d{1,2}):(\d{2})'),
+             self._sub_date_iso_time),
+            ('date_iso', _re(r'\b(\d{4})-(\d{1,2})-(\d{1,2})\b'), self._format_date_ymd),
+            ('date_text_month', _re(
+                r'\b(\d{1,2})\s+(январь|февраль|март|апрель|май|июнь|июль|август|'
+                r'сентябрь|октябрь|ноябрь|декабрь)\s+(\d{4})\b', re.IGNORECASE),
+             self._sub_date_text_month),
+            ('date_dot', _re(r'\b(\d{1,2})\.(\d{1,2})\.(\d{2,4})\b'), self._format_date_dmy),
+            ('date_slash', _re(r'\b(\d{1,2})/(\d{1,2})/(\d{2,4})\b'), self._format_date_dmy),
+            ('date_dash', _re(r'\b(\d{1,2})-(\d{1,2})-(\d{2,4})\b'), self._format_date_dmy),
+        ]
+
+    def _rules_years(self):
+        _re = self._re
+        return [
+            ('year_range', _re(
+                r'(\d{4})\s*[-–—]\s*(\d{4})\s*(?:[-.]\s*)?(жылдары|жылдар|жж|гг)\.?'),
+             self._sub_year_range),
+            ('year_single', _re(r'(\d{4})\s*(?:[-.]\s*)?(жылы|жыл|жж|гг|ж|г)\.?(?!\w)'),
+             self._sub_year_single),
+        ]
+
+    def _rules_time(self):
+        _re = self._re
+        return [
+            ('time_colon_sfx', _re(rf'(\d{{1,2}}):(\d{{2}}){self._SFX}'), self._sub_time_sfx),
+            ('time_colon', _re(r'\b(\d{1,2}):(\d{2})\b'), self._sub_time_colon),
+            ('time_dot_ctx', _re(rf'((?:саат|убакыт)\s+)(\d{{1,2}})\.(\d{{2}}){self._SFX}?'),
+             self._sub_time_dot_ctx),
+        ]
+
+    def _rules_currency(self):
+        _re = self._re
+        return [
+            ('number_k', _re(r'\b(\d+)k\b'), self._sub_number_k),
+            ('som_range', _re(r'(?<!\d)(\d+(?:[,]\d+)?)\s*[-–—]\s*(\d+(?:[,]\d+)?)\s*сом\b'),
+             self._sub_som_range),
+            ('large_range', _re(
+                r'(?<!\d)(\d+(?:[,]\d+)?)\s*[-–—]\s*(\d+(?:[,]\d+)?)\s*(млн|млрд|трлн)\s*(сом|доллар|евро|рубль)'),
+             self._sub_large_range),
+            ('large_single', _re(r'(?<!\d)(\d+(?:[,]\d+)?)\s*(млн|млрд|трлн)\s*(сом|доллар|евро|рубль)'),
+             self._sub_large_single),
+            ('som_spaced_dec', _re(self._SPACED_START + r'(\d{1,3}(?:\s\d{3})*)[,.](\d{2})\s*сом'),
+             self._sub_som_spaced_dec),
+            ('som_spaced', _re(self._SPACED_START + r'(\d{1,3}(?:\s\d{3})+)\s*сом\b'),
+             self._sub_som_spaced),
+            ('som_simple', _re(r'(?<!\d)(\d+)\s*сом\b'), self._sub_som_simple),
+            ('cur_before', _re(r'([$€₽£¥₸₴])(\d+(?:[,]\d+)?)'), self._sub_cur_before),
+            ('cur_after', _re(r'(?<!\d)(\d+(?:[,]\d+)?)([$€₽£¥₸₴])'), self._sub_cur_after),
+        ]
+
+    def _rules_time_dot_sfx(self):
+        return [
+            ('time_dot_sfx', self._re(rf'\b(\d{{1,2}})\.(\d{{2}}){self._SFX}'), self._sub_time_sfx),
+        ]
+
+    def _rules_ordinals(self):
+        _re = self._re
+        return [
+            ('num_dash_word', _re(r'(?<!\d)(\d+)-([а-яөүңА-ЯӨҮҢ]+)'), self._sub_num_dash_word),
+            ('ordinal_sfx', _re(r'(?<!\d)(\d+)\s*(?:-\s*)?(чи|чу|чү|нчи|нчу|нчү|ынчы|инчи|үнчү|унчу)'),
+             self._sub_ordinal),
+            ('age', _re(r'(?<!\d)(\d+)жашта'), self._sub_age),
+            ('class', _re(r'(?<!\d)(\d+)(чи|чу|чү)\s*класста'), self._sub_class),
+            ('minutes', _re(r'(?<!\d)(\d+)(мин|мүн|сек|саат)\b'), self._sub_minutes),
+            ('course', _re(r'(?<!\d)(\d+)\s*(?:-\s*)?курста'), self._sub_course),
+        ]
+
+    def _rules_units(self):
+        matcher = self._matcher('units')
+        return [
+            ('units_range', matcher.range, self._sub_units_range),
+            ('units_single', matcher.single, self._sub_units_single),
+        ]
+
+    def _rules_percentages(self):
+        _re = self._re
+        return [
+            ('pct_range', _re(r'(?<!\d)(\d+(?:[,]\d+)?)\s*[-–—]\s*(\d+(?:[.,]\d+)?)\s*%'),
+             self._sub_pct_range),
+            ('pct_single', _re(r'(?<!\d)(\d+(?:[,]\d+)?)\s*%'), self._sub_pct_single),
+        ]
+
+    def _rules_centuries(self):
+        _re = self._re
+        return [
+            ('century_roman_range', _re(
+                r'\b([IVXLCDM]{1,15})\s*[-–—]\s*([IVXLCDM]{1,15})\s*(?:[-.]\s*)?(кылымдары|кылымдар|кк)\.?'),
+             self._sub_century_roman_range),
+            ('century_arabic_range', _re(
+                r'(?<!\d)(\d+)\s*[-–—]\s*(\d+)\s*(?:[-.]\s*)?(кылымдары|кылымдар|кк)\.?'),
+             self._sub_century_arabic_range),
+        ]
+
+    def _rules_math_and_ranges(self):
+        _re = self._re
+        return [
+            ('math_mul_eq', _re(r'(?<!\d)(\d+)\s*[×xXхХ*]\s*(\d+)\s*=\s*(\d+)'), self._sub_math_mul_eq),
+            ('math_add_eq', _re(r'(?<!\d)(\d+)\s*\+\s*(\d+)\s*=\s*(\d+)'), self._sub_math_add_eq),
+            ('math_sub_eq', _re(r'(?<!\d)(\d+)\s*[-−–—]\s*(\d+)\s*=\s*(\d+)'), self._sub_math_sub_eq),
+            ('math_div_eq', _re(r'(?<!\d)(\d+)\s*/\s*(\d+)\s*=\s*(\d+)'), self._sub_math_div_eq),
+            ('num_range', _re(r'\b(\d+(?:[,]\d+)?)\s*[-–—]\s*(\d+(?:[,]\d+)?)\b'),
+             self._sub_num_range),
+            ('math_add', _re(r'(?<!\d)(\d+)\s*\+\s*(\d+)'), self._sub_math_add),
+            ('math_mul', _re(r'(?<!\d)(\d+)\s*[×xXхХ*]\s*(\d+)'), self._sub_math_mul),
+            ('math_div', _re(r'(?<!\d)(\d+)\s*/\s*(\d+)'), self._sub_math_div),
+        ]
 
-        text = self._p_century_roman_range.sub(_roman_range, text)
+    def _rules_named_abbr(self):
+        return [('named_abbr', self._matcher('named_abbr'), self._sub_abbr)]
 
-        text = self._p_century_arabic_range.sub(
-            lambda m: (f"{self.number_to_ordinal(int(m.group(1)))} "
-                       f"{self.number_to_ordinal(int(m.group(2)))} "
-                       f"{'кылымдары' if m.group(3) == 'кылымдары' else 'кылымдар'}"), text)
+    def _rules_addresses(self):
+        _re = self._re
+        return [
+            ('addr_city', _re(r'\bг\.\s*'), ''),
+            ('addr_district', _re(r'(?<!\d)(\d+)\s*(?:-\s*)?кичи\s*район'), self._sub_addr_district),
+            ('fraction', _re(r'\b(\d+)/(\d+)\b'), self._sub_fraction),
+        ]
+
+    def _rules_symbols(self):
+        _re = self._re
+        return [
+            ('apostrophe', _re(r"(?<!\w)(\w+)'(\w+)"), self._sub_apostrophe),
+            ('quotes_double', _re(r'[«»„"""]'), ''),
+            ('quotes_single', _re(r"[''‚']"), ''),
+            ('number_sign', _re(r'№\s*(\d+)'), self._sub_number_sign),
+            ('standalone_symbol', _re(r'(?<=[,\s])([%№@&])(?=[,\s]|$)'),
+             self._sub_standalone_symbol),
+            ('roman_century', _re(r'\b([IVXLCDM]{1,15})\s*к\.'), self._sub_roman_century),
+            ('roman_general', _re(r'(?<![a-zA-Z])\b([IVXLCDM]{1,15})\b(?!\.|\s*[a-zA-Z])'),
+             self._sub_roman_general),
+        ]
+
+    def _rules_remaining_numbers(self):
+        _re = self._re
+        return [
+            ('decimal', _re(r'\b(\d+[,]\d+)\b'), self._sub_decimal),
+            ('spaced_num', _re(r'\b\d{1,3}(?:\s\d{3})+\b'), self._sub_spaced_num),
+            ('simple_num', _re(r'\b(\d+)\b'), self._sub_simple_num),
+            ('letter_digit', _re(r'([а-яөүңА-ЯӨҮҢa-zA-Z])(\d+)'), self._sub_letter_digit),
+            ('sep_nums', _re(r'(?<!\d)\d+[./]\d+(?:[./]\d+)*'), self._sub_separated_numbers),
+            ('remaining', _re(r'\d+'), self._sub_remaining),
+        ]
+
+    def _run_stage(self, stage, text):
+        for _name, pat, repl in self._get_stage_rules(stage):
+            text = pat.sub(repl, text)
         return text
 
-    def _normalize_math_and_ranges(self, text):
-        text = self._p_math_mul_eq.sub(
-            lambda m: (f"{self.number_to_words(int(m.group(1)))} көбөйтүү "
-                       f"{self.number_to_words(int(m.group(2)))} барабар "
-                       f"{self.number_to_words(int(m.group(3)))}"), text)
-        text = self._p_math_add_eq.sub(
-            lambda m: (f"{self.number_to_words(int(m.group(1)))} кошуу "
-                       f"{self.number_to_words(int(m.group(2)))} барабар "
-                       f"{self.number_to_words(int(m.group(3)))}"), text)
-        text = self._p_math_sub_eq.sub(
-            lambda m: (f"{self.number_to_words(int(m.group(1)))} кемитүү "
-                       f"{self.number_to_words(int(m.group(2)))} барабар "
-                       f"{self.number_to_words(int(m.group(3)))}"), text)
-        text = self._p_math_div_eq.sub(
-            lambda m: (f"{self.number_to_words(int(m.group(1)))} бөлүү "
-                       f"{self.number_to_words(int(m.group(2)))} барабар "
-                       f"{self.number_to_words(int(m.group(3)))}"), text)
-
-        text = self._p_num_range.sub(
-            lambda m: f"{self.decimal_to_words(m.group(1))} {self.decimal_to_words(m.group(2))}", text)
-
-        text = self._p_math_add.sub(
-            lambda m: f"{self.number_to_words(int(m.group(1)))} кошуу {self.number_to_words(int(m.group(2)))}", text)
-        text = self._p_math_mul.sub(
-            lambda m: f"{self.number_to_words(int(m.group(1)))} көбөйтүү {self.number_to_words(int(m.group(2)))}", text)
-        text = self._p_math_div.sub(
-            lambda m: f"{self.number_to_words(int(m.group(1)))} бөлүү {self.number_to_words(int(m.group(2)))}", text)
+    def _split_segments(self, text):
+        """
+        Текстти эч бир эреже кесип өтө албаган чектерден бөлөт.
+
+        Чек — кичине тамгалуу сөздүн аягындагы ``.!?`` менен баш тамга
+        менен башталган кийинки сүйлөмдүн ортосу. Ажыратуучу боштук
+        кийинки сегментке кошулат, ошондуктан сегменттерди бириктирсе
+        баштапкы текст кайра алынат. ``max_input_chars`` тан узун
+        сегмент ``_split_long`` менен андан ары бөлүнөт.
+        """
+        segments = []
+        start = 0
+        for m in self._p_segment_end.finditer(text):
+            segments.append(text[start:m.end()])
+            start = m.end()
+        segments.append(text[start:])
+        limit = self.max_input_chars
+        if limit and len(text) > limit:
+            segments = [piece for segment in segments
+                        for piece in (self._split_long(segment) if len(segment) > limit else (segment,))]
+        return segments
+
+    def _split_long(self, text):
+        """
+        Узун сегментти ``max_input_chars`` тан ашпаган бөлүктөргө бөлөт.
+
+        Чек — бөлүктүн экинчи жарымындагы биринчи тынч чек
+        (``StreamingNormalizer`` тин коопсуз чектери менен бирдей), андай
+        чек жок болсо — андан кийинки биринчи тынч чек: бөлүк узунураак
+        болот, бирок жыйынтык өзгөрбөйт (паттерндер сызыктуу, караңыз
+        ``_SPACED_START``). Тексттин аягына чейин тынч чек жок болсо
+        (цифралардын же белгилердин узун катары) — бөлүктөгү акыркы боштук
+        же бөлүктүн аягы; ушул учурда гана жыйынтык бүт сегментти бир
+        жолу иштеткенден айырмаланышы мүмкүн.
+        """
+        # streaming бул модулду импорттойт
+        from .streaming import _quiet_cut, _quiet_rules
+
+        if self._quiet is None:
+            self._quiet = _quiet_rules(self)
+        hazard, hold = self._quiet
+        limit = self.max_input_chars
+        pieces = []
+        start = 0
+        # Тексттин калганында тынч чек бар болушу мүмкүнбү
+        ahead = True
+        while len(text) - start > limit:
+            stop = start + limit
+            cut = _quiet_cut(text, start + limit // 2, stop, hazard, hold)
+            if cut is None and ahead:
+                cut = _quiet_cut(text, start + limit // 2, len(text), hazard, hold)
+                ahead = cut is not None
+            if cut is None:
+                cut = text.rfind(' ', start + 1, stop)
+                if cut < 0:
+                    cut = stop
+            pieces.append(text[start:cut])
+            start = cut
+        pieces.append(text[start:])
+        return pieces
+
+    def _normalize_scan(self, text):
+        return ''.join(self._run_plan(segment) for segment in self._split_segments(text))
+
+    def _run_plan(self, text):
+        """
+        Сегментке этаптарды триггерлери менен колдонот.
+
+        Сандык этап цифра калбаса өткөрүлөт; калган этаптар триггери
+        табылбаса өткөрүлөт. Иштеген этаптын эрежелери бириктирилбейт:
+        ар бири сегментке өзүнчө ``re.sub`` өтүүсү (цифрасыз сегментте
+        ``_DIGIT_FREE_RULES`` гана). Этаптар цифраларды жаңыдан жаратпайт,
+        ошондуктан цифра жок болуп калгандан кийин сандык куйрук толугу
+        менен өткөрүлөт.
+        """
+        stats = self._stage_stats
+        has_digit = self._p_digit.search(text) is not None
+        for entry in self._scan_plan:
+            stage, numeric, trigger, rules, plain_rules = entry
+            if numeric and not has_digit:
+                stats[stage][1] += 1
+                continue
+            if trigger is _UNLOADED:
+                trigger = self._load_trigger(entry)
+            if trigger is not None and trigger.search(text) is None:
+                stats[stage][1] += 1
+                continue
+            stats[stage][0] += 1
+            if rules is None:
+                rules, plain_rules = self._load_plan_rules(entry)
+            for _name, pat, repl in (rules if has_digit else plain_rules):
+                text = pat.sub(repl, text)
+            if has_digit:
+                has_digit = self._p_digit.search(text) is not None
         return text
 
-    def _normalize_named_abbr(self, text):
-        def _kg_replace(m):
-            full = self.kyrgyz_abbr[m.group(1)]
-            return self.apply_suffix_harmony(full, m.group(2)) if m.group(2) else full
-        text = self._p_kg_abbr.sub(_kg_replace, text)
+    def stage_stats(self):
+        """
+        ``scan`` кыймылдаткычынын этаптар боюнча статистикасы.
+
+        Returns:
+            ``{этап: {'hits': иштеген, 'skips': өткөрүлгөн}}`` — сегменттердин саны
+        """
+        return {stage: {'hits': hits, 'skips': skips}
+                for stage, (hits, skips) in self._stage_stats.items()}
+
+    def reset_stage_stats(self):
+        self._stage_stats = {stage: [0, 0] for stage in self.stages}
 
-        text = self._p_en_abbr.sub(lambda m: self.english_abbr[m.group(1)], text)
+    def _normalize_sequential(self, text):
+        for stage in self.stages:
+            text = getattr(self, f'_normalize_{stage}')(text)
         return text
 
-    def _normalize_addresses(self, text):
-        text = self._p_addr_city.sub('', text)
+    # ================================================================
+    # Нормализация этаптары
+    # ================================================================
 
-        text = self._p_addr_district.sub(
-            lambda m: f"{self.number_to_ordinal(int(m.group(1)))} кичи район", text)
+    def _normalize_short_abbr(self, text):
+        return self._run_stage('short_abbr', text)
 
-        def _fraction(m):
-            numer = self.number_to_words(int(m.group(1)))
-            denom = self.number_to_words(int(m.group(2)))
-            return f"{self.apply_suffix_harmony(denom, 'дан')} {numer}"
-        text = self._p_fraction.sub(_fraction, text)
-        return text
+    def _normalize_contacts(self, text):
+        return self._run_stage('contacts', text)
 
-    def _normalize_symbols(self, text):
-        text = self._p_apostrophe.sub(r'\1\2', text)
+    def _normalize_dates(self, text):
+        return self._run_stage('dates', text)
 
-        text = self._p_quotes_double.sub('', text)
-        text = self._p_quotes_single.sub('', text)
+    def _normalize_years(self, text):
+        return self._run_stage('years', text)
 
-        text = self._p_number_sign.sub(
-            lambda m: f"номур {self.number_to_words(int(m.group(1)))}", text)
+    def _normalize_time(self, text):
+        return self._run_stage('time', text)
 
-        text = re.sub(r'(?<=[,\s])%(?=[,\s]|$)', 'пайыз', text)
-        text = re.sub(r'(?<=[,\s])№(?=[,\s]|$)', 'номур', text)
-        text = re.sub(r'(?<=[,\s])@(?=[,\s]|$)', 'эт белгиси', text)
-        text = re.sub(r'(?<=[,\s])&(?=[,\s]|$)', 'жана', text)
+    def _normalize_currency(self, text):
+        return self._run_stage('currency', text)
 
-        def _roman_century(m):
-            try:
-                return f"{self.number_to_ordinal(self.roman_to_number(m.group(1)))} кылым"
-            except (ValueError, IndexError):
-                return m.group(0)
-        text = self._p_roman_century.sub(_roman_century, text)
+    def _normalize_time_dot_sfx(self, text):
+        return self._run_stage('time_dot_sfx', text)
 
-        text = self._p_roman_general.sub(
-            lambda m: self.number_to_ordinal(self.roman_to_number(m.group(0))), text)
-        return text
+    def _normalize_ordinals(self, text):
+        return self._run_stage('ordinals', text)
 
-    def _normalize_remaining_numbers(self, text):
-        text = self._p_decimal.sub(lambda m: self.decimal_to_words(m.group(1)), text)
+    def _normalize_units(self, text):
+        return self._run_stage('units', text)
 
-        text = self._p_spaced_num.sub(
-            lambda m: self.number_to_words(int(m.group(0).replace(' ', ''))), text)
+    def _normalize_percentages(self, text):
+        return self._run_stage('percentages', text)
 
-        text = self._p_simple_num.sub(lambda m: self.number_to_words(int(m.group(1))), text)
+    def _normalize_centuries(self, text):
+        return self._run_stage('centuries', text)
 
-        text = self._p_letter_digit.sub(r'\1 \2', text)
+    def _normalize_math_and_ranges(self, text):
+        return self._run_stage('math_and_ranges', text)
 
-        def _sep(m):
-            return ' '.join(self.number_to_words(int(p)) for p in re.split(r'[./]', m.group(0)) if p)
-        text = self._p_sep_nums.sub(_sep, text)
+    def _normalize_named_abbr(self, text):
+        return self._run_stage('named_abbr', text)
 
-        text = self._p_remaining.sub(lambda m: self.number_to_words(int(m.group(0))), text)
-        return text
+    def _normalize_addresses(self, text):
+        return self._run_stage('addresses', text)
+
+    def _normalize_symbols(self, text):
+        return self._run_stage('symbols', text)
+
+    def _normalize_remaining_numbers(self, text):
+        return self._run_stage('remaining_numbers', text)
 
     # ================================================================
     # Негизги нормализация
     # ================================================================
 
+    def cache_info(self):
+        """
+        Жыйынтыктар кэшинин статистикасы.
+
+        Returns:
+            ``CacheInfo(hits, misses, evictions, size, maxsize, nbytes, maxbytes)``
+            же кэш өчүк болсо ``None``
+        """
+        if self._result_cache is None:
+            return None
+        return self._result_cache.info()
+
+    def cache_clear(self):
+        if self._result_cache is not None:
+            self._result_cache.clear()
+
     def normalize(self, text):
-        text = self._normalize_short_abbr(text)
-        text = self._normalize_contacts(text)
-        text = self._normalize_dates(text)
-        text = self._normalize_years(text)
-        text = self._normalize_time(text)
-        text = self._normalize_currency(text)
-        text = self._normalize_time_dot_sfx(text)
-        text = self._normalize_ordinals(text)
-        text = self._normalize_units(text)
-        text = self._normalize_percentages(text)
-        text = self._normalize_centuries(text)
-        text = self._normalize_math_and_ranges(text)
-        text = self._normalize_named_abbr(text)
-        text = self._normalize_addresses(text)
-        text = self._normalize_symbols(text)
-        text = self._normalize_remaining_numbers(text)
+        cache = self._result_cache
+        if cache is None or not isinstance(text, str):
+            return self._normalize_uncached(text)
+        result = cache.get(text)
+        if result is None:
+            result = self._normalize_uncached(text)
+            cache.put(text, result)
+        return result
+
+    def _normalize_uncached(self, text):
+        if self.engine == 'scan':
+            text = self._normalize_scan(text)
+        else:
+            text = self._normalize_sequential(text)
         return self._p_spaces.sub(' ', text).strip()
 
+    # ================================================================
+    # Трассировка
+    # ================================================================
+
+    def trace(self, text):
+        """
+        Текстти нормализациялайт жана ар бир этаптын отчетун кайтарат.
+
+        Жыйынтык ``normalize()`` менен бирдей (кэш колдонулбайт).
+        ``normalize()`` өзү трассировкага эч нерсе төлөбөйт — отчет ушул
+        өзүнчө жол менен гана түзүлөт. Биринчи чакырууда паттерндерди
+        компиляциялоо этаптын убактысына кирет; аны чыгаруу үчүн алгач
+        ``warmup()`` чакырыңыз.
+
+        Returns:
+            ``Trace(input, output, seconds, stages)`` — ``stages`` ичинде ар
+            бир этаптын убактысы, ар бир эреженин алмаштыруулары жана
+            этаптан кийинки текст (``StageTrace``)
+        """
+        started = perf_counter()
+        if self.engine == 'scan':
+            stages, result = self._trace_scan(text)
+        else:
+            stages, result = self._trace_sequential(text)
+        output = self._p_spaces.sub(' ', result).strip()
+        return Trace(text, output, perf_counter() - started, stages)
+
+    def _trace_scan(self, text):
+        """
+        ``_run_plan`` сыяктуу, бирок этап боюнча: ар бир этап бардык
+        сегменттерге колдонулат. Сегменттер көз карандысыз болгондуктан,
+        жыйынтык ``_normalize_scan`` менен бирдей.
+        """
+        segments = self._split_segments(text)
+        has_digit = [self._p_digit.search(segment) is not None for segment in segments]
+        stages = []
+        for entry in self._scan_plan:
+            stage, numeric = entry[0], entry[1]
+            started = perf_counter()
+            counts = {}
+            ran = 0
+            for i, segment in enumerate(segments):
+                if numeric and not has_digit[i]:
+                    continue
+                trigger = entry[2]
+                if trigger is _UNLOADED:
+                    trigger = self._load_trigger(entry)
+                if trigger is not None and trigger.search(segment) is None:
+                    continue
+                ran += 1
+                rules, plain_rules = entry[3], entry[4]
+                if rules is None:
+                    rules, plain_rules = self._load_plan_rules(entry)
+                for name, pat, repl in (rules if has_digit[i] else plain_rules):
+                    segment, count = pat.subn(repl, segment)
+                    counts[name] = counts.get(name, 0) + count
+                segments[i] = segment
+                if has_digit[i]:
+                    has_digit[i] = self._p_digit.search(segment) is not None
+            stages.append(StageTrace(stage, perf_counter() - started, ran,
+                                     len(segments) - ran, counts, ''.join(segments)))
+        return stages, ''.join(segments)
+
+    def _trace_sequential(self, text):
+        stages = []
+        for stage in self.stages:
+            started = perf_counter()
+            counts = {}
+            for name, pat, repl in self._get_stage_rules(stage):
+                text, counts[name] = pat.subn(repl, text)
+            stages.append(StageTrace(stage, perf_counter() - started, 1, 0, counts, text))
+        return stages, text
+
+
+def interactive_loop(normalizer):
+    print("Кыргызча текст нормализатор (TTS үчүн)")
+    print("=" * 50)
+    print("Текст киргизиңиз (чыгуу үчүн 'exit'):")
+    print()
+
+    while True:
+        try:
+            user_input = input("> ")
+            if user_input.lower() in ('exit', 'quit', 'чыгуу'):
+                break
+            if user_input.strip():
+                print(f"Жыйынтык: {normalizer.normalize(user_input)}")
+                print()
+        except (KeyboardInterrupt, EOFError):
+            print("\nЧыгуу...")
+            break
+
 
 def main():
     normalizer = KyrgyzTextNormalizer()
@@ -883,22 +1801,7 @@ def main():
         input_text = ' '.join(sys.argv[1:])
         print(normalizer.normalize(input_text))
     else:
-        print("Кыргызча текст нормализатор (TTS үчүн)")
-        print("=" * 50)
-        print("Текст киргизиңиз (чыгуу үчүн 'exit'):")
-        print()
-
-        while True:
-            try:
-                user_input = input("> ")
-                if user_input.lower() in ('exit', 'quit', 'чыгуу'):
-                    break
-                if user_input.strip():
-                    print(f"Жыйынтык: {normalizer.normalize(user_input)}")
-                    print()
-            except (KeyboardInterrupt, EOFError):
-                print("\nЧыгуу...")
-                break
+        interactive_loop(normalizer)
 
 
 if __name__ == "__main__":
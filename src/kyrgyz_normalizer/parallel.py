@@ -0,0 +1,201 @@
+"""
+Бир узун документти бир нече ядродо нормализациялоо.
+
+Документ (китептин бөлүмү, мыйзамдар кодекси) эч бир эреже кесип өтө
+албаган чектерден бөлүктөргө бөлүнөт, бөлүктөр процесстерде бир убакта
+нормализацияланып, кайра бириктирилет. Жыйынтык ``normalize()`` менен
+бирдей.
+
+Чектер:
+    * сүйлөмдүн чеги — ``KyrgyzTextNormalizer._split_segments`` менен бирдей;
+    * тыныш белгиси жок текстте (мис. OCR) — максаттуу ордунан кийинки
+      терезедеги биринчи "тынч" чек: ``hold`` сөздөн (терезенин ичинде,
+      цифра, белги же контекст сөзү жок) кийинки боштуктун башы
+      (``StreamingNormalizer`` дин коопсуз чектери менен бирдей).
+
+Колдонуу:
+    from kyrgyz_normalizer import normalize_document
+    result = normalize_document(chapter, workers=8)   # == normalize(chapter)
+
+    # пулду өзү башкаруу
+    from kyrgyz_normalizer.parallel import ParallelNormalizer
+    with ParallelNormalizer(workers=8) as parallel:
+        result = parallel.normalize(chapter)
+"""
+
+import os
+import threading
+
+from . import batch
+from .normalizer import KyrgyzTextNormalizer
+from .streaming import _quiet_cut, _quiet_rules
+
+# Мындан кыска бөлүктөр (символ) жасалбайт: IPC жана пулдун чыгымы
+# бөлүктүн иштетилишинен арзан болушу керек
+DEFAULT_MIN_PIECE_CHARS = 32 * 1024
+
+# Бир процесске келген бөлүктөрдүн саны (жүк тең бөлүнүшү үчүн)
+PIECES_PER_WORKER = 4
+
+_shared = {}
+_shared_lock = threading.Lock()
+
+
+def _normalize_piece(text):
+    return batch._worker_normalizer._normalize_scan(text)
+
+
+class ParallelNormalizer:
+    """
+    Узун тексттерди бөлүп, процесстер пулунда нормализациялоочу.
+
+    Пул биринчи чакырууда түзүлөт жана ``close()`` чейин колдонулат;
+    процесс кулап пул бузулса, ал жаңы пул менен алмаштырылат.
+    ``sequential`` кыймылдаткычында эрежелер сегменттердин чегин кесип
+    өтүшү мүмкүн, ошондуктан текст бөлүнбөйт (бир процессте иштетилет).
+    """
+
+    def __init__(self, workers=None, engine='scan', profile='full',
+                 min_piece_chars=DEFAULT_MIN_PIECE_CHARS):
+        """
+        Args:
+            workers: Процесстердин саны (демейки: ``os.cpu_count()``);
+                ``1`` — бөлүктөр учурдагы процессте иштетилет
+            engine: ``KyrgyzTextNormalizer`` кыймылдаткычы
+            profile: ``KyrgyzTextNormalizer`` профили
+            min_piece_chars: Бөлүктүн эң кичине өлчөмү (символ)
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.engine = engine
+        self.profile = profile
+        self.min_piece_chars = max(1, min_piece_chars)
+        self.normalizer = KyrgyzTextNormalizer(engine=engine, profile=profile)
+        self._hazard, self._hold = _quiet_rules(self.normalizer)
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    def _discard(self, executor):
+        """Бузулган пулду таштайт; кийинки ``_get_executor()`` жаңысын түзөт."""
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False)
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                # concurrent.futures.process импорту кымбат — пакетти импорттоо тез болсун
+                from concurrent.futures import ProcessPoolExecutor
+
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, initializer=batch._init_worker,
+                    initargs=(self.engine, self.profile))
+            return self._executor
+
+    # ================================================================
+    # Бөлүү
+    # ================================================================
+
+    def split(self, text):
+        """
+        Текстти коопсуз чектерден бөлүктөргө бөлөт.
+
+        Returns:
+            Бөлүктөрдүн тизмеси (бириктирилсе ``text``). Бөлүктөрдүн саны
+            ``workers * PIECES_PER_WORKER`` дан ашпайт; чек табылбаса,
+            кошуна бөлүктөр бириктирилип калат.
+        """
+        if self.engine != 'scan':
+            return [text]
+        count = min(self.workers * PIECES_PER_WORKER, len(text) // self.min_piece_chars)
+        if count < 2:
+            return [text]
+        size = len(text) // count
+        window = max(size // 2, 1024)
+        pieces = []
+        last = 0
+        for i in range(1, count):
+            target = max(i * size, last + 1)
+            cut = self._cut(text, target, min(len(text), target + window))
+            if cut is not None:
+                pieces.append(text[last:cut])
+                last = cut
+        pieces.append(text[last:])
+        return pieces
+
+    def _cut(self, text, start, stop):
+        """``[start, stop)`` ичиндеги биринчи коопсуз чек же ``None``."""
+        m = self.normalizer._p_segment_end.search(text, start, stop)
+        if m is not None:
+            return m.end()
+        # Тыныш белгиси жок текст: тынч сөздөрдөн кийинки боштуктун башы
+        return _quiet_cut(text, start, stop, self._hazard, self._hold)
+
+    # ================================================================
+    # Нормализация
+    # ================================================================
+
+    def normalize(self, text):
+        """
+        Текстти нормализациялайт (``KyrgyzTextNormalizer.normalize`` менен бирдей).
+
+        Бөлүктөр ``_normalize_scan`` менен иштетилет; боштуктарды кысуу
+        жана четтерин кесүү бириктирилген жыйынтыкка бир жолу колдонулат.
+        """
+        if not isinstance(text, str):
+            return self.normalizer.normalize(text)
+        pieces = self.split(text)
+        if len(pieces) == 1:
+            return self.normalizer.normalize(text)
+        if self.workers <= 1:
+            results = [self.normalizer._normalize_scan(piece) for piece in pieces]
+        else:
+            results = self._map(pieces)
+        return self.normalizer._p_spaces.sub(' ', ''.join(results)).strip()
+
+
+    def _map(self, pieces):
+        """Бөлүктөрдү пулда иштетет; пул бузулса, жаңы пулда бир жолу кайталайт."""
+        from concurrent.futures.process import BrokenProcessPool
+
+        for attempt in range(2):
+            executor = self._get_executor()
+            try:
+                return list(executor.map(_normalize_piece, pieces))
+            except BrokenProcessPool:
+                self._discard(executor)
+                if attempt:
+                    raise
+
+
+def normalize_document(text, workers=None, engine='scan', profile='full'):
+    """
+    Бир узун текстти бир нече процессте нормализациялоо.
+
+    Ар бир ``(workers, engine, profile)`` үчүн процесстер пулу бир жолу
+    түзүлөт жана кийинки чакырууларда колдонулат (``profile`` аталыш же
+    этаптардын тизмеси). Пул бузулса (``BrokenProcessPool``), жаңысы
+    түзүлөт. Кыска тексттер бөлүнбөйт.
+
+    Returns:
+        Нормализацияланган текст (``normalize(text)`` менен бирдей)
+    """
+    key = (workers or os.cpu_count() or 1, engine,
+           KyrgyzTextNormalizer._resolve_profile(profile))
+    with _shared_lock:
+        parallel = _shared.get(key)
+        if parallel is None:
+            parallel = _shared[key] = ParallelNormalizer(*key)
+    return parallel.normalize(text)
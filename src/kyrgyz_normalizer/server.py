@@ -0,0 +1,508 @@
+"""
+Жергиликтүү HTTP нормализация кызматы (стандарттык китепкана гана).
+
+Бир убакта келген суроо-талаптардын тексттери кыска убакыт терезесинде
+(``window``) бир микро-пакетке чогултулат жана даяр (жылытылган)
+нормализаторлор пулунда иштетилет — ар бир суроо-талаптын чыгымы азаят.
+
+Эндпоинттер:
+    POST /normalize          {"text": "..."}      → {"text": "..."}
+    POST /normalize/batch    {"texts": ["...", ...]}
+                             → {"texts": [...], "errors": [{"index", "error"}]}
+    POST /normalize          (text/plain) ар бир сап өзүнчө → text/plain
+    GET  /health             абалы жана микро-пакеттердин статистикасы
+
+Колдонуу:
+    kyrgyz-normalizer serve --port 8080 --workers 4
+    kyrgyz-normalizer serve --unix /tmp/kyrgyz-normalizer.sock
+    echo "Баасы 1500 сом" | curl -s --unix-socket /tmp/kyrgyz-normalizer.sock \\
+        --data-binary @- http://localhost/normalize
+
+    # Python'дон
+    from kyrgyz_normalizer.server import create_server
+    server = create_server(port=0, workers=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+"""
+
+import errno
+import json
+import os
+import queue
+import socket
+import socketserver
+import stat
+import threading
+import time
+from concurrent.futures import BrokenExecutor, Future, TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from . import __version__, batch
+from .batch import BatchItemError, _normalize_items
+from .normalizer import KyrgyzTextNormalizer
+
+# Микро-пакетти чогултуу терезеси (секунд) жана пакеттин эң чоң өлчөмү
+DEFAULT_WINDOW = 0.002
+DEFAULT_MAX_BATCH = 256
+# Суроо-талаптын денесинин эң чоң көлөмү (байт)
+DEFAULT_MAX_BODY = 16 * 1024 * 1024
+# Жыйынтыкты күтүүнүн эң көп убактысы (секунд), андан кийин 503
+DEFAULT_TIMEOUT = 60.0
+# Процесссиз режимдеги нормализатордун кэши: жазуулар жана байттар
+DEFAULT_CACHE_SIZE = 4096
+DEFAULT_CACHE_BYTES = 16 * 1024 * 1024
+
+_STOP = object()
+# Кезектеги ``(_RETRY, пакет)`` — пул кулаганда бүтпөй калган пакет
+_RETRY = object()
+
+
+def _init_server_worker(engine, profile='full'):
+    batch._init_worker(engine, profile)
+    batch._worker_normalizer.warmup()
+
+
+def _ping(_):
+    return os.getpid()
+
+
+class MicroBatcher:
+    """
+    Тексттерди микро-пакеттерге чогултуп нормализациялоочу.
+
+    ``submit()`` ар кайсы жиптерден чакырылат жана ``Future`` кайтарат.
+    Бир жип кезектен биринчи текстти алат, андан кийин ``window`` секунд
+    (же ``max_batch`` текст чогулганча) күтүп, чогулгандарды бир тапшырма
+    катары жөнөтөт. Процесстер пулу толгондо (``2 * workers`` пакет
+    иштетилип жатат) жаңы пакет күтөт, ошол убакта кезек чоңоюп, кийинки
+    пакет чоңураак болот.
+
+    Процесс кулап пул бузулса, пул кайра түзүлөт жана бүтпөй калган
+    пакеттер бир-бирден (пулда жалгыз) кайра жөнөтүлөт: ``BatchItemError``
+    пулду кайра кулаткан пакеттин тексттерине гана коюлат.
+    """
+
+    def __init__(self, workers=None, window=DEFAULT_WINDOW, max_batch=DEFAULT_MAX_BATCH,
+                 engine='scan', cache_size=DEFAULT_CACHE_SIZE,
+                 cache_bytes=DEFAULT_CACHE_BYTES, profile='full', timeout=DEFAULT_TIMEOUT):
+        """
+        Args:
+            workers: Процесстердин саны (демейки: ``os.cpu_count()``);
+                ``0`` — учурдагы процессте, бир нормализатор менен
+            window: Микро-пакетти чогултуу терезеси (секунд)
+            max_batch: Бир пакеттеги тексттердин эң көп саны
+            engine: ``KyrgyzTextNormalizer`` кыймылдаткычы
+            cache_size: Процесссиз режимдеги нормализатордун кэши (жазуулар)
+            cache_bytes: Ошол кэштин эң көп көлөмү (байт)
+            profile: ``KyrgyzTextNormalizer`` профили
+            timeout: Кайра жөнөтүлгөн пакетти күтүүнүн эң көп убактысы
+                (секунд); ашса, пакет ката менен бүтөт жана пул алмаштырылат
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 0 or window < 0 or max_batch < 1:
+            raise ValueError("workers, window терс эмес, max_batch оң сан болушу керек")
+        self.workers = workers
+        self.window = window
+        self.max_batch = max_batch
+        self.engine = engine
+        self.profile = profile
+        self.timeout = timeout
+        self.batches = 0
+        self.items = 0
+        self._queue = queue.SimpleQueue()
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self._normalizer = None
+        if workers:
+            self._pool = self._new_pool()
+            self._slots = threading.BoundedSemaphore(2 * workers)
+            # процесстерди азыр эле баштап, жылытып коёбуз
+            list(self._pool.map(_ping, range(workers)))
+        else:
+            self._normalizer = KyrgyzTextNormalizer(engine=engine, profile=profile,
+                                                    cache_size=cache_size,
+                                                    cache_bytes=cache_bytes).warmup()
+        self._thread = threading.Thread(target=self._run, name='kyrgyz-normalizer-batcher',
+                                        daemon=True)
+        self._thread.start()
+
+    def submit(self, text):
+        """
+        Текстти кезекке коёт; ``Future`` нормализацияланган текстти же
+        ``BatchItemError`` ду (``index`` — 0) берет.
+        """
+        future = Future()
+        self._queue.put((text, future))
+        return future
+
+    def normalize_many(self, texts, timeout=DEFAULT_TIMEOUT):
+        """Тексттерди кезекке коюп, жыйынтыктарын (тартиби боюнча) күтөт."""
+        futures = [self.submit(text) for text in texts]
+        deadline = time.monotonic() + timeout
+        results = [future.result(max(0.0, deadline - time.monotonic())) for future in futures]
+        # Катанын индекси — микро-пакетте эмес, ушул ``texts`` тизмесинде
+        return [BatchItemError(index, result.text, result.message)
+                if isinstance(result, BatchItemError) else result
+                for index, result in enumerate(results)]
+
+    def close(self):
+        """Кезектеги тексттерди бүтүрүп, пулду жабат."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+        # Жабылгандан кийин кайра жөнөтүүгө коюлган пакеттер
+        while True:
+            try:
+                item = self._queue.get(block=False)
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                self._fail(item[1] if item[0] is _RETRY else [item],
+                           RuntimeError("MicroBatcher жабылды"))
+
+    def _new_pool(self):
+        # concurrent.futures.process импорту кымбат — керек болгондо гана
+        from concurrent.futures import ProcessPoolExecutor
+
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_init_server_worker,
+                                   initargs=(self.engine, self.profile))
+
+    def _replace_pool(self, broken):
+        """Бузулган пулду (башка жип алмаштыра элек болсо) жаңысы менен алмаштырат."""
+        with self._pool_lock:
+            if self._pool is broken:
+                self._pool = self._new_pool()
+        # пулдун өз жибинен да чакырылат — күтүүгө болбойт
+        broken.shutdown(wait=False)
+
+    # ================================================================
+    # Пакеттерди чогултуу жана жөнөтүү
+    # ================================================================
+
+    def _run(self):
+        get = self._queue.get
+        stop = False
+        while not stop:
+            item = get()
+            if item is _STOP:
+                break
+            if item[0] is _RETRY:
+                self._retry(item[1])
+                continue
+            pending = [item]
+            retries = []
+            deadline = time.monotonic() + self.window
+            while len(pending) < self.max_batch:
+                timeout = deadline - time.monotonic()
+                try:
+                    item = get(timeout=timeout) if timeout > 0 else get(block=False)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                if item[0] is _RETRY:
+                    retries.append(item[1])
+                else:
+                    pending.append(item)
+            self._dispatch(pending)
+            for pending in retries:
+                self._retry(pending)
+
+    def _dispatch(self, pending):
+        self.batches += 1
+        self.items += len(pending)
+        texts = [text for text, _ in pending]
+        if self._pool is None:
+            self._resolve(pending, _normalize_items(self._normalizer, 0, texts))
+            return
+
+        self._slots.acquire()
+        pool = self._pool
+        try:
+            job = pool.submit(batch._normalize_chunk, 0, texts)
+        except BrokenExecutor:
+            self._slots.release()
+            self._replace_pool(pool)
+            self._retry(pending)
+            return
+        except Exception as e:  # пул жабылган
+            self._slots.release()
+            self._fail(pending, e)
+            return
+
+        def done(job):
+            try:
+                results = job.result()
+            except BrokenExecutor:
+                # орун пул алмаштырылгандан кийин бошойт — ``_retry`` бузулган пулду албайт
+                self._replace_pool(pool)
+                self._queue.put((_RETRY, pending))
+            except Exception as e:  # жыйынтык сериализацияланбады
+                self._fail(pending, e)
+            else:
+                self._resolve(pending, results)
+            finally:
+                self._slots.release()
+
+        job.add_done_callback(done)
+
+    def _retry(self, pending):
+        """Пакетти пулда жалгыз аткарат: пулду кайра кулатса, ката ушул пакетке гана коюлат."""
+        slots = 2 * self.workers
+        for _ in range(slots):
+            self._slots.acquire()
+        try:
+            pool = self._pool
+            job = pool.submit(batch._normalize_chunk, 0, [text for text, _ in pending])
+            results = job.result(self.timeout)
+        except (BrokenExecutor, FutureTimeoutError) as e:
+            # Токтоп калган процесс жаңы пулдун орундарын ээлебейт
+            self._replace_pool(pool)
+            self._fail(pending, e)
+        except Exception as e:
+            self._fail(pending, e)
+        else:
+            self._resolve(pending, results)
+        finally:
+            for _ in range(slots):
+                self._slots.release()
+
+    # Пакетте ар кайсы суроо-талаптардын тексттери бар: ар бир ``Future`` —
+    # өзүнчө текст, ошондуктан катанын индекси 0
+    @staticmethod
+    def _resolve(pending, results):
+        for (text, future), result in zip(pending, results):
+            if isinstance(result, BatchItemError):
+                result = BatchItemError(0, text, result.message)
+            future.set_result(result)
+
+    @staticmethod
+    def _fail(pending, error):
+        message = f"{type(error).__name__}: {error}"
+        for text, future in pending:
+            future.set_result(BatchItemError(0, text, message))
+
+
+class _RequestError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # баш саптар жана дене өзүнчө жазылат — Nagle + delayed ACK ар бир
+    # keep-alive суроо-талапка ~40 мс кошот
+    disable_nagle_algorithm = True
+    server_version = f'kyrgyz-normalizer/{__version__}'
+
+    def setup(self):
+        # Unix сокетинде TCP_NODELAY жок
+        if self.request.family not in (socket.AF_INET, socket.AF_INET6):
+            self.disable_nagle_algorithm = False
+        super().setup()
+
+    def do_GET(self):
+        if self.path != '/health':
+            return self._send_error(_RequestError(404, f"Белгисиз жол: {self.path}"))
+        batcher = self.server.batcher
+        self._send_json(200, {
+            'status': 'ok',
+            'version': __version__,
+            'workers': batcher.workers,
+            'window_ms': batcher.window * 1000,
+            'batches': batcher.batches,
+            'items': batcher.items,
+            'mean_batch': batcher.items / batcher.batches if batcher.batches else 0.0,
+        })
+
+    def do_POST(self):
+        try:
+            if self.path not in ('/normalize', '/normalize/batch'):
+                raise _RequestError(404, f"Белгисиз жол: {self.path}")
+            body = self._read_body()
+            if self.headers.get('Content-Type', '').startswith('application/json'):
+                self._handle_json(body)
+            else:
+                self._handle_plain(body)
+        except _RequestError as e:
+            self._send_error(e)
+        except FutureTimeoutError:
+            self._send_error(_RequestError(503, "Жыйынтык убагында даяр болгон жок"))
+
+    def _read_body(self):
+        length = self.headers.get('Content-Length')
+        if length is None:
+            raise _RequestError(411, "Content-Length керек")
+        try:
+            length = int(length)
+        except ValueError:
+            raise _RequestError(400, "Content-Length туура эмес") from None
+        if length > self.server.max_body:
+            # денени окубай жооп беребиз — байланыш жабылат
+            self.close_connection = True
+            raise _RequestError(413, f"Дене {self.server.max_body} байттан чоң")
+        try:
+            return self.rfile.read(length).decode('utf-8')
+        except UnicodeDecodeError:
+            raise _RequestError(400, "Дене UTF-8 эмес") from None
+
+    def _handle_json(self, body):
+        try:
+            payload = json.loads(body)
+        except ValueError as e:
+            raise _RequestError(400, f"JSON катасы: {e}") from None
+        batcher = self.server.batcher
+        if self.path == '/normalize':
+            if not isinstance(payload, dict) or not isinstance(payload.get('text'), str):
+                raise _RequestError(400, "'text' талаасы (сап) керек")
+            result, = batcher.normalize_many([payload['text']], self.server.request_timeout)
+            if isinstance(result, BatchItemError):
+                raise _RequestError(500, result.message)
+            return self._send_json(200, {'text': result})
+
+        texts = payload.get('texts') if isinstance(payload, dict) else None
+        if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+            raise _RequestError(400, "'texts' талаасы (саптардын тизмеси) керек")
+        results = batcher.normalize_many(texts, self.server.request_timeout)
+        errors = [{'index': i, 'error': r.message}
+                  for i, r in enumerate(results) if isinstance(r, BatchItemError)]
+        self._send_json(200, {
+            'texts': [None if isinstance(r, BatchItemError) else r for r in results],
+            'errors': errors,
+        })
+
+    def _handle_plain(self, body):
+        # ар бир сап өзүнчө; иштетилбеген сап өзгөрүүсүз кайтарылат (CLI сыяктуу)
+        lines = body.split('\n')
+        trailing = lines[-1] == ''
+        if trailing:
+            lines.pop()
+        results = self.server.batcher.normalize_many(lines, self.server.request_timeout)
+        out = '\n'.join(line if isinstance(result, BatchItemError) else result
+                        for line, result in zip(lines, results))
+        self._send(200, out + ('\n' if trailing and lines else ''), 'text/plain; charset=utf-8')
+
+    def _send_json(self, status, payload):
+        self._send(status, json.dumps(payload, ensure_ascii=False), 'application/json')
+
+    def _send_error(self, error):
+        self._send_json(error.status, {'error': str(error)})
+
+    def _send(self, status, text, content_type):
+        data = text.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        if self.close_connection:
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.write(data)
+
+    def address_string(self):
+        # Unix сокетинде client_address — бош сап
+        if isinstance(self.client_address, tuple):
+            return self.client_address[0]
+        return 'unix'
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+class _ServiceMixin:
+    daemon_threads = True
+    # демейки 5 — бир убакта көп кардар туташканда байланыштар четке кагылат
+    request_queue_size = 128
+    # ``server_bind`` ката берсе, ``server_close`` ``_setup_service`` ке чейин чакырылат
+    batcher = None
+
+    def _setup_service(self, batcher, max_body, request_timeout, quiet):
+        self.batcher = batcher
+        self.max_body = max_body
+        self.request_timeout = request_timeout
+        self.quiet = quiet
+
+    def server_close(self):
+        super().server_close()
+        if self.batcher is not None:
+            self.batcher.close()
+
+
+class NormalizationServer(_ServiceMixin, ThreadingHTTPServer):
+    """TCP аркылуу HTTP кызматы (``create_server()`` түзөт)."""
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}'
+
+
+def _is_socket(path):
+    try:
+        return stat.S_ISSOCK(os.lstat(path).st_mode)
+    except FileNotFoundError:
+        return False
+
+
+class UnixNormalizationServer(_ServiceMixin, socketserver.ThreadingMixIn,
+                              socketserver.UnixStreamServer):
+    """Unix сокети аркылуу HTTP кызматы (``create_server(unix_socket=...)`` түзөт)."""
+
+    def server_bind(self):
+        # Мурунку иштетүүдөн калган сокет гана өчүрүлөт — башка файлга тийбейбиз
+        if _is_socket(self.server_address):
+            os.unlink(self.server_address)
+        elif os.path.lexists(self.server_address):
+            raise FileExistsError(errno.EEXIST, "Сокет эмес файл бар", self.server_address)
+        super().server_bind()
+
+    def server_close(self):
+        super().server_close()
+        if _is_socket(self.server_address):
+            os.unlink(self.server_address)
+
+    @property
+    def url(self):
+        return f'unix:{self.server_address}'
+
+
+def create_server(host='127.0.0.1', port=8080, unix_socket=None, workers=None,
+                  window=DEFAULT_WINDOW, max_batch=DEFAULT_MAX_BATCH, engine='scan',
+                  max_body=DEFAULT_MAX_BODY, timeout=DEFAULT_TIMEOUT, quiet=True,
+                  profile='full'):
+    """
+    HTTP кызматын түзөт (нормализаторлор пулу ошол замат жылытылат).
+
+    Args:
+        host, port: TCP дареги (``port=0`` — бош порт)
+        unix_socket: Unix сокетинин жолу; берилсе, TCP колдонулбайт
+        workers: Процесстердин саны (демейки: ``os.cpu_count()``);
+            ``0`` — учурдагы процессте
+        window: Микро-пакетти чогултуу терезеси (секунд)
+        max_batch: Бир микро-пакеттеги тексттердин эң көп саны
+        engine: ``KyrgyzTextNormalizer`` кыймылдаткычы
+        max_body: Суроо-талаптын денесинин эң чоң көлөмү (байт)
+        timeout: Жыйынтыкты күтүүнүн эң көп убактысы (секунд)
+        quiet: Ар бир суроо-талапты stderr ге жазбоо
+        profile: ``KyrgyzTextNormalizer`` профили
+
+    Returns:
+        ``NormalizationServer`` же ``UnixNormalizationServer``;
+        ``serve_forever()`` менен иштетилет, ``server_close()`` пулду да жабат
+    """
+    batcher = MicroBatcher(workers, window, max_batch, engine, profile=profile,
+                           timeout=timeout)
+    try:
+        if unix_socket is not None:
+            server = UnixNormalizationServer(unix_socket, _Handler)
+        else:
+            server = NormalizationServer((host, port), _Handler)
+    except BaseException:
+        batcher.close()
+        raise
+    server._setup_service(batcher, max_body, timeout, quiet)
+    return server
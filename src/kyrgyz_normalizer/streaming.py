@@ -0,0 +1,211 @@
+"""
+Агымдык нормализация: LLM токендери келген сайын TTS'ке текст берүү.
+
+``StreamingNormalizer`` текстти бөлүктөр менен кабыл алат жана
+нормализацияланган текстти эч бир эреже кесип өтө албаган чекке чейин
+ошол замат чыгарат. Калган куйрук (мис. ``12`` — ал ``12:30да``,
+``12.05.2024``, ``12 км`` же ``12-класс`` болушу мүмкүн) кийинки бөлүк
+келгенче кармалат.
+
+Коопсуз чектер:
+    * сүйлөмдүн чеги — ``KyrgyzTextNormalizer._split_segments`` менен бирдей;
+    * сөздөн кийинки боштуктун башы, эгер ушул жана андан мурунку
+      ``HOLD_WORDS`` сөздө "коркунучтуу" сөз жок болсо. Боштук кийинки
+      бөлүккө кошулат: ``standalone_symbol`` (``& бак`` → ``жана бак``)
+      сыяктуу эрежелер сөздүн алдындагы боштукту көрүшү керек.
+      Коркунучтуу сөз — кийинки сөздөр менен бир эрежеге
+      кириши мүмкүн болгон сөз: цифра, белги (``$ % № - / :`` ж.б.),
+      рим цифрасынын тамгасы же ``саат``/``номер`` сыяктуу контекст сөзү.
+      Сандан башталган эң узун эрежелер андан кийин эки сөзгө чейин
+      камтыйт (``5 млн сом``, ``2024 . жыл``, ``3 кичи район``).
+
+Бириктирилген чыгуу бүт текстке ``normalize()`` менен бирдей.
+
+Колдонуу:
+    from kyrgyz_normalizer import StreamingNormalizer
+
+    stream = StreamingNormalizer()
+    for token in llm_tokens:
+        tts.speak(stream.feed(token))
+    tts.speak(stream.flush())
+
+    # же генератор катары
+    from kyrgyz_normalizer.streaming import normalize_stream
+    for piece in normalize_stream(llm_tokens):
+        tts.speak(piece)
+"""
+
+import re
+
+from .normalizer import KyrgyzTextNormalizer
+
+# Коркунучтуу сөздөн кийин кармалуучу толук сөздөрдүн саны
+HOLD_WORDS = 2
+
+_p_token = re.compile(r'\S+')
+_p_hazard = re.compile(
+    r'\d|[IVXLCDM]|[$€₽£¥₸₴№%@&§+=×*/<>−–—\-:]'
+    r'|(?i:номер|тел|звоните|code|код|борбор|индекс|почтовый|whatsapp|telegram|саат|убакыт)'
+)
+
+
+def _quiet_rules(normalizer):
+    """
+    ``(hazard, hold)`` — коркунучтуу сөздүн паттерни жана андан кийин
+    кармалуучу сөздөрдүн саны. Бир нече сөздүү кыскартуулардын биринчи
+    сөздөрү да коркунучтуу.
+    """
+    hold = HOLD_WORDS
+    heads = set()
+    for name in ('short_abbr', 'month_abbr', 'kyrgyz_abbr', 'english_abbr'):
+        for key in getattr(normalizer, name):
+            words = key.split()
+            if len(words) > 1:
+                heads.add(words[0])
+                hold = max(hold, len(words) - 1)
+    if not heads:
+        return _p_hazard, hold
+    return re.compile(
+        f'{_p_hazard.pattern}|(?i:{KyrgyzTextNormalizer._alternation(heads)})'), hold
+
+
+def _quiet_cut(text, start, stop, hazard, hold):
+    """
+    ``[start, stop)`` ичиндеги биринчи тынч чек же ``None``: ``hold``
+    тынч сөздөн (терезенин ичинде) кийинки сөздүн алдындагы боштуктун
+    башы. Терезенин башындагы жана аягындагы бүтпөгөн сөздөр эсептелбейт.
+    """
+    quiet = 0
+    end = None
+    for m in _p_token.finditer(text, start, stop):
+        if m.start() == start and start and not text[start - 1].isspace():
+            continue
+        if quiet >= hold:
+            return end
+        if m.end() == stop and stop < len(text) and not text[stop].isspace():
+            break
+        quiet = 0 if hazard.search(m.group()) else quiet + 1
+        end = m.end()
+    return None
+
+
+class StreamingNormalizer:
+    """
+    ``feed(chunk)`` / ``flush()`` интерфейси менен абалдуу нормализатор.
+
+    Бир нуска — бир агым; бир нече агым үчүн бир ``KyrgyzTextNormalizer``
+    бөлүшүлө берет. Жип үчүн коопсуз эмес.
+    """
+
+    __slots__ = ('normalizer', '_hold', '_hazard', '_buffer', '_started', '_space')
+
+    def __init__(self, normalizer=None):
+        """
+        Args:
+            normalizer: ``KyrgyzTextNormalizer`` (демейки: жаңы нуска).
+                Анын ``overrides`` кыскартуулары бир нече сөздөн турса,
+                алардын биринчи сөзү коркунучтуу деп эсептелет.
+        """
+        self.normalizer = normalizer if normalizer is not None else KyrgyzTextNormalizer()
+        self._hazard, self._hold = _quiet_rules(self.normalizer)
+        self._buffer = ''
+        # Эч нерсе чыгарылдыбы / акыркы чыгарылган боштук кармалдыбы
+        self._started = False
+        self._space = False
+
+    @property
+    def pending(self):
+        """Азыр кармалып турган (али нормализацияланбаган) текст."""
+        return self._buffer
+
+    def feed(self, chunk):
+        """
+        Бөлүктү кошот жана даяр болгон нормализацияланган текстти кайтарат.
+
+        Returns:
+            Жаңы чыгарылган текст (бош сап болушу мүмкүн). Бардык
+            ``feed()`` жана ``flush()`` жыйынтыктарынын биригиши бүт
+            текстке ``normalize()`` менен бирдей.
+        """
+        if not chunk:
+            return ''
+        buffer = self._buffer + chunk
+        cut = self._safe_cut(buffer)
+        if not cut:
+            self._buffer = buffer
+            return ''
+        self._buffer = buffer[cut:]
+        return self._emit(buffer[:cut], final=False)
+
+    def flush(self):
+        """Калган текстти нормализациялап кайтарат жана агымды баштапкы абалга келтирет."""
+        buffer, self._buffer = self._buffer, ''
+        result = self._emit(buffer, final=True)
+        self._started = self._space = False
+        return result
+
+    def _safe_cut(self, text):
+        """
+        ``text`` ичиндеги эң оңдогу коопсуз чек (0 — жок).
+
+        Буфердин башы мурунку коопсуз чек болгондуктан, андан мурунку
+        сөздөр тынч деп эсептелет. Чек — сөздүн алдындагы боштуктун башы
+        (``_quiet_cut`` тегидей). Акыркы сөз (артында боштук жок) али
+        бүтпөгөн болушу мүмкүн, ошондуктан ал чек катары каралбайт.
+        """
+        segment_ends = [m.end() for m in self.normalizer._p_segment_end.finditer(text)]
+        cut = segment_ends[-1] if segment_ends else 0
+
+        hold = self._hold
+        quiet = hold
+        next_end = 0
+        end = 0
+        for m in _p_token.finditer(text):
+            # Сүйлөмдүн чегинен кийин мурунку сөздөр эч нерсеге таасир этпейт
+            while next_end < len(segment_ends) and segment_ends[next_end] <= m.start():
+                quiet = hold
+                next_end += 1
+            if quiet >= hold and end > cut:
+                cut = end
+            if m.end() == len(text):
+                break
+            quiet = 0 if self._hazard.search(m.group()) else quiet + 1
+            end = m.end()
+        return cut
+
+    def _emit(self, text, final):
+        """
+        Бөлүктү нормализациялайт; боштуктар ``normalize()`` тегидей
+        кысылат, ал эми бөлүктүн аягындагы боштук кийинки текст
+        келгенче кармалат (аягында ал таштала турган болушу мүмкүн).
+        """
+        normalizer = self.normalizer
+        text = normalizer._p_spaces.sub(' ', normalizer._normalize_scan(text))
+        if self._space:
+            text = ' ' + text.lstrip(' ')
+        if not self._started:
+            text = text.lstrip(' ')
+        self._space = text.endswith(' ')
+        if self._space:
+            text = text[:-1]
+        if text:
+            self._started = True
+        if final:
+            self._space = False
+        return text
+
+
+def normalize_stream(chunks, normalizer=None):
+    """
+    Бөлүктөрдүн итераторун нормализацияланган текст бөлүктөрүнө айландырат.
+
+    Бош бөлүктөр чыгарылбайт; акыркы бөлүк ``flush()`` тен келет.
+    """
+    stream = StreamingNormalizer(normalizer)
+    for chunk in chunks:
+        piece = stream.feed(chunk)
+        if piece:
+            yield piece
+    piece = stream.flush()
+    if piece:
+        yield piece
@@ -0,0 +1,209 @@
+"""
+Нормализатордун орнотулган таблицалары.
+
+Бардык таблицалар модулдун деңгээлинде бир жолу түзүлөт жана окуу үчүн
+гана: тизмелер — кортеж, сөздүктөр — ``MappingProxyType``. Бардык
+``KyrgyzTextNormalizer`` нускалары ушул объекттерди бөлүшөт; нусканын
+өзгөчө жазуулары (``overrides``) өзүнчө катмарда сакталат.
+"""
+
+from types import MappingProxyType
+
+ONES = ('', 'бир', 'эки', 'үч', 'төрт', 'беш', 'алты', 'жети', 'сегиз', 'тогуз')
+
+TENS = ('', 'он', 'жыйырма', 'отуз', 'кырк', 'элүү', 'алтымыш', 'жетимиш', 'сексен', 'токсон')
+
+HUNDREDS = ('', 'жүз', 'эки жүз', 'үч жүз', 'төрт жүз', 'беш жүз',
+            'алты жүз', 'жети жүз', 'сегиз жүз', 'тогуз жүз')
+
+ORDINAL_ONES = ('', 'биринчи', 'экинчи', 'үчүнчү', 'төртүнчү', 'бешинчи',
+                'алтынчы', 'жетинчи', 'сегизинчи', 'тогузунчу')
+
+ORDINAL_TENS = ('', 'онунчу', 'жыйырманчы', 'отузунчу', 'кыркынчы', 'элүүнчү',
+                'алтымышынчы', 'жетимишинчи', 'сексенинчи', 'токсонунчу')
+
+SCALE_WORDS = ('', 'миң', 'миллион', 'миллиард', 'триллион')
+
+SCALE_ORDINALS = MappingProxyType({
+    'миң': 'миңинчи', 'миллион': 'миллионунчу',
+    'миллиард': 'миллиардынчы', 'триллион': 'триллионунчу',
+})
+
+DIGIT_WORDS = MappingProxyType({
+    '0': 'нөл', '1': 'бир', '2': 'эки', '3': 'үч', '4': 'төрт',
+    '5': 'беш', '6': 'алты', '7': 'жети', '8': 'сегиз', '9': 'тогуз',
+})
+
+DECIMAL_PLACES = MappingProxyType({
+    1: 'ондон', 2: 'жүздөн', 3: 'миңден',
+    4: 'он миңден', 5: 'жүз миңден', 6: 'миллиондон',
+})
+
+MONTHS = MappingProxyType({
+    '01': 'январь', '02': 'февраль', '03': 'март', '04': 'апрель',
+    '05': 'май', '06': 'июнь', '07': 'июль', '08': 'август',
+    '09': 'сентябрь', '10': 'октябрь', '11': 'ноябрь', '12': 'декабрь',
+    '1': 'январь', '2': 'февраль', '3': 'март', '4': 'апрель',
+    '5': 'май', '6': 'июнь', '7': 'июль', '8': 'август',
+    '9': 'сентябрь',
+})
+
+MONTH_ABBR = MappingProxyType({
+    'янв': 'январь', 'фев': 'февраль', 'мар': 'март', 'апр': 'апрель',
+    'июн': 'июнь', 'июл': 'июль', 'авг': 'август',
+    'сен': 'сентябрь', 'окт': 'октябрь', 'ноя': 'ноябрь', 'дек': 'декабрь',
+})
+
+SHORT_ABBR = MappingProxyType({
+    'ж.б.у.с.': 'жана башка ушул сыяктуу',
+    'ж.б.': 'жана башка',
+    'б.з.ч.': 'биздин заманга чейин',
+    'б.з.ч': 'биздин заманга чейин',
+    'б.з.': 'биздин заман',
+    'кк.': 'кылымдар',
+    'жж.': 'жылдар',
+    'к.': 'кылым',
+    'көч.': 'көчөсү',
+    'м-н': 'менен',
+    'б-ча': 'боюнча',
+    'ж-а': 'жана',
+    'т.б.': 'тагыраак болсо',
+    'ө.к.': 'өңдүү көп',
+    'б.а.': 'башкача айтканда',
+    'мис.': 'мисалы',
+    'ш.': 'шаары',
+    'обл.': 'облусу',
+    'р-н': 'району',
+    'р.': 'району',
+    'үй': 'үй',
+    'кв.': 'квартира',
+    'мкр.': 'микрорайон',
+    'мкр': 'микрорайон',
+})
+
+KYRGYZ_ABBR = MappingProxyType({
+    'КР': 'кыргыз республикасы',
+    'КТЖ': 'кыргыз темир жолу',
+    'ЖОЖ': 'жогорку окуу жайы',
+    'КМШ': 'көз карандысыз мамлекеттердин шериктештиги',
+    'ААК': 'ачык акционердик коом',
+    'ЖЧК': 'жоопкерчилиги чектелген коом',
+    'БУУ': 'бириккен улуттар уюму',
+    'АКШ': 'америка кошмо штаттары',
+    'БШК': 'борбордук шайлоо комиссиясы',
+    'ШКУ': 'шанхай кызматташтык уюму',
+    'ЕККУ': 'европа коопсуздук жана кызматташуу уюму',
+    'ЕБ': 'европалык биримдик',
+    'ЕАЭБ': 'евразия экономикалык биримдиги',
+    'СССР': 'советтик социалисттик республикалар союзу',
+    'ФСК': 'сорос кыргызстан фонду',
+    'ЭЭА': 'эркин экономикалык аймак',
+    'ПРООН': 'бириккен улуттар уюмунун өнүктүрүү программасы',
+    'UNICEF': 'бириккен улуттар уюмунун балдар фонду',
+    'USAID': 'америка кошмо штаттарынын эл аралык өнүктүрүү агенттиги',
+    'ИДП': 'ички дүң продукциясы',
+    'ЖМК': 'жалпыга маалымдоо каражаттары',
+    'ЖАМК': 'жаза аткаруу мамлекеттик кызматы',
+    'УКМК': 'улуттук коопсуздук мамлекеттик комитети',
+    'ТИМ': 'тышкы иштер министрлиги',
+    'ӨКМ': 'өзгөчө кырдаалдар министрлиги',
+    'ИИМ': 'ички иштер министрлиги',
+    'ОИИБ': 'облустук ички иштер башкармалыгы',
+    'ШИИББ': 'шаардык ички иштер башкы башкармалыгы',
+    'РИИБ': 'райондук ички иштер башкармалыгы',
+    'ЧЧК': 'чоң чүй каналы',
+})
+
+ENGLISH_ABBR = MappingProxyType({
+    'IT': 'ай ти', 'AI': 'эй ай', 'GPU': 'жи пи ю', 'CPU': 'си пи ю',
+    'ML': 'эм эл', 'API': 'эй пи ай', 'URL': 'ю ар эл',
+    'HTTP': 'эйч ти ти пи', 'HTTPS': 'эйч ти ти пи эс',
+    'HTML': 'эйч ти эм эл', 'CSS': 'си эс эс', 'PDF': 'пи ди эф',
+    'USB': 'ю эс би', 'WiFi': 'вай фай', 'GPS': 'жи пи эс',
+    'SMS': 'эс эм эс', 'SIM': 'сим', 'PIN': 'пин', 'ATM': 'эй ти эм',
+    'VPN': 'ви пи эн', 'iOS': 'ай о эс', 'RAM': 'рам', 'ROM': 'ром',
+    'SSD': 'эс эс ди', 'HDD': 'эйч ди ди', 'LED': 'лед', 'LCD': 'эл си ди',
+    'TV': 'ти ви', 'DVD': 'ди ви ди', 'CD': 'си ди', 'PR': 'пи ар',
+    'HR': 'эйч ар', 'CEO': 'си и о', 'ID': 'ай ди', 'OK': 'окей', 'QR': 'кю ар',
+})
+
+UNITS = MappingProxyType({
+    'км': 'километр', 'м': 'метр', 'см': 'сантиметр', 'мм': 'миллиметр',
+    'кг': 'килограмм', 'г': 'грамм', 'мг': 'миллиграмм', 'т': 'тонна',
+    'л': 'литр', 'мл': 'миллилитр', 'га': 'гектар',
+    'м2': 'квадрат метр', 'м3': 'куб метр', 'км2': 'квадрат километр',
+    'см2': 'квадрат сантиметр', 'км/ч': 'километр саатына', 'м/с': 'метр секундасына',
+    'кВт': 'киловатт', 'Вт': 'ватт', 'МВт': 'мегаватт',
+    'ГГц': 'гигагерц', 'МГц': 'мегагерц', 'кГц': 'килогерц', 'Гц': 'герц',
+    'ГБ': 'гигабайт', 'МБ': 'мегабайт', 'КБ': 'килобайт', 'ТБ': 'терабайт',
+    'мин': 'мүнөт', 'сек': 'секунд', 'саат': 'саат',
+    'km': 'километр', 'km²': 'квадрат километр', 'm': 'метр',
+    'm²': 'квадрат метр', 'm³': 'куб метр', 'cm': 'сантиметр', 'mm': 'миллиметр',
+    'kg': 'килограмм', 'g': 'грамм', 'mg': 'миллиграмм',
+    'l': 'литр', 'ml': 'миллилитр', 'ha': 'гектар',
+    'km/h': 'километр саатына', 'm/s': 'метр секундасына',
+    'kW': 'киловатт', 'W': 'ватт', 'MW': 'мегаватт',
+    'GHz': 'гигагерц', 'MHz': 'мегагерц', 'kHz': 'килогерц', 'Hz': 'герц',
+    'GB': 'гигабайт', 'MB': 'мегабайт', 'KB': 'килобайт', 'TB': 'терабайт',
+    'min': 'мүнөт', 'sec': 'секунд', 'h': 'саат',
+})
+
+CURRENCIES = MappingProxyType({
+    'сом': 'сом', '$': 'доллар', '€': 'евро', '₽': 'рубль',
+    '¥': 'юань', '£': 'фунт', '₸': 'тенге', '₴': 'гривна',
+})
+
+LARGE_NUMBERS = MappingProxyType({
+    'млн': 'миллион', 'млрд': 'миллиард', 'трлн': 'триллион', 'тыс': 'миң',
+})
+
+SYMBOLS = MappingProxyType({
+    '%': 'пайыз', '№': 'номур', '@': 'эт белгиси', '&': 'жана',
+    '§': 'параграф', '©': 'автордук укук', '®': 'катталган', '™': 'соода белгиси',
+    '°': 'градус', '×': 'көбөйтүү', '÷': 'бөлүү', '±': 'кошуу кемитүү',
+    '≈': 'болжол менен', '≠': 'барабар эмес', '≤': 'кичине же барабар',
+    '≥': 'чоң же барабар', '<': 'кичине', '>': 'чоң', '=': 'барабар',
+    '+': 'кошуу', '−': 'кемитүү', '—': '', '–': '', '/': 'сызыкча',
+})
+
+ROMAN_VALUES = (
+    ('M', 1000), ('CM', 900), ('D', 500), ('CD', 400),
+    ('C', 100), ('XC', 90), ('L', 50), ('XL', 40),
+    ('X', 10), ('IX', 9), ('V', 5), ('IV', 4), ('I', 1),
+)
+
+CARDINAL_SUFFIXES = (
+    'дык', 'дик', 'дүк', 'дук',
+    'тык', 'тик', 'түк', 'тук',
+    'лык', 'лик', 'лүк', 'лук',
+    'луу', 'лүү', 'дуу', 'дүү', 'туу', 'түү',
+)
+
+# Аббревиатуралардан кийинки суффикстер (узундары биринчи)
+ABBR_SUFFIXES = (
+    'нын', 'нун', 'нүн', 'нин', 'дын', 'дун', 'дүн', 'дин', 'тын', 'тун', 'түн', 'тин',
+    'га', 'ге', 'ка', 'ке', 'го', 'гө', 'ко', 'кө', 'да', 'де', 'та', 'те', 'до', 'дө', 'то', 'тө',
+    'дан', 'ден', 'тан', 'тен', 'дон', 'дөн', 'тон', 'төн', 'н', 'ы', 'и', 'у', 'ү',
+)
+
+SUFFIX_BASE_MAP = MappingProxyType({
+    'га': 'га', 'ге': 'га', 'го': 'га', 'гө': 'га',
+    'ка': 'ка', 'ке': 'ка', 'ко': 'ка', 'кө': 'ка',
+    'да': 'да', 'де': 'да', 'до': 'да', 'дө': 'да',
+    'та': 'та', 'те': 'та', 'то': 'та', 'тө': 'та',
+})
+
+TIME_SUFFIXES = MappingProxyType({
+    ('нөл', 'га'): 'нөлгө', ('беш', 'га'): 'бешке', ('он', 'га'): 'онго',
+    ('он беш', 'га'): 'он бешке', ('жыйырма', 'га'): 'жыйырмага',
+    ('жыйырма беш', 'га'): 'жыйырма бешке', ('отуз', 'га'): 'отузга',
+    ('отуз беш', 'га'): 'отуз бешке', ('кырк', 'га'): 'кыркка',
+    ('кырк беш', 'га'): 'кырк бешке', ('элүү', 'га'): 'элүүгө',
+    ('элүү беш', 'га'): 'элүү бешке',
+    ('нөл', 'да'): 'нөлдө', ('беш', 'да'): 'беште', ('он', 'да'): 'ондо',
+    ('он беш', 'да'): 'он беште', ('жыйырма', 'да'): 'жыйырмада',
+    ('жыйырма беш', 'да'): 'жыйырма беште', ('отуз', 'да'): 'отузда',
+    ('отуз беш', 'да'): 'отуз беште', ('кырк', 'да'): 'кыркта',
+    ('кырк беш', 'да'): 'кырк беште', ('элүү', 'да'): 'элүүдө',
+    ('элүү беш', 'да'): 'элүү беште',
+})
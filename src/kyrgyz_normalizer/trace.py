@@ -0,0 +1,74 @@
+"""
+``KyrgyzTextNormalizer.trace()`` отчетунун түрлөрү.
+
+Колдонуу:
+    result = normalizer.trace("Саат 12:30да КРдин 3-классында")
+    result.output                 # normalize() менен бирдей
+    for stage in result.stages:   # этаптар тартиби боюнча
+        print(stage.stage, stage.seconds, stage.rules)
+    print(result.format())        # адам окуй турган таблица
+"""
+
+from collections import namedtuple
+
+_StageTrace = namedtuple('StageTrace', 'stage seconds ran skipped rules text')
+_Trace = namedtuple('Trace', 'input output seconds stages')
+
+
+class StageTrace(_StageTrace):
+    """
+    Бир этаптын отчету.
+
+    Attributes:
+        stage: Этаптын аты (``KyrgyzTextNormalizer.STAGES``)
+        seconds: Этаптын убактысы (триггерлер жана эрежелер, бардык сегменттер)
+        ran: Этап иштеген сегменттердин саны (``sequential`` — 1)
+        skipped: Өткөрүлгөн сегменттердин саны (``sequential`` — 0)
+        rules: ``{эреже: алмаштыруулардын саны}`` — текшерилген эрежелер
+        text: Этаптан кийинки текст (боштуктар али кысылган эмес)
+    """
+
+    __slots__ = ()
+
+    @property
+    def substitutions(self):
+        return sum(self.rules.values())
+
+
+class Trace(_Trace):
+    """
+    ``trace()`` жыйынтыгы.
+
+    Attributes:
+        input: Кирүүчү текст
+        output: Нормализацияланган текст (``normalize()`` менен бирдей)
+        seconds: Жалпы убакыт
+        stages: ``StageTrace`` тизмеси, этаптардын тартиби боюнча
+    """
+
+    __slots__ = ()
+
+    def fired(self):
+        """``{эреже: саны}`` — жок дегенде бир жолу иштеген эрежелер."""
+        return {name: count for stage in self.stages
+                for name, count in stage.rules.items() if count}
+
+    def format(self, show_text=True):
+        """
+        Адам окуй турган таблица.
+
+        Args:
+            show_text: Текстти өзгөрткөн этаптан кийинки текстти да көрсөтүү
+        """
+        lines = [f"{'этап':<18} {'мкс':>9} {'сегм.':>6}  эрежелер"]
+        previous = self.input
+        for stage in self.stages:
+            fired = ', '.join(f'{name}×{count}' for name, count in stage.rules.items() if count)
+            lines.append(f"{stage.stage:<18} {stage.seconds * 1e6:9.1f} "
+                         f"{stage.ran:>2}/{stage.ran + stage.skipped:<3}  {fired}")
+            if show_text and stage.text != previous:
+                lines.append(f"{'':<18} → {stage.text}")
+            previous = stage.text
+        lines.append(f"{'жалпы':<18} {self.seconds * 1e6:9.1f}")
+        lines.append(f"жыйынтык: {self.output}")
+        return '\n'.join(lines)
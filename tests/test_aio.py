@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Тесттер — anormalize / AsyncNormalizer
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from kyrgyz_normalizer import (BatchItemError, KyrgyzTextNormalizer, anormalize, anormalize_many,
+                               normalize)
+from kyrgyz_normalizer.aio import AsyncNormalizer
+
+TEXTS = [
+    "Баасы 1500 сом",
+    "2024-жылы 15 км жол курулду",
+    "Саат 12:30да башталат",
+    "КР Президенти БУУнун жыйынында",
+    "01.02.2024",
+] * 20
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class Wrapped:
+    """Нормализатордун ``normalize``'ун алмаштырууга мүмкүндүк берет."""
+
+    def __init__(self, normalize):
+        self.normalize = normalize
+
+
+def test_module_functions():
+    assert run(anormalize("Баасы 1500 сом")) == normalize("Баасы 1500 сом")
+    assert run(anormalize_many(TEXTS)) == [normalize(t) for t in TEXTS]
+
+
+def test_inline_and_executor_give_same_results():
+    async def main():
+        async with AsyncNormalizer(inline_threshold=10 ** 9) as inline, \
+                AsyncNormalizer(inline_threshold=0, max_workers=2) as pooled:
+            first = await asyncio.gather(*(inline.normalize(t) for t in TEXTS))
+            second = await asyncio.gather(*(pooled.normalize(t) for t in TEXTS))
+            assert inline._executor is None
+            return first, second, await pooled.normalize_many(TEXTS, chunksize=7)
+
+    first, second, many = run(main())
+    expected = [normalize(t) for t in TEXTS]
+    assert first == second == many == expected
+
+
+def test_process_executor():
+    async def main():
+        async with AsyncNormalizer(executor='process', max_workers=2, inline_threshold=0) as n:
+            return await n.normalize(TEXTS[1]), await n.normalize_many(TEXTS + [None], chunksize=9)
+
+    single, many = run(main())
+    assert single == normalize(TEXTS[1])
+    assert many[:-1] == [normalize(t) for t in TEXTS]
+    assert isinstance(many[-1], BatchItemError) and many[-1].index == len(TEXTS)
+
+
+def test_process_executor_uses_options():
+    options = {'profile': 'numbers', 'overrides': {'units': {'км': 'чакырым'}}}
+    local = KyrgyzTextNormalizer(**options)
+
+    async def main():
+        async with AsyncNormalizer(executor='process', max_workers=1, inline_threshold=0,
+                                   **options) as n:
+            return await n.normalize(TEXTS[1]), await n.normalize_many(TEXTS, chunksize=9)
+
+    single, many = run(main())
+    assert single == local.normalize(TEXTS[1]) == "эки миң жыйырма төртүнчү жылы он беш чакырым жол курулду"
+    assert many == [local.normalize(t) for t in TEXTS]
+    assert "КР Президенти БУУнун жыйынында" in many
+
+
+def test_concurrency_limit():
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    normalizer = AsyncNormalizer(max_workers=8, max_concurrency=2, inline_threshold=0)
+    original = normalizer.normalizer.normalize
+
+    def slow(text):
+        with lock:
+            active.append(text)
+            peak.append(len(active))
+        time.sleep(0.01)
+        with lock:
+            active.remove(text)
+        return original(text)
+
+    normalizer.normalizer = Wrapped(slow)
+
+    async def main():
+        try:
+            return await asyncio.gather(*(normalizer.normalize(t) for t in TEXTS[:12]))
+        finally:
+            await normalizer.aclose()
+
+    assert run(main()) == [normalize(t) for t in TEXTS[:12]]
+    assert max(peak) == 2
+
+
+def test_cancellation_releases_permit():
+    started = threading.Event()
+    release = threading.Event()
+    normalizer = AsyncNormalizer(max_workers=1, max_concurrency=1, inline_threshold=0)
+    original = normalizer.normalizer.normalize
+
+    def blocking(text):
+        started.set()
+        release.wait(5)
+        return original(text)
+
+    normalizer.normalizer = Wrapped(blocking)
+
+    async def main():
+        task = asyncio.ensure_future(normalizer.normalize("5 км"))
+        while not started.is_set():
+            await asyncio.sleep(0.001)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # иштеп жаткан тапшырма орунду бошото элек
+        assert normalizer._semaphore.locked()
+        release.set()
+        normalizer.normalizer = Wrapped(original)
+        result = await asyncio.wait_for(normalizer.normalize("5 км"), 5)
+        await normalizer.aclose()
+        return result
+
+    assert run(main()) == "беш километр"
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        AsyncNormalizer(executor='fiber')
+    with pytest.raises(ValueError):
+        AsyncNormalizer(max_concurrency=-1)
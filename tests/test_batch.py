@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Тесттер — normalize_batch
+"""
+
+import os
+
+from kyrgyz_normalizer import BatchItemError, KyrgyzTextNormalizer, normalize, normalize_batch
+from kyrgyz_normalizer.batch import auto_chunksize, iter_normalize
+
+TEXTS = [
+    "Баасы 1500 сом",
+    "2024-жылы 15 км жол курулду",
+    "Саат 12:30да башталат",
+    "КР Президенти БУУнун жыйынында",
+    "01.02.2024",
+] * 20
+
+
+def test_serial_matches_normalize():
+    assert normalize_batch(TEXTS, workers=1) == [normalize(t) for t in TEXTS]
+
+
+def test_process_pool_keeps_order():
+    assert normalize_batch(TEXTS, workers=2, chunksize=7) == [normalize(t) for t in TEXTS]
+
+
+def test_item_errors_do_not_stop_batch():
+    texts = ["Баасы 1500 сом", None, "5 км"]
+    for workers in (1, 2):
+        results = normalize_batch(texts, workers=workers, chunksize=1)
+        assert results[0] == "Баасы бир миң беш жүз сом"
+        assert isinstance(results[1], BatchItemError)
+        assert results[1].index == 1
+        assert results[2] == "беш километр"
+
+
+class Crash:
+    """Процесске жеткенде (unpickle) ошол процессти өлтүрөт."""
+
+    def __reduce__(self):
+        return os._exit, (1,)
+
+
+def test_crashed_worker_fails_only_its_chunk():
+    texts = TEXTS[:20] + [Crash()] + TEXTS[20:40]
+    expected = [normalize(t) for t in TEXTS[:40]]
+    results = normalize_batch(texts, workers=2, chunksize=5)
+    assert len(results) == 41
+    # Кулаткан элементтин бөлүгү (20..24) гана ката болот
+    assert all(isinstance(r, BatchItemError) for r in results[20:25])
+    assert [r.index for r in results[20:25]] == list(range(20, 25))
+    assert results[:20] + results[25:] == expected[:20] + expected[24:]
+
+
+def test_stream_continues_after_crashed_worker():
+    # Пул бузулгандан кийин да жаңы бөлүктөр тапшырыла берет
+    texts = TEXTS[:12] + [Crash()] + TEXTS[12:40]
+    expected = [normalize(t) for t in TEXTS[:40]]
+    results = list(iter_normalize(iter(texts), workers=2, chunksize=5, max_pending=2))
+    assert len(results) == 41
+    assert all(isinstance(r, BatchItemError) for r in results[10:15])
+    assert results[:10] + results[15:] == expected[:10] + expected[14:]
+
+
+def test_auto_chunksize():
+    assert auto_chunksize(0, 0, 4) == 1
+    # көп кыска сүйлөм — ар бир процесске 4 бөлүк
+    assert auto_chunksize(1000, 30000, 4) == 63
+    # узун тексттер — бөлүк кичирейет
+    assert auto_chunksize(1000, 10_000_000, 4) == 6
+
+
+def test_profile_in_workers():
+    numbers = KyrgyzTextNormalizer(profile="numbers")
+    expected = [numbers.normalize(t) for t in TEXTS]
+    assert "КР Президенти БУУнун жыйынында" in expected
+    for workers in (1, 2):
+        assert normalize_batch(TEXTS, workers=workers, chunksize=7, profile="numbers") == expected
+
+
+def test_early_close_works_without_cancel_futures(monkeypatch):
+    from concurrent.futures import ProcessPoolExecutor
+
+    calls = []
+    original = ProcessPoolExecutor.shutdown
+
+    def shutdown(self, wait=True):  # Python 3.7-3.8 сигнатурасы
+        calls.append(wait)
+        original(self, wait=wait)
+
+    monkeypatch.setattr(ProcessPoolExecutor, "shutdown", shutdown)
+    stream = iter_normalize(iter(TEXTS * 5), workers=2, chunksize=1, max_pending=8)
+    assert next(stream) == normalize(TEXTS[0])
+    stream.close()
+    assert len(calls) == 1
+    assert list(iter_normalize(iter(TEXTS), workers=2, chunksize=7)) == [normalize(t) for t in TEXTS]
+    assert len(calls) == 2
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Тесттер — бенчмарк корпустары жана `kyrgyz-normalizer bench`
+"""
+
+import json
+
+import pytest
+
+from kyrgyz_normalizer import KyrgyzTextNormalizer, cli
+from kyrgyz_normalizer.bench import CATEGORIES, generate_corpus, parse_size
+from kyrgyz_normalizer.bench.adversarial import ADVERSARIAL, adversarial_text, check_scaling
+
+
+def test_corpus_is_reproducible():
+    for category in CATEGORIES + ('mixed',):
+        first = list(generate_corpus(category, sentences=50, seed=3))
+        assert first == list(generate_corpus(category, sentences=50, seed=3))
+        assert len(first) == 50 and all(first)
+    assert list(generate_corpus('dates', sentences=50, seed=1)) != \
+        list(generate_corpus('dates', sentences=50, seed=2))
+
+
+def test_corpus_size_limit():
+    size = parse_size('4KB')
+    sentences = list(generate_corpus('mixed', size=size))
+    total = sum(len(s.encode('utf-8')) + 1 for s in sentences)
+    assert size - 300 < total <= size
+
+
+def test_categories_contain_their_class():
+    assert all(any(ch.isdigit() for ch in s) for s in generate_corpus('dates', sentences=30))
+    assert all(':' in s for s in generate_corpus('times', sentences=30))
+    assert not any(ch.isdigit() for s in generate_corpus('prose', sentences=30) for ch in s)
+
+
+def test_parse_size():
+    assert parse_size('1KB') == 1024
+    assert parse_size('100mb') == 100 * 1024 ** 2
+    assert parse_size('512') == 512
+    with pytest.raises(ValueError):
+        parse_size('много')
+    with pytest.raises(ValueError):
+        list(generate_corpus('poetry', sentences=1))
+
+
+def test_bench_cli_writes_json(tmp_path, capsys):
+    out = tmp_path / 'results.json'
+    assert cli.main(['bench', '--categories', 'dates', 'prose', '--sentences', '20',
+                     '--sizes', '1KB', '--memory-sample', '5', '-o', str(out)]) == 0
+    report = json.loads(out.read_text(encoding='utf-8'))
+    assert set(report['results']) == {'dates', 'prose', 'mixed-1KB'}
+    dates = report['results']['dates']
+    assert dates['sentences'] == 20
+    assert dates['chars_per_s'] > 0 and dates['sentences_per_s'] > 0
+    assert 0 < dates['latency_us']['p50'] <= dates['latency_us']['p99']
+    assert dates['peak_memory_bytes'] > 0
+    assert 'dates' in capsys.readouterr().err
+    assert report['meta']['profile'] == 'full'
+
+    assert cli.main(['bench', '--categories', 'dates', '--sentences', '20', '--sizes',
+                     '--memory-sample', '0', '-q', '-o', str(tmp_path / 'again.json'),
+                     '--compare', str(out)]) == 0
+    again = json.loads((tmp_path / 'again.json').read_text(encoding='utf-8'))
+    assert again['results']['dates']['sha256'] == dates['sha256']
+    assert 'ылдамдык' in capsys.readouterr().err
+
+
+def test_adversarial_texts():
+    for case in ADVERSARIAL:
+        assert len(adversarial_text(case, 500)) == 500
+    assert adversarial_text('email_local', 10).endswith('@')
+    with pytest.raises(ValueError):
+        adversarial_text('poetry', 10)
+
+
+@pytest.mark.parametrize('engine', KyrgyzTextNormalizer.ENGINES)
+def test_adversarial_stages_scale_linearly(engine):
+    # Жумшак чектер: квадраттык этап (мис. 250 → 1000 символдо 16 эсе)
+    # жай машинада да кармалат, ал эми кичине убакыттар эсептелбейт
+    normalizer = KyrgyzTextNormalizer(engine=engine).warmup()
+    for case in ADVERSARIAL:
+        rows = check_scaling(normalizer, case, size=250, factor=4, tolerance=3, floor=0.005)
+        assert all(row.ok for row in rows), [row for row in rows if not row.ok]
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Тесттер — number_to_words_many / number_to_ordinal_many
+"""
+
+import random
+
+import pytest
+
+from kyrgyz_normalizer import KyrgyzTextNormalizer
+
+np = pytest.importorskip("numpy")
+
+normalizer = KyrgyzTextNormalizer()
+
+rng = random.Random(0)
+VALUES = [0, 1, -1, 999, 1000, -1000, 2024, 1_002_000, 5_000_000, 10 ** 15 + 7,
+          -2 ** 63, 2 ** 63 - 1]
+VALUES += [rng.randrange(-10 ** k, 10 ** k) for k in range(1, 19) for _ in range(50)]
+
+
+@pytest.mark.parametrize("many, scalar", [
+    (normalizer.number_to_words_many, normalizer.number_to_words),
+    (normalizer.number_to_ordinal_many, normalizer.number_to_ordinal),
+])
+def test_matches_scalar(many, scalar):
+    result = many(np.array(VALUES * 2, dtype=np.int64))
+    assert result.tolist() == [scalar(v) for v in VALUES * 2]
+
+
+def test_shape_and_input_types():
+    result = normalizer.number_to_ordinal_many(np.array([[1, 2000], [3, 4]], dtype=np.uint16))
+    assert result.shape == (2, 2)
+    assert result[0, 1] == "эки миңинчи"
+    assert normalizer.number_to_words_many([1500, 1500]) == ["бир миң беш жүз"] * 2
+    assert normalizer.number_to_words_many([]) == []
+    huge = np.array([2 ** 64 - 1], dtype=np.uint64)
+    assert normalizer.number_to_words_many(huge)[0] == normalizer.number_to_words(2 ** 64 - 1)
+
+
+def test_rejects_floats():
+    with pytest.raises(TypeError):
+        normalizer.number_to_words_many(np.array([1.5]))
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Тесттер — жыйынтыктар кэши
+"""
+
+import pytest
+
+import kyrgyz_normalizer
+from kyrgyz_normalizer import KyrgyzTextNormalizer
+from kyrgyz_normalizer.cache import ResultCache
+
+
+def test_cache_off_by_default():
+    assert KyrgyzTextNormalizer().cache_info() is None
+
+
+def test_hits_and_misses():
+    normalizer = KyrgyzTextNormalizer(cache_size=10)
+    plain = KyrgyzTextNormalizer()
+    for _ in range(3):
+        assert normalizer.normalize("Баасы 1500 сом") == plain.normalize("Баасы 1500 сом")
+    info = normalizer.cache_info()
+    assert (info.hits, info.misses, info.size) == (2, 1, 1)
+    normalizer.cache_clear()
+    assert normalizer.cache_info().size == 0
+
+
+def test_lru_eviction_by_entries():
+    cache = ResultCache(maxsize=2)
+    cache.put('a', 'A')
+    cache.put('b', 'B')
+    cache.get('a')
+    cache.put('c', 'C')
+    assert cache.get('b') is None
+    assert cache.get('a') == 'A'
+    assert cache.info().evictions == 1
+
+
+def test_eviction_by_bytes():
+    entry = ResultCache._entry_size('x' * 100, 'y' * 100)
+    cache = ResultCache(maxbytes=entry * 2)
+    for key in ('a', 'b', 'c'):
+        cache.put(key * 100, 'y' * 100)
+    info = cache.info()
+    assert info.size == 2
+    assert info.nbytes <= entry * 2
+    cache.put('z' * 10000, 'y')   # чектен чоң жазуу сакталбайт
+    assert cache.info().size == 2
+
+
+def test_negative_limit():
+    with pytest.raises(ValueError):
+        KyrgyzTextNormalizer(cache_size=-1)
+
+
+def test_module_level_normalize_uses_cache():
+    kyrgyz_normalizer.cache_clear()
+    kyrgyz_normalizer.normalize("5 км")
+    kyrgyz_normalizer.normalize("5 км")
+    assert kyrgyz_normalizer.cache_info().hits == 1
+
+
+def test_default_caches_are_bounded_by_bytes():
+    from kyrgyz_normalizer.aio import _get_default_async
+    from kyrgyz_normalizer.server import MicroBatcher
+
+    info = kyrgyz_normalizer.cache_info()
+    assert info.maxsize == kyrgyz_normalizer.DEFAULT_CACHE_SIZE
+    assert info.maxbytes == kyrgyz_normalizer.DEFAULT_CACHE_BYTES
+    assert _get_default_async().normalizer.cache_info().maxbytes == info.maxbytes
+    batcher = MicroBatcher(workers=0)
+    try:
+        assert batcher._normalizer.cache_info().maxbytes == info.maxbytes
+    finally:
+        batcher.close()
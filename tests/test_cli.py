@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Тесттер — kyrgyz-normalizer CLI
+"""
+
+import io
+import json
+
+from kyrgyz_normalizer.cli import _build_serve_parser, main, stream
+
+
+def test_single_text(capsys):
+    assert main(["Баасы", "1500", "сом"]) == 0
+    assert capsys.readouterr().out == "Баасы бир миң беш жүз сом\n"
+
+
+def test_stream_text_keeps_order():
+    src = io.StringIO("Баасы 1500 сом\n\n5 км\n" * 10)
+    dst = io.StringIO()
+    progress = stream(src, dst, jobs=2, chunk_size=4)
+    assert dst.getvalue() == "Баасы бир миң беш жүз сом\n\nбеш километр\n" * 10
+    assert progress.lines == 30
+    assert progress.errors == 0
+
+
+def test_stream_jsonl_field_and_errors():
+    src = io.StringIO('{"id": 1, "body": "5 км"}\nnot json\n{"id": 2}\n')
+    dst = io.StringIO()
+    progress = stream(src, dst, fmt="jsonl", field="body")
+    lines = dst.getvalue().splitlines()
+    assert json.loads(lines[0]) == {"id": 1, "body": "беш километр"}
+    assert lines[1:] == ["not json", '{"id": 2}']
+    assert progress.errors == 2
+
+
+def test_file_mode(tmp_path):
+    src = tmp_path / "in.txt"
+    dst = tmp_path / "out.txt"
+    src.write_text("01.02.2024\n", encoding="utf-8")
+    assert main(["-i", str(src), "-o", str(dst), "-q"]) == 0
+    assert dst.read_text(encoding="utf-8") == "эки миң жыйырма төртүнчү жыл биринчи февраль\n"
+
+
+def test_trace_flag(capsys):
+    assert main(['--trace', 'Баасы 1500 сом']) == 0
+    captured = capsys.readouterr()
+    assert captured.out.strip() == 'Баасы бир миң беш жүз сом'
+    assert 'currency' in captured.err and 'som_simple×1' in captured.err
+
+
+def test_profile_flag(capsys):
+    assert main(['--profile', 'numbers', 'КР', '5', 'км']) == 0
+    assert capsys.readouterr().out == "КР беш километр\n"
+    assert _build_serve_parser().parse_args(['--profile', 'numbers']).profile == 'numbers'
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Тесттер — колдонуучунун сөздүктөрү (load_dictionary, add/remove_entries)
+"""
+
+import json
+import sys
+import threading
+
+import pytest
+
+from kyrgyz_normalizer import KyrgyzTextNormalizer, load_dictionary
+
+
+def test_load_tsv(tmp_path):
+    path = tmp_path / "custom.tsv"
+    path.write_text("# кыскартуулар\n"
+                    "kyrgyz_abbr\tКТУ\tкыргыз техникалык университети\n"
+                    "\n"
+                    "units\tпуд\tпуд\n", encoding="utf-8")
+    overrides = load_dictionary(path)
+    assert overrides == {"kyrgyz_abbr": {"КТУ": "кыргыз техникалык университети"},
+                         "units": {"пуд": "пуд"}}
+    normalizer = KyrgyzTextNormalizer(overrides=overrides)
+    assert normalizer.normalize("КТУ 5 пуд алды") == \
+        "кыргыз техникалык университети беш пуд алды"
+
+
+def test_load_json(tmp_path):
+    path = tmp_path / "custom.json"
+    path.write_text(json.dumps({"units": {"пуд": "пуд"}}, ensure_ascii=False), encoding="utf-8")
+    assert load_dictionary(str(path)) == {"units": {"пуд": "пуд"}}
+
+
+def test_load_errors(tmp_path):
+    path = tmp_path / "bad.tsv"
+    path.write_text("units\tпуд\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="bad.tsv:1"):
+        load_dictionary(path)
+    path.write_text("ones\t1\tбир\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="белгисиз таблица"):
+        load_dictionary(path)
+
+
+def test_add_and_remove_on_live_normalizer():
+    normalizer = KyrgyzTextNormalizer().warmup()
+    text = "КТУнын 5 пуд жүгү, 3 км жол"
+    assert normalizer.normalize(text) == "КТУнын беш пуд жүгү, үч километр жол"
+    normalizer.add_entries("kyrgyz_abbr", {"КТУ": "кыргыз техникалык университети"})
+    normalizer.add_entries("units", [("пуд", "пуд")])
+    assert normalizer.normalize(text) == \
+        "кыргыз техникалык университетинин беш пуд жүгү, үч километр жол"
+    # Орнотулган мааниси алмаштырылып, кайра калыбына келет
+    normalizer.add_entries("units", {"км": "чакырым"})
+    assert normalizer.normalize("3 км") == "үч чакырым"
+    assert normalizer.remove_entries("units", ["км", "пуд", "жок"]) == 2
+    assert normalizer.normalize("3 км, 5 пуд") == "үч километр, беш пуд"
+    normalizer.add_entries("kyrgyz_abbr", {"КР": "кызыл роза"})
+    assert normalizer.remove_entries("kyrgyz_abbr", ["КР", "КТУ"]) == 2
+    assert normalizer.normalize("КР КТУ") == "кыргыз республикасы КТУ"
+    # Бөлүшүлгөн таблицалар жана башка нускалар өзгөргөн жок
+    assert KyrgyzTextNormalizer().normalize("КТУ") == "КТУ"
+    assert "КТУ" not in KyrgyzTextNormalizer().kyrgyz_abbr
+
+
+def test_sequential_engine_and_unknown_table():
+    normalizer = KyrgyzTextNormalizer(engine="sequential")
+    normalizer.add_entries("units", {"пуд": "пуд"})
+    assert normalizer.normalize("2-3 пуд") == "эки үч пуд"
+    with pytest.raises(ValueError):
+        normalizer.add_entries("ones", {"1": "бир"})
+    assert KyrgyzTextNormalizer().remove_entries("units", ["км"]) == 0
+
+
+def test_update_overrides_applies_difference():
+    normalizer = KyrgyzTextNormalizer(overrides={
+        "kyrgyz_abbr": {"КТУ": "кыргыз техникалык университети"},
+        "units": {"пуд": "пуд"},
+    })
+    assert normalizer.normalize("КТУ 5 пуд") == "кыргыз техникалык университети беш пуд"
+    normalizer.update_overrides({"kyrgyz_abbr": {"КТУ": "техникалык университет"}})
+    assert normalizer.normalize("КТУ 5 пуд") == "техникалык университет беш пуд"
+    assert "пуд" not in normalizer.units
+    with pytest.raises(ValueError):
+        normalizer.update_overrides({"ones": {}})
+
+
+def test_updates_during_concurrent_normalize():
+    normalizer = KyrgyzTextNormalizer(cache_size=0).warmup()
+    errors = []
+    done = threading.Event()
+
+    def reader():
+        try:
+            while not done.is_set():
+                assert normalizer.normalize("3 км жол").startswith("үч ")
+        except Exception as exc:  # pragma: no cover
+            errors.append(exc)
+
+    threads = [threading.Thread(target=reader) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for i in range(300):
+        normalizer.add_entries("units", {f"бд{i}": "бирдик"})
+        normalizer.add_entries("kyrgyz_abbr", {f"ЖК{i}": "жаңы уюм"})
+        normalizer.remove_entries("units", [f"бд{i - 1}"])
+    done.set()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert normalizer.normalize("7 бд299 ЖК5") == "жети бирдик жаңы уюм"
+
+
+def test_reload_of_keys_being_read():
+    # Окулуп жаткан ачкычтар кошулуп/өчүрүлүп турат: KeyError болбошу керек
+    normalizer = KyrgyzTextNormalizer(cache_size=0).warmup()
+    text = "5 пуд ЖЖЖ 2-5 пуд"
+    with_keys = "беш орус пуду жаңы жамаат эки беш орус пуду"
+    errors = []
+    outputs = set()
+    done = threading.Event()
+
+    def reader():
+        try:
+            while not done.is_set():
+                outputs.add(normalizer.normalize(text))
+        except Exception as exc:  # pragma: no cover
+            errors.append(exc)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    threads = [threading.Thread(target=reader) for _ in range(3)]
+    try:
+        for thread in threads:
+            thread.start()
+        for _ in range(500):
+            normalizer.update_overrides({"units": {"пуд": "орус пуду"},
+                                         "kyrgyz_abbr": {"ЖЖЖ": "жаңы жамаат"}})
+            normalizer.update_overrides({})
+    finally:
+        done.set()
+        for thread in threads:
+            thread.join()
+        sys.setswitchinterval(interval)
+    assert not errors
+    assert normalizer.normalize(text) == "беш пуд ЖЖЖ эки беш пуд"
+    normalizer.update_overrides({"units": {"пуд": "орус пуду"},
+                                 "kyrgyz_abbr": {"ЖЖЖ": "жаңы жамаат"}})
+    assert normalizer.normalize(text) == with_keys
+    # Жаңыртуунун ортосунда бир бөлүгү гана өзгөргөн жыйынтыктар болушу мүмкүн
+    for output in outputs:
+        assert output.split()[0] == "беш"
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Тесттер — NormalizedDocument
+"""
+
+import os
+import random
+
+import pytest
+
+from kyrgyz_normalizer import KyrgyzTextNormalizer, NormalizedDocument
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), "test_data.txt")
+
+
+@pytest.fixture(scope="module")
+def normalizer():
+    return KyrgyzTextNormalizer()
+
+
+def _sentences():
+    with open(DATA_FILE, encoding="utf-8") as f:
+        inputs = [line.split(" | ", 1)[0].strip() for line in f
+                  if " | " in line and not line.startswith("#")]
+    return [text[0].upper() + text[1:] + ending
+            for text in inputs for ending in (".", " деди.")]
+
+
+def _apply(output, change):
+    return output[:change.start] + change.text + output[change.end:]
+
+
+@pytest.mark.parametrize("block_size", [1, 3, NormalizedDocument.BLOCK_SIZE])
+def test_random_edits_match_normalize(normalizer, monkeypatch, block_size):
+    monkeypatch.setattr(NormalizedDocument, "BLOCK_SIZE", block_size)
+    rng = random.Random(block_size)
+    sentences = _sentences()
+    replacements = ["", " ", "а", ". Бул ", " 12", ":30да", "Ж", ".", "2024-жылы"]
+    for _ in range(60):
+        text = ' '.join(rng.choice(sentences) for _ in range(rng.randint(0, 10)))
+        doc = NormalizedDocument(text, normalizer)
+        output = doc.output
+        assert output == normalizer.normalize(text)
+        for _ in range(10):
+            start = rng.randint(0, len(doc))
+            end = min(len(doc), start + rng.randint(0, 20))
+            replacement = rng.choice(replacements + [rng.choice(sentences)])
+            if rng.random() < 0.2:
+                change = doc.update(doc.text[:start] + replacement + doc.text[end:])
+            else:
+                change = doc.edit(start, end, replacement)
+            output = _apply(output, change)
+            assert output == doc.output == normalizer.normalize(doc.text)
+
+
+def test_only_changed_segments_are_normalized(normalizer):
+    text = ' '.join(f"Бул {i}-сүйлөм." for i in range(1, 301))
+    doc = NormalizedDocument(text, normalizer)
+    assert doc.cache_info().misses == 300
+
+    position = doc.text.index("150-сүйлөм")
+    output = doc.output
+    change = doc.edit(position, position + 3, "999")
+    # түзөтүлгөн сегмент жана анын эки кошунасы
+    assert doc.cache_info().misses == 301
+    assert doc.cache_info().hits == 2
+    assert output[change.start:change.end] == "жүз элүүнчү"
+    assert change.text == "тогуз жүз токсон тогузунчу"
+
+    # жокко чыгарылган түзөтүү кэштен алынат
+    doc.edit(position, position + 3, "150")
+    assert doc.cache_info().misses == 301
+    assert doc.output == normalizer.normalize(text)
+
+
+def test_update_reuses_unchanged_segments(normalizer):
+    doc = NormalizedDocument("Бүгүн 5 км жүрдүк. Эртең 10 км жүрөбүз.", normalizer)
+    output = doc.output
+    change = doc.update("Бүгүн 5 км жүрдүк. Эртең 12 км жүрөбүз.")
+    assert _apply(output, change) == doc.output == "Бүгүн беш километр жүрдүк. Эртең он эки километр жүрөбүз."
+    assert doc.cache_info().misses == 3
+    assert doc.update(doc.text).text == ""
+
+
+def test_edit_validates_range(normalizer):
+    doc = NormalizedDocument("Бүгүн", normalizer)
+    with pytest.raises(ValueError):
+        doc.edit(3, 10, "")
+
+
+def test_block_lengths_tree():
+    from kyrgyz_normalizer.document import _Lengths
+
+    rng = random.Random(3)
+    for size in range(1, 40):
+        values = [rng.choice((0, 1, 5, 30)) for _ in range(size)]
+        lengths = _Lengths(values)
+        for _ in range(20):
+            index = rng.randrange(size)
+            values[index] = rng.choice((0, 2, 7))
+            lengths.set(index, values[index])
+        for index in range(size + 1):
+            assert lengths.prefix(index) == sum(values[:index])
+        for position in range(sum(values) + 1):
+            offset = 0
+            for block, length in enumerate(values):
+                if position < offset + length or block == size - 1:
+                    break
+                offset += length
+            assert lengths.find(position) == (block, offset)
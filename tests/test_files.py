@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Тесттер — normalize_file (mmap бөлүктөрү)
+"""
+
+import io
+import json
+import multiprocessing
+import os
+
+import pytest
+
+from kyrgyz_normalizer import KyrgyzTextNormalizer, files, normalize_file
+from kyrgyz_normalizer.cli import main
+
+LINES = ["Баасы 1500 сом", "", "2024-жылы 15 км жол курулду", "КР Президенти БУУнун жыйынында"]
+PROSE = ("Бүгүн 5 км жол салынды. Эртең 12:30да жолугушуу болот. "
+         "Баасы $500 болду. Шаардын көчөлөрүндө кар жаады. ") * 20
+
+
+def expected(text, normalizer=None):
+    normalizer = normalizer or KyrgyzTextNormalizer()
+    if text.endswith("\n"):
+        text = text[:-1]
+    return "".join(normalizer.normalize(line) + "\n" for line in text.split("\n"))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_lines_in_order(tmp_path, workers):
+    src, dst = tmp_path / "in.txt", tmp_path / "out.txt"
+    text = "\n".join(LINES * 30) + "\n"
+    src.write_text(text, encoding="utf-8")
+    stats = normalize_file(src, dst, workers=workers, chunk_bytes=100)
+    assert dst.read_text(encoding="utf-8") == expected(text)
+    assert stats.lines == len(LINES) * 30
+    assert stats.done == stats.total == len(text.encode("utf-8"))
+    assert stats.errors == 0
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != "fork",
+                    reason="алмаштырылган функция процесстерге fork менен гана жетет")
+def test_crashed_worker_keeps_other_chunks(tmp_path, monkeypatch):
+    normalize_span = files._normalize_span
+
+    def crash(normalizer, path, start, end, *args):
+        with open(path, "rb") as f:
+            if b"CRASH" in f.read()[start:end]:
+                os._exit(1)
+        return normalize_span(normalizer, path, start, end, *args)
+
+    monkeypatch.setattr(files, "_normalize_span", crash)
+    src, dst = tmp_path / "in.txt", tmp_path / "out.txt"
+    lines = LINES * 10 + ["CRASH 5 км"] + LINES * 10
+    src.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    errors = []
+    stats = normalize_file(src, dst, workers=2, chunk_bytes=100, max_pending=2,
+                           on_error=lambda line, message: errors.append(line))
+    normalizer = KyrgyzTextNormalizer()
+    out = dst.read_text(encoding="utf-8").split("\n")
+    assert out.pop() == "" and len(out) == len(lines)
+    # Кулаткан бөлүк гана өзгөрүүсүз жазылат
+    raw = [i for i, (a, b) in enumerate(zip(lines, out)) if b != normalizer.normalize(a)]
+    assert out[40] == "CRASH 5 км" and 40 in raw
+    assert all(out[i] == lines[i] for i in raw) and len(raw) <= 6
+    assert stats.errors == 1 and errors == [raw[0] + 1]
+
+
+def test_long_line_cut_on_sentences(tmp_path):
+    src = tmp_path / "in.txt"
+    text = PROSE + "\n" + "5 км" + "\n" + PROSE
+    src.write_text(text, encoding="utf-8")
+    seen = []
+    for chunk_bytes in (1, 64, 300, 1 << 20):
+        dst = io.BytesIO()
+        normalize_file(src, dst, workers=1, chunk_bytes=chunk_bytes, progress=seen.append)
+        assert dst.getvalue().decode("utf-8") == expected(text)
+    # Бөлүктөр киргизүү тартибинде жазылат
+    assert all(a.done < b.done or a.done == a.total for a, b in zip(seen, seen[1:]))
+    assert len(seen) > 10
+
+
+def test_long_line_without_sentences_is_capped(tmp_path):
+    # Сүйлөмдүн чеги жок узун сап тынч чектерде бөлүнөт
+    src = tmp_path / "in.txt"
+    text = " ".join(["Бүгүн 5 км жол салынды жана шаарда кар жаады"] * 2000)
+    src.write_text(text, encoding="utf-8")
+    seen = []
+    dst = io.BytesIO()
+    normalize_file(src, dst, workers=1, chunk_bytes=300, progress=seen.append)
+    assert dst.getvalue().decode("utf-8") == expected(text)
+    done = [0] + [stats.done for stats in seen]
+    assert max(b - a for a, b in zip(done, done[1:])) < 2 * 300
+    # Тынч чек жок болсо да бөлүк чектелет
+    digits = " ".join(str(i % 97) for i in range(100000))
+    src.write_text(digits, encoding="utf-8")
+    seen.clear()
+    normalize_file(src, io.BytesIO(), workers=1, chunk_bytes=300, progress=seen.append)
+    cap = files.MAX_CHUNK_FACTOR * files.MIN_CAP_BYTES
+    done = [0] + [stats.done for stats in seen]
+    assert len(seen) > 1 and max(b - a for a, b in zip(done, done[1:])) <= cap
+
+
+def test_sequential_engine_keeps_whole_lines(tmp_path):
+    src, dst = tmp_path / "in.txt", tmp_path / "out.txt"
+    src.write_text(PROSE, encoding="utf-8")
+    normalize_file(src, dst, workers=1, chunk_bytes=64, engine="sequential")
+    sequential = KyrgyzTextNormalizer(engine="sequential")
+    assert dst.read_text(encoding="utf-8") == expected(PROSE, sequential)
+
+
+def test_jsonl_errors_and_empty_file(tmp_path):
+    src, dst = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    src.write_text('{"id": 1, "body": "5 км"}\nnot json\n{"id": 2}', encoding="utf-8")
+    errors = []
+    stats = normalize_file(src, dst, workers=1, fmt="jsonl", field="body",
+                           on_error=lambda line, message: errors.append(line))
+    lines = dst.read_text(encoding="utf-8").splitlines()
+    assert json.loads(lines[0]) == {"id": 1, "body": "беш километр"}
+    assert lines[1:] == ["not json", '{"id": 2}']
+    assert stats.errors == 2 and errors == [2, 3]
+
+    src.write_text("", encoding="utf-8")
+    assert normalize_file(src, dst, workers=1).lines == 0
+    assert dst.read_text(encoding="utf-8") == ""
+
+
+def test_cli_mmap(tmp_path):
+    src, dst = tmp_path / "in.txt", tmp_path / "out.txt"
+    src.write_text(PROSE, encoding="utf-8")
+    assert main(["-i", str(src), "-o", str(dst), "--mmap", "--chunk-bytes", "200", "-q"]) == 0
+    assert dst.read_text(encoding="utf-8") == expected(PROSE)
+    assert main(["--mmap", "-q"]) == 2
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Тесттер — кыскартуулардын бир өтүүлүү издөөчүсү
+"""
+
+import random
+import re
+
+from kyrgyz_normalizer import KyrgyzTextNormalizer
+from kyrgyz_normalizer.matcher import ALNUM, AbbreviationMatcher, AbbreviationTable, UnitMatcher
+
+
+def test_longest_key_and_tail_order():
+    matcher = AbbreviationMatcher([
+        AbbreviationTable('kg', {'К': 1, 'КР': 1, 'КРД': 1}, tails=('да', 'дан', 'н')),
+    ])
+    hits = [(m.key, m.tail) for m in matcher.finditer("КРдан КРДн КРД КРх К")]
+    # 'КРда'+'н' — \b жок, 'дан' табылат; 'КРх' — чек жок
+    assert hits == [('КР', 'дан'), ('КРД', 'н'), ('КРД', None), ('К', None)]
+
+
+def test_boundaries():
+    word = AbbreviationMatcher([AbbreviationTable('en', {'IT': 1})])
+    assert [m.start for m in word.finditer("IT, xIT IT_ (IT)")] == [0, 13]
+    alnum = AbbreviationMatcher([AbbreviationTable('short', {'ж.б.': 1}, ALNUM)])
+    assert [m.start for m in alnum.finditer("ж.б. аж.б. _ж.б.")] == [0, 12]
+
+
+def test_ignore_case_with_optional_dot():
+    matcher = AbbreviationMatcher([
+        AbbreviationTable('month', {'янв': 1}, ignore_case=True, tails=('.',)),
+    ])
+    assert [(m.key, m.end) for m in matcher.finditer("ЯНВ.2024")] == [('янв', 4)]
+    # Чекиттен кийин чек жок — чекит алмаштырылбайт (мурунку ``\.?\b``)
+    assert matcher.sub(lambda m: 'январь', "Янв. 5") == "январь. 5"
+
+
+def test_table_priority_and_empty():
+    matcher = AbbreviationMatcher([
+        AbbreviationTable('first', {'AB': 1}),
+        AbbreviationTable('second', {'AB': 1, 'ABC': 1}),
+    ])
+    assert [m.table for m in matcher.finditer("AB ABC")] == ['first', 'second']
+    empty = AbbreviationMatcher([AbbreviationTable('none', {})])
+    assert empty.search("текст") is None
+    assert empty.sub(lambda m: '', "текст") == "текст"
+
+
+def test_same_result_as_alternation_regex():
+    rng = random.Random(0)
+    keys = {''.join(rng.choice('АБКРЫ') for _ in range(rng.randint(1, 4))) for _ in range(300)}
+    suffixes = ('дын', 'га', 'н', 'ы')
+    matcher = AbbreviationMatcher([AbbreviationTable('kg', keys, tails=suffixes)])
+    alternation = '|'.join(re.escape(k) for k in sorted(keys, key=len, reverse=True))
+    regex = re.compile(rf"\b({alternation})({'|'.join(suffixes)})?\b")
+    for _ in range(500):
+        text = ''.join(rng.choice((' ', '', '-', 'а')) + rng.choice(sorted(keys))
+                       + rng.choice(('', 'дын', 'н', 'х')) for _ in range(4))
+        expected = [(m.start(), m.end(), m.group(1), m.group(2)) for m in regex.finditer(text)]
+        assert [tuple(m[:2]) + (m.key, m.tail) for m in matcher.finditer(text)] == expected
+
+
+def test_large_custom_dictionary():
+    entries = {f'КЛ{i}': 'кардардын уюму' for i in range(20000)}
+    entries['ЖАМЫ'] = 'жаңы палата'
+    normalizer = KyrgyzTextNormalizer(overrides={'kyrgyz_abbr': entries})
+    assert normalizer.normalize("ЖАМЫнын жана КЛ19999дун отчету") == \
+        "жаңы палатанын жана кардардын уюмунун отчету"
+    assert normalizer.normalize("КРдин ЖМК") == KyrgyzTextNormalizer().normalize("КРдин ЖМК")
+
+
+def test_incremental_updates_match_rebuild():
+    rng = random.Random(1)
+    for ignore_case in (False, True):
+        keys = {}
+        matcher = AbbreviationMatcher([AbbreviationTable('t', keys, ignore_case=ignore_case)])
+        for _ in range(400):
+            key = ''.join(rng.choice('АБкК') for _ in range(rng.randint(1, 3)))
+            if key in keys and rng.random() < 0.5:
+                del keys[key]
+                matcher.discard('t', [key])
+            else:
+                keys[key] = 1
+                matcher.add('t', [key])
+        fresh = AbbreviationMatcher([AbbreviationTable('t', keys, ignore_case=ignore_case)])
+        assert matcher._tries == fresh._tries
+        assert matcher.trigger.pattern == fresh.trigger.pattern
+
+
+def test_unit_matcher_same_result_as_regex():
+    units = {'км': 1, 'м': 1, 'м²': 1, 'км/ч': 1, 'г': 1, 'ГБ': 1}
+    alternation = '|'.join(re.escape(k) for k in sorted(units, key=len, reverse=True))
+    single = re.compile(rf'(\d+(?:[,]\d+)?)\s*({alternation})\b')
+    ranged = re.compile(rf'(\d+(?:[,]\d+)?)\s*[-–—]\s*(\d+(?:[,]\d+)?)\s*({alternation})\b')
+    matcher = UnitMatcher(units)
+    rng = random.Random(0)
+    atoms = list(units) + ['1', '25', ',', ' ', '-', '—', 'а', 'ге', '/', '²']
+    for _ in range(3000):
+        text = ''.join(rng.choice(atoms) for _ in range(rng.randint(1, 8)))
+        for regex, pattern in ((single, matcher.single), (ranged, matcher.range)):
+            expected = [(m.span(), m.groups()) for m in regex.finditer(text)]
+            assert [(m.span(), m.groups()) for m in pattern.finditer(text)] == expected, text
+
+
+def test_unit_matcher_live_keys():
+    units = {'км': 1}
+    matcher = UnitMatcher(units)
+    assert matcher.single.search("5 пуд") is None
+    units['пуд'] = 1
+    matcher.add(['пуд'])
+    assert matcher.trigger.search("5 пуд")
+    assert matcher.single.search("5 пуд").groups() == ('5', 'пуд')
+    del units['пуд']
+    matcher.discard(['пуд'])
+    assert matcher.single.search("5 пуд") is None
@@ -5,6 +5,8 @@
 """
 
 import os
+import random
+
 import pytest
 from kyrgyz_normalizer import KyrgyzTextNormalizer, normalize
 
@@ -72,9 +74,81 @@ class TestNumberToWords:
     def test_millions(self, normalizer):
         assert normalizer.number_to_words(1000000) == "бир миллион"
 
+    def test_zero_groups(self, normalizer):
+        assert normalizer.number_to_words(7_000_012_000) == "жети миллиард он эки миң"
+        assert normalizer.number_to_words(10 ** 15) == "бир миң триллион"
+
     def test_negative(self, normalizer):
         assert normalizer.number_to_words(-5) == "минус беш"
 
+    def test_number_string_matches_int(self, normalizer):
+        for digits in ("0", "007", "1" + "0" * 15, "123456789012345678", "9" * 40,
+                       "1000000000000000000000000000001", "5" + "0" * 24 + "7" * 3):
+            assert normalizer.number_string_to_words(digits) == \
+                normalizer.number_to_words(int(digits)), digits
+        assert normalizer.number_string_to_words("0000") == "нөл"
+
+
+class TestLongNumbers:
+    def test_runs_past_int_limit(self, normalizer):
+        result = normalizer.normalize("1" * 6000)
+        assert result.startswith("жүз он бир миллиард жүз он бир миллион жүз он бир миң жүз он бир триллион")
+        assert result.count("триллион") == 499
+
+    # Ар бир эреженин цифралар катары ``int()`` сыз окулат
+    @pytest.mark.parametrize("engine", KyrgyzTextNormalizer.ENGINES)
+    @pytest.mark.parametrize("text, expected", [
+        ("{L}k", "{W} миң"),                                       # number_k
+        ("{L} сом", "{W} сом"),                                    # som_simple
+        ("{L}-чи", "{O} чи"),                                      # num_dash_word
+        ("{L} -чи", "{O}"),                                        # ordinal_sfx
+        ("{L}жашта", "{W} жашта"),                                 # age
+        ("{L}чи класста", "{O} класста"),                          # class
+        ("{L}мин", "{W} мүнөт"),                                   # minutes
+        ("{L}-курста", "{O} курста"),                              # course
+        ("{L}-{L2} кылымдар", "{O} {O2} кылымдар"),                # century_arabic_range
+        ("{L}*2=3", "{W} көбөйтүү эки барабар үч"),                # math_mul_eq
+        ("{L}+2=3", "{W} кошуу эки барабар үч"),                   # math_add_eq
+        ("{L}-2=3", "{W} кемитүү эки барабар үч"),                 # math_sub_eq
+        ("{L} / 2=3", "{W} бөлүү эки барабар үч"),                 # math_div_eq
+        ("2 + {L}", "эки кошуу {W}"),                              # math_add
+        ("2 x {L}", "эки көбөйтүү {W}"),                           # math_mul
+        ("2 / {L}", "эки бөлүү {W}"),                              # math_div
+        ("{L} кичи район", "{O} кичи район"),                      # addr_district
+        ("№{L}", "номур {W}"),                                     # number_sign
+    ])
+    def test_rules_past_int_limit(self, engine, text, expected):
+        normalizer = KyrgyzTextNormalizer(engine=engine)
+        long1, long2 = "1" * 5000, "2" * 5000
+        words = {"L": long1, "L2": long2,
+                 "W": normalizer.number_string_to_words(long1),
+                 "O": normalizer.number_string_to_ordinal(long1),
+                 "O2": normalizer.number_string_to_ordinal(long2)}
+        assert normalizer.normalize(text.format(**words)) == expected.format(**words)
+
+    def test_spaced_som_past_int_limit(self, normalizer):
+        text = "1 " + " ".join(["000"] * 2000) + " сом"
+        assert normalizer.normalize(text) == \
+            normalizer.number_string_to_words("1" + "000" * 2000) + " сом"
+
+    def test_string_ordinal_matches_int(self, normalizer):
+        rng = random.Random(0)
+        for _ in range(500):
+            digits = str(rng.randrange(10 ** rng.randint(1, 60)))
+            digits = digits[:rng.randint(1, len(digits))].ljust(len(digits), "0")
+            assert normalizer.number_string_to_ordinal(digits) == \
+                normalizer.number_to_ordinal(int(digits)), digits
+
+    def test_digits_policy(self):
+        normalizer = KyrgyzTextNormalizer(long_numbers="digits", long_number_digits=6)
+        assert normalizer.normalize("код 1234567, баасы 1500 сом") == \
+            "код бир эки үч төрт беш алты жети, баасы бир миң беш жүз сом"
+        assert normalizer.normalize("3,14159265") == "үч бүтүн бир төрт бир беш тогуз эки алты беш"
+        assert normalizer.normalize("1234567 -чи") == "бир эки үч төрт беш алты жетинчи"
+        assert normalizer.normalize("1234560-курста") == "бир эки үч төрт беш алты нөлүнчү курста"
+        with pytest.raises(ValueError):
+            KyrgyzTextNormalizer(long_numbers="words")
+
 
 # ── Unit tests: number_to_ordinal ────────────────────────────────────
 
@@ -88,6 +162,15 @@ class TestNumberToOrdinal:
     def test_year(self, normalizer):
         assert normalizer.number_to_ordinal(2024) == "эки миң жыйырма төртүнчү"
 
+    def test_round_scales(self, normalizer):
+        assert normalizer.number_to_ordinal(300) == "үч жүзүнчү"
+        assert normalizer.number_to_ordinal(2000) == "эки миңинчи"
+        assert normalizer.number_to_ordinal(5_000_000) == "беш миллионунчу"
+
+    def test_millions(self, normalizer):
+        assert normalizer.number_to_ordinal(1_234_567) == \
+            "бир миллион эки жүз отуз төрт миң беш жүз алтымыш жетинчи"
+
 
 # ── Unit tests: roman_to_number ──────────────────────────────────────
 
@@ -123,6 +206,83 @@ class TestSuffixHarmony:
         result = normalizer.apply_suffix_harmony("беш", "да")
         assert result == "беште"
 
+    def test_last_word_decides(self, normalizer):
+        assert normalizer.apply_suffix_harmony("он беш", "да") == "он беште"
+        assert normalizer.apply_suffix_harmony("Бишкек ", "дан") == "Бишкек тен"
+
+    def test_unknown_words_match_precomputed(self):
+        fresh = KyrgyzTextNormalizer()
+        for full in fresh.kyrgyz_abbr.values():
+            for suffix in ("нын", "га", "дан", "ы"):
+                expected = fresh.apply_suffix_harmony(full, suffix)
+                assert fresh.apply_suffix_harmony(full.upper(), suffix) == full.upper() + expected[len(full):]
+
+    def test_vowelless_word_is_not_memoized(self):
+        # "тв" жалгыз чакырылгандан кийин да алдындагы сөз классты аныктайт
+        fresh = KyrgyzTextNormalizer()
+        assert fresh.apply_suffix_harmony("тв", "да") == "твдө"
+        assert fresh.apply_suffix_harmony("мамлекеттик тв", "да") == "мамлекеттик твде"
+        assert fresh.apply_suffix_harmony("кыргыз тв", "га") == "кыргыз твга"
+        assert fresh.apply_suffix_harmony("МАМЛЕКЕТТИК ТВ", "да") == "МАМЛЕКЕТТИК ТВде"
+
+
+# ── Date cache ───────────────────────────────────────────────────────
+
+class TestDateCache:
+    def test_year_table_boundary(self, normalizer):
+        assert normalizer.number_to_ordinal(1999) == "бир миң тогуз жүз токсон тогузунчу"
+        assert normalizer.number_to_ordinal(2000) == "эки миңинчи"
+        assert normalizer.number_to_ordinal(2199) == "эки миң жүз токсон тогузунчу"
+        assert normalizer.number_to_ordinal(2200) == "эки миң эки жүзүнчү"
+
+    def test_hits_and_same_output(self):
+        cached = KyrgyzTextNormalizer()
+        uncached = KyrgyzTextNormalizer(date_cache_size=0)
+        text = "12.05.2024, 2024-05-12, 12 май 2024 жана 12.05.2024"
+        assert cached.normalize(text) == uncached.normalize(text)
+        info = cached.date_cache_info()
+        assert (info.hits, info.misses, info.size) == (1, 3, 3)
+        assert uncached.date_cache_info().size == 0
+        cached.date_cache_clear()
+        assert cached.date_cache_info().size == 0
+
+    def test_invalid_dates_not_cached(self):
+        normalizer = KyrgyzTextNormalizer()
+        assert normalizer.normalize("2024.13.14") == normalizer.normalize("2024.13.14")
+        assert normalizer.date_cache_info().size == 0
+
+
+# ── Time-of-day table ────────────────────────────────────────────────
+
+class TestTimeTable:
+    def test_table_matches_computed(self, normalizer):
+        for hours in (0, 9, 14, 23, 24, 99):
+            for minutes in ("00", "05", "30", "45", "59", "60", "99"):
+                for suffix in (None, "да", "дө", "го", "ке", "та"):
+                    assert normalizer._time_to_words(hours, minutes, suffix) == \
+                        normalizer._compute_time_words(hours, minutes, suffix)
+
+    def test_minute_forms_built_once(self, normalizer):
+        minutes = normalizer._time_minutes
+        assert len(minutes) == 59 and minutes is KyrgyzTextNormalizer()._time_minutes
+        # time_suffixes тин даяр формасы гармониядан айырмаланат
+        assert minutes["30"]["га"] == "отузга"
+        assert minutes["05"]["да"] == "нөл беште"
+        assert minutes["45"][None] == "кырк беш"
+
+    def test_suffix_forms(self, normalizer):
+        assert normalizer.normalize("14:30да") == "он төрт отузда"
+        assert normalizer.normalize("09.05та жолугабыз") == "тогуз нөл беште жолугабыз"
+        assert normalizer.normalize("23:00гө чейин") == "жыйырма үчкө чейин"
+
+    def test_shared_and_bounded(self):
+        first, second = KyrgyzTextNormalizer(), KyrgyzTextNormalizer()
+        assert first._time_words is second._time_words
+        first.normalize("27:75 жана 99:99да")
+        assert (27, "75", None) not in first._time_words
+        first.normalize("18:45ке")
+        assert second._time_words[(18, "45", "ке")] == "он сегиз кырк бешке"
+
 
 # ── Integration: regression tests ────────────────────────────────────
 
@@ -144,3 +304,194 @@ class TestRegression:
         result = normalize("КР Президенти БУУнун жыйынында")
         assert "кыргыз республикасы" in result
         assert "бириккен улуттар уюмунун" in result
+
+
+# ── Engines: scan vs sequential ──────────────────────────────────────
+
+class TestEngines:
+    def test_scan_matches_sequential_on_test_data(self):
+        scan = KyrgyzTextNormalizer(engine="scan")
+        sequential = KyrgyzTextNormalizer(engine="sequential")
+        inputs = [p.values[0] for p in _load_test_cases()]
+        for text in inputs:
+            assert scan.normalize(text) == sequential.normalize(text), text
+        document = ". ".join(inputs)
+        assert scan.normalize(document) == sequential.normalize(document)
+
+    def test_segments_roundtrip(self, normalizer):
+        text = "Бүгүн 5 км жүрдүк. Эртең XXI кылым!  Ал  келди?\nЖок."
+        segments = normalizer._split_segments(text)
+        assert len(segments) == 4
+        assert "".join(segments) == text
+
+    def test_long_segments_split_on_quiet_words(self):
+        text = " ".join(["Баасы 1500 сом жана 5 км жол бүгүн салынды"] * 200)
+        limited = KyrgyzTextNormalizer(max_input_chars=500)
+        segments = limited._split_segments(text)
+        assert "".join(segments) == text
+        assert len(segments) > 10 and max(map(len, segments)) <= 500
+        assert limited.normalize(text) == KyrgyzTextNormalizer(max_input_chars=None).normalize(text)
+        # Коопсуз чек жок: боштуктан же так чектен
+        assert [len(s) for s in limited._split_segments("1" * 1200)] == [500, 500, 200]
+
+    def test_split_output_matches_unsplit(self):
+        # Белгилер жана сандар тынч чектердин жанында; текст тынч сөздөр менен
+        # бүтөт, ошондуктан ар бир бөлүктөн кийин тынч чек табылат
+        rng = random.Random(0)
+        words = ["Бул", "чоң", "үй", "бак", "китеп", "кызыл", "&", "%", "№", "@",
+                 "5", "12", "км", "сом", "саат", "10:30", "КР", "ж.б.", "2024-жылы", ","]
+        unsplit = KyrgyzTextNormalizer(max_input_chars=None)
+        for limit in (20, 30, 50):
+            limited = KyrgyzTextNormalizer(max_input_chars=limit)
+            for _ in range(300):
+                text = " ".join(rng.choice(words) for _ in range(rng.randint(5, 40))) + " үй бак жол"
+                assert limited.normalize(text) == unsplit.normalize(text), (limit, text)
+
+    def test_guarded_patterns_keep_matches(self, normalizer):
+        assert normalizer.normalize("5 12 345 сом") == "беш он эки миң үч жүз кырк беш сом"
+        assert normalizer.normalize("5  -  чи") == "бешинчи"
+        assert normalizer.normalize("12.345.6") == "он эки үч жүз кырк беш.алты"
+
+    @pytest.mark.parametrize("engine", ["scan", "sequential"])
+    @pytest.mark.parametrize("text,expected", [
+        ("10/10/201050/5=10", "он бөлүү он/эки жүз бир миң элүү беш=он"),
+        ("31/12/200001.01.2024",
+         "отуз бир бөлүү он эки/эки жүз миң бир бир эки миң жыйырма төрт"),
+        ("31.12.9981/9=9",
+         "отуз бир.он эки.тогуз миң тогуз жүз сексен бир тогуз=тогуз"),
+    ])
+    def test_separator_chains_keep_old_output(self, engine, text, expected):
+        # date_invalid чынжырдын ортосунан да башталат (эски эреже сыяктуу)
+        assert KyrgyzTextNormalizer(engine=engine).normalize(text) == expected
+
+    def test_stage_stats_skip_numeric_tail(self):
+        normalizer = KyrgyzTextNormalizer()
+        assert normalizer.normalize("Бүгүн аба ырайы жакшы. Баасы 1500 сом.") == \
+            "Бүгүн аба ырайы жакшы. Баасы бир миң беш жүз сом."
+        stats = normalizer.stage_stats()
+        assert stats["currency"] == {"hits": 1, "skips": 1}
+        assert stats["remaining_numbers"] == {"hits": 0, "skips": 2}
+        normalizer.reset_stage_stats()
+        assert normalizer.stage_stats()["currency"] == {"hits": 0, "skips": 0}
+
+    def test_unknown_engine(self):
+        with pytest.raises(ValueError):
+            KyrgyzTextNormalizer(engine="fast")
+
+    def test_lazy_compile_and_warmup(self):
+        normalizer = KyrgyzTextNormalizer()
+        assert normalizer._stage_rules == {}
+        normalizer.normalize("Бүгүн аба ырайы жакшы")
+        assert "currency" not in normalizer._stage_rules
+        assert normalizer.warmup() is normalizer
+        assert set(normalizer._stage_rules) == set(KyrgyzTextNormalizer.STAGES)
+
+    def test_patterns_shared_between_instances(self):
+        first = KyrgyzTextNormalizer().warmup()
+        second = KyrgyzTextNormalizer().warmup()
+        for stage in KyrgyzTextNormalizer.STAGES:
+            for (_n1, p1, _r1), (_n2, p2, _r2) in zip(first._stage_rules[stage],
+                                                      second._stage_rules[stage]):
+                assert p1 is p2
+
+
+# ── Pipeline profiles ────────────────────────────────────────────────
+
+class TestProfiles:
+    def test_numbers_profile_skips_text_stages(self):
+        normalizer = KyrgyzTextNormalizer(profile="numbers")
+        text = "КР 01.02.2024 күнү 5 км, «жол» info@kg.kg"
+        assert normalizer.normalize(text) == (
+            "КР эки миң жыйырма төртүнчү жыл биринчи февраль күнү беш километр, "
+            "«жол» info@kg.kg")
+        assert normalizer.warmup()._stage_rules.keys() == set(normalizer.stages)
+        assert "named_abbr" not in normalizer.stage_stats()
+
+    @pytest.mark.parametrize("profile", sorted(KyrgyzTextNormalizer.PROFILES))
+    def test_engines_agree(self, profile):
+        scan = KyrgyzTextNormalizer(profile=profile)
+        sequential = KyrgyzTextNormalizer(engine="sequential", profile=profile)
+        inputs = [case.values[0] for case in _load_test_cases()]
+        for text in inputs + [". ".join(inputs)]:
+            assert scan.normalize(text) == sequential.normalize(text), text
+        assert [s.stage for s in scan.trace(inputs[0]).stages] == list(scan.stages)
+
+    def test_no_contacts_matches_full_without_contacts(self):
+        full = KyrgyzTextNormalizer()
+        no_contacts = KyrgyzTextNormalizer(profile="no_contacts")
+        for case in _load_test_cases():
+            text = case.values[0]
+            contacts = next(s for s in full.trace(text).stages if s.stage == "contacts")
+            if not contacts.substitutions:
+                assert no_contacts.normalize(text) == full.normalize(text), text
+
+    def test_custom_stages_keep_pipeline_order(self):
+        normalizer = KyrgyzTextNormalizer(profile=["remaining_numbers", "time"])
+        assert normalizer.stages == ("time", "remaining_numbers")
+        assert normalizer.normalize("Саат 12:30да 5 КР") == "Саат он эки отузда беш КР"
+
+    def test_unknown_profile_or_stage(self):
+        with pytest.raises(ValueError):
+            KyrgyzTextNormalizer(profile="subtitles")
+        with pytest.raises(ValueError):
+            KyrgyzTextNormalizer(profile=["dates", "emails"])
+
+
+# ── Shared tables and per-instance overrides ─────────────────────────
+
+class TestOverrides:
+    def test_builtin_tables_shared_and_read_only(self):
+        first, second = KyrgyzTextNormalizer(), KyrgyzTextNormalizer()
+        assert first.kyrgyz_abbr is second.kyrgyz_abbr
+        assert first._group_words is second._group_words
+        with pytest.raises(TypeError):
+            first.units["пуд"] = "пуд"
+        assert not hasattr(first, "__dict__")
+
+    def test_override_is_per_instance(self):
+        custom = KyrgyzTextNormalizer(overrides={
+            "kyrgyz_abbr": {"КТУ": "кыргыз техникалык университети"},
+            "units": {"пуд": "пуд"},
+        })
+        plain = KyrgyzTextNormalizer()
+        text = "КТУ 5 пуд алды"
+        assert custom.normalize(text) == "кыргыз техникалык университети беш пуд алды"
+        assert plain.normalize(text) == "КТУ беш пуд алды"
+        assert custom.kyrgyz_abbr["КР"] == plain.kyrgyz_abbr["КР"]
+        custom.kyrgyz_abbr["ЖИА"] = "жаңы"
+        assert "ЖИА" not in plain.kyrgyz_abbr
+
+    def test_unknown_table(self):
+        with pytest.raises(ValueError):
+            KyrgyzTextNormalizer(overrides={"ones": {"1": "бир"}})
+
+
+# ── Trace mode ───────────────────────────────────────────────────────
+
+class TestTrace:
+    @pytest.mark.parametrize("engine", KyrgyzTextNormalizer.ENGINES)
+    def test_output_matches_normalize(self, engine):
+        normalizer = KyrgyzTextNormalizer(engine=engine)
+        inputs = [case.values[0] for case in _load_test_cases()]
+        inputs.append(". ".join(inputs[100:110]))
+        for text in inputs:
+            assert normalizer.trace(text).output == normalizer.normalize(text)
+
+    def test_stages_rules_and_text(self):
+        normalizer = KyrgyzTextNormalizer()
+        result = normalizer.trace("Саат 12:30да 5 км. Бишкек ш. КРдин борбору")
+        assert [s.stage for s in result.stages] == list(KyrgyzTextNormalizer.STAGES)
+        stages = {s.stage: s for s in result.stages}
+        assert stages["time"].rules["time_colon_sfx"] == 1
+        assert stages["time"].text.startswith("Саат он эки отузда")
+        assert stages["currency"].ran == 0 and stages["currency"].skipped == 2
+        assert result.fired() == {"short_abbr": 1, "time_colon_sfx": 1,
+                                  "units_single": 1, "named_abbr": 1}
+        assert result.seconds >= sum(s.seconds for s in result.stages)
+        assert "time_colon_sfx×1" in result.format()
+
+    def test_trace_bypasses_cache_and_stats(self):
+        normalizer = KyrgyzTextNormalizer(cache_size=10)
+        normalizer.trace("Баасы 1500 сом")
+        assert normalizer.cache_info().size == 0
+        assert normalizer.stage_stats()["currency"] == {"hits": 0, "skips": 0}
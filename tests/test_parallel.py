@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Тесттер — normalize_document (бир документти бөлүп иштетүү)
+"""
+
+import random
+import re
+
+from kyrgyz_normalizer import KyrgyzTextNormalizer, normalize, normalize_document
+from kyrgyz_normalizer.bench import generate_corpus
+from kyrgyz_normalizer.parallel import ParallelNormalizer
+
+SENTENCES = list(generate_corpus("mixed", sentences=2000, seed=5))
+
+
+def documents(count, seed=0):
+    rng = random.Random(seed)
+    for i in range(count):
+        text = rng.choice((" ", "  ", "\n")).join(
+            rng.choice(SENTENCES) for _ in range(rng.randint(1, 60)))
+        if i % 2:  # OCR: тыныш белгилери жок
+            text = re.sub(r"[.!?,]", "", text)
+        yield text
+
+
+def test_pieces_are_safe():
+    serial = KyrgyzTextNormalizer()
+    parallel = ParallelNormalizer(workers=16, min_piece_chars=16)
+    pieces = 0
+    for text in documents(200):
+        split = parallel.split(text)
+        assert "".join(split) == text
+        pieces += len(split)
+        joined = "".join(serial._normalize_scan(piece) for piece in split)
+        assert serial._p_spaces.sub(" ", joined).strip() == serial.normalize(text)
+    assert pieces > 2000
+
+
+def test_symbols_after_cuts_match_normalize():
+    # Тыныш белгиси жок текст: белгилер тынч сөздөрдөн кийин, чектердин так артында
+    rng = random.Random(2)
+    quiet = ["бул", "чоң", "үй", "бак", "китеп", "кызыл", "ала", "жол"]
+    parallel = ParallelNormalizer(workers=1, min_piece_chars=50)
+    cuts = 0
+    for _ in range(300):
+        text = " ".join(rng.choice(("&", "%", "№")) if rng.random() < 0.15 else rng.choice(quiet)
+                        for _ in range(rng.randint(20, 80)))
+        split = parallel.split(text)
+        cuts += sum(piece.startswith((" &", " %", " №")) for piece in split[1:])
+        assert parallel.normalize(text) == normalize(text), text
+    assert cuts > 20
+
+
+def test_unpunctuated_text_is_split():
+    text = re.sub(r"[.!?,]", "", " ".join(SENTENCES[:300])).lower()
+    assert len(ParallelNormalizer(workers=4, min_piece_chars=64).split(text)) == 16
+
+
+def test_in_process_and_pool_match_normalize():
+    text = " ".join(SENTENCES[:400])
+    with ParallelNormalizer(workers=1, min_piece_chars=256) as parallel:
+        assert parallel.normalize(text) == normalize(text)
+    with ParallelNormalizer(workers=2, min_piece_chars=256) as parallel:
+        assert parallel.normalize(text) == normalize(text)
+        assert parallel.normalize("5 км") == "беш километр"
+
+
+def test_sequential_engine_is_not_split():
+    parallel = ParallelNormalizer(workers=4, engine="sequential", min_piece_chars=16)
+    text = " ".join(SENTENCES[:50])
+    assert parallel.split(text) == [text]
+    assert parallel.normalize(text) == KyrgyzTextNormalizer(engine="sequential").normalize(text)
+
+
+def test_normalize_document_short_text():
+    assert normalize_document("Баасы 1500 сом", workers=2) == "Баасы бир миң беш жүз сом"
+
+
+def test_normalize_document_profile_list():
+    text = " ".join(SENTENCES[:50])
+    stages = list(KyrgyzTextNormalizer.PROFILES["numbers"])
+    expected = KyrgyzTextNormalizer(profile="numbers").normalize(text)
+    assert normalize_document(text, workers=2, profile=stages) == expected
+    assert normalize_document(text, workers=2, profile="numbers") == expected
+
+
+def test_normalize_document_recovers_broken_pool():
+    from kyrgyz_normalizer import parallel as parallel_module
+
+    text = " ".join(SENTENCES) * 2
+    assert normalize_document(text, workers=2) == normalize(text)
+    shared = parallel_module._shared[(2, "scan", KyrgyzTextNormalizer.STAGES)]
+    broken = shared._executor
+    for process in list(broken._processes.values()):
+        process.kill()
+        process.join()
+    assert normalize_document(text, workers=2) == normalize(text)
+    assert shared._executor is not broken
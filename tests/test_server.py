@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Тесттер — HTTP кызматы жана микро-пакеттер
+"""
+
+import http.client
+import json
+import os
+import socket
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pytest
+
+from kyrgyz_normalizer import normalize
+from kyrgyz_normalizer.server import MicroBatcher, create_server
+
+
+@pytest.fixture
+def server():
+    server = create_server(port=0, workers=0, window=0.005)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def request(server, method, path, body=None, content_type='application/json'):
+    conn = http.client.HTTPConnection(*server.server_address[:2], timeout=10)
+    try:
+        if isinstance(body, (dict, list)):
+            body = json.dumps(body)
+        headers = {'Content-Type': content_type} if body is not None else {}
+        conn.request(method, path, body=body.encode('utf-8') if body is not None else None,
+                     headers=headers)
+        response = conn.getresponse()
+        return response.status, response.read().decode('utf-8')
+    finally:
+        conn.close()
+
+
+def test_single_and_batch(server):
+    status, body = request(server, 'POST', '/normalize', {'text': 'Баасы 1500 сом'})
+    assert status == 200
+    assert json.loads(body) == {'text': 'Баасы бир миң беш жүз сом'}
+
+    texts = ['5 км', 'Саат 12:30да', '']
+    status, body = request(server, 'POST', '/normalize/batch', {'texts': texts})
+    assert status == 200
+    assert json.loads(body) == {'texts': [normalize(t) for t in texts], 'errors': []}
+
+
+def test_plain_text_lines(server):
+    status, body = request(server, 'POST', '/normalize', '5 км\n\nБаасы 1500 сом\n',
+                           content_type='text/plain')
+    assert status == 200
+    assert body == 'беш километр\n\nБаасы бир миң беш жүз сом\n'
+
+
+def test_bad_requests(server):
+    assert request(server, 'POST', '/normalize', '{"text": 5}')[0] == 400
+    assert request(server, 'POST', '/normalize', '{не json')[0] == 400
+    assert request(server, 'POST', '/normalize/batch', {'texts': ['а', 1]})[0] == 400
+    assert request(server, 'POST', '/nowhere', {'text': 'а'})[0] == 404
+    server.max_body = 10
+    status, body = request(server, 'POST', '/normalize', {'text': 'өтө узун текст'})
+    assert status == 413 and 'error' in json.loads(body)
+
+
+def test_concurrent_requests_are_coalesced(server):
+    texts = ['Баасы {} сом'.format(i) for i in range(40)]
+    with ThreadPoolExecutor(max_workers=20) as pool:
+        responses = list(pool.map(
+            lambda t: request(server, 'POST', '/normalize', {'text': t}), texts))
+    assert [json.loads(body)['text'] for _, body in responses] == [normalize(t) for t in texts]
+    status, body = request(server, 'GET', '/health')
+    health = json.loads(body)
+    assert status == 200 and health['status'] == 'ok'
+    assert health['items'] == 40
+    assert health['batches'] < 40
+
+
+def test_keep_alive(server):
+    conn = http.client.HTTPConnection(*server.server_address[:2], timeout=10)
+    try:
+        for text in ('5 км', '10 км'):
+            conn.request('POST', '/normalize', body=json.dumps({'text': text}).encode('utf-8'),
+                         headers={'Content-Type': 'application/json'})
+            response = conn.getresponse()
+            assert json.loads(response.read())['text'] == normalize(text)
+    finally:
+        conn.close()
+
+
+def test_process_batcher():
+    batcher = MicroBatcher(workers=2, window=0.001, max_batch=8)
+    try:
+        texts = ['Баасы 1500 сом', None, '5 км'] * 10
+        results = batcher.normalize_many(texts)
+    finally:
+        batcher.close()
+    assert results[0] == 'Баасы бир миң беш жүз сом'
+    assert results[2] == 'беш километр'
+    assert all(isinstance(r, Exception) for r in results[1::3])
+
+
+class Crash:
+    """Процесске жеткенде (unpickle) ошол процессти өлтүрөт."""
+
+    def __reduce__(self):
+        return os._exit, (1,)
+
+
+def test_process_batcher_survives_crash():
+    texts = ['Баасы 1500 сом', '5 км', 'КР Президенти'] * 5
+    batcher = MicroBatcher(workers=2, window=0, max_batch=1)
+    try:
+        futures = [batcher.submit(text) for text in texts[:7]]
+        crashed = batcher.submit(Crash())
+        futures += [batcher.submit(text) for text in texts[7:]]
+        results = [future.result(timeout=30) for future in futures]
+        assert isinstance(crashed.result(timeout=30), Exception)
+        # Пул кайра түзүлдү — кийинки суроо-талаптар да иштейт
+        assert batcher.normalize_many(texts, timeout=30) == results
+    finally:
+        batcher.close()
+    assert results == [normalize(text) for text in texts]
+
+
+def test_batcher_profile():
+    for workers in (0, 2):
+        batcher = MicroBatcher(workers=workers, window=0, profile="numbers")
+        try:
+            assert batcher.normalize_many(["КР 5 км"]) == ["КР беш километр"]
+        finally:
+            batcher.close()
+
+
+def test_retry_waits_at_most_timeout():
+    class StuckPool:
+        def submit(self, *args):
+            return Future()
+
+        def shutdown(self, wait=True):
+            pass
+
+    batcher = MicroBatcher(workers=1, window=0, timeout=0.05)
+    try:
+        original = batcher._pool
+        batcher._pool = StuckPool()
+        future = Future()
+        batcher._retry([("5 км", future)])
+        assert "TimeoutError" in future.result(timeout=0).message
+        # Токтоп калган пул алмаштырылды
+        assert batcher._pool is not original and not isinstance(batcher._pool, StuckPool)
+        assert batcher.normalize_many(["5 км"], timeout=30) == ["беш километр"]
+    finally:
+        batcher.close()
+        original.shutdown()
+
+
+def test_error_index_is_within_request():
+    # Башка суроо-талаптын тексттери ошол эле микро-пакетте
+    batcher = MicroBatcher(workers=0, window=0.2)
+    try:
+        other = [batcher.submit('Баасы 1500 сом'), batcher.submit(None)]
+        results = batcher.normalize_many(['5 км', None])
+        assert results[0] == 'беш километр'
+        assert results[1].index == 1
+        assert other[1].result().index == 0
+    finally:
+        batcher.close()
+    assert batcher.batches == 1
+
+
+@pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'), reason='Unix сокеттери жок')
+def test_unix_socket(tmp_path):
+    path = str(tmp_path / 'kn.sock')
+    server = create_server(unix_socket=path, workers=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(10)
+        sock.connect(path)
+        body = '5 км\n'.encode('utf-8')
+        sock.sendall(b'POST /normalize HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n'
+                     b'Content-Length: ' + str(len(body)).encode() + b'\r\n\r\n' + body)
+        response = b''
+        while True:
+            data = sock.recv(65536)
+            if not data:
+                break
+            response += data
+        sock.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert response.startswith(b'HTTP/1.1 200')
+    assert response.split(b'\r\n\r\n', 1)[1].decode('utf-8') == 'беш километр\n'
+    assert not (tmp_path / 'kn.sock').exists()
+
+
+@pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'), reason='Unix сокеттери жок')
+def test_unix_socket_replaces_only_sockets(tmp_path):
+    path = tmp_path / 'kn.sock'
+    path.write_text('маанилүү', encoding='utf-8')
+    with pytest.raises(FileExistsError):
+        create_server(unix_socket=str(path), workers=0)
+    assert path.read_text(encoding='utf-8') == 'маанилүү'
+
+    # Мурунку иштетүүдөн калган сокет алмаштырылат
+    path.unlink()
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(path))
+    stale.close()
+    server = create_server(unix_socket=str(path), workers=0)
+    server.server_close()
+    assert not path.exists()
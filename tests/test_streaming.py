@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Тесттер — StreamingNormalizer
+"""
+
+import os
+import random
+
+import pytest
+
+from kyrgyz_normalizer import KyrgyzTextNormalizer, StreamingNormalizer
+from kyrgyz_normalizer.streaming import normalize_stream
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), "test_data.txt")
+
+
+@pytest.fixture(scope="module")
+def normalizer():
+    return KyrgyzTextNormalizer()
+
+
+def _inputs():
+    with open(DATA_FILE, encoding="utf-8") as f:
+        return [line.split(" | ", 1)[0].strip() for line in f
+                if " | " in line and not line.startswith("#")]
+
+
+def _stream(stream, text, sizes):
+    out = []
+    i = 0
+    while i < len(text):
+        j = i + next(sizes)
+        out.append(stream.feed(text[i:j]))
+        i = j
+    out.append(stream.flush())
+    return out
+
+
+def test_random_chunks_match_normalize(normalizer):
+    rng = random.Random(0)
+    inputs = _inputs()
+    words = sorted({word for text in inputs for word in text.split()})
+    stream = StreamingNormalizer(normalizer)
+    sizes = iter(lambda: rng.randint(1, 6), None)
+    for _ in range(500):
+        text = ' '.join(rng.choice(inputs) for _ in range(rng.randint(1, 4)))
+        assert ''.join(_stream(stream, text, sizes)) == normalizer.normalize(text)
+        text = ' '.join(rng.choice(words) for _ in range(rng.randint(1, 12)))
+        assert ''.join(_stream(stream, text, sizes)) == normalizer.normalize(text)
+
+
+def test_symbols_after_cut_match_normalize(normalizer):
+    # Белги тынч сөздөрдөн кийин — так коопсуз чектин артында
+    rng = random.Random(1)
+    quiet = ["Бул", "чоң", "үй", "бак", "китеп", "кызыл", "ала"]
+    symbols = ["&", "%", "№", "@", ",", "&,"]
+    stream = StreamingNormalizer(normalizer)
+    sizes = iter(lambda: rng.randint(1, 8), None)
+    for _ in range(1000):
+        text = ' '.join(rng.choice(symbols) if rng.random() < 0.25 else rng.choice(quiet)
+                        for _ in range(rng.randint(1, 20)))
+        if rng.random() < 0.5:
+            text += ' '
+        assert ''.join(_stream(stream, text, sizes)) == normalizer.normalize(text), text
+    stream = StreamingNormalizer(normalizer)
+    assert stream.feed("Бул чоң үй ") + stream.feed("& бак") + stream.flush() == \
+        normalizer.normalize("Бул чоң үй & бак") == "Бул чоң үй жана бак"
+
+
+def test_ambiguous_number_is_held(normalizer):
+    for tail, expected in [(":30да келет", "он эки отузда келет"),
+                           (".05.2024 келет", "эки миң жыйырма төртүнчү жыл он экинчи май келет"),
+                           (" км келет", "он эки километр келет"),
+                           ("-класс келет", "он экинчи класс келет")]:
+        stream = StreamingNormalizer(normalizer)
+        assert stream.feed("Саат 12") in ("", "Саат")
+        assert stream.pending.endswith("12")
+        rest = stream.feed(tail) + stream.flush()
+        assert normalizer.normalize("Саат 12" + tail).endswith(expected)
+        assert rest.endswith(expected)
+
+
+def test_emits_before_sentence_end(normalizer):
+    stream = StreamingNormalizer(normalizer)
+    assert stream.feed("Бүгүн") == ""
+    assert stream.feed(" биз") == "Бүгүн"
+    assert stream.feed(" 15 км жол ") == " биз"
+    assert stream.feed("курдук жана") == " он беш километр жол курдук"
+    assert stream.feed(". Эртең") == " жана."
+    assert stream.flush() == " Эртең"
+
+
+def test_flush_resets_state(normalizer):
+    stream = StreamingNormalizer(normalizer)
+    first = stream.feed("  Баасы 1500 ") + stream.flush()
+    assert first == "Баасы бир миң беш жүз"
+    assert stream.pending == ""
+    assert stream.feed("  сом ") + stream.flush() == "сом"
+
+
+def test_multiword_override_keys_are_held():
+    normalizer = KyrgyzTextNormalizer(overrides={"kyrgyz_abbr": {"Ак Үй": "ак үй сарайы"}})
+    text = "Биз Ак Үй жөнүндө сүйлөштүк"
+    pieces = list(normalize_stream(text, normalizer))
+    assert ''.join(pieces) == normalizer.normalize(text)
+    assert all(piece for piece in pieces)